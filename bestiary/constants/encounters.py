@@ -0,0 +1,51 @@
+"""
+Encounter building constants for D&D 5e SRD.
+
+This module defines the encounter difficulties, the XP thresholds of a
+character for each of them, and the multipliers applied to the XP of a
+group of monsters.
+"""
+
+from django.db.models import TextChoices
+
+
+class EncounterDifficulty(TextChoices):
+    EASY = "easy", "Easy"
+    MEDIUM = "medium", "Medium"
+    HARD = "hard", "Hard"
+    DEADLY = "deadly", "Deadly"
+
+
+# XP thresholds by character level, in EncounterDifficulty order
+XP_THRESHOLDS = {
+    1: (25, 50, 75, 100),
+    2: (50, 100, 150, 200),
+    3: (75, 150, 225, 400),
+    4: (125, 250, 375, 500),
+    5: (250, 500, 750, 1100),
+    6: (300, 600, 900, 1400),
+    7: (350, 750, 1100, 1700),
+    8: (450, 900, 1400, 2100),
+    9: (550, 1100, 1600, 2400),
+    10: (600, 1200, 1900, 2800),
+    11: (800, 1600, 2400, 3600),
+    12: (1000, 2000, 3000, 4500),
+    13: (1100, 2200, 3400, 5100),
+    14: (1250, 2500, 3800, 5700),
+    15: (1400, 2800, 4300, 6400),
+    16: (1600, 3200, 4800, 7200),
+    17: (2000, 3900, 5900, 8800),
+    18: (2100, 4200, 6300, 9500),
+    19: (2400, 4900, 7300, 10900),
+    20: (2800, 5700, 8500, 12700),
+}
+
+# Encounter multipliers, from the smallest to the largest group of monsters
+ENCOUNTER_MULTIPLIERS = (0.5, 1, 1.5, 2, 2.5, 3, 4, 5)
+
+# Smallest number of monsters of each step of ENCOUNTER_MULTIPLIERS, for a
+# party of 3 to 5 characters. Smaller parties use the next step, larger
+# parties the previous one.
+MULTIPLIER_MONSTER_COUNTS = (0, 1, 2, 3, 7, 11, 15)
+SMALL_PARTY_SIZE = 2
+LARGE_PARTY_SIZE = 6
@@ -9,6 +9,8 @@ This module defines enums for monster stat blocks including:
 - Senses
 """
 
+from fractions import Fraction
+
 from django.db.models import TextChoices
 
 
@@ -139,6 +141,9 @@ CR_XP_TABLE = {
     "30": 155000,
 }
 
+# Challenge rating as a number, for range filtering: "1/4" -> 0.25
+CR_VALUES = {cr.value: float(Fraction(cr.value)) for cr in ChallengeRating}
+
 
 class DamageRelationType(TextChoices):
     """Relationship types for monster damage interactions."""
@@ -170,6 +175,10 @@ class DamageType(TextChoices):
     THUNDER = "thunder", "Thunder"
 
 
+# Bit of each damage type in the damage relation masks of the bestiary index
+DAMAGE_TYPE_BITS = {member.value: 1 << index for index, member in enumerate(DamageType)}
+
+
 class ActionType(TextChoices):
     """Types of monster actions per D&D 5e SRD."""
 
@@ -203,6 +212,26 @@ class RechargeType(TextChoices):
     DAILY_3 = "daily_3", "3/Day"
 
 
+# Lowest d6 roll recharging a spent action at the start of the monster's turn
+RECHARGE_THRESHOLDS = {
+    RechargeType.RECHARGE_4_6: 4,
+    RechargeType.RECHARGE_5_6: 5,
+    RechargeType.RECHARGE_6: 6,
+}
+
+# Uses of a limited action until it recharges (on a d6 roll, a rest or at dawn)
+ACTION_USES = {
+    RechargeType.RECHARGE_5_6: 1,
+    RechargeType.RECHARGE_6: 1,
+    RechargeType.RECHARGE_4_6: 1,
+    RechargeType.SHORT_REST: 1,
+    RechargeType.LONG_REST: 1,
+    RechargeType.DAILY_1: 1,
+    RechargeType.DAILY_2: 2,
+    RechargeType.DAILY_3: 3,
+}
+
+
 class SaveType(TextChoices):
     """Saving throw types for monster abilities."""
 
@@ -0,0 +1,145 @@
+"""Encounter generation from the XP budget of a party.
+
+The party's XP thresholds for the requested difficulty give the range of
+adjusted XP (the monsters' XP times the encounter multiplier of their
+number) the encounter must fall in. Rather than trying every combination of
+monsters, the generator works on CR buckets: monsters of a CR are
+interchangeable as far as XP goes. For each number of monsters up to the
+maximum, a bitset holds the XP totals reachable with that many monsters
+(a bounded knapsack, one shift per bucket and count). The lowest reachable
+total in range is read off each bitset, one of the fitting counts is drawn,
+and a combination of buckets summing to that total is walked back from the
+bitsets, drawing a monster from each bucket.
+
+Candidates come from the bestiary index, so generating an encounter does not
+query the database.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .constants.encounters import (
+    ENCOUNTER_MULTIPLIERS,
+    LARGE_PARTY_SIZE,
+    MULTIPLIER_MONSTER_COUNTS,
+    SMALL_PARTY_SIZE,
+    XP_THRESHOLDS,
+    EncounterDifficulty,
+)
+from .exceptions import EncounterGenerationError
+from .index import MonsterEntry, get_bestiary_index
+
+DEFAULT_MAX_MONSTERS = 8
+
+
+def party_threshold(levels: Iterable[int], difficulty: str) -> int:
+    """Return the XP threshold of a party for a difficulty."""
+    column = list(EncounterDifficulty).index(difficulty)
+    return sum(XP_THRESHOLDS[min(max(level, 1), 20)][column] for level in levels)
+
+
+def encounter_multiplier(monster_count: int, party_size: int) -> float:
+    """Return the multiplier of the XP of a group of monsters."""
+    step = bisect_right(MULTIPLIER_MONSTER_COUNTS, monster_count) - 1
+    if party_size <= SMALL_PARTY_SIZE:
+        step += 1
+    elif party_size >= LARGE_PARTY_SIZE:
+        step -= 1
+    return ENCOUNTER_MULTIPLIERS[step]
+
+
+def adjusted_xp(monsters: Iterable[MonsterEntry], party_size: int) -> int:
+    """Return the XP of monsters weighted by the multiplier of their number."""
+    monsters = list(monsters)
+    return int(
+        sum(monster.xp for monster in monsters)
+        * encounter_multiplier(len(monsters), party_size)
+    )
+
+
+def plan_encounter(
+    levels: Iterable[int],
+    difficulty: str,
+    *,
+    max_monsters: int = DEFAULT_MAX_MONSTERS,
+    **facets,
+) -> list[MonsterEntry]:
+    """Pick monsters making an encounter of a difficulty for a party.
+
+    Args:
+        levels: The levels of the characters of the party
+        difficulty: An EncounterDifficulty
+        max_monsters: The largest number of monsters of the encounter
+        facets: Constraints on the monsters, see BestiaryIndex.search()
+
+    Returns:
+        The monsters of the encounter, in CR order, repeated for each copy
+
+    Raises:
+        EncounterGenerationError: If no group of monsters fits
+    """
+    levels = list(levels)
+    if not levels:
+        raise EncounterGenerationError("The party has no characters.")
+    party_size = len(levels)
+    floor = party_threshold(levels, difficulty)
+    difficulties = list(EncounterDifficulty)
+    harder = difficulties.index(difficulty) + 1
+    ceiling = (
+        party_threshold(levels, difficulties[harder])
+        if harder < len(difficulties)
+        else None
+    )
+
+    buckets: defaultdict[int, list[MonsterEntry]] = defaultdict(list)
+    for monster in get_bestiary_index().search(**facets):
+        if monster.xp:
+            buckets[monster.xp].append(monster)
+    if not buckets:
+        raise EncounterGenerationError("No monster matches the constraints.")
+    unit = math.gcd(*buckets)
+    weights = [xp // unit for xp in buckets]
+
+    # reachable[count]: bit n is set when count monsters can total n * unit XP
+    reachable = [1]
+    for _ in range(max_monsters):
+        previous = reachable[-1]
+        current = 0
+        for weight in weights:
+            current |= previous << weight
+        reachable.append(current)
+
+    fits = []
+    for count in range(1, max_monsters + 1):
+        step = encounter_multiplier(count, party_size) * unit
+        low = math.ceil(floor / step)
+        totals = reachable[count] >> low
+        if not totals:
+            continue
+        total = low + (totals & -totals).bit_length() - 1
+        if ceiling is None or total * step < ceiling:
+            fits.append((count, total))
+    if not fits:
+        raise EncounterGenerationError(
+            f"No group of up to {max_monsters} monsters makes a {difficulty} "
+            "encounter for this party."
+        )
+
+    count, total = random.choice(fits)
+    monsters = []
+    for remaining in range(count, 0, -1):
+        weight = random.choice(
+            [
+                weight
+                for weight in weights
+                if weight <= total and reachable[remaining - 1] >> (total - weight) & 1
+            ]
+        )
+        monsters.append(random.choice(buckets[weight * unit]))
+        total -= weight
+    return sorted(monsters, key=lambda monster: (monster.cr, monster.name))
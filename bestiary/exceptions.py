@@ -0,0 +1,2 @@
+class EncounterGenerationError(Exception):
+    pass
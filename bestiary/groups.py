@@ -0,0 +1,166 @@
+"""Groups of monsters spawned and damaged together.
+
+A goblin horde caught in a fireball takes one damage roll: the damage is
+adjusted once per stat block, from its damage relation masks, then applied
+to every living monster in memory and written with a single bulk UPDATE, or
+to the combat roster of monsters in an active combat (see game.combatants).
+Spent actions recharge the same way, with one d6 roll per action drawn in a
+single batch.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from game.combatants import update_roster
+from utils.dice import roll_batch
+
+from .constants.monsters import RECHARGE_THRESHOLDS
+from .index import get_damage_relations
+from .models.monsters import Monster, MonsterActionTemplate, MonsterSettings
+
+if TYPE_CHECKING:
+    from game.models.combat import Combat
+
+
+class MonsterGroup:
+    """Monsters of one or several stat blocks, acting as one."""
+
+    def __init__(self, monsters: Iterable[Monster]) -> None:
+        self.monsters = list(monsters)
+
+    def __iter__(self) -> Iterator[Monster]:
+        return iter(self.monsters)
+
+    def __len__(self) -> int:
+        return len(self.monsters)
+
+    @staticmethod
+    def build(
+        settings: MonsterSettings,
+        count: int,
+        combat: Combat | None = None,
+        roll_hp: bool = False,
+    ) -> list[Monster]:
+        """
+        Build unsaved instances of a stat block, numbered if there are several.
+
+        Args:
+            settings: The stat block of the monsters
+            count: The number of monsters
+            combat: The combat the monsters join, if any
+            roll_hp: If True, roll the HP of each monster from its hit dice,
+                all at once; otherwise use the average HP.
+        """
+        if roll_hp:
+            hps = [max(1, hp) for hp in roll_batch(settings.hit_dice, count)]
+        else:
+            hps = [settings.hp_average] * count
+        return [
+            Monster(
+                settings=settings,
+                instance_name=f"{settings.name} {number}" if count > 1 else "",
+                hp_current=hp,
+                hp_max=hp,
+                legendary_actions_remaining=settings.legendary_action_count,
+                combat=combat,
+            )
+            for number, hp in enumerate(hps, start=1)
+        ]
+
+    @classmethod
+    def spawn(
+        cls,
+        settings: MonsterSettings,
+        count: int,
+        combat: Combat | None = None,
+        roll_hp: bool = False,
+    ) -> MonsterGroup:
+        """Create monsters of a stat block with a single bulk INSERT.
+
+        Takes the arguments of build().
+        """
+        return cls(
+            Monster.objects.bulk_create(
+                cls.build(settings, count, combat=combat, roll_hp=roll_hp)
+            )
+        )
+
+    @property
+    def alive(self) -> list[Monster]:
+        return [monster for monster in self.monsters if monster.is_alive]
+
+    def take_damage(self, damage: int, damage_type: str = "") -> list[int]:
+        """
+        Apply one damage roll to every living monster of the group.
+
+        Monsters in a combat with an open roster take the damage in the
+        roster, once per combat; the others are written with a single bulk
+        UPDATE.
+
+        Returns the damage taken by each monster, in group order (0 for the
+        dead ones).
+        """
+        alive = self.alive
+        relations = get_damage_relations({monster.settings_id for monster in alive})
+        adjusted = {
+            settings_id: monster_relations.adjust_damage(damage, damage_type)
+            for settings_id, monster_relations in relations.items()
+        }
+        by_combat: defaultdict[int | None, list[Monster]] = defaultdict(list)
+        for monster in alive:
+            by_combat[monster.combat_id].append(monster)
+        taken = {}
+        to_save = []
+        for combat_id, monsters in by_combat.items():
+            with update_roster(combat_id) as roster:
+                for monster in monsters:
+                    monster_damage = adjusted[monster.settings_id]
+                    if roster is None:
+                        taken[monster.pk] = monster.absorb_damage(monster_damage)
+                        to_save.append(monster)
+                        continue
+                    combatant = roster.track(monster, relations[monster.settings_id])
+                    taken[monster.pk] = combatant.absorb_damage(monster_damage)
+                    monster.hp_current = combatant.hp
+                    monster.hp_temp = combatant.hp_temp
+        Monster.objects.bulk_update(to_save, ["hp_current", "hp_temp"])
+        return [taken.get(monster.pk, 0) for monster in self.monsters]
+
+    def recharge_actions(self) -> list[list[int]]:
+        """
+        Roll the recharge of the spent actions of every monster, as at the
+        start of their turn, and write them with a single bulk UPDATE.
+
+        Returns the IDs of the actions recharged by each monster, in group order.
+        """
+        spent = [
+            (monster, int(action_id))
+            for monster in self.monsters
+            for action_id in monster.spent_actions
+        ]
+        thresholds = dict(
+            MonsterActionTemplate.objects.filter(
+                pk__in={action_id for _, action_id in spent},
+                recharge__in=RECHARGE_THRESHOLDS,
+            ).values_list("pk", "recharge")
+        )
+        spent = [(monster, pk) for monster, pk in spent if pk in thresholds]
+        recharged: dict[int, list[int]] = {}
+        for (monster, pk), roll in zip(spent, roll_batch("1d6", len(spent))):
+            if roll >= RECHARGE_THRESHOLDS[thresholds[pk]]:
+                del monster.spent_actions[str(pk)]
+                recharged.setdefault(monster.pk, []).append(pk)
+        Monster.objects.bulk_update(
+            [monster for monster in self.monsters if monster.pk in recharged],
+            ["spent_actions"],
+        )
+        return [recharged.get(monster.pk, []) for monster in self.monsters]
+
+    def restore_actions(self) -> None:
+        """Restore every limited action of the group, as after a long rest."""
+        for monster in self.monsters:
+            monster.spent_actions = {}
+        Monster.objects.bulk_update(self.monsters, ["spent_actions"])
@@ -0,0 +1,230 @@
+"""In-memory search index of the bestiary, for the encounter builder.
+
+The SRD monsters only change when fixtures are loaded. The index reads their
+searchable columns once per process, in two queries, and answers facet
+searches without touching the database.
+
+Monsters are held in CR order. A CR range is a contiguous run of positions,
+found by bisection, and every other facet (creature type, size, legendary
+status, each damage immunity, resistance and vulnerability) is a bitset: a
+Python int with the bit of each matching position set. A search intersects
+the bitsets of its facets, so its cost does not depend on relation tables.
+
+Saving or deleting a monster or one of its damage relations invalidates the
+index of the current process (see bestiary.signals). Other processes keep
+their index, so lookups by name must allow for monsters it does not hold
+(see get_damage_relations()).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .constants.monsters import DAMAGE_TYPE_BITS, DamageRelationType
+from .models.monsters import MonsterDamageRelation, MonsterSettings
+
+
+# Damage relation type -> attribute holding its mask
+RELATION_MASKS = {
+    DamageRelationType.VULNERABILITY: "vulnerabilities",
+    DamageRelationType.RESISTANCE: "resistances",
+    DamageRelationType.IMMUNITY: "immunities",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class DamageRelations:
+    """The damage relations of a monster, as masks over DAMAGE_TYPE_BITS."""
+
+    vulnerabilities: int = 0
+    resistances: int = 0
+    immunities: int = 0
+
+    def adjust_damage(self, damage: int, damage_type: str = "") -> int:
+        """Apply the monster's immunity, resistance or vulnerability to damage."""
+        bit = DAMAGE_TYPE_BITS.get(damage_type.lower(), 0)
+        if self.immunities & bit:
+            return 0
+        if self.resistances & bit:
+            return damage // 2
+        if self.vulnerabilities & bit:
+            return damage * 2
+        return damage
+
+
+@dataclass(frozen=True)
+class MonsterEntry(DamageRelations):
+    """The searchable columns of a monster."""
+
+    name: str
+    challenge_rating: str
+    cr: float
+    xp: int
+    ac: int
+    hp: int
+    size: str
+    creature_type: str
+    legendary: bool
+
+
+def _load_masks(names: Iterable[str] | None = None) -> dict[str, dict[str, int]]:
+    """Read the damage relation masks of monsters (all by default) in one query."""
+    rows = MonsterDamageRelation.objects.values_list(
+        "monster_id", "relation_type", "damage_type"
+    )
+    if names is not None:
+        rows = rows.filter(monster_id__in=names)
+    masks: defaultdict[str, dict[str, int]] = defaultdict(dict)
+    for name, relation_type, damage_type in rows:
+        attribute = RELATION_MASKS[relation_type]
+        bit = DAMAGE_TYPE_BITS.get(damage_type.lower(), 0)
+        masks[name][attribute] = masks[name].get(attribute, 0) | bit
+    return masks
+
+
+def _positions(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BestiaryIndex:
+    """Monsters in CR order, with a bitset of positions per facet value."""
+
+    def __init__(self, entries: list[MonsterEntry]) -> None:
+        self.entries = tuple(sorted(entries, key=lambda entry: (entry.cr, entry.name)))
+        self.by_name = {entry.name: entry for entry in self.entries}
+        self._crs = [entry.cr for entry in self.entries]
+        self._all = (1 << len(self.entries)) - 1
+        self._types: defaultdict[str, int] = defaultdict(int)
+        self._sizes: defaultdict[str, int] = defaultdict(int)
+        self._legendary = 0
+        self._relations: dict[str, defaultdict[str, int]] = {
+            relation_type: defaultdict(int) for relation_type in DamageRelationType
+        }
+        for position, entry in enumerate(self.entries):
+            bit = 1 << position
+            self._types[entry.creature_type] |= bit
+            self._sizes[entry.size] |= bit
+            if entry.legendary:
+                self._legendary |= bit
+            for relation_type, attribute in RELATION_MASKS.items():
+                mask = getattr(entry, attribute)
+                for damage_type, damage_bit in DAMAGE_TYPE_BITS.items():
+                    if mask & damage_bit:
+                        self._relations[relation_type][damage_type] |= bit
+
+    @classmethod
+    def load(cls) -> BestiaryIndex:
+        """Read the searchable columns of every monster in two queries."""
+        masks = _load_masks()
+        entries = []
+        for monster in MonsterSettings.objects.only(
+            "name",
+            "challenge_rating",
+            "cr_value",
+            "ac",
+            "hp_average",
+            "size",
+            "creature_type",
+            "legendary_action_count",
+        ):
+            entries.append(
+                MonsterEntry(
+                    name=monster.name,
+                    challenge_rating=monster.challenge_rating,
+                    cr=monster.cr_value,
+                    xp=monster.xp,
+                    ac=monster.ac,
+                    hp=monster.hp_average,
+                    size=monster.size,
+                    creature_type=monster.creature_type,
+                    legendary=monster.legendary_action_count > 0,
+                    **masks.get(monster.name, {}),
+                )
+            )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(
+        self,
+        *,
+        creature_type: str | None = None,
+        size: str | None = None,
+        cr_min: float | None = None,
+        cr_max: float | None = None,
+        legendary: bool | None = None,
+        immune_to: str | None = None,
+        resistant_to: str | None = None,
+        vulnerable_to: str | None = None,
+    ) -> list[MonsterEntry]:
+        """Return the monsters matching every given facet, in CR order.
+
+        Takes the arguments of ``MonsterSettings.objects.search()``.
+        """
+        mask = self._all
+        if cr_min is not None:
+            mask &= ~((1 << bisect_left(self._crs, cr_min)) - 1)
+        if cr_max is not None:
+            mask &= (1 << bisect_right(self._crs, cr_max)) - 1
+        if creature_type is not None:
+            mask &= self._types.get(creature_type, 0)
+        if size is not None:
+            mask &= self._sizes.get(size, 0)
+        if legendary is not None:
+            mask &= self._legendary if legendary else ~self._legendary
+        for relation_type, damage_type in (
+            (DamageRelationType.IMMUNITY, immune_to),
+            (DamageRelationType.RESISTANCE, resistant_to),
+            (DamageRelationType.VULNERABILITY, vulnerable_to),
+        ):
+            if damage_type is not None:
+                mask &= self._relations[relation_type].get(damage_type.lower(), 0)
+        return [self.entries[position] for position in _positions(mask)]
+
+
+# The monsters are reference data: their index is built once per process.
+_index: BestiaryIndex | None = None
+
+
+def get_bestiary_index() -> BestiaryIndex:
+    """Return the bestiary index, building it on first use."""
+    global _index
+    if _index is None:
+        _index = BestiaryIndex.load()
+    return _index
+
+
+def invalidate_bestiary_index() -> None:
+    """Drop the bestiary index (e.g. after a monster or its damage relations change)."""
+    global _index
+    _index = None
+
+
+def get_damage_relations(names: Iterable[str]) -> dict[str, DamageRelations]:
+    """Return the damage relations of monsters, keyed by monster name.
+
+    Monsters are looked up in the bestiary index if this process has built
+    it. The others are read with one query, without building the index:
+    every monster when it is not built, and monsters created since, maybe by
+    another process.
+    """
+    names = set(names)
+    relations: dict[str, DamageRelations] = {}
+    if _index is not None:
+        relations.update(
+            (name, _index.by_name[name]) for name in names if name in _index.by_name
+        )
+    missing = names - relations.keys()
+    if missing:
+        masks = _load_masks(missing)
+        relations.update(
+            (name, DamageRelations(**masks.get(name, {}))) for name in missing
+        )
+    return relations
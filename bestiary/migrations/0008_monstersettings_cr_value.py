@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bestiary", "0007_drop_remaining_json_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monstersettings",
+            name="cr_value",
+            field=models.FloatField(
+                default=0,
+                help_text="Challenge rating as a number, set from challenge_rating",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monsterdamagerelation",
+            index=models.Index(
+                fields=["damage_type", "relation_type"],
+                name="monster_damage_relation_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monstersettings",
+            index=models.Index(fields=["cr_value"], name="monster_cr_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="monstersettings",
+            index=models.Index(
+                fields=["creature_type", "cr_value"], name="monster_type_cr_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monstersettings",
+            index=models.Index(fields=["size", "cr_value"], name="monster_size_cr_idx"),
+        ),
+    ]
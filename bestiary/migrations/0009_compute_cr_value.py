@@ -0,0 +1,28 @@
+"""
+Compute the numeric CR of existing monsters.
+
+It is then set from the challenge rating whenever a monster is saved, see
+bestiary.signals.
+"""
+
+from fractions import Fraction
+
+from django.db import migrations
+
+
+def forwards(apps, schema_editor):
+    MonsterSettings = apps.get_model("bestiary", "MonsterSettings")
+    monsters = list(MonsterSettings.objects.only("challenge_rating"))
+    for monster in monsters:
+        monster.cr_value = float(Fraction(monster.challenge_rating))
+    MonsterSettings.objects.bulk_update(monsters, ["cr_value"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bestiary", "0008_monstersettings_cr_value"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bestiary", "0009_compute_cr_value"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="monster",
+            name="spent_actions",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -16,10 +16,12 @@ from django.db import models
 
 from character.ability_modifiers import compute_ability_modifier
 from bestiary.constants.monsters import (
+    ACTION_USES,
     ActionType,
     Alignment,
     AreaShape,
     ChallengeRating,
+    CR_VALUES,
     CR_XP_TABLE,
     CreatureSize,
     CreatureType,
@@ -34,6 +36,84 @@ from bestiary.constants.monsters import (
 )
 
 
+# Relations rebuilding the stat block of a monster, see with_stat_block().
+STAT_BLOCK_PREFETCH = (
+    "speed_entries",
+    "saving_throw_entries",
+    "skill_entries",
+    "sense_entries",
+    "damage_relations",
+    "condition_immunity_entries",
+    "language_entries",
+    "trait_templates",
+    "action_templates",
+    "reaction_templates",
+    "legendary_action_templates",
+    "lair_action_templates",
+    "spellcasting_entry__levels",
+)
+
+
+class MonsterSettingsQuerySet(models.QuerySet):
+    def search(
+        self,
+        *,
+        creature_type: str | None = None,
+        size: str | None = None,
+        cr_min: float | None = None,
+        cr_max: float | None = None,
+        legendary: bool | None = None,
+        immune_to: str | None = None,
+        resistant_to: str | None = None,
+        vulnerable_to: str | None = None,
+    ) -> "MonsterSettingsQuerySet":
+        """Filter monsters on the indexed facets of the bestiary.
+
+        The CR bounds are inclusive and numeric ("1/4" is 0.25). See
+        bestiary.index for the same search answered in memory.
+        """
+        queryset = self
+        if creature_type is not None:
+            queryset = queryset.filter(creature_type=creature_type)
+        if size is not None:
+            queryset = queryset.filter(size=size)
+        if cr_min is not None:
+            queryset = queryset.filter(cr_value__gte=cr_min)
+        if cr_max is not None:
+            queryset = queryset.filter(cr_value__lte=cr_max)
+        if legendary is not None:
+            if legendary:
+                queryset = queryset.filter(legendary_action_count__gt=0)
+            else:
+                queryset = queryset.filter(legendary_action_count=0)
+        for relation_type, damage_type in (
+            (DamageRelationType.IMMUNITY, immune_to),
+            (DamageRelationType.RESISTANCE, resistant_to),
+            (DamageRelationType.VULNERABILITY, vulnerable_to),
+        ):
+            if damage_type is not None:
+                queryset = queryset.filter(
+                    models.Exists(
+                        MonsterDamageRelation.objects.filter(
+                            monster=models.OuterRef("pk"),
+                            damage_type=damage_type,
+                            relation_type=relation_type,
+                        )
+                    )
+                )
+        return queryset
+
+    def with_stat_block(self) -> "MonsterSettingsQuerySet":
+        """Load the relations of the stat blocks in a fixed number of queries.
+
+        The stat block properties of the monsters then read the prefetched
+        rows instead of querying each relation.
+        """
+        return self.select_related("spellcasting_entry").prefetch_related(
+            *STAT_BLOCK_PREFETCH
+        )
+
+
 class MonsterSettings(models.Model):
     """
     Reference data for monster stat blocks from D&D 5e SRD.
@@ -111,6 +191,10 @@ class MonsterSettings(models.Model):
         max_length=5,
         choices=ChallengeRating.choices,
     )
+    cr_value = models.FloatField(
+        default=0,
+        help_text="Challenge rating as a number, set from challenge_rating",
+    )
 
     # Proficiency Bonus (derived from CR)
     proficiency_bonus = models.PositiveSmallIntegerField(
@@ -127,8 +211,17 @@ class MonsterSettings(models.Model):
     # Lair Actions (for creatures with lairs)
     has_lair = models.BooleanField(default=False)
 
+    objects = MonsterSettingsQuerySet.as_manager()
+
     class Meta:
         db_table = "character_monstersettings"
+        indexes = [
+            models.Index(fields=["cr_value"], name="monster_cr_idx"),
+            models.Index(
+                fields=["creature_type", "cr_value"], name="monster_type_cr_idx"
+            ),
+            models.Index(fields=["size", "cr_value"], name="monster_size_cr_idx"),
+        ]
         ordering = ["name"]
         verbose_name = "monster settings"
         verbose_name_plural = "monster settings"
@@ -136,6 +229,10 @@ class MonsterSettings(models.Model):
     def __str__(self):
         return f"{self.name} (CR {self.challenge_rating})"
 
+    def parse_challenge_rating(self) -> None:
+        """Set the numeric CR from the challenge rating."""
+        self.cr_value = CR_VALUES[self.challenge_rating]
+
     @property
     def xp(self) -> int:
         """Get XP value based on challenge rating."""
@@ -195,73 +292,75 @@ class MonsterSettings(models.Model):
         result["passive_perception"] = self.passive_perception
         return result
 
+    @cached_property
+    def _damage_relations(self) -> dict[str, list[str]]:
+        relations: dict[str, list[str]] = {
+            relation_type: [] for relation_type in DamageRelationType
+        }
+        for e in self.damage_relations.all():
+            relations[e.relation_type].append(e.damage_type)
+        return relations
+
     @cached_property
     def damage_vulnerabilities(self) -> list[str]:
-        return list(
-            self.damage_relations.filter(
-                relation_type=DamageRelationType.VULNERABILITY
-            ).values_list("damage_type", flat=True)
-        )
+        return self._damage_relations[DamageRelationType.VULNERABILITY]
 
     @cached_property
     def damage_resistances(self) -> list[str]:
-        return list(
-            self.damage_relations.filter(
-                relation_type=DamageRelationType.RESISTANCE
-            ).values_list("damage_type", flat=True)
-        )
+        return self._damage_relations[DamageRelationType.RESISTANCE]
 
     @cached_property
     def damage_immunities(self) -> list[str]:
-        return list(
-            self.damage_relations.filter(
-                relation_type=DamageRelationType.IMMUNITY
-            ).values_list("damage_type", flat=True)
-        )
+        return self._damage_relations[DamageRelationType.IMMUNITY]
 
     @cached_property
     def condition_immunities(self) -> list[str]:
-        return list(self.condition_immunity_entries.values_list("condition", flat=True))
+        return [e.condition for e in self.condition_immunity_entries.all()]
 
     @cached_property
     def languages(self) -> list[str]:
-        return list(self.language_entries.values_list("language", flat=True))
+        return [e.language for e in self.language_entries.all()]
+
+    # The relations below are read in the order of their Meta.ordering.
 
     @cached_property
     def traits(self) -> list[dict]:
-        return list(
-            self.trait_templates.values("name", "description").order_by(
-                "sort_order", "name"
-            )
-        )
+        return [
+            {"name": e.name, "description": e.description}
+            for e in self.trait_templates.all()
+        ]
 
     @cached_property
     def actions(self) -> list[dict]:
-        return list(
-            self.action_templates.values(
-                "name", "description", "attack_bonus", "damage_dice"
-            ).order_by("sort_order", "name")
-        )
+        return [
+            {
+                "name": e.name,
+                "description": e.description,
+                "attack_bonus": e.attack_bonus,
+                "damage_dice": e.damage_dice,
+            }
+            for e in self.action_templates.all()
+        ]
 
     @cached_property
     def reactions(self) -> list[dict]:
-        return list(
-            self.reaction_templates.values("name", "description").order_by("name")
-        )
+        return [
+            {"name": e.name, "description": e.description}
+            for e in self.reaction_templates.all()
+        ]
 
     @cached_property
     def legendary_actions(self) -> list[dict]:
-        return list(
-            self.legendary_action_templates.values(
-                "name", "description", "cost"
-            ).order_by("sort_order", "cost", "name")
-        )
+        return [
+            {"name": e.name, "description": e.description, "cost": e.cost}
+            for e in self.legendary_action_templates.all()
+        ]
 
     @cached_property
     def lair_actions(self) -> list[dict]:
-        return list(
-            self.lair_action_templates.values("description").order_by("sort_order")
-        )
+        return [
+            {"description": e.description} for e in self.lair_action_templates.all()
+        ]
 
     @cached_property
     def spellcasting(self) -> dict:
@@ -275,7 +374,7 @@ class MonsterSettings(models.Model):
             "attack_bonus": entry.attack_bonus,
             "spells": {},
         }
-        for level in entry.levels.order_by("level"):
+        for level in entry.levels.all():
             if level.level == "cantrips":
                 result["spells"]["cantrips"] = level.spells
             else:
@@ -365,6 +464,9 @@ class Monster(models.Model):
     # For legendary creatures
     legendary_actions_remaining = models.PositiveSmallIntegerField(default=0)
 
+    # Uses of limited actions (recharge, per rest or per day), by action ID
+    spent_actions = models.JSONField(default=dict, blank=True)
+
     # Notes for this specific instance
     notes = models.TextField(max_length=500, blank=True)
 
@@ -407,30 +509,36 @@ class Monster(models.Model):
         """
         Apply damage to the monster, considering resistances/immunities.
 
+        In a combat with an open roster, the damage goes to the monster's
+        combatant, written back when the round ends (see game.combatants).
+
         Returns the actual damage taken after modifications.
         """
-        actual_damage = damage
+        # The bestiary index and the combatants depend on the monster models.
+        from bestiary.index import get_damage_relations
+        from game.combatants import combatant_of
+
+        with combatant_of(self) as combatant:
+            if combatant is not None:
+                return combatant.take_damage(damage, damage_type)
+        relations = get_damage_relations([self.settings_id])[self.settings_id]
+        actual_damage = self.absorb_damage(relations.adjust_damage(damage, damage_type))
+        self.save()
+        return actual_damage
 
-        if damage_type:
-            if self.settings.is_immune_to_damage(damage_type):
-                actual_damage = 0
-            elif self.settings.is_resistant_to_damage(damage_type):
-                actual_damage = damage // 2
-            elif self.settings.is_vulnerable_to_damage(damage_type):
-                actual_damage = damage * 2
+    def absorb_damage(self, damage: int) -> int:
+        """
+        Apply damage already adjusted for the damage type, without saving:
+        temporary HP first, then current HP.
 
-        # Apply to temp HP first
+        Returns the damage taken by current HP.
+        """
         if self.hp_temp > 0:
-            if actual_damage <= self.hp_temp:
-                self.hp_temp -= actual_damage
-                actual_damage = 0
-            else:
-                actual_damage -= self.hp_temp
-                self.hp_temp = 0
-
-        self.hp_current = max(0, self.hp_current - actual_damage)
-        self.save()
-        return actual_damage
+            absorbed = min(self.hp_temp, damage)
+            self.hp_temp -= absorbed
+            damage -= absorbed
+        self.hp_current = max(0, self.hp_current - damage)
+        return damage
 
     def heal(self, amount: int) -> int:
         """
@@ -438,6 +546,11 @@ class Monster(models.Model):
 
         Returns the actual amount healed.
         """
+        from game.combatants import combatant_of
+
+        with combatant_of(self) as combatant:
+            if combatant is not None:
+                return combatant.heal(amount)
         old_hp = self.hp_current
         self.hp_current = min(self.hp_max, self.hp_current + amount)
         self.save()
@@ -445,6 +558,12 @@ class Monster(models.Model):
 
     def add_temp_hp(self, amount: int) -> None:
         """Add temporary hit points (doesn't stack, takes higher)."""
+        from game.combatants import combatant_of
+
+        with combatant_of(self) as combatant:
+            if combatant is not None:
+                combatant.add_temp_hp(amount)
+                return
         self.hp_temp = max(self.hp_temp, amount)
         self.save()
 
@@ -457,13 +576,25 @@ class Monster(models.Model):
         if self.legendary_actions_remaining < cost:
             return False
         self.legendary_actions_remaining -= cost
-        self.save()
+        # HP may be held by the combat roster: leave it alone.
+        self.save(update_fields=["legendary_actions_remaining"])
         return True
 
     def reset_legendary_actions(self) -> None:
         """Reset legendary actions at the start of the monster's turn."""
         self.legendary_actions_remaining = self.settings.legendary_action_count
-        self.save()
+        self.save(update_fields=["legendary_actions_remaining"])
+
+    def can_use_action(self, action: "MonsterActionTemplate") -> bool:
+        """Check if a limited action has uses left; other actions always do."""
+        uses = ACTION_USES.get(action.recharge)
+        return uses is None or self.spent_actions.get(str(action.pk), 0) < uses
+
+    def spend_action(self, action: "MonsterActionTemplate") -> None:
+        """Count a use of a limited action, without saving."""
+        if action.recharge in ACTION_USES:
+            key = str(action.pk)
+            self.spent_actions[key] = self.spent_actions.get(key, 0) + 1
 
     @classmethod
     def create_from_settings(
@@ -1086,6 +1217,12 @@ class MonsterDamageRelation(models.Model):
                 name="unique_monster_damage_relation",
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["damage_type", "relation_type"],
+                name="monster_damage_relation_idx",
+            ),
+        ]
         ordering = ["monster", "relation_type", "damage_type"]
         verbose_name = "monster damage relation"
         verbose_name_plural = "monster damage relations"
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .index import invalidate_bestiary_index
+from .models.monsters import MonsterDamageRelation, MonsterSettings
+
+
+@receiver(pre_save, sender=MonsterSettings)
+def parse_challenge_rating(sender, instance: MonsterSettings, **kwargs) -> None:
+    """Set the numeric CR of a monster when it is saved, fixtures included."""
+    instance.parse_challenge_rating()
+
+
+def invalidate_index(sender, **kwargs) -> None:
+    invalidate_bestiary_index()
+
+
+for signal in (post_save, post_delete):
+    signal.connect(invalidate_index, sender=MonsterSettings)
+    signal.connect(invalidate_index, sender=MonsterDamageRelation)
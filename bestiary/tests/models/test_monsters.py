@@ -35,6 +35,32 @@ from bestiary.models.monsters import (
     MultiattackAction,
 )
 
+# Stat block properties, compared with and without with_stat_block()
+STAT_BLOCK_PROPERTIES = (
+    "xp",
+    "strength_modifier",
+    "dexterity_modifier",
+    "constitution_modifier",
+    "intelligence_modifier",
+    "wisdom_modifier",
+    "charisma_modifier",
+    "speed",
+    "saving_throws",
+    "skills",
+    "senses",
+    "damage_vulnerabilities",
+    "damage_resistances",
+    "damage_immunities",
+    "condition_immunities",
+    "languages",
+    "traits",
+    "actions",
+    "reactions",
+    "legendary_actions",
+    "lair_actions",
+    "spellcasting",
+)
+
 
 @pytest.mark.django_db
 class TestMonsterSettingsModel:
@@ -1751,6 +1777,91 @@ class TestPassivePerception:
         assert dragon.senses["passive_perception"] == 23
 
 
+@pytest.mark.django_db
+class TestMonsterSettingsSearch:
+    """Tests for the indexed facet search of MonsterSettings."""
+
+    def test_cr_value_from_fixture(self):
+        wolf = MonsterSettings.objects.get(name=MonsterName.WOLF)
+        assert wolf.cr_value == 0.25
+
+    def test_cr_value_set_on_save(self):
+        wolf = MonsterSettings.objects.get(name=MonsterName.WOLF)
+        wolf.challenge_rating = ChallengeRating.CR_1_8
+        wolf.save()
+        wolf.refresh_from_db()
+        assert wolf.cr_value == 0.125
+
+    def test_numeric_cr_range(self):
+        monsters = MonsterSettings.objects.search(cr_min=0.125, cr_max=0.5)
+        assert monsters.exists()
+        assert set(monsters.values_list("challenge_rating", flat=True)) <= {
+            "1/8",
+            "1/4",
+            "1/2",
+        }
+
+    def test_facets(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            names = list(
+                MonsterSettings.objects.search(
+                    creature_type=CreatureType.UNDEAD,
+                    cr_min=2,
+                    cr_max=5,
+                    immune_to=DamageType.POISON,
+                ).values_list("name", flat=True)
+            )
+        assert names == [
+            MonsterName.GHOST,
+            MonsterName.MUMMY,
+            MonsterName.WIGHT,
+            MonsterName.WRAITH,
+        ]
+
+    def test_legendary(self):
+        assert (
+            MonsterSettings.objects.search(legendary=True, cr_max=1).exists() is False
+        )
+        assert MonsterName.ADULT_RED_DRAGON in MonsterSettings.objects.search(
+            legendary=True
+        ).values_list("name", flat=True)
+
+
+@pytest.mark.django_db
+class TestStatBlock:
+    """Tests for the stat block loaded by with_stat_block()."""
+
+    def test_prefetched_stat_block_matches(self):
+        names = [MonsterName.ADULT_RED_DRAGON, MonsterName.LICH, MonsterName.WOLF]
+        for monster in MonsterSettings.objects.with_stat_block().filter(name__in=names):
+            fresh = MonsterSettings.objects.get(name=monster.name)
+            for prop in STAT_BLOCK_PROPERTIES:
+                assert getattr(monster, prop) == getattr(fresh, prop), prop
+
+    def test_query_count_does_not_depend_on_monster_count(
+        self, django_assert_num_queries
+    ):
+        # Monsters with their spellcasting, 12 relations, spellcasting levels
+        with django_assert_num_queries(14):
+            for monster in MonsterSettings.objects.with_stat_block():
+                for prop in STAT_BLOCK_PROPERTIES:
+                    getattr(monster, prop)
+
+    def test_damage_relations_share_one_query(self, django_assert_num_queries):
+        dragon = MonsterSettings.objects.get(name=MonsterName.ADULT_RED_DRAGON)
+        with django_assert_num_queries(1):
+            assert dragon.damage_immunities == [DamageType.FIRE]
+            assert dragon.damage_resistances == []
+            assert dragon.damage_vulnerabilities == []
+
+    def test_spellcasting(self):
+        lich = MonsterSettings.objects.with_stat_block().get(name=MonsterName.LICH)
+        assert lich.spellcasting["ability"] == "INT"
+        assert "cantrips" in lich.spellcasting["spells"]
+        wolf = MonsterSettings.objects.with_stat_block().get(name=MonsterName.WOLF)
+        assert wolf.spellcasting == {}
+
+
 @pytest.mark.django_db
 class TestSRDMonsterCompleteness:
     def test_total_monster_count(self):
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from bestiary.constants.encounters import EncounterDifficulty
+from bestiary.constants.monsters import CreatureType
+from bestiary.encounters import (
+    adjusted_xp,
+    encounter_multiplier,
+    party_threshold,
+    plan_encounter,
+)
+from bestiary.exceptions import EncounterGenerationError
+from bestiary.index import get_bestiary_index
+
+pytestmark = pytest.mark.django_db
+
+DIFFICULTIES = list(EncounterDifficulty)
+
+
+class TestPartyThreshold:
+    def test_sum_of_character_thresholds(self):
+        assert party_threshold([1, 1, 1, 1], EncounterDifficulty.MEDIUM) == 200
+        assert party_threshold([5, 3], EncounterDifficulty.DEADLY) == 1500
+
+    def test_levels_above_20(self):
+        assert party_threshold([21], EncounterDifficulty.EASY) == 2800
+
+
+class TestEncounterMultiplier:
+    @pytest.mark.parametrize(
+        "monster_count, multiplier",
+        [(1, 1), (2, 1.5), (3, 2), (6, 2), (7, 2.5), (11, 3), (14, 3), (15, 4)],
+    )
+    def test_party_of_four(self, monster_count, multiplier):
+        assert encounter_multiplier(monster_count, 4) == multiplier
+
+    def test_small_party(self):
+        assert encounter_multiplier(1, 2) == 1.5
+        assert encounter_multiplier(15, 1) == 5
+
+    def test_large_party(self):
+        assert encounter_multiplier(1, 6) == 0.5
+        assert encounter_multiplier(2, 7) == 1
+
+
+class TestPlanEncounter:
+    @pytest.mark.parametrize("difficulty", DIFFICULTIES)
+    @pytest.mark.parametrize("levels", [[1, 1, 1, 1], [3, 4, 5], [10] * 5, [20] * 6])
+    def test_adjusted_xp_fits_the_difficulty(self, levels, difficulty):
+        random.seed(levels[0])
+        for _ in range(10):
+            monsters = plan_encounter(levels, difficulty)
+            assert 1 <= len(monsters) <= 8
+            xp = adjusted_xp(monsters, len(levels))
+            assert xp >= party_threshold(levels, difficulty)
+            harder = DIFFICULTIES.index(difficulty) + 1
+            if harder < len(DIFFICULTIES):
+                assert xp < party_threshold(levels, DIFFICULTIES[harder])
+
+    def test_constraints(self):
+        for _ in range(10):
+            monsters = plan_encounter(
+                [5, 5, 5, 5],
+                EncounterDifficulty.HARD,
+                max_monsters=3,
+                creature_type=CreatureType.UNDEAD,
+            )
+            assert len(monsters) <= 3
+            assert {monster.creature_type for monster in monsters} == {
+                CreatureType.UNDEAD
+            }
+
+    def test_no_queries_once_indexed(self, django_assert_num_queries):
+        get_bestiary_index()
+        with django_assert_num_queries(0):
+            plan_encounter([8, 8, 9, 10], EncounterDifficulty.DEADLY, max_monsters=15)
+
+    def test_empty_party(self):
+        with pytest.raises(EncounterGenerationError):
+            plan_encounter([], EncounterDifficulty.EASY)
+
+    def test_no_matching_monster(self):
+        with pytest.raises(EncounterGenerationError):
+            plan_encounter([1], EncounterDifficulty.EASY, creature_type="unknown")
+
+    def test_no_fitting_group(self):
+        # Every dragon is too much for a lone level 1 character.
+        with pytest.raises(EncounterGenerationError):
+            plan_encounter(
+                [1], EncounterDifficulty.EASY, creature_type=CreatureType.DRAGON
+            )
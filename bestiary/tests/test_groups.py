@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+
+from bestiary.constants.monsters import DamageType, MonsterName, RechargeType
+from bestiary.groups import MonsterGroup
+from bestiary.index import get_bestiary_index
+from bestiary.models.monsters import Monster, MonsterSettings
+from bestiary.tests.factories import MonsterActionTemplateFactory
+from game.tests.factories import CombatFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bandits():
+    return MonsterSettings.objects.get(name=MonsterName.BANDIT)
+
+
+@pytest.fixture
+def skeletons():
+    return MonsterSettings.objects.get(name=MonsterName.SKELETON)
+
+
+class TestSpawn:
+    def test_build_numbers_copies(self, bandits):
+        monsters = MonsterGroup.build(bandits, 3)
+        assert [monster.instance_name for monster in monsters] == [
+            f"{bandits.name} 1",
+            f"{bandits.name} 2",
+            f"{bandits.name} 3",
+        ]
+        assert all(monster.pk is None for monster in monsters)
+
+    def test_build_single(self, bandits):
+        (monster,) = MonsterGroup.build(bandits, 1)
+        assert monster.instance_name == ""
+
+    def test_spawn_with_one_insert(self, bandits, django_assert_num_queries):
+        combat = CombatFactory()
+        with django_assert_num_queries(1):
+            group = MonsterGroup.spawn(bandits, 20, combat=combat)
+        assert len(group) == 20
+        assert Monster.objects.filter(combat=combat).count() == 20
+        for monster in group:
+            assert monster.hp_current == monster.hp_max == bandits.hp_average
+
+    def test_rolled_hp(self, skeletons):
+        group = MonsterGroup.spawn(skeletons, 50, roll_hp=True)
+        # Skeletons have 2d8+4 hit dice.
+        assert skeletons.hit_dice == "2d8+4"
+        hps = [monster.hp_max for monster in group]
+        assert all(6 <= hp <= 20 for hp in hps)
+        assert len(set(hps)) > 1
+        assert all(monster.hp_current == monster.hp_max for monster in group)
+
+
+class TestGroupDamage:
+    def test_one_update(self, bandits, django_assert_num_queries):
+        group = MonsterGroup.spawn(bandits, 10)
+        get_bestiary_index()
+        with django_assert_num_queries(1):
+            taken = group.take_damage(3, DamageType.FIRE)
+        assert taken == [3] * 10
+        for monster in Monster.objects.filter(pk__in=[m.pk for m in group]):
+            assert monster.hp_current == bandits.hp_average - 3
+
+    def test_damage_relations_per_stat_block(self, bandits, skeletons):
+        group = MonsterGroup(
+            [
+                *MonsterGroup.spawn(bandits, 2),
+                *MonsterGroup.spawn(skeletons, 2),
+            ]
+        )
+        assert group.take_damage(4, DamageType.BLUDGEONING) == [4, 4, 8, 8]
+        assert group.take_damage(4, DamageType.POISON) == [4, 4, 0, 0]
+
+    def test_temp_hp_and_death(self, bandits):
+        group = MonsterGroup.spawn(bandits, 2)
+        first, second = group.monsters
+        first.hp_temp = 5
+        taken = group.take_damage(bandits.hp_average + 2)
+        assert taken == [bandits.hp_average - 3, bandits.hp_average + 2]
+        assert group.alive == [first]
+        second.refresh_from_db()
+        assert second.hp_current == 0
+        first.refresh_from_db()
+        assert first.hp_temp == 0
+
+    def test_dead_monsters_are_left_out(self, bandits, django_assert_num_queries):
+        group = MonsterGroup.spawn(bandits, 3)
+        group.monsters[1].hp_current = 0
+        # Damage relations of the bandits, one bulk update
+        with django_assert_num_queries(2):
+            assert group.take_damage(2) == [2, 0, 2]
+        assert group.monsters[1].hp_current == 0
+
+
+class TestGroupRecharge:
+    @pytest.fixture
+    def actions(self, bandits):
+        return [
+            MonsterActionTemplateFactory(monster=bandits, recharge=recharge)
+            for recharge in (
+                RechargeType.RECHARGE_5_6,
+                RechargeType.RECHARGE_6,
+                RechargeType.DAILY_1,
+            )
+        ]
+
+    @pytest.fixture
+    def group(self, bandits, actions):
+        group = MonsterGroup.spawn(bandits, 2)
+        for monster in group:
+            for action in actions:
+                monster.spend_action(action)
+        Monster.objects.bulk_update(group.monsters, ["spent_actions"])
+        return group
+
+    def test_recharge_on_roll(self, group, actions, django_assert_num_queries):
+        recharge_5_6, recharge_6, daily = actions
+        # One d6 per spent recharge action, in group order.
+        with (
+            patch("bestiary.groups.roll_batch", return_value=[5, 5, 1, 6]),
+            django_assert_num_queries(2),
+        ):
+            recharged = group.recharge_actions()
+        assert recharged == [[recharge_5_6.pk], [recharge_6.pk]]
+        first, second = Monster.objects.filter(pk__in=[m.pk for m in group])
+        assert first.can_use_action(recharge_5_6)
+        assert not first.can_use_action(recharge_6)
+        assert not second.can_use_action(recharge_5_6)
+        assert second.can_use_action(recharge_6)
+        assert not first.can_use_action(daily)
+
+    def test_restore(self, group, actions):
+        group.restore_actions()
+        for monster in Monster.objects.filter(pk__in=[m.pk for m in group]):
+            assert all(monster.can_use_action(action) for action in actions)
@@ -0,0 +1,137 @@
+import pytest
+from django.db.models.signals import post_save
+from factory.django import mute_signals
+
+from bestiary.constants.monsters import (
+    DAMAGE_TYPE_BITS,
+    CreatureSize,
+    CreatureType,
+    DamageRelationType,
+    DamageType,
+    MonsterName,
+)
+from bestiary.index import BestiaryIndex, get_bestiary_index, get_damage_relations
+from bestiary.models.monsters import MonsterDamageRelation, MonsterSettings
+from bestiary.tests.factories import MonsterDamageRelationFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def index():
+    return BestiaryIndex.load()
+
+
+class TestBestiaryIndex:
+    def test_load_query_count(self, django_assert_num_queries):
+        # Damage relations, monsters
+        with django_assert_num_queries(2):
+            index = BestiaryIndex.load()
+        assert len(index) == MonsterSettings.objects.count()
+
+    def test_entry(self, index):
+        dragon = index.by_name[MonsterName.ADULT_RED_DRAGON]
+        assert dragon.cr == 17
+        assert dragon.xp == 18000
+        assert dragon.legendary
+        assert dragon.immunities == DAMAGE_TYPE_BITS[DamageType.FIRE]
+        assert dragon.resistances == 0
+
+    def test_adjust_damage(self, index):
+        skeleton = index.by_name[MonsterName.SKELETON]
+        assert skeleton.adjust_damage(10, DamageType.POISON) == 0
+        assert skeleton.adjust_damage(10, "Bludgeoning") == 20
+        assert skeleton.adjust_damage(10, DamageType.FIRE) == 10
+        assert skeleton.adjust_damage(10) == 10
+        elemental = index.by_name[MonsterName.AIR_ELEMENTAL]
+        assert elemental.adjust_damage(11, DamageType.LIGHTNING) == 5
+
+    def test_search_without_queries(self, index, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            results = index.search(
+                creature_type=CreatureType.UNDEAD,
+                cr_min=2,
+                cr_max=5,
+                immune_to=DamageType.POISON,
+            )
+        assert [entry.name for entry in results] == [
+            MonsterName.MUMMY,
+            MonsterName.WIGHT,
+            MonsterName.GHOST,
+            MonsterName.WRAITH,
+        ]
+
+    def test_fractional_cr_range(self, index):
+        results = index.search(cr_min=0.125, cr_max=0.25)
+        assert results
+        assert {entry.challenge_rating for entry in results} == {"1/8", "1/4"}
+
+    def test_no_facet_returns_every_monster_in_cr_order(self, index):
+        results = index.search()
+        assert len(results) == len(index)
+        assert [entry.cr for entry in results] == sorted(entry.cr for entry in results)
+
+    @pytest.mark.parametrize(
+        "facets",
+        [
+            {"creature_type": CreatureType.UNDEAD, "cr_min": 2, "cr_max": 5},
+            {"size": CreatureSize.TINY},
+            {"legendary": True},
+            {"legendary": False, "cr_min": 10},
+            {"resistant_to": DamageType.COLD, "cr_max": 8},
+            {"vulnerable_to": DamageType.RADIANT},
+            {"creature_type": "unknown"},
+        ],
+    )
+    def test_matches_database_search(self, index, facets):
+        expected = set(
+            MonsterSettings.objects.search(**facets).values_list("name", flat=True)
+        )
+        assert {entry.name for entry in index.search(**facets)} == expected
+
+
+class TestIndexInvalidation:
+    def test_damage_relation_invalidates(self):
+        index = get_bestiary_index()
+        assert get_bestiary_index() is index
+        MonsterDamageRelation.objects.create(
+            monster_id=MonsterName.WOLF,
+            relation_type=DamageRelationType.IMMUNITY,
+            damage_type=DamageType.POISON,
+        )
+        results = get_bestiary_index().search(immune_to=DamageType.POISON)
+        assert MonsterName.WOLF in {entry.name for entry in results}
+
+    def test_monster_save_invalidates(self):
+        get_bestiary_index()
+        wolf = MonsterSettings.objects.get(name=MonsterName.WOLF)
+        wolf.challenge_rating = "2"
+        wolf.save()
+        assert get_bestiary_index().by_name[MonsterName.WOLF].cr == 2
+
+
+class TestGetDamageRelations:
+    def test_without_index(self, django_assert_num_queries):
+        # Only the damage relations of the monster are read.
+        with django_assert_num_queries(1):
+            relations = get_damage_relations([MonsterName.SKELETON])
+        assert relations[MonsterName.SKELETON].adjust_damage(10, DamageType.POISON) == 0
+
+    def test_from_index(self, django_assert_num_queries):
+        index = get_bestiary_index()
+        with django_assert_num_queries(0):
+            relations = get_damage_relations([MonsterName.SKELETON, MonsterName.WOLF])
+        assert relations[MonsterName.WOLF] is index.by_name[MonsterName.WOLF]
+
+    def test_monster_missing_from_index(self, django_assert_num_queries):
+        get_bestiary_index()
+        # As if created by another process: this index is not invalidated.
+        with mute_signals(post_save):
+            relation = MonsterDamageRelationFactory(
+                monster__name="Frost Wight", damage_type=DamageType.COLD
+            )
+        with django_assert_num_queries(1):
+            relations = get_damage_relations(["Frost Wight", MonsterName.WOLF])
+        assert relations["Frost Wight"].immunities == DAMAGE_TYPE_BITS[DamageType.COLD]
+        assert relation.monster.name not in get_bestiary_index().by_name
+        assert relations[MonsterName.WOLF].immunities == 0
@@ -2,14 +2,24 @@ import random
 from abc import ABC, abstractmethod
 
 from utils.dice import DiceString
+from utils.registry import get_registry
 
+from .ability_modifiers import compute_ability_modifier
+from .constants.abilities import AbilityName
 from .constants.backgrounds import BACKGROUNDS
-from .constants.skills import SkillName
+from .constants.proficiencies import (
+    ABILITY_BITS,
+    ARMOR_BITS,
+    SKILL_BITS,
+    WEAPON_BITS,
+    to_mask,
+)
+from .derived_stats import Inputs, update_derived_stats
 from .forms.character import CharacterCreateForm
-from .models.abilities import Ability, AbilityType
+from .models.abilities import Ability
 from .models.character import Character
-from equipment.models.equipment import Inventory, ToolSettings
-from .models.feats import CharacterFeat, Feat
+from equipment.models.equipment import Inventory
+from .models.feats import CharacterFeat, invalidate_feats
 from .models.classes import CharacterClass, CharacterFeature, Class
 from .models.proficiencies import (
     ArmorProficiency,
@@ -18,21 +28,28 @@ from .models.proficiencies import (
     ToolProficiency,
     WeaponProficiency,
 )
-from equipment.models.equipment import ArmorSettings, WeaponSettings
-from .models.skills import Skill
-from magic.models.spells import (
-    CharacterSpellSlot,
-    ClassSpellcasting,
-    SpellSlotTable,
-    WarlockSpellSlot,
-)
+from magic.models.spells import ClassSpellcasting, WarlockSpellSlot
+from magic.spell_slots import get_spell_slot_matrix, sync_spell_slots
 
 
 class CharacterAttributesBuilder(ABC):
+    """Apply a part of a character.
+
+    ``apply()`` sets the character's fields in memory and bulk-creates the
+    related rows; ``build()`` also saves the character. The creation pipeline
+    applies every builder and saves the character once.
+    """
+
+    character: Character
+
     @abstractmethod
-    def build(self) -> None:
+    def apply(self) -> None:
         pass
 
+    def build(self) -> None:
+        self.apply()
+        self.character.save()
+
 
 class BaseBuilder(CharacterAttributesBuilder):
     def __init__(self, character: Character, form: CharacterCreateForm) -> None:
@@ -43,14 +60,24 @@ class BaseBuilder(CharacterAttributesBuilder):
         self.character.inventory = Inventory.objects.create()
 
     def _initialize_ability_scores(self) -> None:
-        for ability_type in AbilityType.objects.all():
-            ability = Ability.objects.create(
-                ability_type=ability_type,
-                score=self.form.cleaned_data[ability_type.get_name_display().lower()],
+        abilities = []
+        for name, label in AbilityName.choices:
+            score = self.form.cleaned_data[label.lower()]
+            abilities.append(
+                Ability(
+                    ability_type_id=name,
+                    score=score,
+                    # bulk_create does not call Ability.save()
+                    modifier=compute_ability_modifier(score),
+                )
             )
-            self.character.abilities.add(ability)
+        Ability.objects.bulk_create(abilities)
+        Character.abilities.through.objects.bulk_create(
+            Character.abilities.through(character=self.character, ability=ability)
+            for ability in abilities
+        )
 
-    def build(self) -> None:
+    def apply(self) -> None:
         self._add_inventory()
         self.character.save()
         self._initialize_ability_scores()
@@ -70,14 +97,14 @@ class SpeciesBuilder(CharacterAttributesBuilder):
         self.character.size = self.species.size
         self.character.speed = self.species.speed
         self.character.darkvision = self.species.darkvision
-        # Need to save before setting many-to-many relationships
-        self.character.save()
-        for language in self.species.languages.all():
-            self.character.languages.add(language)
+        species = get_registry().species.get(self.species.pk)
+        Character.languages.through.objects.bulk_create(
+            Character.languages.through(character=self.character, language=language)
+            for language in species.languages.all()
+        )
 
-    def build(self) -> None:
+    def apply(self) -> None:
         self._apply_species_traits()
-        self.character.save()
 
 
 class ClassBuilder(CharacterAttributesBuilder):
@@ -89,11 +116,15 @@ class ClassBuilder(CharacterAttributesBuilder):
 
     def _create_character_class(self) -> None:
         """Create the CharacterClass junction record."""
-        CharacterClass.objects.create(
-            character=self.character,
-            klass=self.klass,
-            level=1,
-            is_primary=True,
+        CharacterClass.objects.bulk_create(
+            [
+                CharacterClass(
+                    character=self.character,
+                    klass=self.klass,
+                    level=1,
+                    is_primary=True,
+                )
+            ]
         )
 
     def _apply_hit_points(self) -> None:
@@ -107,18 +138,28 @@ class ClassBuilder(CharacterAttributesBuilder):
 
     def _apply_saving_throw_proficiencies(self) -> None:
         """Grant saving throw proficiencies from class."""
-        for ability_type in self.klass.saving_throws.all():
-            SavingThrowProficiency.objects.create(
-                character=self.character, ability_type=ability_type
-            )
+        klass = get_registry().classes.get(self.klass.pk)
+        names = [ability_type.pk for ability_type in klass.saving_throws.all()]
+        SavingThrowProficiency.objects.bulk_create(
+            SavingThrowProficiency(character=self.character, ability_type_id=name)
+            for name in names
+        )
+        # bulk_create bypasses the signals keeping the masks in sync.
+        self.character.saving_throw_proficiency_mask |= to_mask(ABILITY_BITS, names)
 
     def _apply_armor_proficiencies(self) -> None:
         """Grant armor proficiencies based on class armor type categories."""
         armor_types = self.klass.armor_proficiencies  # e.g., ["LA", "MA", "SH"]
         if not armor_types:
             return
-        for armor in ArmorSettings.objects.filter(armor_type__in=armor_types):
-            ArmorProficiency.objects.create(character=self.character, armor=armor)
+        names = [
+            armor.pk
+            for armor in get_registry().armor.filter(armor_type__in=armor_types)
+        ]
+        ArmorProficiency.objects.bulk_create(
+            ArmorProficiency(character=self.character, armor_id=name) for name in names
+        )
+        self.character.armor_proficiency_mask |= to_mask(ARMOR_BITS, names)
 
     def _apply_weapon_proficiencies(self) -> None:
         """Grant weapon proficiencies based on class weapon categories.
@@ -136,8 +177,15 @@ class ClassBuilder(CharacterAttributesBuilder):
             weapon_types.extend(["SM", "SR"])  # Simple Melee, Simple Ranged
         if "martial" in weapon_categories:
             weapon_types.extend(["MM", "MR"])  # Martial Melee, Martial Ranged
-        for weapon in WeaponSettings.objects.filter(weapon_type__in=weapon_types):
-            WeaponProficiency.objects.create(character=self.character, weapon=weapon)
+        names = [
+            weapon.pk
+            for weapon in get_registry().weapons.filter(weapon_type__in=weapon_types)
+        ]
+        WeaponProficiency.objects.bulk_create(
+            WeaponProficiency(character=self.character, weapon_id=name)
+            for name in names
+        )
+        self.character.weapon_proficiency_mask |= to_mask(WEAPON_BITS, names)
 
     def _add_starting_wealth(self) -> None:
         """Roll and add starting wealth from class."""
@@ -147,16 +195,18 @@ class ClassBuilder(CharacterAttributesBuilder):
 
     def _apply_class_features(self) -> None:
         """Grant level 1 class features to the character."""
-        level_1_features = self.klass.features.filter(level=1)
-        for feature in level_1_features:
-            CharacterFeature.objects.create(
+        CharacterFeature.objects.bulk_create(
+            CharacterFeature(
                 character=self.character,
                 class_feature=feature,
                 source_class=self.klass,
                 level_gained=1,
             )
+            for feature in get_registry().classes.get(self.klass.pk).features.all()
+            if feature.level == 1
+        )
 
-    def build(self) -> None:
+    def apply(self) -> None:
         self._create_character_class()
         self._apply_hit_points()
         self._apply_saving_throw_proficiencies()
@@ -164,36 +214,44 @@ class ClassBuilder(CharacterAttributesBuilder):
         self._apply_weapon_proficiencies()
         self._apply_class_features()
         self._add_starting_wealth()
-        self.character.save()
 
 
-class BackgroundBuilder:
+class BackgroundBuilder(CharacterAttributesBuilder):
     def __init__(self, character: Character) -> None:
         self.character = character
         self.background = character.background
 
     def _add_skill_proficiencies(self) -> None:
         skill_proficiencies = BACKGROUNDS[self.background]["skill_proficiencies"]
-        for skill in skill_proficiencies:
-            SkillProficiency.objects.create(
-                character=self.character, skill=Skill.objects.get(name=skill)
-            )
+        SkillProficiency.objects.bulk_create(
+            SkillProficiency(character=self.character, skill_id=skill)
+            for skill in skill_proficiencies
+        )
+        self.character.skill_proficiency_mask |= to_mask(
+            SKILL_BITS, skill_proficiencies
+        )
 
     def _add_tool_proficiency(self) -> None:
         """Grant tool proficiency from background."""
         tool_name = BACKGROUNDS[self.background].get("tool_proficiency")
         if tool_name:
-            tool = ToolSettings.objects.get(name=tool_name)
-            ToolProficiency.objects.create(character=self.character, tool=tool)
+            ToolProficiency.objects.create(character=self.character, tool_id=tool_name)
 
     def _add_origin_feat(self) -> None:
         """Grant origin feat from background."""
         feat_name = BACKGROUNDS[self.background].get("origin_feat")
         if feat_name:
-            feat = Feat.objects.get(name=feat_name)
-            CharacterFeat.objects.create(
-                character=self.character, feat=feat, granted_by="background"
+            CharacterFeat.objects.bulk_create(
+                [
+                    CharacterFeat(
+                        character=self.character,
+                        feat_id=feat_name,
+                        granted_by="background",
+                    )
+                ]
             )
+            # bulk_create bypasses the signal reloading memoized feat names.
+            invalidate_feats()
 
     def _add_starting_gold(self) -> None:
         """Add 50 GP starting equipment (2024 rules)."""
@@ -220,7 +278,7 @@ class BackgroundBuilder:
             list(BACKGROUNDS[self.background]["flaws"].values())
         )
 
-    def build(self) -> None:
+    def apply(self) -> None:
         self._add_skill_proficiencies()
         self._add_tool_proficiency()
         self._add_origin_feat()
@@ -229,53 +287,28 @@ class BackgroundBuilder:
         self._select_ideal()
         self._select_bond()
         self._select_flaw()
-        self.character.save()
 
 
 class DerivedStatsBuilder(CharacterAttributesBuilder):
-    """Calculate and apply derived statistics for a character.
+    """Compute every derived stat of a character: AC, speed, initiative...
 
-    Handles stats that depend on other character attributes being set:
-    - Passive Perception: 10 + WIS modifier + proficiency bonus (if proficient)
-    - Initiative is DEX modifier (computed property, no storage needed)
-    - AC is calculated when armor is equipped (handled by Inventory)
+    Applied after the builders creating the rows the derived stats depend on:
+    they bulk-create them, bypassing the signals keeping the stats up to date.
     """
 
-    def __init__(self, character: Character) -> None:
+    def __init__(self, character: Character, inputs: Inputs | None = None) -> None:
         self.character = character
+        self.inputs = inputs
 
-    def _calculate_passive_perception(self) -> int:
-        """Calculate passive Perception score.
-
-        Formula: 10 + Wisdom modifier + proficiency bonus (if proficient in Perception)
-        """
-        base = 10
-        wis_mod = self.character.wisdom.modifier
-
-        # Check if character has Perception proficiency
-        has_perception_proficiency = SkillProficiency.objects.filter(
-            character=self.character, skill__name=SkillName.PERCEPTION
-        ).exists()
-
-        proficiency_bonus = (
-            self.character.proficiency_bonus if has_perception_proficiency else 0
-        )
-
-        return base + wis_mod + proficiency_bonus
-
-    def build(self) -> None:
-        # Passive perception is a derived stat that we store for convenience
-        # It's used frequently for stealth checks and hidden enemies
-        # Note: We don't have a field for this yet, so this is calculated on demand
-        # If needed, add a passive_perception field to Character model
-        pass
+    def apply(self) -> None:
+        update_derived_stats(self.character, loaded=self.inputs)
 
 
 class SpellcastingBuilder(CharacterAttributesBuilder):
     """Set up spellcasting for classes that have spell slots.
 
     Only runs for classes with a ClassSpellcasting configuration.
-    Creates CharacterSpellSlot records based on the SpellSlotTable.
+    Creates CharacterSpellSlot records from the spell slot matrix.
     """
 
     def __init__(self, character: Character, klass: Class) -> None:
@@ -287,7 +320,8 @@ class SpellcastingBuilder(CharacterAttributesBuilder):
         """Get the ClassSpellcasting config for this class, if it exists."""
         if self._spellcasting is None:
             try:
-                self._spellcasting = self.klass.spellcasting
+                klass = get_registry().classes.get(self.klass.pk)
+                self._spellcasting = klass.spellcasting
             except ClassSpellcasting.DoesNotExist:
                 pass
         return self._spellcasting
@@ -298,46 +332,24 @@ class SpellcastingBuilder(CharacterAttributesBuilder):
         return config is not None and config.is_caster
 
     def _setup_spell_slots(self) -> None:
-        """Create CharacterSpellSlot records based on class level."""
-        char_class = self.character.character_classes.get(klass=self.klass)
-        class_level = char_class.level
+        """Create CharacterSpellSlot records from the in-memory slot matrix.
 
-        # Get spell slots for this class and level from the reference table
-        slot_data = SpellSlotTable.objects.filter(
-            class_name=self.klass.name, class_level=class_level
-        )
-
-        for slot in slot_data:
-            if slot.slots > 0:
-                CharacterSpellSlot.objects.create(
-                    character=self.character,
-                    slot_level=slot.slot_level,
-                    total=slot.slots,
-                    used=0,
-                )
+        Multiclass characters get their combined slots from the Multiclass
+        Spellcaster table.
+        """
+        sync_spell_slots(self.character)
 
     def _setup_warlock_pact_magic(self) -> None:
         """Set up Warlock's Pact Magic spell slots."""
         char_class = self.character.character_classes.get(klass=self.klass)
-        class_level = char_class.level
-
-        # Warlock Pact Magic progression
-        # Level 1: 1 slot at level 1
-        # Level 2: 2 slots at level 1
-        # Level 3-4: 2 slots at level 2
-        # Level 5-6: 2 slots at level 3
-        # etc.
-        if class_level >= 1:
-            slots = 1 if class_level == 1 else 2
-            slot_level = min((class_level + 1) // 2, 5)  # Max level 5 slots
-            WarlockSpellSlot.objects.create(
+        slots, slot_level = get_spell_slot_matrix().pact_magic(char_class.level)
+        if slots:
+            WarlockSpellSlot.objects.update_or_create(
                 character=self.character,
-                slot_level=slot_level,
-                total=slots,
-                used=0,
+                defaults={"slot_level": slot_level, "total": slots},
             )
 
-    def build(self) -> None:
+    def apply(self) -> None:
         """Set up spellcasting if the class supports it."""
         if not self._is_spellcaster():
             return
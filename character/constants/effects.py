@@ -0,0 +1,144 @@
+"""Declarative effects of conditions, species traits and feats.
+
+Each rule grants an effect to the creature having its source. Roll effects
+apply to the roll types, abilities and threats they list (an empty tuple or
+None means any); speed effects have no roll dimension. Rules are compiled
+into lookup tables by character.effects.
+"""
+
+from typing import NamedTuple
+
+from django.db.models import TextChoices
+
+from game.constants.events import Against, RollType
+
+from .abilities import AbilityName
+from .conditions import ConditionName
+from .species import SpeciesTraitName
+
+
+class Effect(TextChoices):
+    ADVANTAGE = "advantage", "Advantage"
+    DISADVANTAGE = "disadvantage", "Disadvantage"
+    AUTO_FAIL = "auto_fail", "Automatic failure"
+    SPEED_ZERO = "speed_zero", "Speed 0"
+    SPEED_HALVED = "speed_halved", "Speed halved"
+
+
+SPEED_EFFECTS = (Effect.SPEED_ZERO, Effect.SPEED_HALVED)
+
+
+class EffectSource(TextChoices):
+    CONDITION = "condition", "Condition"
+    SPECIES_TRAIT = "species_trait", "Species trait"
+    FEAT = "feat", "Feat"
+
+
+class EffectRule(NamedTuple):
+    source: EffectSource
+    name: str
+    effect: Effect
+    roll_types: tuple[RollType, ...] = ()
+    abilities: tuple[AbilityName, ...] = ()
+    against: Against | None = None
+    # Minimum level of the source (Exhaustion levels), 0 if not leveled
+    level: int = 0
+
+
+_STR_DEX = (AbilityName.STRENGTH, AbilityName.DEXTERITY)
+
+
+def _condition(name: ConditionName, effect: Effect, *roll_types, **kwargs):
+    return EffectRule(EffectSource.CONDITION, name, effect, roll_types, **kwargs)
+
+
+def _trait(name: SpeciesTraitName, effect: Effect, *roll_types, **kwargs):
+    return EffectRule(EffectSource.SPECIES_TRAIT, name, effect, roll_types, **kwargs)
+
+
+EFFECT_RULES: tuple[EffectRule, ...] = (
+    # Species traits
+    _trait(
+        SpeciesTraitName.DWARVEN_RESILIENCE,
+        Effect.ADVANTAGE,
+        RollType.SAVING_THROW,
+        against=Against.POISON,
+    ),
+    _trait(
+        SpeciesTraitName.FEY_ANCESTRY,
+        Effect.ADVANTAGE,
+        RollType.SAVING_THROW,
+        against=Against.CHARM,
+    ),
+    _trait(
+        SpeciesTraitName.BRAVE,
+        Effect.ADVANTAGE,
+        RollType.SAVING_THROW,
+        against=Against.BEING_FRIGHTENED,
+    ),
+    # Conditions
+    _condition(ConditionName.BLINDED, Effect.DISADVANTAGE, RollType.ATTACK),
+    _condition(
+        ConditionName.EXHAUSTION, Effect.DISADVANTAGE, RollType.ABILITY_CHECK, level=1
+    ),
+    _condition(ConditionName.EXHAUSTION, Effect.SPEED_HALVED, level=2),
+    _condition(
+        ConditionName.EXHAUSTION,
+        Effect.DISADVANTAGE,
+        RollType.ATTACK,
+        RollType.SAVING_THROW,
+        level=3,
+    ),
+    _condition(ConditionName.EXHAUSTION, Effect.SPEED_ZERO, level=5),
+    _condition(
+        ConditionName.FRIGHTENED,
+        Effect.DISADVANTAGE,
+        RollType.ABILITY_CHECK,
+        RollType.ATTACK,
+    ),
+    _condition(ConditionName.GRAPPLED, Effect.SPEED_ZERO),
+    _condition(ConditionName.INVISIBLE, Effect.ADVANTAGE, RollType.ATTACK),
+    _condition(
+        ConditionName.PARALYZED,
+        Effect.AUTO_FAIL,
+        RollType.SAVING_THROW,
+        abilities=_STR_DEX,
+    ),
+    _condition(ConditionName.PARALYZED, Effect.SPEED_ZERO),
+    _condition(
+        ConditionName.PETRIFIED,
+        Effect.AUTO_FAIL,
+        RollType.SAVING_THROW,
+        abilities=_STR_DEX,
+    ),
+    _condition(ConditionName.PETRIFIED, Effect.SPEED_ZERO),
+    _condition(
+        ConditionName.POISONED,
+        Effect.DISADVANTAGE,
+        RollType.ABILITY_CHECK,
+        RollType.ATTACK,
+    ),
+    _condition(ConditionName.PRONE, Effect.DISADVANTAGE, RollType.ATTACK),
+    _condition(ConditionName.RESTRAINED, Effect.DISADVANTAGE, RollType.ATTACK),
+    _condition(
+        ConditionName.RESTRAINED,
+        Effect.DISADVANTAGE,
+        RollType.SAVING_THROW,
+        abilities=(AbilityName.DEXTERITY,),
+    ),
+    _condition(ConditionName.RESTRAINED, Effect.SPEED_ZERO),
+    _condition(
+        ConditionName.STUNNED,
+        Effect.AUTO_FAIL,
+        RollType.SAVING_THROW,
+        abilities=_STR_DEX,
+    ),
+    _condition(ConditionName.STUNNED, Effect.SPEED_ZERO),
+    _condition(
+        ConditionName.UNCONSCIOUS,
+        Effect.AUTO_FAIL,
+        RollType.SAVING_THROW,
+        abilities=_STR_DEX,
+    ),
+    _condition(ConditionName.UNCONSCIOUS, Effect.SPEED_ZERO),
+)
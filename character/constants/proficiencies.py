@@ -0,0 +1,30 @@
+"""Bit layouts of the proficiency and disadvantage masks stored on Character.
+
+Each member of an enum owns the bit at its declaration index, so new members
+must be appended to keep the stored masks valid.
+"""
+
+from enum import EnumType
+
+from equipment.constants.equipment import ArmorName, WeaponName
+
+from .abilities import AbilityName
+from .skills import SkillName
+
+
+def _bits(enum: EnumType) -> dict[str, int]:
+    return {member.value: 1 << index for index, member in enumerate(enum)}
+
+
+ABILITY_BITS = _bits(AbilityName)
+SKILL_BITS = _bits(SkillName)
+ARMOR_BITS = _bits(ArmorName)
+WEAPON_BITS = _bits(WeaponName)
+
+
+def to_mask(bits: dict[str, int], names) -> int:
+    """Combine the bits of several names into a mask, ignoring unknown names."""
+    mask = 0
+    for name in names:
+        mask |= bits.get(name, 0)
+    return mask
@@ -0,0 +1,336 @@
+"""Derived stats of a character, stored on ``Character`` and kept up to date.
+
+Each derived stat is computed from some inputs: ability scores, level,
+species, class, skill proficiencies, feats, worn armor, conditions, active
+spell effects, magic items and the carried weight. DERIVED_STATS declares the inputs of each
+stat, and is compiled once, at import, into the stats depending on each
+input. When an input changes, only the stats depending on it are recomputed
+and saved; the others keep their stored value.
+
+The inputs of a recomputation are loaded lazily, once: recomputing the
+speed after a change of armor does not load the spell effects of the
+character.
+
+``character.signals`` refreshes the stats when a row holding one of their
+inputs is saved or deleted. Code bypassing the signals (bulk inserts, the
+creation pipeline) refreshes them explicitly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from django.db.models import Sum
+
+from equipment.constants.equipment import ArmorType
+from equipment.models.equipment import Armor, ArmorSettings
+from equipment.models.magic_items import MagicItem
+from game.constants.events import RollType
+from magic.models.spell_effects import ActiveSpellEffect
+from utils.registry import get_registry
+
+from .constants.abilities import AbilityName
+from .constants.feats import FeatName
+from .constants.races import Size
+from .constants.skills import SkillName
+from .constants.species import SpeciesTraitName
+
+if TYPE_CHECKING:
+    from .models.character import Character
+
+UNARMORED_AC = 10
+DEFAULT_SPEED = 30
+HEAVY_ARMOR_SPEED_PENALTY = 10
+CARRYING_CAPACITY_PER_STRENGTH = 15  # In pounds
+CARRYING_CAPACITY_SIZE_MULTIPLIERS = {Size.SMALL: 1, Size.MEDIUM: 1}
+# Powerful Build counts as one size larger: a Medium creature carries as Large.
+POWERFUL_BUILD_MULTIPLIER = 2
+PASSIVE_CHECK_BASE = 10
+PASSIVE_CHECK_ADVANTAGE = 5
+SPELL_SAVE_DC_BASE = 8
+
+
+class Input(StrEnum):
+    """What derived stats are computed from."""
+
+    ABILITIES = "abilities"
+    LEVEL = "level"
+    SPECIES = "species"
+    CLASS = "class"
+    SKILLS = "skills"
+    FEATS = "feats"
+    ARMOR = "armor"
+    CONDITIONS = "conditions"
+    SPELL_EFFECTS = "spell_effects"
+    MAGIC_ITEMS = "magic_items"
+    LOAD = "load"
+
+
+class Inputs:
+    """The inputs of a character's derived stats, each loaded on first use."""
+
+    def __init__(self, character: Character) -> None:
+        self.character = character
+
+    @classmethod
+    def of_new_character(cls, character: Character) -> Inputs:
+        """Inputs of a character being created, which has no active spell
+        effects nor magic items yet: they are not loaded."""
+        inputs = cls(character)
+        inputs.spell_effects_ac_modifier = 0
+        inputs.magic_items_ac_bonus = 0
+        return inputs
+
+    @cached_property
+    def armor(self) -> list[ArmorSettings]:
+        """Settings of the armor and shields in the character's inventory."""
+        if self.character.inventory_id is None:
+            return []
+        table = get_registry().armor
+        return [
+            table.get(name)
+            for name in Armor.objects.filter(
+                inventory_id=self.character.inventory_id
+            ).values_list("settings_id", flat=True)
+        ]
+
+    @cached_property
+    def body_armor(self) -> ArmorSettings | None:
+        """The armor worn: the one granting the best AC, if any."""
+        dex_modifier = self.character.dexterity.modifier
+        return max(
+            (armor for armor in self.armor if armor.armor_type != ArmorType.SHIELD),
+            key=lambda armor: armor.armor_class(dex_modifier),
+            default=None,
+        )
+
+    @cached_property
+    def shield_bonus(self) -> int:
+        return max(
+            (
+                armor.ac_bonus
+                for armor in self.armor
+                if armor.armor_type == ArmorType.SHIELD
+            ),
+            default=0,
+        )
+
+    @cached_property
+    def spell_effects_ac_modifier(self) -> int:
+        return (
+            ActiveSpellEffect.objects.filter(character_id=self.character.pk).aggregate(
+                total=Sum("template__ac_modifier")
+            )["total"]
+            or 0
+        )
+
+    @cached_property
+    def magic_items_ac_bonus(self) -> int:
+        """AC granted by the magic items in use: attuned, or not requiring it."""
+        if self.character.inventory_id is None:
+            return 0
+        table = get_registry().magic_items
+        bonus = 0
+        for name, attuned_by in MagicItem.objects.filter(
+            inventory_id=self.character.inventory_id
+        ).values_list("settings_id", "attunement__character_id"):
+            settings = table.get(name)
+            if settings.requires_attunement and attuned_by != self.character.pk:
+                continue
+            bonus += settings.effects.get("ac_bonus", 0)
+        return bonus
+
+    @cached_property
+    def carried_weight(self) -> int:
+        """Weight carried, in pounds, maintained by the inventory."""
+        if self.character.inventory_id is None:
+            return 0
+        return self.character.inventory.weight
+
+    @cached_property
+    def spellcasting_modifier(self) -> int:
+        """Modifier of the spellcasting ability of the primary class, if any."""
+        # game.spell depends on the character models.
+        from game.spell import SPELLCASTING_ABILITY_MAP
+
+        klass = None
+        for char_class in self.character.character_classes.all():
+            if char_class.is_primary:
+                klass = get_registry().classes.get(char_class.klass_id)
+                break
+        spellcasting = getattr(klass, "spellcasting", None)
+        if spellcasting is None or not spellcasting.is_caster:
+            return 0
+        ability_name = SPELLCASTING_ABILITY_MAP.get(spellcasting.spellcasting_ability)
+        ability = self.character.stats.get(ability_name)
+        return ability.modifier if ability else 0
+
+
+def _armor_class(inputs: Inputs) -> int:
+    character = inputs.character
+    dex_modifier = character.dexterity.modifier
+    if inputs.body_armor is None:
+        ac = UNARMORED_AC + dex_modifier
+    else:
+        ac = inputs.body_armor.armor_class(dex_modifier)
+    return (
+        ac
+        + inputs.shield_bonus
+        + inputs.spell_effects_ac_modifier
+        + inputs.magic_items_ac_bonus
+    )
+
+
+def _speed(inputs: Inputs) -> int:
+    character = inputs.character
+    if character.species_id is None:
+        speed = DEFAULT_SPEED
+    else:
+        speed = get_registry().species.get(character.species_id).speed
+    armor = inputs.body_armor
+    if armor is not None and character.strength.score < armor.strength_requirement:
+        speed -= HEAVY_ARMOR_SPEED_PENALTY
+    return speed
+
+
+def _initiative(inputs: Inputs) -> int:
+    character = inputs.character
+    initiative = character.dexterity.modifier
+    if character.has_feat(FeatName.ALERT):
+        initiative += character.proficiency_bonus
+    return initiative
+
+
+def _passive_perception(inputs: Inputs) -> int:
+    character = inputs.character
+    score = PASSIVE_CHECK_BASE + character.wisdom.modifier
+    if character.is_proficient_in_skill(SkillName.PERCEPTION):
+        score += character.proficiency_bonus
+    effects = character.roll_effects(RollType.ABILITY_CHECK, AbilityName.WISDOM)
+    if effects.advantage and not effects.disadvantage:
+        score += PASSIVE_CHECK_ADVANTAGE
+    elif effects.disadvantage and not effects.advantage:
+        score -= PASSIVE_CHECK_ADVANTAGE
+    return score
+
+
+def _carrying_capacity(inputs: Inputs) -> int:
+    character = inputs.character
+    multiplier = CARRYING_CAPACITY_SIZE_MULTIPLIERS.get(character.size, 1)
+    if SpeciesTraitName.POWERFUL_BUILD in character.species_traits:
+        multiplier = POWERFUL_BUILD_MULTIPLIER
+    return character.strength.score * CARRYING_CAPACITY_PER_STRENGTH * multiplier
+
+
+def _encumbered(inputs: Inputs) -> bool:
+    return inputs.carried_weight > _carrying_capacity(inputs)
+
+
+def _spell_save_dc(inputs: Inputs) -> int:
+    return (
+        SPELL_SAVE_DC_BASE
+        + inputs.character.proficiency_bonus
+        + inputs.spellcasting_modifier
+    )
+
+
+@dataclass(frozen=True)
+class DerivedStat:
+    """How a derived stat is computed, and from which inputs."""
+
+    inputs: frozenset[Input]
+    compute: Callable[[Inputs], int | bool]
+
+
+# Character field -> derived stat
+DERIVED_STATS: dict[str, DerivedStat] = {
+    "ac": DerivedStat(
+        frozenset(
+            {Input.ABILITIES, Input.ARMOR, Input.SPELL_EFFECTS, Input.MAGIC_ITEMS}
+        ),
+        _armor_class,
+    ),
+    "speed": DerivedStat(
+        frozenset({Input.ABILITIES, Input.SPECIES, Input.ARMOR}), _speed
+    ),
+    "initiative": DerivedStat(
+        frozenset({Input.ABILITIES, Input.LEVEL, Input.FEATS}), _initiative
+    ),
+    # Species traits, feats and conditions may grant advantage or disadvantage.
+    "passive_perception": DerivedStat(
+        frozenset(
+            {
+                Input.ABILITIES,
+                Input.LEVEL,
+                Input.SKILLS,
+                Input.SPECIES,
+                Input.FEATS,
+                Input.CONDITIONS,
+            }
+        ),
+        _passive_perception,
+    ),
+    "carrying_capacity": DerivedStat(
+        frozenset({Input.ABILITIES, Input.SPECIES}), _carrying_capacity
+    ),
+    "encumbered": DerivedStat(
+        frozenset({Input.ABILITIES, Input.SPECIES, Input.LOAD}), _encumbered
+    ),
+    "spell_save_dc": DerivedStat(
+        frozenset({Input.ABILITIES, Input.LEVEL, Input.CLASS}), _spell_save_dc
+    ),
+}
+
+# Input -> fields of the derived stats depending on it
+DEPENDENTS: dict[Input, tuple[str, ...]] = {
+    input_: tuple(
+        field for field, stat in DERIVED_STATS.items() if input_ in stat.inputs
+    )
+    for input_ in Input
+}
+
+
+def derived_fields(inputs: Iterable[Input] = Input) -> list[str]:
+    """Return the fields of the derived stats depending on any of the inputs."""
+    fields = set()
+    for input_ in inputs:
+        fields.update(DEPENDENTS[input_])
+    return [field for field in DERIVED_STATS if field in fields]
+
+
+def update_derived_stats(
+    character: Character,
+    inputs: Iterable[Input] = Input,
+    loaded: Inputs | None = None,
+) -> list[str]:
+    """Recompute in memory the derived stats depending on the changed inputs.
+
+    ``loaded`` reuses inputs already loaded (or known) by the caller.
+    Returns the fields whose value changed.
+    """
+    if loaded is None:
+        loaded = Inputs(character)
+    changed = []
+    for field in derived_fields(inputs):
+        value = DERIVED_STATS[field].compute(loaded)
+        if getattr(character, field) != value:
+            setattr(character, field, value)
+            changed.append(field)
+    return changed
+
+
+def refresh_derived_stats(
+    character: Character, inputs: Iterable[Input] = Input
+) -> list[str]:
+    """Recompute the derived stats depending on the changed inputs and save them.
+
+    Only the fields whose value changed are written.
+    """
+    changed = update_derived_stats(character, inputs)
+    if changed and character.pk is not None:
+        character.save(update_fields=changed)
+    return changed
@@ -0,0 +1,116 @@
+"""Lookup tables compiled from the declarative effect rules.
+
+EFFECT_RULES are compiled once, at import, into one table entry per
+(roll type, ability, against) combination listing the sources granting each
+effect. Resolving the effects of a roll is then a dictionary lookup and a few
+set intersections with the creature's sources (its conditions, species
+traits and feats), with no query per condition.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import product
+
+from game.constants.events import Against, RollType
+
+from .constants.abilities import AbilityName
+from .constants.effects import (
+    EFFECT_RULES,
+    SPEED_EFFECTS,
+    Effect,
+    EffectRule,
+    EffectSource,
+)
+
+# (source type, source name, level): e.g. ("condition", "exhaustion", 2)
+Source = tuple[str, str, int]
+RollKey = tuple[int, str | None, str | None]
+
+
+def condition_sources(name: str, level: int | None = None) -> set[Source]:
+    """Sources granted by a condition; leveled conditions grant every level up to theirs."""
+    sources = {(EffectSource.CONDITION, name, 0)}
+    for lvl in range(1, (level or 0) + 1):
+        sources.add((EffectSource.CONDITION, name, lvl))
+    return sources
+
+
+def compile_roll_effects(
+    rules: Iterable[EffectRule],
+) -> dict[RollKey, dict[Effect, frozenset[Source]]]:
+    """Compile roll rules into a table keyed by (roll type, ability, against).
+
+    A None ability or threat stands for an unspecified one: only the rules
+    not restricted to an ability (resp. a threat) match it.
+    """
+    rules = [rule for rule in rules if rule.effect not in SPEED_EFFECTS]
+    table = {}
+    for roll_type, ability, against in product(
+        RollType, [*AbilityName, None], [*Against, None]
+    ):
+        effects: dict[Effect, set[Source]] = {}
+        for rule in rules:
+            if rule.roll_types and roll_type not in rule.roll_types:
+                continue
+            if rule.abilities and ability not in rule.abilities:
+                continue
+            if rule.against is not None and rule.against != against:
+                continue
+            effects.setdefault(rule.effect, set()).add(
+                (rule.source, rule.name, rule.level)
+            )
+        table[(roll_type, ability, against)] = {
+            effect: frozenset(sources) for effect, sources in effects.items()
+        }
+    return table
+
+
+def compile_speed_effects(
+    rules: Iterable[EffectRule],
+) -> dict[Effect, frozenset[Source]]:
+    """Compile speed rules into the sources granting each speed effect."""
+    table: dict[Effect, set[Source]] = {effect: set() for effect in SPEED_EFFECTS}
+    for rule in rules:
+        if rule.effect in SPEED_EFFECTS:
+            table[rule.effect].add((rule.source, rule.name, rule.level))
+    return {effect: frozenset(sources) for effect, sources in table.items()}
+
+
+ROLL_EFFECTS = compile_roll_effects(EFFECT_RULES)
+SPEED_EFFECT_SOURCES = compile_speed_effects(EFFECT_RULES)
+
+
+@dataclass(frozen=True, slots=True)
+class RollEffects:
+    """Effects applying to a roll."""
+
+    advantage: bool = False
+    disadvantage: bool = False
+    auto_fail: bool = False
+
+
+def get_roll_effects(
+    sources: frozenset[Source],
+    roll_type: int,
+    ability: str | None = None,
+    against: str | None = None,
+) -> RollEffects:
+    """Return the effects granted by a set of sources to a roll."""
+    effects = ROLL_EFFECTS.get((roll_type, ability or None, against or None), {})
+    if not effects or not sources:
+        return RollEffects()
+    empty = frozenset()
+    return RollEffects(
+        advantage=not effects.get(Effect.ADVANTAGE, empty).isdisjoint(sources),
+        disadvantage=not effects.get(Effect.DISADVANTAGE, empty).isdisjoint(sources),
+        auto_fail=not effects.get(Effect.AUTO_FAIL, empty).isdisjoint(sources),
+    )
+
+
+def get_speed(sources: frozenset[Source], base_speed: int) -> int:
+    """Return a speed after applying the speed effects of a set of sources."""
+    if not SPEED_EFFECT_SOURCES[Effect.SPEED_ZERO].isdisjoint(sources):
+        return 0
+    if not SPEED_EFFECT_SOURCES[Effect.SPEED_HALVED].isdisjoint(sources):
+        return base_speed // 2
+    return base_speed
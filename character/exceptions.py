@@ -1,2 +1,6 @@
 class CharacterAttributeError(Exception):
     pass
+
+
+class CharacterImportError(Exception):
+    pass
@@ -2,7 +2,7 @@ from django import forms
 
 from ..constants.backgrounds import Background
 from equipment.constants.equipment import GearType, ToolType
-from equipment.models.equipment import GearSettings, ToolSettings
+from utils.registry import get_registry
 
 
 def _get_holy_symbols() -> set[tuple[str, str]]:
@@ -11,7 +11,7 @@ def _get_holy_symbols() -> set[tuple[str, str]]:
     """
     return {
         (gear.name, gear.get_name_display())
-        for gear in GearSettings.objects.filter(gear_type=GearType.HOLY_SYMBOL)
+        for gear in get_registry().gear.filter(gear_type=GearType.HOLY_SYMBOL)
     }
 
 
@@ -21,7 +21,7 @@ def _get_gaming_set_tools() -> set[tuple[str, str]]:
     """
     return {
         (tool.name, tool.get_name_display())
-        for tool in ToolSettings.objects.filter(tool_type=ToolType.GAMING_SET)
+        for tool in get_registry().tools.filter(tool_type=ToolType.GAMING_SET)
     }
 
 
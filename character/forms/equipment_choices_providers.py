@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 
-from django.db.models import Q
-
+from character.constants.classes import ClassName
 from equipment.constants.equipment import (
     ArmorName,
     GearName,
@@ -10,20 +9,45 @@ from equipment.constants.equipment import (
     WeaponType,
     PackName,
 )
-from equipment.models.equipment import (
-    ArmorSettings,
-    GearSettings,
-    PackSettings,
-    WeaponSettings,
-)
+from utils.registry import Table, get_registry
+
+
+def _choices(rows: tuple) -> set[tuple[str, str]]:
+    return {(row.name, row.name) for row in rows}
+
+
+def _union(*row_sets: tuple) -> set[tuple[str, str]]:
+    return set().union(*(_choices(rows) for rows in row_sets))
 
 
 class EquipmentChoicesProvider(ABC):
     """
     Provides methods to get equipment choices per character's class,
     in post creation form.
+
+    Choices are read from the reference data registry, without queries.
     """
 
+    @property
+    def weapons(self) -> Table:
+        return get_registry().weapons
+
+    @property
+    def armor(self) -> Table:
+        return get_registry().armor
+
+    @property
+    def gear(self) -> Table:
+        return get_registry().gear
+
+    @property
+    def packs(self) -> Table:
+        return get_registry().packs
+
+    def get_choices(self, field: str):
+        """Return the choices of an equipment form field (e.g. "first_weapon")."""
+        return getattr(self, f"get_{field}_choices")()
+
     @abstractmethod
     def get_first_weapon_choices(self):
         pass
@@ -51,70 +75,60 @@ class EquipmentChoicesProvider(ABC):
 
 class ClericEquipmentChoicesProvider(EquipmentChoicesProvider):
     def get_first_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.MACE) | Q(name=WeaponName.WARHAMMER)
+        return _choices(
+            self.weapons.filter(name__in=[WeaponName.MACE, WeaponName.WARHAMMER])
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_second_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.CROSSBOW_LIGHT)
-            | Q(weapon_type=WeaponType.SIMPLE_MELEE)
-            | Q(weapon_type=WeaponType.SIMPLE_RANGED)
+        return _union(
+            self.weapons.filter(name=WeaponName.CROSSBOW_LIGHT),
+            self.weapons.filter(
+                weapon_type__in=[WeaponType.SIMPLE_MELEE, WeaponType.SIMPLE_RANGED]
+            ),
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_third_weapon_choices(self):
         pass
 
     def get_armor_choices(self):
-        queryset = ArmorSettings.objects.filter(
-            Q(name=ArmorName.SCALE_MAIL)
-            | Q(name=ArmorName.LEATHER)
-            | Q(name=ArmorName.CHAIN_MAIL)
+        return _choices(
+            self.armor.filter(
+                name__in=[ArmorName.SCALE_MAIL, ArmorName.LEATHER, ArmorName.CHAIN_MAIL]
+            )
         )
-        choices = {armor + armor for armor in queryset.values_list("name")}
-        return choices
 
     def get_gear_choices(self):
-        queryset = GearSettings.objects.filter(Q(gear_type=GearType.HOLY_SYMBOL))
-        choices = {gear + gear for gear in queryset.values_list("name")}
-        return choices
+        return _choices(self.gear.filter(gear_type=GearType.HOLY_SYMBOL))
 
     def get_pack_choices(self):
-        queryset = PackSettings.objects.filter(
-            Q(name=PackName.PRIESTS_PACK) | Q(name=PackName.EXPLORERS_PACK)
+        return _choices(
+            self.packs.filter(name__in=[PackName.PRIESTS_PACK, PackName.EXPLORERS_PACK])
         )
-        choices = {armor + armor for armor in queryset.values_list("name")}
-        return choices
 
 
 class FighterEquipmentChoicesProvider(EquipmentChoicesProvider):
     def get_first_weapon_choices(self):
         choices = set()
-        chain_mail = ArmorSettings.objects.get(name=ArmorName.CHAIN_MAIL).name
+        chain_mail = self.armor.get(ArmorName.CHAIN_MAIL).name
         choices.add((chain_mail, chain_mail))
-        leather = ArmorSettings.objects.get(name=ArmorName.LEATHER).name
-        longbow = WeaponSettings.objects.get(name=WeaponName.LONGBOW).name
+        leather = self.armor.get(ArmorName.LEATHER).name
+        longbow = self.weapons.get(WeaponName.LONGBOW).name
         choices.add((f"{leather} & {longbow}", f"{leather} & {longbow}"))
         return choices
 
     def get_second_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(weapon_type=WeaponType.MARTIAL_MELEE)
-            | Q(weapon_type=WeaponType.MARTIAL_RANGED)
+        return _choices(
+            self.weapons.filter(
+                weapon_type__in=[WeaponType.MARTIAL_MELEE, WeaponType.MARTIAL_RANGED]
+            )
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_third_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.CROSSBOW_LIGHT) | Q(name=WeaponName.HANDAXE)
+        return _choices(
+            self.weapons.filter(
+                name__in=[WeaponName.CROSSBOW_LIGHT, WeaponName.HANDAXE]
+            )
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_armor_choices(self):
         pass
@@ -123,27 +137,23 @@ class FighterEquipmentChoicesProvider(EquipmentChoicesProvider):
         pass
 
     def get_pack_choices(self):
-        queryset = PackSettings.objects.filter(
-            Q(name=PackName.DUNGEONEERS_PACK) | Q(name=PackName.EXPLORERS_PACK)
+        return _choices(
+            self.packs.filter(
+                name__in=[PackName.DUNGEONEERS_PACK, PackName.EXPLORERS_PACK]
+            )
         )
-        choices = {armor + armor for armor in queryset.values_list("name")}
-        return choices
 
 
 class RogueEquipmentChoicesProvider(EquipmentChoicesProvider):
     def get_first_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.RAPIER) | Q(name=WeaponName.SHORTSWORD)
+        return _choices(
+            self.weapons.filter(name__in=[WeaponName.RAPIER, WeaponName.SHORTSWORD])
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_second_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.SHORTBOW) | Q(name=WeaponName.SHORTSWORD)
+        return _choices(
+            self.weapons.filter(name__in=[WeaponName.SHORTBOW, WeaponName.SHORTSWORD])
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_third_weapon_choices(self):
         pass
@@ -155,22 +165,22 @@ class RogueEquipmentChoicesProvider(EquipmentChoicesProvider):
         pass
 
     def get_pack_choices(self):
-        queryset = PackSettings.objects.filter(
-            Q(name=PackName.BURGLARS_PACK)
-            | Q(name=PackName.DUNGEONEERS_PACK)
-            | Q(name=PackName.EXPLORERS_PACK)
+        return _choices(
+            self.packs.filter(
+                name__in=[
+                    PackName.BURGLARS_PACK,
+                    PackName.DUNGEONEERS_PACK,
+                    PackName.EXPLORERS_PACK,
+                ]
+            )
         )
-        choices = {armor + armor for armor in queryset.values_list("name")}
-        return choices
 
 
 class WizardEquipmentChoicesProvider(EquipmentChoicesProvider):
     def get_first_weapon_choices(self):
-        queryset = WeaponSettings.objects.filter(
-            Q(name=WeaponName.QUARTERSTAFF) | Q(name=WeaponName.DAGGER)
+        return _choices(
+            self.weapons.filter(name__in=[WeaponName.QUARTERSTAFF, WeaponName.DAGGER])
         )
-        choices = {weapon + weapon for weapon in queryset.values_list("name")}
-        return choices
 
     def get_second_weapon_choices(self):
         pass
@@ -182,15 +192,37 @@ class WizardEquipmentChoicesProvider(EquipmentChoicesProvider):
         pass
 
     def get_gear_choices(self):
-        queryset = GearSettings.objects.filter(
-            Q(name=GearName.COMPONENT_POUCH) | Q(gear_type=GearType.ARCANE_FOCUS)
+        return _union(
+            self.gear.filter(name=GearName.COMPONENT_POUCH),
+            self.gear.filter(gear_type=GearType.ARCANE_FOCUS),
         )
-        choices = {gear + gear for gear in queryset.values_list("name")}
-        return choices
 
     def get_pack_choices(self):
-        queryset = PackSettings.objects.filter(
-            Q(name=PackName.SCHOLARS_PACK) | Q(name=PackName.EXPLORERS_PACK)
+        return _choices(
+            self.packs.filter(
+                name__in=[PackName.SCHOLARS_PACK, PackName.EXPLORERS_PACK]
+            )
         )
-        choices = {armor + armor for armor in queryset.values_list("name")}
-        return choices
+
+
+# Class -> (choices provider, equipment form fields, in display order)
+CLASS_EQUIPMENT_CHOICES: dict[
+    str, tuple[type[EquipmentChoicesProvider], tuple[str, ...]]
+] = {
+    ClassName.CLERIC: (
+        ClericEquipmentChoicesProvider,
+        ("first_weapon", "second_weapon", "armor", "gear", "pack"),
+    ),
+    ClassName.FIGHTER: (
+        FighterEquipmentChoicesProvider,
+        ("first_weapon", "second_weapon", "third_weapon", "pack"),
+    ),
+    ClassName.ROGUE: (
+        RogueEquipmentChoicesProvider,
+        ("first_weapon", "second_weapon", "pack"),
+    ),
+    ClassName.WIZARD: (
+        WizardEquipmentChoicesProvider,
+        ("first_weapon", "gear", "pack"),
+    ),
+}
@@ -14,19 +14,13 @@ Character creation wizard forms.
 from django import forms
 
 from ..constants.abilities import AbilityScore
-from ..constants.backgrounds import BACKGROUNDS, Background
+from ..constants.backgrounds import Background
 from ..constants.classes import ClassName
 from ..constants.skills import SkillName
 from ..models.character import Character
 from ..models.classes import Class
-from ..models.feats import Feat
 from ..models.species import Species
-from .equipment_choices_providers import (
-    ClericEquipmentChoicesProvider,
-    FighterEquipmentChoicesProvider,
-    RogueEquipmentChoicesProvider,
-    WizardEquipmentChoicesProvider,
-)
+from ..wizard_data import get_wizard_data
 from .mixins import NoDuplicateValuesFormMixin
 
 # Common widget classes
@@ -37,7 +31,7 @@ class SpeciesSelectForm(forms.Form):
     """Step 1: Species selection with racial trait preview data."""
 
     species = forms.ModelChoiceField(
-        queryset=Species.objects.all().prefetch_related("traits", "languages"),
+        queryset=Species.objects.all(),
         widget=forms.Select(attrs=DROPDOWN_ATTRS),
         label="Species",
         empty_label="---------",
@@ -45,32 +39,14 @@ class SpeciesSelectForm(forms.Form):
 
     def get_species_preview_data(self):
         """Return preview data for all species for JavaScript rendering."""
-        preview_data = {}
-        for species in Species.objects.all().prefetch_related("traits", "languages"):
-            preview_data[species.name] = {
-                "display_name": species.get_name_display(),
-                "size": species.get_size_display(),
-                "speed": species.speed,
-                "darkvision": species.darkvision,
-                "description": species.description,
-                "traits": [
-                    {"name": trait.get_name_display(), "description": trait.description}
-                    for trait in species.traits.all()
-                ],
-                "languages": [
-                    lang.get_name_display() for lang in species.languages.all()
-                ],
-            }
-        return preview_data
+        return get_wizard_data().species
 
 
 class ClassSelectForm(forms.Form):
     """Step 2: Class selection with starting features preview."""
 
     klass = forms.ModelChoiceField(
-        queryset=Class.objects.all()
-        .select_related("primary_ability")
-        .prefetch_related("saving_throws", "features"),
+        queryset=Class.objects.all(),
         widget=forms.Select(attrs=DROPDOWN_ATTRS),
         label="Class",
         empty_label="---------",
@@ -78,46 +54,7 @@ class ClassSelectForm(forms.Form):
 
     def get_class_preview_data(self):
         """Return preview data for all classes for JavaScript rendering."""
-        # Map armor proficiency codes to display names
-        armor_display = {
-            "LA": "Light Armor",
-            "MA": "Medium Armor",
-            "HA": "Heavy Armor",
-            "SH": "Shields",
-        }
-        weapon_display = {
-            "simple": "Simple Weapons",
-            "martial": "Martial Weapons",
-        }
-
-        preview_data = {}
-        for klass in (
-            Class.objects.all()
-            .select_related("primary_ability")
-            .prefetch_related("saving_throws", "features")
-        ):
-            level_1_features = klass.features.filter(level=1)
-            preview_data[klass.name] = {
-                "display_name": klass.get_name_display(),
-                "description": klass.description,
-                "hit_die": f"d{klass.hit_die}",
-                "hp_first_level": klass.hp_first_level,
-                "primary_ability": klass.primary_ability.get_name_display(),
-                "saving_throws": [
-                    st.get_name_display() for st in klass.saving_throws.all()
-                ],
-                "armor_proficiencies": [
-                    armor_display.get(p, p) for p in klass.armor_proficiencies
-                ],
-                "weapon_proficiencies": [
-                    weapon_display.get(p, p) for p in klass.weapon_proficiencies
-                ],
-                "level_1_features": [
-                    {"name": f.name, "description": f.description}
-                    for f in level_1_features
-                ],
-            }
-        return preview_data
+        return get_wizard_data().classes
 
 
 class AbilityScoreForm(NoDuplicateValuesFormMixin, forms.Form):
@@ -277,38 +214,7 @@ class BackgroundSelectForm(forms.Form):
 
     def get_background_preview_data(self):
         """Return preview data for all backgrounds for JavaScript rendering."""
-        preview_data = {}
-        for bg_value, bg_display in Background.choices:
-            bg_data = BACKGROUNDS.get(bg_value, {})
-            skill_profs = bg_data.get("skill_proficiencies", set())
-            tool_prof = bg_data.get("tool_proficiency")
-            origin_feat_name = bg_data.get("origin_feat")
-
-            # Get feat description if available
-            feat_info = None
-            if origin_feat_name:
-                try:
-                    feat = Feat.objects.get(name=origin_feat_name)
-                    feat_info = {
-                        "name": feat.get_name_display(),
-                        "description": feat.description,
-                    }
-                except Feat.DoesNotExist:
-                    feat_info = {"name": origin_feat_name, "description": ""}
-
-            preview_data[bg_value] = {
-                "display_name": bg_display,
-                "skill_proficiencies": [SkillName(s).label for s in skill_profs],
-                "tool_proficiency": tool_prof.label if tool_prof else None,
-                "origin_feat": feat_info,
-                "personality_traits": list(
-                    bg_data.get("personality_traits", {}).values()
-                ),
-                "ideals": list(bg_data.get("ideals", {}).values()),
-                "bonds": list(bg_data.get("bonds", {}).values()),
-                "flaws": list(bg_data.get("flaws", {}).values()),
-            }
-        return preview_data
+        return get_wizard_data().backgrounds
 
 
 def _get_skills(class_name: str) -> set[tuple[str, str]] | None:
@@ -410,16 +316,7 @@ class SkillsSelectForm(NoDuplicateValuesFormMixin, forms.Form):
 
     def get_skill_descriptions(self):
         """Return skill descriptions for preview."""
-        from ..models.skills import Skill
-
-        skill_data = {}
-        for skill in Skill.objects.all().select_related("ability_type"):
-            skill_data[skill.name] = {
-                "display_name": skill.get_name_display(),
-                "ability": skill.ability_type.get_name_display(),
-                "description": skill.description,
-            }
-        return skill_data
+        return get_wizard_data().skills
 
 
 class EquipmentSelectForm(forms.Form):
@@ -440,23 +337,6 @@ class EquipmentSelectForm(forms.Form):
         # klass can be a Class model instance or a ClassName enum/string value
         class_name = klass.name if hasattr(klass, "_meta") else klass
 
-        match class_name:
-            case ClassName.CLERIC:
-                choices_provider = ClericEquipmentChoicesProvider()
-                fields = ["first_weapon", "second_weapon", "armor", "gear", "pack"]
-            case ClassName.FIGHTER:
-                choices_provider = FighterEquipmentChoicesProvider()
-                fields = ["first_weapon", "second_weapon", "third_weapon", "pack"]
-            case ClassName.ROGUE:
-                choices_provider = RogueEquipmentChoicesProvider()
-                fields = ["first_weapon", "second_weapon", "pack"]
-            case ClassName.WIZARD:
-                choices_provider = WizardEquipmentChoicesProvider()
-                fields = ["first_weapon", "gear", "pack"]
-            case _:
-                # For classes without specific equipment choices, no fields are added
-                return
-
         # Field labels for better UX
         field_labels = {
             "first_weapon": "Primary Weapon",
@@ -467,29 +347,14 @@ class EquipmentSelectForm(forms.Form):
             "pack": "Equipment Pack",
         }
 
-        field_choices = {
-            "first_weapon": self._get_choices(
-                choices_provider.get_first_weapon_choices()
-            ),
-            "second_weapon": self._get_choices(
-                choices_provider.get_second_weapon_choices()
-            ),
-            "third_weapon": self._get_choices(
-                choices_provider.get_third_weapon_choices()
-            ),
-            "armor": self._get_choices(choices_provider.get_armor_choices()),
-            "gear": self._get_choices(choices_provider.get_gear_choices()),
-            "pack": self._get_choices(choices_provider.get_pack_choices()),
-        }
-
-        for field in fields:
-            choices = field_choices[field]
-            if choices:
-                self.fields[field] = forms.ChoiceField(
-                    choices=choices,
-                    widget=forms.Select(attrs=DROPDOWN_ATTRS),
-                    label=field_labels.get(field, field.replace("_", " ").title()),
-                )
+        # Classes without specific equipment choices get no fields.
+        field_choices = get_wizard_data().equipment_choices.get(class_name, {})
+        for field, choices in field_choices.items():
+            self.fields[field] = forms.ChoiceField(
+                choices=self._get_choices(choices),
+                widget=forms.Select(attrs=DROPDOWN_ATTRS),
+                label=field_labels.get(field, field.replace("_", " ").title()),
+            )
 
 
 class ReviewForm(forms.Form):
@@ -518,35 +383,30 @@ class ReviewForm(forms.Form):
     def get_character_summary(self):
         """Build a summary of the character from all wizard steps."""
         summary = {}
+        payloads = get_wizard_data()
 
         # Species (from step 0)
         species_data = self.wizard_data.get("0", {})
         if species_data and "species" in species_data:
             species_pk = species_data.get("0-species") or species_data.get("species")
-            try:
-                species = Species.objects.get(pk=species_pk)
+            if species := payloads.species.get(species_pk):
                 summary["species"] = {
-                    "name": species.get_name_display(),
-                    "size": species.get_size_display(),
-                    "speed": species.speed,
-                    "darkvision": species.darkvision,
+                    "name": species["display_name"],
+                    "size": species["size"],
+                    "speed": species["speed"],
+                    "darkvision": species["darkvision"],
                 }
-            except Species.DoesNotExist:
-                pass
 
         # Class (from step 1)
         class_data = self.wizard_data.get("1", {})
         if class_data:
             klass_pk = class_data.get("1-klass") or class_data.get("klass")
-            try:
-                klass = Class.objects.get(pk=klass_pk)
+            if klass := payloads.classes.get(klass_pk):
                 summary["klass"] = {
-                    "name": klass.get_name_display(),
-                    "hit_die": f"d{klass.hit_die}",
-                    "hp_first_level": klass.hp_first_level,
+                    "name": klass["display_name"],
+                    "hit_die": klass["hit_die"],
+                    "hp_first_level": klass["hp_first_level"],
                 }
-            except Class.DoesNotExist:
-                pass
 
         # Abilities (from step 2)
         abilities_data = self.wizard_data.get("2", {})
@@ -0,0 +1,52 @@
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+
+from character.transfer import DEFAULT_CHUNK_SIZE, export_characters, export_queryset
+
+
+class Command(BaseCommand):
+    help = "export characters to a JSON Lines file"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "path", type=str, help="JSONL file to write, or - for stdout"
+        )
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            default=[],
+            help="only export the character of this user (repeatable)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="number of characters fetched per query",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        path = options["path"]
+        assert isinstance(path, str)
+        usernames = options["usernames"]
+        assert isinstance(usernames, list)
+        chunk_size = options["chunk_size"]
+        assert isinstance(chunk_size, int)
+
+        if chunk_size <= 0:
+            raise CommandError("chunk size must be greater than 0")
+
+        queryset = export_queryset()
+        if usernames:
+            queryset = queryset.filter(user__username__in=usernames)
+
+        if path == "-":
+            count = export_characters(self.stdout, queryset, chunk_size)
+            self.stderr.write(f"Exported {count} characters")
+            return
+        with open(path, "w", encoding="utf-8") as stream:
+            count = export_characters(stream, queryset, chunk_size)
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully exported {count} characters to {path}")
+        )
@@ -0,0 +1,41 @@
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+
+from character.exceptions import CharacterImportError
+from character.transfer import DEFAULT_CHUNK_SIZE, import_characters
+
+
+class Command(BaseCommand):
+    help = "import characters from a JSON Lines file"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "path", type=str, help="JSONL file written by export_characters"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="number of characters written per bulk insert",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        path = options["path"]
+        assert isinstance(path, str)
+        batch_size = options["batch_size"]
+        assert isinstance(batch_size, int)
+
+        if batch_size <= 0:
+            raise CommandError("batch size must be greater than 0")
+
+        try:
+            with open(path, encoding="utf-8") as stream:
+                count = import_characters(stream, batch_size)
+        except OSError as exc:
+            raise CommandError(f"cannot read {path}: {exc}") from exc
+        except CharacterImportError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully imported {count} characters from {path}")
+        )
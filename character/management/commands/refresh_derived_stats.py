@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from character.derived_stats import refresh_derived_stats
+from character.models.character import Character
+
+
+class Command(BaseCommand):
+    help = "recompute the derived stats (AC, speed, initiative...) of every character"
+
+    def handle(self, *args: object, **options: object) -> None:
+        refreshed = 0
+        characters = Character.objects.select_related("inventory").prefetch_related(
+            "abilities", "active_conditions", "feats", "character_classes"
+        )
+        for character in characters.iterator(chunk_size=500):
+            if refresh_derived_stats(character):
+                refreshed += 1
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully refreshed {refreshed} character(s)")
+        )
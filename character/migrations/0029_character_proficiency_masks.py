@@ -0,0 +1,179 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:15
+
+from django.db import migrations, models
+
+# Bit layout of the masks when this migration was written, frozen so that
+# later changes to the enums do not alter the backfill: bit i is the i-th name.
+ABILITY_NAMES = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
+SKILL_NAMES = [
+    "Athletics",
+    "Acrobatics",
+    "Sleight of Hand",
+    "Stealth",
+    "Arcana",
+    "History",
+    "Investigation",
+    "Nature",
+    "Religion",
+    "Animal Handling",
+    "Insight",
+    "Medicine",
+    "Perception",
+    "Survival",
+    "Deception",
+    "Intimidation",
+    "Performance",
+    "Persuasion",
+]
+ARMOR_NAMES = [
+    "Padded",
+    "Leather",
+    "Studded leather",
+    "Hide",
+    "Chain shirt",
+    "Scale mail",
+    "Breastplate",
+    "Half plate",
+    "Ring mail",
+    "Chain mail",
+    "Splint",
+    "Plate",
+    "Shield",
+]
+WEAPON_NAMES = [
+    "Club",
+    "Dagger",
+    "Greatclub",
+    "Handaxe",
+    "Javelin",
+    "Light hammer",
+    "Mace",
+    "Quarterstaff",
+    "Sickle",
+    "Spear",
+    "Crossbow, light",
+    "Dart",
+    "Shortbow",
+    "Sling",
+    "Battleaxe",
+    "Flail",
+    "Glaive",
+    "Greataxe",
+    "Greatsword",
+    "Halberd",
+    "Lance",
+    "Longsword",
+    "Maul",
+    "Morningstar",
+    "Pike",
+    "Rapier",
+    "Scimitar",
+    "Shortsword",
+    "Trident",
+    "War pick",
+    "Warhammer",
+    "Whip",
+    "Blowgun",
+    "Crossbow, hand",
+    "Crossbow, heavy",
+    "Longbow",
+    "Net",
+]
+ABILITY_BITS = {name: 1 << i for i, name in enumerate(ABILITY_NAMES)}
+SKILL_BITS = {name: 1 << i for i, name in enumerate(SKILL_NAMES)}
+ARMOR_BITS = {name: 1 << i for i, name in enumerate(ARMOR_NAMES)}
+WEAPON_BITS = {name: 1 << i for i, name in enumerate(WEAPON_NAMES)}
+
+# Row model -> (Character mask field, row attribute holding the name, bit layout)
+MASKED_MODELS = {
+    "SavingThrowProficiency": (
+        "saving_throw_proficiency_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+    "SkillProficiency": ("skill_proficiency_mask", "skill_id", SKILL_BITS),
+    "ArmorProficiency": ("armor_proficiency_mask", "armor_id", ARMOR_BITS),
+    "WeaponProficiency": ("weapon_proficiency_mask", "weapon_id", WEAPON_BITS),
+    "AbilityCheckDisadvantage": (
+        "ability_check_disadvantage_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+    "AttackRollDisadvantage": (
+        "attack_roll_disadvantage_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+}
+FLAGGED_MODELS = {
+    "SavingThrowDisadvantage": "saving_throw_disadvantage",
+    "SpellCastDisadvantage": "spell_cast_disadvantage",
+}
+
+
+def backfill_masks(apps, schema_editor):
+    Character = apps.get_model("character", "Character")
+    updates = {}
+    for model_name, (field, attribute, bits) in MASKED_MODELS.items():
+        Model = apps.get_model("character", model_name)
+        for character_id, name in Model.objects.values_list("character_id", attribute):
+            masks = updates.setdefault(character_id, {})
+            masks[field] = masks.get(field, 0) | bits.get(name, 0)
+    for model_name, field in FLAGGED_MODELS.items():
+        Model = apps.get_model("character", model_name)
+        for character_id in Model.objects.values_list("character_id", flat=True):
+            updates.setdefault(character_id, {})[field] = True
+    for character_id, fields in updates.items():
+        Character.objects.filter(pk=character_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("character", "0028_extend_background_max_length"),
+        # The models must be renderable: spell FKs moved to magic in game 0009.
+        ("game", "0009_update_spell_fks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="character",
+            name="ability_check_disadvantage_mask",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="armor_proficiency_mask",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="attack_roll_disadvantage_mask",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="saving_throw_disadvantage",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="saving_throw_proficiency_mask",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="skill_proficiency_mask",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="spell_cast_disadvantage",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="weapon_proficiency_mask",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_masks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("character", "0029_character_proficiency_masks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="character",
+            name="carrying_capacity",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="initiative",
+            field=models.SmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="passive_perception",
+            field=models.SmallIntegerField(default=10),
+        ),
+        migrations.AddField(
+            model_name="character",
+            name="spell_save_dc",
+            field=models.SmallIntegerField(default=0),
+        ),
+    ]
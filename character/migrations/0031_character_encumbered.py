@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("character", "0030_character_derived_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="character",
+            name="encumbered",
+            field=models.BooleanField(default=False),
+        ),
+    ]
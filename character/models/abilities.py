@@ -4,6 +4,20 @@ from django.db import models
 from ..ability_modifiers import compute_ability_modifier
 from ..constants.abilities import AbilityName
 
+# Bumped whenever an ability changes; memoized Character.stats maps built
+# under an older generation are reloaded on next access.
+_stats_generation = 0
+
+
+def get_stats_generation() -> int:
+    return _stats_generation
+
+
+def invalidate_stats() -> None:
+    """Invalidate the memoized abilities of every Character instance."""
+    global _stats_generation
+    _stats_generation += 1
+
 
 class AbilityType(models.Model):
     name = models.CharField(max_length=3, primary_key=True, choices=AbilityName)
@@ -29,3 +43,11 @@ class Ability(models.Model):
     def save(self, *args, **kwargs):
         self.modifier = compute_ability_modifier(self.score)
         super().save(*args, **kwargs)
+        invalidate_stats()
+
+
+class AbilityStats(dict[str, Ability]):
+    """A character's abilities keyed by ability name."""
+
+    def __missing__(self, key: str) -> Ability:
+        raise Ability.DoesNotExist(f"Character has no {key} ability")
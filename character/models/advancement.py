@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from django.db import models
 
 
@@ -11,3 +13,27 @@ class Advancement(models.Model):
 
     def __str__(self):
         return str(self.level)
+
+
+# The advancement table is reference data: it is loaded once per process.
+# Index i holds the XP required to reach level i + 1.
+_xp_thresholds: list[int] = []
+
+
+def get_xp_thresholds() -> list[int]:
+    """Return the XP required for each level, querying the table once per process."""
+    if not _xp_thresholds:
+        _xp_thresholds.extend(
+            Advancement.objects.order_by("level").values_list("xp", flat=True)
+        )
+    return _xp_thresholds
+
+
+def invalidate_advancement() -> None:
+    """Drop the cached advancement table (e.g. after it is edited)."""
+    _xp_thresholds.clear()
+
+
+def level_for_xp(xp: int) -> int:
+    """Return the level reached with an amount of XP, capped at the highest level."""
+    return bisect_right(get_xp_thresholds(), xp)
@@ -5,15 +5,27 @@ from django.urls import reverse
 
 from game.constants.events import Against, RollType
 from utils.dice import DiceString
+from utils.registry import get_registry
 
 from ..constants.abilities import AbilityName
 from ..constants.backgrounds import Background
 from ..constants.character import Gender
+from ..constants.effects import EffectSource
+from ..constants.proficiencies import ABILITY_BITS, ARMOR_BITS, SKILL_BITS, WEAPON_BITS
 from ..constants.races import Size
-from .abilities import Ability
-from .advancement import Advancement
+from ..effects import (
+    RollEffects,
+    Source,
+    condition_sources,
+    get_roll_effects,
+    get_speed,
+)
+from .abilities import Ability, AbilityStats, get_stats_generation
+from .advancement import level_for_xp
 from equipment.models.equipment import Inventory
 from .classes import Class
+from .conditions import get_conditions_generation
+from .feats import get_feats_generation
 from .races import Language
 from .skills import Skill
 
@@ -59,6 +71,26 @@ class Character(models.Model):
     )
     location = models.CharField(max_length=100, blank=True, default="")
 
+    # Derived stats, like ac and speed: they are recomputed when one of their
+    # inputs changes, see character/derived_stats.py.
+    initiative = models.SmallIntegerField(default=0)
+    passive_perception = models.SmallIntegerField(default=10)
+    carrying_capacity = models.PositiveSmallIntegerField(default=0)
+    encumbered = models.BooleanField(default=False)
+    spell_save_dc = models.SmallIntegerField(default=0)
+
+    # Bitmasks mirroring the proficiency and disadvantage tables, which remain
+    # the source of truth. Bit layouts are in constants/proficiencies.py and the
+    # masks are kept in sync by character.signals.
+    saving_throw_proficiency_mask = models.PositiveSmallIntegerField(default=0)
+    skill_proficiency_mask = models.PositiveIntegerField(default=0)
+    armor_proficiency_mask = models.PositiveIntegerField(default=0)
+    weapon_proficiency_mask = models.PositiveBigIntegerField(default=0)
+    ability_check_disadvantage_mask = models.PositiveSmallIntegerField(default=0)
+    attack_roll_disadvantage_mask = models.PositiveSmallIntegerField(default=0)
+    saving_throw_disadvantage = models.BooleanField(default=False)
+    spell_cast_disadvantage = models.BooleanField(default=False)
+
     class Meta:
         indexes = [
             models.Index(Upper("name"), name="character_name_upper_idx"),
@@ -67,29 +99,48 @@ class Character(models.Model):
     def __str__(self):
         return str(self.name)
 
+    @property
+    def stats(self) -> AbilityStats:
+        """Abilities keyed by AbilityName, loaded with a single query.
+
+        The map is memoized on the instance (and reuses a prefetch of
+        ``abilities``). It is reloaded after any Ability is saved or the
+        character's abilities change.
+        """
+        generation = get_stats_generation()
+        if getattr(self, "_stats_generation", None) != generation:
+            if hasattr(self, "_stats_generation"):
+                # The prefetched abilities may be stale as well.
+                getattr(self, "_prefetched_objects_cache", {}).pop("abilities", None)
+            self._stats = AbilityStats(
+                (ability.ability_type_id, ability) for ability in self.abilities.all()
+            )
+            self._stats_generation = generation
+        return self._stats
+
     @property
     def strength(self):
-        return self.abilities.get(ability_type__name=AbilityName.STRENGTH)
+        return self.stats[AbilityName.STRENGTH]
 
     @property
     def dexterity(self):
-        return self.abilities.get(ability_type__name=AbilityName.DEXTERITY)
+        return self.stats[AbilityName.DEXTERITY]
 
     @property
     def constitution(self):
-        return self.abilities.get(ability_type__name=AbilityName.CONSTITUTION)
+        return self.stats[AbilityName.CONSTITUTION]
 
     @property
     def intelligence(self):
-        return self.abilities.get(ability_type__name=AbilityName.INTELLIGENCE)
+        return self.stats[AbilityName.INTELLIGENCE]
 
     @property
     def wisdom(self):
-        return self.abilities.get(ability_type__name=AbilityName.WISDOM)
+        return self.stats[AbilityName.WISDOM]
 
     @property
     def charisma(self):
-        return self.abilities.get(ability_type__name=AbilityName.CHARISMA)
+        return self.stats[AbilityName.CHARISMA]
 
     @property
     def proficiency_bonus(self):
@@ -101,9 +152,14 @@ class Character(models.Model):
 
     @property
     def primary_class(self) -> Class | None:
-        """Return the character's primary class."""
-        char_class = self.character_classes.filter(is_primary=True).first()
-        return char_class.klass if char_class else None
+        """Return the character's primary class.
+
+        Reuses a prefetch of ``character_classes``, if any.
+        """
+        for char_class in self.character_classes.all():
+            if char_class.is_primary:
+                return char_class.klass
+        return None
 
     @property
     def class_level(self) -> int:
@@ -114,13 +170,6 @@ class Character(models.Model):
     def get_absolute_url(self):
         return reverse("character-detail", args=(self.id,))
 
-    def _check_level_increase(self):
-        next_level = self.level + 1
-        advancement = Advancement.objects.get(level=next_level)
-        if self.xp >= advancement.xp:
-            return True
-        return False
-
     def _increase_level(self):
         self.level += 1
 
@@ -131,52 +180,129 @@ class Character(models.Model):
         self.max_hp += self.hp_increase
 
     def increase_xp(self, xp):
+        # derived_stats depends on the equipment and magic models.
+        from ..derived_stats import Input, update_derived_stats
+
         self.xp += xp
-        while self._check_level_increase():
+        level = self.level
+        for _ in range(level, level_for_xp(self.xp)):
             self._increase_level()
+        if self.level != level:
+            update_derived_stats(self, [Input.LEVEL])
 
     def is_proficient(self, ability: Ability) -> bool:
-        if not self.abilities.filter(ability_type=ability.ability_type).exists():
+        if ability.ability_type_id not in self.stats:
             return False
-        return any(
-            proficiency["ability_type_id"] == ability.ability_type.name
-            for proficiency in self.savingthrowproficiency_set.values()
+        return self.is_proficient_in_saving_throw(ability.ability_type_id)
+
+    def is_proficient_in_saving_throw(self, ability_name: str) -> bool:
+        return bool(
+            self.saving_throw_proficiency_mask & ABILITY_BITS.get(ability_name, 0)
         )
 
+    def is_proficient_in_skill(self, skill_name: str) -> bool:
+        return bool(self.skill_proficiency_mask & SKILL_BITS.get(skill_name, 0))
+
+    def is_proficient_with_armor(self, armor_name: str) -> bool:
+        return bool(self.armor_proficiency_mask & ARMOR_BITS.get(armor_name, 0))
+
+    def is_proficient_with_weapon(self, weapon_name: str) -> bool:
+        return bool(self.weapon_proficiency_mask & WEAPON_BITS.get(weapon_name, 0))
+
+    def has_ability_check_disadvantage(self, ability_name: str) -> bool:
+        return bool(
+            self.ability_check_disadvantage_mask & ABILITY_BITS.get(ability_name, 0)
+        )
+
+    def has_attack_roll_disadvantage(self, ability_name: str) -> bool:
+        return bool(
+            self.attack_roll_disadvantage_mask & ABILITY_BITS.get(ability_name, 0)
+        )
+
+    @property
+    def species_traits(self) -> frozenset[str]:
+        """Trait names of the character's species, read from the registry."""
+        if self.species_id is None:
+            return frozenset()
+        species = get_registry().species.get(self.species_id)
+        return frozenset(trait.pk for trait in species.traits.all())
+
+    @property
+    def feat_names(self) -> frozenset[str]:
+        """Names of the character's feats, loaded with a single query.
+
+        Memoized on the instance like ``stats``, and reloaded after the feats
+        of any character change.
+        """
+        generation = get_feats_generation()
+        if getattr(self, "_feat_names_generation", None) != generation:
+            if hasattr(self, "_feat_names_generation"):
+                getattr(self, "_prefetched_objects_cache", {}).pop("feats", None)
+            self._feat_names = frozenset(feat.name for feat in self.feats.all())
+            self._feat_names_generation = generation
+        return self._feat_names
+
     def _has_trait(self, trait_name: str) -> bool:
         """Check if character's species has a specific trait."""
-        if not self.species:
-            return False
-        return self.species.traits.filter(name=trait_name).exists()
+        return trait_name in self.species_traits
 
     def has_feat(self, feat_name: str) -> bool:
         """Check if character has a specific feat."""
-        return self.feats.filter(name=feat_name).exists()
-
-    def has_advantage(self, roll_type: RollType, against: Against) -> bool:
-        if (
-            self._has_trait("dwarven_resilience")
-            and roll_type == RollType.SAVING_THROW
-            and against == Against.POISON
-        ):
-            return True
-        if (
-            self._has_trait("fey_ancestry")
-            and roll_type == RollType.SAVING_THROW
-            and against == Against.CHARM
-        ):
-            return True
-        if (
-            self._has_trait("brave")
-            and roll_type == RollType.SAVING_THROW
-            and against == Against.BEING_FRIGHTENED
-        ):
-            return True
-        return False
-
-    def has_disadvantage(self, roll_type: RollType, against: Against) -> bool:
-        # Not supported.
-        return False
+        return feat_name in self.feat_names
+
+    @property
+    def condition_sources(self) -> frozenset[Source]:
+        """Effect sources of the active conditions, loaded with a single query.
+
+        Memoized on the instance (reusing a prefetch of ``active_conditions``)
+        and reloaded after any character condition changes.
+        """
+        generation = get_conditions_generation()
+        if getattr(self, "_condition_sources_generation", None) != generation:
+            if hasattr(self, "_condition_sources_generation"):
+                getattr(self, "_prefetched_objects_cache", {}).pop(
+                    "active_conditions", None
+                )
+            sources = set()
+            for condition in self.active_conditions.all():
+                sources |= condition_sources(
+                    condition.condition_id, condition.exhaustion_level
+                )
+            self._condition_sources = frozenset(sources)
+            self._condition_sources_generation = generation
+        return self._condition_sources
+
+    @property
+    def effect_sources(self) -> frozenset[Source]:
+        """Conditions, species traits and feats which may grant effects."""
+        return self.condition_sources.union(
+            ((EffectSource.SPECIES_TRAIT, trait, 0) for trait in self.species_traits),
+            ((EffectSource.FEAT, feat, 0) for feat in self.feat_names),
+        )
+
+    def roll_effects(
+        self,
+        roll_type: RollType,
+        ability_name: str | None = None,
+        against: Against | None = None,
+    ) -> RollEffects:
+        """Return the advantage, disadvantage and auto-fail effects on a roll."""
+        return get_roll_effects(self.effect_sources, roll_type, ability_name, against)
+
+    def has_advantage(
+        self, roll_type: RollType, against: Against, ability_name: str | None = None
+    ) -> bool:
+        return self.roll_effects(roll_type, ability_name, against).advantage
+
+    def has_disadvantage(
+        self, roll_type: RollType, against: Against, ability_name: str | None = None
+    ) -> bool:
+        return self.roll_effects(roll_type, ability_name, against).disadvantage
+
+    @property
+    def effective_speed(self) -> int:
+        """Speed after the effects of conditions (e.g. Grappled, Exhaustion)."""
+        return get_speed(self.effect_sources, self.speed or 30)
 
     @property
     def is_unconscious(self) -> bool:
@@ -210,6 +336,18 @@ class Character(models.Model):
 
         Returns the actual damage taken (after temp HP absorption).
         """
+        if damage <= 0:
+            return 0
+        actual_damage = self.absorb_damage(damage)
+        self.save()
+        return actual_damage
+
+    def absorb_damage(self, damage: int) -> int:
+        """Apply damage like take_damage(), without saving.
+
+        Used to damage several characters at once, then write them back with
+        a single bulk UPDATE.
+        """
         if damage <= 0:
             return 0
 
@@ -219,7 +357,6 @@ class Character(models.Model):
         if self.temp_hp > 0:
             if self.temp_hp >= damage:
                 self.temp_hp -= damage
-                self.save()
                 return 0  # All damage absorbed by temp HP
             else:
                 damage -= self.temp_hp
@@ -233,7 +370,6 @@ class Character(models.Model):
             self.death_save_successes = 0
             self.death_save_failures = 0
 
-        self.save()
         return actual_damage
 
     def heal(self, amount: int) -> int:
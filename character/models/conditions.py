@@ -3,6 +3,18 @@ from django.db import models
 
 from ..constants.conditions import ConditionName
 
+_conditions_generation = 0
+
+
+def get_conditions_generation() -> int:
+    return _conditions_generation
+
+
+def invalidate_conditions() -> None:
+    """Invalidate the memoized conditions of every Character instance."""
+    global _conditions_generation
+    _conditions_generation += 1
+
 
 class Condition(models.Model):
     """Reference model for D&D 5e SRD conditions."""
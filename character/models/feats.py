@@ -2,6 +2,18 @@ from django.db import models
 
 from ..constants.feats import FeatName, FeatType
 
+_feats_generation = 0
+
+
+def get_feats_generation() -> int:
+    return _feats_generation
+
+
+def invalidate_feats() -> None:
+    """Invalidate the memoized feat names of every Character instance."""
+    global _feats_generation
+    _feats_generation += 1
+
 
 class Feat(models.Model):
     """D&D 2024 SRD feats."""
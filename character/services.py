@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import json
 import re
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
+from django.core.cache import cache
+from django.db import transaction
+
+from equipment.models.equipment import Inventory
 from magic.constants.spells import SpellLevel, SpellSchool
-from magic.models.spells import Concentration
+from magic.models.spells import Concentration, WarlockSpellSlot
+from utils.registry import get_registry
 
 from .character_attributes_builders import (
     BackgroundBuilder,
@@ -15,12 +23,23 @@ from .character_attributes_builders import (
     SpeciesBuilder,
     SpellcastingBuilder,
 )
+from .constants.abilities import AbilityName
 from .constants.classes import ClassName
+from .derived_stats import Inputs
 from .models.character import Character
-from equipment.constants.equipment import ArmorName, GearName, ToolName, WeaponName
+from equipment.constants.equipment import (
+    EQUIPMENT_KINDS,
+    ArmorName,
+    EquipmentKind,
+    GearName,
+    ToolName,
+    WeaponName,
+)
 
 MULTI_EQUIPMENT_REGEX = r"\S+\s&\s\S+"
 
+SHEET_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 @dataclass
 class SpellCastResult:
@@ -101,17 +120,13 @@ class SpellsPanelService:
     def restore_all_slots(character: Character) -> None:
         """Restore all spell slots and pact magic (long rest).
 
-        Iterates all character spell slots calling restore_all() on each,
-        and also restores pact magic if the character has it.
+        Resets used spell slots and pact magic with one UPDATE each.
 
         Args:
             character: The character whose slots to restore.
         """
-        for slot in character.spell_slots.all():
-            slot.restore_all()
-
-        if hasattr(character, "pact_magic"):
-            character.pact_magic.restore_all()
+        character.spell_slots.update(used=0)
+        WarlockSpellSlot.objects.filter(character=character).update(used=0)
 
     @staticmethod
     def get_spells_panel_data(
@@ -305,34 +320,113 @@ class SpellsPanelService:
 
 
 class CharacterSheetService:
-    """Encapsulates business logic for the character detail sheet."""
+    """Encapsulates business logic for the character detail sheet.
+
+    The computed sheet is cached as a JSON blob stamped with the character's
+    sheet version and the global reference data version. Signals bump the
+    former whenever a model feeding the sheet changes, and the latter when
+    reference data shown on every sheet changes (see character.signals),
+    which makes the cached blob stale.
+    """
+
+    REFERENCE_VERSION_KEY = "character-sheet-version:reference"
+
+    @staticmethod
+    def _cache_keys(character_id: int) -> tuple[str, str]:
+        return (
+            f"character-sheet-version:{character_id}",
+            f"character-sheet:{character_id}",
+        )
+
+    @staticmethod
+    def invalidate(character_ids: Iterable[int]) -> None:
+        """Bump the sheet version of characters, making their cached sheet stale."""
+        for character_id in character_ids:
+            version_key, _ = CharacterSheetService._cache_keys(character_id)
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                # No version yet: the next read seeds a new one.
+                pass
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """Bump the reference data version, making every cached sheet stale."""
+        try:
+            cache.incr(CharacterSheetService.REFERENCE_VERSION_KEY)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _seed_version(key: str) -> int | None:
+        # Seeded from the clock so that a lost version never matches a blob
+        # stored under an earlier one.
+        cache.add(key, time.time_ns(), timeout=None)
+        return cache.get(key)
 
     @staticmethod
     def get_character_sheet_data(character: Character) -> dict[str, Any]:
-        """Build all data needed for the character detail template.
+        """Return all data needed for the character detail template.
+
+        The sheet is read from the cache with a single request when its
+        version is current, and rebuilt and stored otherwise.
+
+        Args:
+            character: The character to get sheet data for.
+
+        Returns:
+            A dict containing all character sheet display data.
+        """
+        reference_key = CharacterSheetService.REFERENCE_VERSION_KEY
+        version_key, sheet_key = CharacterSheetService._cache_keys(character.pk)
+        cached = cache.get_many([reference_key, version_key, sheet_key])
+        version = cached.get(version_key)
+        reference_version = cached.get(reference_key)
+        sheet = cached.get(sheet_key)
+        # Blobs are only stored under known versions, so a missing one never matches.
+        if sheet is not None and sheet[0] == (version, reference_version):
+            data = json.loads(sheet[1])
+        else:
+            if version is None:
+                version = CharacterSheetService._seed_version(version_key)
+            if reference_version is None:
+                reference_version = CharacterSheetService._seed_version(reference_key)
+            data = CharacterSheetService.build_character_sheet_data(character)
+            if version is not None and reference_version is not None:
+                cache.set(
+                    sheet_key,
+                    (
+                        (version, reference_version),
+                        json.dumps(data, separators=(",", ":")),
+                    ),
+                    SHEET_CACHE_TIMEOUT,
+                )
+        data["inventory"] = character.inventory
+        return data
+
+    @staticmethod
+    def build_character_sheet_data(character: Character) -> dict[str, Any]:
+        """Build the JSON-serializable data of the character detail sheet.
 
         Computes abilities, skills, saving throws, attacks, racial traits,
         class features, feats, and spell placeholders from the given
-        character instance.
+        character instance, with one query per section.
 
         Args:
             character: The character to build sheet data for.
 
         Returns:
-            A dict containing all character sheet display data.
+            A dict containing the character sheet display data.
         """
         data: dict[str, Any] = {}
 
-        # Inventory
-        data["inventory"] = character.inventory
-
         # Abilities with abbreviations for display
         abilities = []
-        for ability in character.abilities.all().select_related("ability_type"):
+        for name, ability in character.stats.items():
             abilities.append(
                 {
-                    "name": ability.ability_type.get_name_display(),
-                    "abbreviation": ability.ability_type.name,
+                    "name": AbilityName(name).label,
+                    "abbreviation": name,
                     "score": ability.score,
                     "modifier": ability.modifier,
                 }
@@ -340,25 +434,26 @@ class CharacterSheetService:
         data["abilities"] = abilities
 
         # Skills with proficiency status and modifiers
-        from .models.skills import Skill
-
-        all_skills = Skill.objects.all().select_related("ability_type")
-        character_skill_names = set(character.skills.values_list("name", flat=True))
+        character_skill_names = set(
+            Character.skills.through.objects.filter(
+                character_id=character.pk
+            ).values_list("skill_id", flat=True)
+        )
 
         # Build ability modifier lookup
         ability_modifiers = {a["abbreviation"]: a["modifier"] for a in abilities}
 
         skills = []
-        for skill in all_skills:
+        for skill in get_registry().skills:
             is_proficient = skill.name in character_skill_names
-            ability_mod = ability_modifiers.get(skill.ability_type.name, 0)
+            ability_mod = ability_modifiers.get(skill.ability_type_id, 0)
             modifier = ability_mod + (
                 character.proficiency_bonus if is_proficient else 0
             )
             skills.append(
                 {
                     "name": skill.get_name_display(),
-                    "ability": skill.ability_type.name,
+                    "ability": skill.ability_type_id,
                     "proficient": is_proficient,
                     "modifier": modifier,
                 }
@@ -366,14 +461,11 @@ class CharacterSheetService:
         data["skills"] = skills
 
         # Saving throws with proficiency and modifiers
-        saving_throw_proficiencies = set(
-            character.savingthrowproficiency_set.values_list(
-                "ability_type__name", flat=True
-            )
-        )
         saving_throws = []
         for ability in abilities:
-            is_proficient = ability["abbreviation"] in saving_throw_proficiencies
+            is_proficient = character.is_proficient_in_saving_throw(
+                ability["abbreviation"]
+            )
             modifier = ability["modifier"] + (
                 character.proficiency_bonus if is_proficient else 0
             )
@@ -388,13 +480,15 @@ class CharacterSheetService:
 
         # Attacks from equipped weapons
         attacks = []
-        if character.inventory:
+        if character.inventory_id:
             str_mod = ability_modifiers.get("STR", 0)
             dex_mod = ability_modifiers.get("DEX", 0)
-            for weapon in character.inventory.weapon_set.select_related(
-                "settings"
-            ).all():
-                settings = weapon.settings
+            weapons = get_registry().weapons
+            item_counts = Inventory.count_items(character.inventory_id)
+            for name, count in sorted(item_counts.items()):
+                if EQUIPMENT_KINDS.get(name) != EquipmentKind.WEAPON:
+                    continue
+                settings = weapons.get(name)
                 # Check if weapon is ranged or has finesse property
                 is_ranged = settings.weapon_type in ("SR", "MR")
                 is_finesse = (
@@ -411,19 +505,21 @@ class CharacterSheetService:
                 attack_bonus = attack_mod + character.proficiency_bonus
                 damage_dice = settings.damage or "1d4"
                 damage = f"{damage_dice}+{attack_mod}" if attack_mod else damage_dice
-                attacks.append(
+                attacks.extend(
                     {
-                        "name": str(weapon),
+                        "name": str(settings),
                         "bonus": attack_bonus,
                         "damage": damage,
                     }
+                    for _ in range(count)
                 )
         data["attacks"] = attacks
 
         # Species/Racial traits
         racial_traits = []
-        if character.species:
-            for trait in character.species.traits.all():
+        if character.species_id:
+            species = get_registry().species.get(character.species_id)
+            for trait in species.traits.all():
                 racial_traits.append(
                     {
                         "name": trait.get_name_display(),
@@ -492,8 +588,8 @@ class CharacterCreationService:
         """Create a fully-built character through the builder pipeline.
 
         Runs the full character creation pipeline: base setup, species
-        traits, class features, skills, background, derived stats,
-        spellcasting, equipment, and class-specific default equipment.
+        traits, class features, skills, background, spellcasting,
+        equipment and class-specific default equipment, then derived stats.
 
         Args:
             user: The user who owns the character.
@@ -520,57 +616,66 @@ class CharacterCreationService:
         # Wrap abilities dict for BaseBuilder compatibility
         ability_data = CharacterCreationService._AbilityData(abilities)
 
-        # Phase 1: Base setup - inventory and ability scores
-        BaseBuilder(character, ability_data).build()  # type: ignore[arg-type]
-
-        # Phase 2: Species traits - size, speed, darkvision, languages
-        SpeciesBuilder(character).build()
-
-        # Phase 3: Class - HP, proficiencies, features, wealth
-        ClassBuilder(character, klass).build()
-
-        # Phase 4: Add skills
-        for skill_name in skills:
-            if skill_name:
-                character.skills.add(skill_name)
-
-        # Phase 5: Background - skill proficiencies, tools, feat, personality
-        BackgroundBuilder(character).build()
-
-        # Phase 6: Derived stats (after all modifiers are applied)
-        DerivedStatsBuilder(character).build()
-
-        # Phase 7: Spellcasting setup (if class is a spellcaster)
-        SpellcastingBuilder(character, klass).build()
-
-        # Phase 8: Add equipment
-        inventory = character.inventory
+        # Expand "Name1 & Name2" selections into separate equipment.
+        equipment_names = []
         for equipment_name in equipment:
             if not equipment_name:
                 continue
-            # If the field is under the form "equipment_name1 & equipment_name2",
-            # each equipment must be added separately.
             if re.match(MULTI_EQUIPMENT_REGEX, equipment_name):
-                names = equipment_name.split(" & ")
-                for item_name in names:
-                    inventory.add(item_name)
+                equipment_names.extend(equipment_name.split(" & "))
             else:
-                inventory.add(equipment_name)
+                equipment_names.append(equipment_name)
 
         # Some equipment is added without selection, depending on character's class.
         match klass.name:
             case ClassName.CLERIC:
-                inventory.add(WeaponName.CROSSBOW_LIGHT)
-                inventory.add(GearName.CROSSBOW_BOLTS)
-                inventory.add(ArmorName.SHIELD)
+                equipment_names += [
+                    WeaponName.CROSSBOW_LIGHT,
+                    GearName.CROSSBOW_BOLTS,
+                    ArmorName.SHIELD,
+                ]
             case ClassName.ROGUE:
-                inventory.add(WeaponName.SHORTBOW)
-                inventory.add(GearName.QUIVER)
-                inventory.add(ArmorName.LEATHER)
-                inventory.add(WeaponName.DAGGER)
-                inventory.add(WeaponName.DAGGER)
-                inventory.add(ToolName.THIEVES_TOOLS)
+                equipment_names += [
+                    WeaponName.SHORTBOW,
+                    GearName.QUIVER,
+                    ArmorName.LEATHER,
+                    WeaponName.DAGGER,
+                    WeaponName.DAGGER,
+                    ToolName.THIEVES_TOOLS,
+                ]
             case ClassName.WIZARD:
-                inventory.add(GearName.SPELLBOOK)
+                equipment_names.append(GearName.SPELLBOOK)
+
+        # Builders only change the character in memory and bulk-create its
+        # related rows; the character itself is saved once, at the end.
+        with transaction.atomic():
+            # Phase 1: Base setup - inventory and ability scores
+            BaseBuilder(character, ability_data).apply()  # type: ignore[arg-type]
+
+            # Phase 2: Species traits - size, speed, darkvision, languages
+            SpeciesBuilder(character).apply()
+
+            # Phase 3: Class - HP, proficiencies, features, wealth
+            ClassBuilder(character, klass).apply()
+
+            # Phase 4: Add skills
+            skill_names = [skill_name for skill_name in skills if skill_name]
+            if skill_names:
+                character.skills.add(*skill_names)
+
+            # Phase 5: Background - skill proficiencies, tools, feat, personality
+            BackgroundBuilder(character).apply()
+
+            # Phase 6: Spellcasting setup (if class is a spellcaster)
+            SpellcastingBuilder(character, klass).apply()
+
+            # Phase 7: Add equipment; armor and load are left to the derived stats
+            character.inventory.add_all(equipment_names, refresh_derived_stats=False)
+
+            # Phase 8: Derived stats (after all modifiers and armor are applied),
+            # each input loaded once
+            DerivedStatsBuilder(character, Inputs.of_new_character(character)).apply()
+
+            character.save()
 
         return character
@@ -0,0 +1,326 @@
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from equipment.models.equipment import Armor, Weapon
+from equipment.models.magic_items import Attunement, MagicItem
+from magic.models.spell_effects import ActiveSpellEffect
+from magic.models.spells import ClassSpellcasting
+from utils.registry import Registry, get_registry, invalidate_registry
+
+from .constants.proficiencies import ABILITY_BITS, ARMOR_BITS, SKILL_BITS, WEAPON_BITS
+from .derived_stats import Input, refresh_derived_stats
+from .models.abilities import Ability, invalidate_stats
+from .models.advancement import Advancement, invalidate_advancement
+from .models.character import Character
+from .models.classes import CharacterClass, CharacterFeature, Class, ClassFeature
+from .models.conditions import CharacterCondition, invalidate_conditions
+from .models.feats import CharacterFeat, invalidate_feats
+from .models.disadvantages import (
+    AbilityCheckDisadvantage,
+    AttackRollDisadvantage,
+    SavingThrowDisadvantage,
+    SpellCastDisadvantage,
+)
+from .models.proficiencies import (
+    ArmorProficiency,
+    SavingThrowProficiency,
+    SkillProficiency,
+    WeaponProficiency,
+)
+from .models.species import Species, SpeciesTrait
+from .services import CharacterSheetService
+
+
+@receiver(m2m_changed, sender=Character.abilities.through)
+@receiver(post_delete, sender=Ability)
+def invalidate_character_stats(sender, action: str = "post_remove", **kwargs) -> None:
+    """Reload memoized Character.stats when abilities are added or removed."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_stats()
+
+
+@receiver(m2m_changed, sender=Character.feats.through)
+@receiver(post_save, sender=CharacterFeat)
+@receiver(post_delete, sender=CharacterFeat)
+def invalidate_character_feats(sender, action: str = "post_add", **kwargs) -> None:
+    """Reload memoized Character.feat_names when a character's feats change."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_feats()
+
+
+@receiver(post_save, sender=CharacterCondition)
+@receiver(post_delete, sender=CharacterCondition)
+def invalidate_character_conditions(sender, **kwargs) -> None:
+    """Reload memoized Character.condition_sources when conditions change."""
+    invalidate_conditions()
+
+
+@receiver(post_save, sender=Advancement)
+@receiver(post_delete, sender=Advancement)
+def invalidate_cached_advancement(sender, **kwargs) -> None:
+    """Drop the process-wide advancement table when it is edited."""
+    invalidate_advancement()
+
+
+def invalidate_reference_data(sender, action: str = "post_add", **kwargs) -> None:
+    """Drop the reference data registry when a registered table changes."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_registry()
+
+
+for model in (*Registry.models(), ClassFeature, ClassSpellcasting, SpeciesTrait):
+    post_save.connect(invalidate_reference_data, sender=model)
+    post_delete.connect(invalidate_reference_data, sender=model)
+for through in (
+    Class.saving_throws.through,
+    Species.traits.through,
+    Species.languages.through,
+):
+    m2m_changed.connect(invalidate_reference_data, sender=through)
+
+
+# Row model -> (Character mask field, row attribute holding the name, bit layout)
+MASKED_MODELS = {
+    SavingThrowProficiency: (
+        "saving_throw_proficiency_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+    SkillProficiency: ("skill_proficiency_mask", "skill_id", SKILL_BITS),
+    ArmorProficiency: ("armor_proficiency_mask", "armor_id", ARMOR_BITS),
+    WeaponProficiency: ("weapon_proficiency_mask", "weapon_id", WEAPON_BITS),
+    AbilityCheckDisadvantage: (
+        "ability_check_disadvantage_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+    AttackRollDisadvantage: (
+        "attack_roll_disadvantage_mask",
+        "ability_type_id",
+        ABILITY_BITS,
+    ),
+}
+
+# Row model -> Character flag field
+FLAGGED_MODELS = {
+    SavingThrowDisadvantage: "saving_throw_disadvantage",
+    SpellCastDisadvantage: "spell_cast_disadvantage",
+}
+
+
+def _cached_character(sender, instance) -> Character | None:
+    """Return the row's character if it is already loaded, to update it too."""
+    if sender.character.is_cached(instance):
+        return instance.character
+    return None
+
+
+def _set_character_field(sender, instance, field: str, value) -> None:
+    Character.objects.filter(pk=instance.character_id).update(**{field: value})
+    character = _cached_character(sender, instance)
+    if character is not None:
+        setattr(character, field, value)
+
+
+def _recompute_mask(sender, instance) -> None:
+    field, attribute, bits = MASKED_MODELS[sender]
+    mask = 0
+    for name in sender.objects.filter(character_id=instance.character_id).values_list(
+        attribute, flat=True
+    ):
+        mask |= bits.get(name, 0)
+    _set_character_field(sender, instance, field, mask)
+
+
+def set_mask_bit(sender, instance, created: bool, raw: bool = False, **kwargs) -> None:
+    """Set the character's bit for a new proficiency or disadvantage.
+
+    An updated row may have changed the name it grants, so the mask is then
+    recomputed from every row of the character.
+    """
+    if raw:
+        return
+    if not created:
+        _recompute_mask(sender, instance)
+        return
+    field, attribute, bits = MASKED_MODELS[sender]
+    bit = bits.get(getattr(instance, attribute), 0)
+    Character.objects.filter(pk=instance.character_id).update(
+        **{field: F(field).bitor(bit)}
+    )
+    character = _cached_character(sender, instance)
+    if character is not None:
+        setattr(character, field, getattr(character, field) | bit)
+
+
+def clear_mask_bit(sender, instance, origin=None, **kwargs) -> None:
+    """Recompute the character's mask once a row is deleted.
+
+    Disadvantage rows may be duplicated, so a bit is only cleared when no
+    other row grants it.
+    """
+    if isinstance(origin, Character):
+        return
+    _recompute_mask(sender, instance)
+
+
+def set_flag(sender, instance, created: bool, raw: bool = False, **kwargs) -> None:
+    """Raise the character's flag for a new disadvantage."""
+    if created and not raw:
+        _set_character_field(sender, instance, FLAGGED_MODELS[sender], True)
+
+
+def clear_flag(sender, instance, origin=None, **kwargs) -> None:
+    """Lower the character's flag once its last disadvantage row is deleted."""
+    if isinstance(origin, Character):
+        return
+    flag = sender.objects.filter(character_id=instance.character_id).exists()
+    _set_character_field(sender, instance, FLAGGED_MODELS[sender], flag)
+
+
+for model in MASKED_MODELS:
+    post_save.connect(set_mask_bit, sender=model)
+    post_delete.connect(clear_mask_bit, sender=model)
+for model in FLAGGED_MODELS:
+    post_save.connect(set_flag, sender=model)
+    post_delete.connect(clear_flag, sender=model)
+
+
+# Row model holding an input of its character's derived stats -> input
+CHARACTER_INPUTS = {
+    CharacterClass: Input.CLASS,
+    SkillProficiency: Input.SKILLS,
+    CharacterFeat: Input.FEATS,
+    CharacterCondition: Input.CONDITIONS,
+    ActiveSpellEffect: Input.SPELL_EFFECTS,
+    Attunement: Input.MAGIC_ITEMS,
+}
+
+# Inventory item model -> input
+ITEM_INPUTS = {
+    Armor: Input.ARMOR,
+    MagicItem: Input.MAGIC_ITEMS,
+}
+
+
+def _grants_ac(magic_item_name: str) -> bool:
+    return bool(get_registry().magic_items.get(magic_item_name).effects.get("ac_bonus"))
+
+
+def refresh_stats_on_row_change(
+    sender, instance, raw: bool = False, origin=None, **kwargs
+) -> None:
+    """Refresh the derived stats depending on a changed row of a character.
+
+    Connected after the mask receivers, so that the masks are up to date.
+    """
+    if raw or isinstance(origin, Character):
+        return
+    if sender is Attunement and not _grants_ac(instance.magic_item.settings_id):
+        return
+    character = _cached_character(sender, instance)
+    if character is None:
+        character = Character.objects.filter(pk=instance.character_id).first()
+    if character is not None:
+        refresh_derived_stats(character, [CHARACTER_INPUTS[sender]])
+
+
+def refresh_stats_on_item_change(sender, instance, raw: bool = False, **kwargs) -> None:
+    """Refresh the derived stats of the character holding a changed item."""
+    if raw or instance.inventory_id is None:
+        return
+    if sender is MagicItem and not _grants_ac(instance.settings_id):
+        return
+    for character in Character.objects.filter(inventory_id=instance.inventory_id):
+        refresh_derived_stats(character, [ITEM_INPUTS[sender]])
+
+
+for model in CHARACTER_INPUTS:
+    post_save.connect(refresh_stats_on_row_change, sender=model)
+    post_delete.connect(refresh_stats_on_row_change, sender=model)
+for model in ITEM_INPUTS:
+    post_save.connect(refresh_stats_on_item_change, sender=model)
+    post_delete.connect(refresh_stats_on_item_change, sender=model)
+
+
+@receiver(post_save, sender=Ability)
+def refresh_stats_on_ability_save(
+    sender, instance, created: bool, raw: bool = False, **kwargs
+) -> None:
+    if created or raw:
+        return
+    for character in instance.character_set.all():
+        refresh_derived_stats(character, [Input.ABILITIES])
+
+
+@receiver(post_save, sender=Species)
+def refresh_stats_on_species_save(
+    sender, instance, raw: bool = False, **kwargs
+) -> None:
+    if raw:
+        return
+    for character in instance.character_set.all():
+        refresh_derived_stats(character, [Input.SPECIES])
+
+
+def _invalidate_sheets(character_ids) -> None:
+    CharacterSheetService.invalidate(character_ids)
+
+
+@receiver(post_save, sender=Character)
+def invalidate_sheet_on_character_save(sender, instance, **kwargs) -> None:
+    _invalidate_sheets([instance.pk])
+
+
+@receiver(post_save, sender=CharacterFeat)
+@receiver(post_delete, sender=CharacterFeat)
+@receiver(post_save, sender=CharacterFeature)
+@receiver(post_delete, sender=CharacterFeature)
+@receiver(post_save, sender=SavingThrowProficiency)
+@receiver(post_delete, sender=SavingThrowProficiency)
+def invalidate_sheet_on_character_row_change(sender, instance, **kwargs) -> None:
+    """Invalidate the sheet of the character owning a changed row."""
+    _invalidate_sheets([instance.character_id])
+
+
+@receiver(m2m_changed, sender=Character.abilities.through)
+@receiver(m2m_changed, sender=Character.skills.through)
+@receiver(m2m_changed, sender=Character.feats.through)
+def invalidate_sheet_on_m2m_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _invalidate_sheets([instance.pk])
+    elif pk_set:
+        _invalidate_sheets(pk_set)
+    else:
+        # Cleared from the related side: the affected characters are unknown.
+        CharacterSheetService.invalidate_all()
+
+
+@receiver(post_save, sender=Ability)
+def invalidate_sheet_on_ability_save(sender, instance, created: bool, **kwargs) -> None:
+    if not created:
+        _invalidate_sheets(instance.character_set.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Weapon)
+@receiver(post_delete, sender=Weapon)
+def invalidate_sheet_on_weapon_change(sender, instance, **kwargs) -> None:
+    if instance.inventory_id:
+        _invalidate_sheets(
+            Character.objects.filter(inventory_id=instance.inventory_id).values_list(
+                "pk", flat=True
+            )
+        )
+
+
+@receiver(m2m_changed, sender=Species.traits.through)
+@receiver(post_save, sender=SpeciesTrait)
+def invalidate_sheet_on_species_traits_change(sender, **kwargs) -> None:
+    """Species are reference data: invalidate every sheet showing their traits."""
+    if kwargs.get("action", "post_add") in ("post_add", "post_remove", "post_clear"):
+        CharacterSheetService.invalidate_all()
@@ -56,6 +56,7 @@ from character.constants.classes import ClassName
 from character.constants.conditions import ConditionName
 from character.constants.feats import FeatName, FeatType
 from character.constants.species import SpeciesName, SpeciesTraitName
+from character.derived_stats import refresh_derived_stats
 from character.models.abilities import Ability, AbilityType
 from character.models.character import Character
 from character.models.classes import (
@@ -125,6 +126,7 @@ class CharacterFactory(factory.django.DjangoModelFactory):
         for ability_name, _ in AbilityName.choices:
             ability = AbilityFactory(ability_type__name=ability_name)
             character.abilities.add(ability)
+        refresh_derived_stats(character)
         return character
 
 
@@ -0,0 +1,74 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from character.tests.factories import CharacterFactory
+from equipment.tests.factories import WeaponFactory
+from user.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_characters_writes_one_line_per_character(tmp_path):
+    out = StringIO()
+    characters = CharacterFactory.create_batch(3)
+    path = tmp_path / "characters.jsonl"
+    call_command("export_characters", str(path), stdout=out)
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [
+        character.name for character in characters
+    ]
+    assert "Successfully exported 3 characters" in out.getvalue()
+
+
+def test_export_characters_includes_graph(tmp_path):
+    character = CharacterFactory()
+    WeaponFactory(inventory=character.inventory)
+    path = tmp_path / "characters.jsonl"
+    call_command("export_characters", str(path), stdout=StringIO())
+    graph = json.loads(path.read_text())
+    assert graph["user"] == character.user.username
+    assert len(graph["abilities"]) == 6
+    assert len(graph["inventory"]["weapons"]) == 1
+    assert "id" not in graph
+
+
+def test_export_characters_to_stdout():
+    out = StringIO()
+    character = CharacterFactory()
+    call_command("export_characters", "-", stdout=out, stderr=StringIO())
+    assert json.loads(out.getvalue())["name"] == character.name
+
+
+def test_export_characters_filters_users(tmp_path):
+    user = UserFactory()
+    CharacterFactory(user=user)
+    CharacterFactory()
+    path = tmp_path / "characters.jsonl"
+    call_command(
+        "export_characters", str(path), "--user", user.username, stdout=StringIO()
+    )
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_export_characters_query_count(tmp_path, django_assert_max_num_queries):
+    CharacterFactory.create_batch(5)
+    path = tmp_path / "characters.jsonl"
+    # One query for the characters plus one per prefetched relation,
+    # whatever the number of characters.
+    with django_assert_max_num_queries(26):
+        call_command("export_characters", str(path), stdout=StringIO())
+
+
+def test_export_characters_invalid_chunk_size(tmp_path):
+    with pytest.raises(CommandError):
+        call_command(
+            "export_characters",
+            str(tmp_path / "characters.jsonl"),
+            "--chunk-size",
+            "0",
+            stdout=StringIO(),
+        )
@@ -0,0 +1,170 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from character.constants.classes import ClassName
+from character.models.character import Character
+from character.models.classes import Class
+from character.services import CharacterCreationService
+from character.tests.factories import (
+    CharacterConditionFactory,
+    CharacterFactory,
+    SpeciesFactory,
+)
+from character.transfer import export_queryset, serialize_character
+from equipment.constants.equipment import WeaponName
+from equipment.tests.factories import MagicItemFactory
+from magic.tests.factories import (
+    SpellFactory,
+    SpellPreparationFactory,
+    WarlockSpellSlotFactory,
+)
+from user.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def character():
+    character = CharacterCreationService.create_character(
+        UserFactory(),
+        name="Exported Hero",
+        species=SpeciesFactory(),
+        klass=Class.objects.get(name=ClassName.WARLOCK),
+        abilities={
+            "strength": 8,
+            "dexterity": 14,
+            "constitution": 13,
+            "intelligence": 12,
+            "wisdom": 10,
+            "charisma": 15,
+        },
+        background="sage",
+        skills=["Arcana", "Deception"],
+        equipment=[WeaponName.DAGGER],
+    )
+    CharacterConditionFactory(character=character)
+    spell = SpellFactory(character=character)
+    SpellPreparationFactory(character=character, settings=spell.settings)
+    MagicItemFactory(inventory=character.inventory)
+    if not hasattr(character, "pact_magic"):
+        WarlockSpellSlotFactory(character=character)
+    return character
+
+
+def _export(path):
+    call_command("export_characters", str(path), stdout=StringIO())
+
+
+def test_import_characters_round_trip(tmp_path, character):
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    before = serialize_character(export_queryset().get(pk=character.pk))
+    character.delete()
+
+    out = StringIO()
+    call_command("import_characters", str(path), stdout=out)
+
+    imported = export_queryset().get(user__username=before["user"])
+    assert serialize_character(imported) == before
+    assert imported.pact_magic is not None
+    assert "Successfully imported 1 characters" in out.getvalue()
+
+
+def test_import_characters_keeps_masks(tmp_path, character):
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    character.delete()
+    call_command("import_characters", str(path), stdout=StringIO())
+    imported = Character.objects.get(name="Exported Hero")
+    assert imported.is_proficient_with_weapon(WeaponName.DAGGER)
+
+
+def test_import_characters_query_count(tmp_path, django_assert_max_num_queries):
+    characters = CharacterFactory.create_batch(5)
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    for character in characters:
+        character.delete()
+    # One bulk insert per table, whatever the number of characters.
+    with django_assert_max_num_queries(35):
+        call_command("import_characters", str(path), stdout=StringIO())
+    assert Character.objects.count() == 5
+
+
+def test_import_characters_in_batches(tmp_path):
+    characters = CharacterFactory.create_batch(3)
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    for character in characters:
+        character.delete()
+    call_command("import_characters", str(path), "--batch-size", "2", stdout=StringIO())
+    assert Character.objects.count() == 3
+
+
+def test_import_characters_unknown_user(tmp_path):
+    character = CharacterFactory()
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    character.user.delete()
+    with pytest.raises(CommandError, match="Unknown users"):
+        call_command("import_characters", str(path), stdout=StringIO())
+
+
+def test_import_characters_user_has_character(tmp_path):
+    CharacterFactory()
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    with pytest.raises(CommandError, match="already have a character"):
+        call_command("import_characters", str(path), stdout=StringIO())
+    assert Character.objects.count() == 1
+
+
+def test_import_characters_is_atomic(tmp_path):
+    first, second = CharacterFactory.create_batch(2)
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    first.delete()
+    with pytest.raises(CommandError):
+        call_command(
+            "import_characters", str(path), "--batch-size", "1", stdout=StringIO()
+        )
+    assert list(Character.objects.all()) == [second]
+
+
+def test_import_characters_invalid_json(tmp_path):
+    path = tmp_path / "characters.jsonl"
+    path.write_text(json.dumps({"name": "Valid"})[:-1])
+    with pytest.raises(CommandError, match="Invalid JSON"):
+        call_command("import_characters", str(path), stdout=StringIO())
+
+
+def test_import_characters_missing_key(tmp_path, character):
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    graph = json.loads(path.read_text())
+    del graph["inventory"]
+    path.write_text(json.dumps(graph))
+    character.delete()
+    with pytest.raises(CommandError, match="Line 1 misses keys: inventory"):
+        call_command("import_characters", str(path), stdout=StringIO())
+
+
+def test_import_characters_not_an_object(tmp_path, character):
+    path = tmp_path / "characters.jsonl"
+    _export(path)
+    path.write_text(f"{path.read_text()}[1, 2]\n")
+    character.delete()
+    with pytest.raises(CommandError, match="Line 2 is not a JSON object"):
+        call_command("import_characters", str(path), stdout=StringIO())
+    assert not Character.objects.exists()
+
+
+def test_import_characters_missing_file(tmp_path):
+    with pytest.raises(CommandError):
+        call_command(
+            "import_characters", str(tmp_path / "missing.jsonl"), stdout=StringIO()
+        )
@@ -0,0 +1,27 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from character.models.character import Character
+from character.tests.factories import CharacterFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_refresh_derived_stats():
+    out = StringIO()
+    character = CharacterFactory()
+    Character.objects.filter(pk=character.pk).update(ac=0, initiative=0)
+    call_command("refresh_derived_stats", stdout=out)
+    character.refresh_from_db()
+    assert character.ac == 10 + character.dexterity.modifier
+    assert character.initiative == character.dexterity.modifier
+    assert "Successfully refreshed 1 character(s)" in out.getvalue()
+
+
+def test_refresh_derived_stats_up_to_date():
+    out = StringIO()
+    CharacterFactory()
+    call_command("refresh_derived_stats", stdout=out)
+    assert "Successfully refreshed 0 character(s)" in out.getvalue()
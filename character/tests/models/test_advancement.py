@@ -1,6 +1,11 @@
 import pytest
 
-from character.models.advancement import Advancement
+from character.models.advancement import (
+    Advancement,
+    get_xp_thresholds,
+    invalidate_advancement,
+    level_for_xp,
+)
 
 
 @pytest.mark.django_db
@@ -16,3 +21,35 @@ class TestAdvancementModel:
 
     def test_str(self):
         assert str(self.advancement) == str(self.advancement.level)
+
+
+@pytest.mark.django_db
+class TestLevelForXp:
+    @pytest.mark.parametrize(
+        "xp,level",
+        [(0, 1), (299, 1), (300, 2), (899, 2), (6500, 5), (354_999, 19), (355_000, 20)],
+    )
+    def test_level_for_xp(self, xp, level):
+        assert level_for_xp(xp) == level
+
+    def test_capped_at_highest_level(self):
+        assert level_for_xp(10_000_000) == 20
+
+    def test_table_is_queried_once(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            level_for_xp(0)
+            level_for_xp(100_000)
+
+    def test_edit_invalidates_table(self):
+        get_xp_thresholds()
+        Advancement.objects.filter(level=2).update(xp=250)
+        assert level_for_xp(250) == 1
+        invalidate_advancement()
+        assert level_for_xp(250) == 2
+
+    def test_save_invalidates_table(self):
+        get_xp_thresholds()
+        advancement = Advancement.objects.get(level=2)
+        advancement.xp = 250
+        advancement.save()
+        assert level_for_xp(250) == 2
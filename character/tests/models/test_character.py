@@ -4,13 +4,15 @@ from faker import Faker
 from character.constants.abilities import AbilityName
 from character.constants.character import Gender
 from character.constants.feats import FeatName
-from character.constants.species import SpeciesTraitName
+from character.constants.species import SpeciesName, SpeciesTraitName
+from character.models.abilities import Ability
 from character.models.character import Character
 from character.models.feats import CharacterFeat
 from character.models.proficiencies import SavingThrowProficiency
 from character.models.species import SpeciesTrait
 from game.constants.events import Against, RollType
 from utils.dice import DiceString
+from utils.registry import get_registry
 
 from ..factories import AbilityFactory, CharacterFactory, FeatFactory, SpeciesFactory
 
@@ -27,7 +29,7 @@ class TestCharacterModel:
         assert character.xp == 0
         assert character.hp == 100
         assert character.gender == Gender.MALE
-        assert character.ac == 0
+        assert character.ac == 10 + character.dexterity.modifier
 
     def test_str(self, character):
         assert str(character) == character.name
@@ -62,6 +64,42 @@ class TestCharacterModel:
             ability_type__name=AbilityName.CHARISMA
         )
 
+    def test_stats(self, character):
+        assert set(character.stats) == set(AbilityName)
+        assert character.stats[AbilityName.WISDOM] == character.wisdom
+
+    def test_stats_single_query(self, character, django_assert_num_queries):
+        character = Character.objects.get(pk=character.pk)
+        with django_assert_num_queries(1):
+            for name in AbilityName:
+                character.stats[name]
+            character.strength
+            character.dexterity
+
+    def test_stats_uses_prefetch(self, character, django_assert_num_queries):
+        character = Character.objects.prefetch_related("abilities").get(pk=character.pk)
+        with django_assert_num_queries(0):
+            character.constitution
+
+    def test_stats_invalidated_on_ability_save(self, character):
+        other = Character.objects.get(pk=character.pk)
+        assert other.strength.score == character.strength.score
+        ability = character.strength
+        ability.score = 18
+        ability.save()
+        assert other.strength.score == 18
+        assert other.strength.modifier == 4
+
+    def test_stats_invalidated_on_abilities_change(self, character):
+        character.stats
+        character.abilities.remove(character.strength)
+        assert AbilityName.STRENGTH not in character.stats
+
+    def test_stats_missing_ability(self, character):
+        character.abilities.clear()
+        with pytest.raises(Ability.DoesNotExist):
+            character.strength
+
     @pytest.mark.parametrize(
         "level,expected_bonus",
         [
@@ -122,6 +160,20 @@ class TestCharacterModel:
         assert DiceString(character.hit_dice).nb_throws == old_throws + 8
         assert character.max_hp == old_max_hp + character.hp_increase * 8
 
+    def test_xp_increase_past_highest_level(self, character):
+        character.increase_xp(1_000_000)
+        assert character.level == 20
+        character.increase_xp(1)
+        assert character.level == 20
+
+    def test_xp_increase_does_not_query_per_level(
+        self, character, django_assert_max_num_queries
+    ):
+        # The advancement table, then the primary class for the spell save DC
+        with django_assert_max_num_queries(2):
+            character.increase_xp(355_000)
+        assert character.level == 20
+
     def test_is_proficient_ability_present(self, character):
         ability = AbilityFactory(character=character)
         SavingThrowProficiency.objects.create(
@@ -197,6 +249,45 @@ class TestCharacterModel:
         assert character.has_feat(FeatName.SAVAGE_ATTACKER)
         assert not character.has_feat(FeatName.MAGIC_INITIATE_CLERIC)
 
+    def test_feat_names_single_query(self, character, django_assert_num_queries):
+        CharacterFeat.objects.create(
+            character=character, feat=FeatFactory(name=FeatName.ALERT)
+        )
+        character = Character.objects.get(pk=character.pk)
+        with django_assert_num_queries(1):
+            assert character.feat_names == {FeatName.ALERT}
+            character.has_feat(FeatName.ALERT)
+            character.has_feat(FeatName.LUCKY)
+
+    def test_feat_names_invalidated_on_feat_removal(self, character):
+        feat = CharacterFeat.objects.create(
+            character=character, feat=FeatFactory(name=FeatName.ALERT)
+        )
+        assert character.has_feat(FeatName.ALERT)
+        feat.delete()
+        assert not character.has_feat(FeatName.ALERT)
+
+    def test_species_traits_cached_across_characters(self, django_assert_num_queries):
+        species = SpeciesFactory(name=SpeciesName.DWARF)
+        for _ in range(3):
+            CharacterFactory(species=species)
+        characters = Character.objects.filter(species=species).prefetch_related(
+            "active_conditions", "feats"
+        )
+        get_registry()
+        # Characters and their prefetches; species traits come from the registry
+        with django_assert_num_queries(3):
+            for character in characters:
+                assert character.has_advantage(RollType.SAVING_THROW, Against.POISON)
+                assert not character.has_advantage(RollType.SAVING_THROW, Against.CHARM)
+
+    def test_species_traits_invalidated_on_traits_change(self):
+        species = SpeciesFactory(name=SpeciesName.DWARF)
+        character = CharacterFactory(species=species)
+        assert SpeciesTraitName.DWARVEN_RESILIENCE in character.species_traits
+        species.traits.clear()
+        assert character.species_traits == frozenset()
+
 
 @pytest.mark.django_db
 class TestCharacterLocation:
@@ -1,5 +1,12 @@
 import pytest
 
+from character.constants.abilities import AbilityName
+from character.constants.proficiencies import ABILITY_BITS
+from character.constants.skills import SkillName
+from character.models.disadvantages import (
+    AbilityCheckDisadvantage,
+    SavingThrowDisadvantage,
+)
 from character.models.proficiencies import (
     ArmorProficiency,
     SavingThrowProficiency,
@@ -7,6 +14,7 @@ from character.models.proficiencies import (
     ToolProficiency,
     WeaponProficiency,
 )
+from equipment.constants.equipment import ArmorName, WeaponName
 
 from ..factories import (
     AbilityTypeFactory,
@@ -144,3 +152,69 @@ class TestSkillProficiency:
         character_id = character.id
         character.delete()
         assert not SkillProficiency.objects.filter(character_id=character_id).exists()
+
+
+@pytest.mark.django_db
+class TestProficiencyMasks:
+    def test_saving_throw_mask(self, character):
+        ability_type = AbilityTypeFactory(name=AbilityName.WISDOM)
+        SavingThrowProficiency.objects.create(
+            character=character, ability_type=ability_type
+        )
+        assert character.is_proficient_in_saving_throw(AbilityName.WISDOM)
+        assert not character.is_proficient_in_saving_throw(AbilityName.STRENGTH)
+        character.refresh_from_db()
+        assert character.saving_throw_proficiency_mask == ABILITY_BITS["WIS"]
+
+    def test_weapon_mask(self, character):
+        weapon = WeponSettingsFactory(name=WeaponName.LONGBOW)
+        WeaponProficiency.objects.create(character=character, weapon=weapon)
+        assert character.is_proficient_with_weapon(WeaponName.LONGBOW)
+        assert not character.is_proficient_with_weapon(WeaponName.DAGGER)
+
+    def test_mask_synced_from_other_instance(self, character):
+        armor = ArmorSettingsFactory(name=ArmorName.PLATE)
+        ArmorProficiency.objects.create(character_id=character.pk, armor=armor)
+        assert not character.is_proficient_with_armor(ArmorName.PLATE)
+        character.refresh_from_db()
+        assert character.is_proficient_with_armor(ArmorName.PLATE)
+
+    def test_delete_clears_bit(self, character):
+        armor = ArmorSettingsFactory(name=ArmorName.PLATE)
+        proficiency = ArmorProficiency.objects.create(character=character, armor=armor)
+        proficiency.delete()
+        assert not character.is_proficient_with_armor(ArmorName.PLATE)
+        character.refresh_from_db()
+        assert character.armor_proficiency_mask == 0
+
+    def test_update_moves_bit(self, character):
+        proficiency = ArmorProficiency.objects.create(
+            character=character, armor=ArmorSettingsFactory(name=ArmorName.PLATE)
+        )
+        proficiency.armor = ArmorSettingsFactory(name=ArmorName.CHAIN_MAIL)
+        proficiency.save()
+        assert not character.is_proficient_with_armor(ArmorName.PLATE)
+        assert character.is_proficient_with_armor(ArmorName.CHAIN_MAIL)
+        character.refresh_from_db()
+        assert not character.is_proficient_with_armor(ArmorName.PLATE)
+        assert character.is_proficient_with_armor(ArmorName.CHAIN_MAIL)
+
+    def test_delete_keeps_bit_granted_by_another_row(self, character):
+        AbilityCheckDisadvantage.objects.create(
+            character=character, ability_type_id=AbilityName.DEXTERITY
+        )
+        duplicate = AbilityCheckDisadvantage.objects.create(
+            character=character, ability_type_id=AbilityName.DEXTERITY
+        )
+        duplicate.delete()
+        assert character.has_ability_check_disadvantage(AbilityName.DEXTERITY)
+
+    def test_disadvantage_flags(self, character):
+        disadvantage = SavingThrowDisadvantage.objects.create(character=character)
+        assert character.saving_throw_disadvantage
+        disadvantage.delete()
+        assert not character.saving_throw_disadvantage
+
+    def test_check_without_query(self, character, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            character.is_proficient_in_skill(SkillName.PERCEPTION)
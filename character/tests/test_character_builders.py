@@ -3,7 +3,7 @@
 Tests cover:
 - SpeciesBuilder: darkvision, size, speed, languages
 - ClassBuilder: proficiencies (armor, weapon), class features
-- DerivedStatsBuilder: passive perception calculation
+- DerivedStatsBuilder: passive perception
 - SpellcastingBuilder: spell slot setup for casters
 """
 
@@ -375,24 +375,24 @@ class TestDerivedStatsBuilder:
     def test_passive_perception_without_proficiency(self, perception_skill):
         """Test passive perception calculation without proficiency."""
         character = CharacterFactory()
-        builder = DerivedStatsBuilder(character)
+        DerivedStatsBuilder(character).apply()
 
         wis_mod = character.wisdom.modifier
         expected = 10 + wis_mod
 
-        assert builder._calculate_passive_perception() == expected
+        assert character.passive_perception == expected
 
     def test_passive_perception_with_proficiency(self, perception_skill):
         """Test passive perception calculation with proficiency."""
         character = CharacterFactory()
         SkillProficiency.objects.create(character=character, skill=perception_skill)
-        builder = DerivedStatsBuilder(character)
+        DerivedStatsBuilder(character).apply()
 
         wis_mod = character.wisdom.modifier
         prof_bonus = character.proficiency_bonus
         expected = 10 + wis_mod + prof_bonus
 
-        assert builder._calculate_passive_perception() == expected
+        assert character.passive_perception == expected
 
     def test_passive_perception_higher_level(self, perception_skill):
         """Test passive perception at higher levels."""
@@ -400,12 +400,12 @@ class TestDerivedStatsBuilder:
         character.level = 5  # Proficiency bonus = +3
         character.save()
         SkillProficiency.objects.create(character=character, skill=perception_skill)
-        builder = DerivedStatsBuilder(character)
+        DerivedStatsBuilder(character).apply()
 
         wis_mod = character.wisdom.modifier
         expected = 10 + wis_mod + 3
 
-        assert builder._calculate_passive_perception() == expected
+        assert character.passive_perception == expected
 
 
 # =============================================================================
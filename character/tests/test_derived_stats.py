@@ -0,0 +1,239 @@
+import pytest
+
+from character.constants.abilities import AbilityName
+from character.constants.conditions import ConditionName
+from character.constants.feats import FeatName
+from character.constants.skills import SkillName
+from character.constants.species import SpeciesName
+from character.derived_stats import (
+    DERIVED_STATS,
+    Input,
+    derived_fields,
+    refresh_derived_stats,
+    update_derived_stats,
+)
+from character.models.character import Character
+from character.models.proficiencies import SkillProficiency
+from equipment.constants.equipment import ArmorName, WeaponName
+from equipment.constants.magic_items import MagicItemName
+from equipment.models.equipment import Armor
+from equipment.models.magic_items import Attunement, MagicItem
+from magic.tests.factories import ActiveSpellEffectFactory
+from utils.registry import get_registry
+
+from .factories import (
+    CharacterConditionFactory,
+    CharacterFactory,
+    CharacterFeatFactory,
+    ConditionFactory,
+    FeatFactory,
+    SpeciesFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def set_score(character: Character, ability_name: str, score: int) -> None:
+    ability = character.stats[ability_name]
+    ability.score = score
+    ability.save()
+    character.refresh_from_db()
+
+
+@pytest.fixture
+def character():
+    character = CharacterFactory(xp=0, species=SpeciesFactory(name=SpeciesName.HUMAN))
+    set_score(character, AbilityName.STRENGTH, 10)
+    set_score(character, AbilityName.DEXTERITY, 14)
+    set_score(character, AbilityName.WISDOM, 12)
+    return character
+
+
+class TestDependencies:
+    def test_every_input_has_dependents(self):
+        assert all(derived_fields([input_]) for input_ in Input)
+
+    def test_derived_fields(self):
+        assert derived_fields([Input.ARMOR]) == ["ac", "speed"]
+        assert derived_fields([Input.CLASS]) == ["spell_save_dc"]
+        assert derived_fields() == list(DERIVED_STATS)
+
+    def test_only_dependent_stats_are_recomputed(self, character):
+        character.initiative = 99
+        update_derived_stats(character, [Input.ARMOR])
+        assert character.initiative == 99
+        update_derived_stats(character, [Input.FEATS])
+        assert character.initiative == 2
+
+    def test_unchanged_stats_are_not_saved(
+        self, character, django_assert_max_num_queries
+    ):
+        with django_assert_max_num_queries(10) as context:
+            assert refresh_derived_stats(character) == []
+        assert not any(
+            query["sql"].startswith("UPDATE") for query in context.captured_queries
+        )
+
+
+class TestArmorClass:
+    def test_unarmored(self, character):
+        assert character.ac == 10 + 2
+
+    def test_armor(self, character):
+        character.inventory.add(ArmorName.CHAIN_MAIL)
+        character.refresh_from_db()
+        assert character.ac == 16
+
+    def test_armor_with_capped_dex_modifier(self, character):
+        set_score(character, AbilityName.DEXTERITY, 18)
+        character.inventory.add(ArmorName.HIDE)
+        character.refresh_from_db()
+        assert character.ac == 12 + 2
+
+    def test_shield_adds_to_unarmored_ac(self, character):
+        character.inventory.add(ArmorName.SHIELD)
+        character.refresh_from_db()
+        assert character.ac == 10 + 2 + 2
+
+    def test_best_armor_is_worn(self, character):
+        character.inventory.add_all(
+            [ArmorName.LEATHER, ArmorName.CHAIN_MAIL, ArmorName.SHIELD]
+        )
+        character.refresh_from_db()
+        assert character.ac == 16 + 2
+
+    def test_removing_armor(self, character):
+        character.inventory.add(ArmorName.CHAIN_MAIL)
+        Armor.objects.filter(inventory=character.inventory).delete()
+        character.refresh_from_db()
+        assert character.ac == 12
+
+    def test_dexterity_change(self, character):
+        set_score(character, AbilityName.DEXTERITY, 16)
+        assert character.ac == 13
+
+    def test_spell_effect(self, character):
+        effect = ActiveSpellEffectFactory(character=character, template__ac_modifier=2)
+        character.refresh_from_db()
+        assert character.ac == 14
+        effect.delete()
+        character.refresh_from_db()
+        assert character.ac == 12
+
+    def test_magic_item(self, character):
+        MagicItem.objects.create(
+            settings_id=MagicItemName.ARMOR_PLUS_1, inventory=character.inventory
+        )
+        character.refresh_from_db()
+        assert character.ac == 13
+
+    def test_magic_item_requiring_attunement(self, character):
+        settings = get_registry().magic_items.get(MagicItemName.RING_OF_PROTECTION)
+        item = MagicItem.objects.create(
+            settings_id=settings.name, inventory=character.inventory
+        )
+        character.refresh_from_db()
+        assert character.ac == 12
+        attunement = Attunement.attune(character, item)
+        assert character.ac == 12 + settings.effects["ac_bonus"]
+        attunement.end_attunement()
+        assert character.ac == 12
+
+
+class TestSpeed:
+    def test_species_speed(self, character):
+        assert character.speed == character.species.speed
+
+    def test_heavy_armor_without_strength(self, character):
+        character.inventory.add(ArmorName.PLATE)
+        character.refresh_from_db()
+        assert character.speed == character.species.speed - 10
+
+    def test_strength_increase_restores_speed(self, character):
+        character.inventory.add(ArmorName.PLATE)
+        set_score(character, AbilityName.STRENGTH, 15)
+        assert character.speed == character.species.speed
+
+    def test_heavy_armor_with_strength(self, character):
+        set_score(character, AbilityName.STRENGTH, 15)
+        character.inventory.add(ArmorName.PLATE)
+        character.refresh_from_db()
+        assert character.speed == character.species.speed
+
+
+class TestInitiative:
+    def test_dexterity_modifier(self, character):
+        assert character.initiative == 2
+
+    def test_alert_feat(self, character):
+        CharacterFeatFactory(character=character, feat=FeatFactory(name=FeatName.ALERT))
+        assert character.initiative == 2 + character.proficiency_bonus
+
+
+class TestPassivePerception:
+    def test_wisdom_modifier(self, character):
+        assert character.passive_perception == 11
+
+    def test_proficiency(self, character):
+        SkillProficiency.objects.create(
+            character=character, skill_id=SkillName.PERCEPTION
+        )
+        assert character.passive_perception == 11 + character.proficiency_bonus
+
+    def test_condition_disadvantage(self, character):
+        condition = CharacterConditionFactory(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.POISONED),
+        )
+        assert character.passive_perception == 11 - 5
+        condition.delete()
+        assert character.passive_perception == 11
+
+
+class TestCarryingCapacity:
+    def test_strength_score(self, character):
+        assert character.carrying_capacity == 150
+        set_score(character, AbilityName.STRENGTH, 16)
+        assert character.carrying_capacity == 240
+
+    def test_powerful_build(self, character):
+        character.species = SpeciesFactory(name=SpeciesName.GOLIATH)
+        character.save()
+        refresh_derived_stats(character, [Input.SPECIES])
+        assert character.carrying_capacity == 300
+
+
+class TestEncumbrance:
+    def test_load_over_capacity(self, character):
+        character.inventory.add(WeaponName.MAUL, 15)
+        assert not character.encumbered
+        character.inventory.add(WeaponName.MAUL)
+        character.refresh_from_db()
+        assert character.encumbered
+        character.inventory.consume(WeaponName.MAUL, 2)
+        character.refresh_from_db()
+        assert not character.encumbered
+
+    def test_strength_increase(self, character):
+        character.inventory.add(WeaponName.MAUL, 16)
+        set_score(character, AbilityName.STRENGTH, 12)
+        assert not character.encumbered
+
+    def test_reading_the_load_does_not_sum_items(
+        self, character, django_assert_num_queries
+    ):
+        character.inventory.add(WeaponName.MAUL, 16)
+        with django_assert_num_queries(1):
+            character = Character.objects.select_related("inventory").get(
+                pk=character.pk
+            )
+            assert character.inventory.weight == 160
+            assert character.encumbered
+
+
+class TestLevel:
+    def test_level_up(self, character):
+        character.increase_xp(6500)
+        assert character.level == 5
+        assert character.spell_save_dc == 8 + 3
+        assert character.initiative == 2
@@ -0,0 +1,144 @@
+import pytest
+
+from character.constants.abilities import AbilityName
+from character.constants.conditions import ConditionName
+from character.constants.effects import Effect, EffectRule, EffectSource
+from character.effects import (
+    RollEffects,
+    compile_roll_effects,
+    condition_sources,
+    get_roll_effects,
+    get_speed,
+)
+from game.constants.events import Against, RollType
+
+from .factories import CharacterConditionFactory, CharacterFactory, ConditionFactory
+
+
+def sources(*conditions):
+    result = set()
+    for condition in conditions:
+        result |= condition_sources(condition)
+    return frozenset(result)
+
+
+class TestCompileRollEffects:
+    def test_restricted_to_ability(self):
+        rule = EffectRule(
+            EffectSource.CONDITION,
+            ConditionName.RESTRAINED,
+            Effect.DISADVANTAGE,
+            (RollType.SAVING_THROW,),
+            abilities=(AbilityName.DEXTERITY,),
+        )
+        table = compile_roll_effects([rule])
+        source = (EffectSource.CONDITION, ConditionName.RESTRAINED, 0)
+        assert table[(RollType.SAVING_THROW, AbilityName.DEXTERITY, None)] == {
+            Effect.DISADVANTAGE: frozenset({source})
+        }
+        assert table[(RollType.SAVING_THROW, AbilityName.STRENGTH, None)] == {}
+        assert table[(RollType.SAVING_THROW, None, None)] == {}
+
+    def test_restricted_to_threat(self):
+        rule = EffectRule(
+            EffectSource.SPECIES_TRAIT,
+            "brave",
+            Effect.ADVANTAGE,
+            (RollType.SAVING_THROW,),
+            against=Against.BEING_FRIGHTENED,
+        )
+        table = compile_roll_effects([rule])
+        assert table[(RollType.SAVING_THROW, None, Against.BEING_FRIGHTENED)]
+        assert table[(RollType.SAVING_THROW, None, Against.POISON)] == {}
+
+    def test_speed_rules_are_skipped(self):
+        rule = EffectRule(EffectSource.CONDITION, "grappled", Effect.SPEED_ZERO)
+        assert not any(compile_roll_effects([rule]).values())
+
+
+class TestGetRollEffects:
+    def test_no_sources(self):
+        assert get_roll_effects(frozenset(), RollType.ATTACK) == RollEffects()
+
+    def test_poisoned(self):
+        effects = get_roll_effects(
+            sources(ConditionName.POISONED), RollType.ATTACK, AbilityName.STRENGTH
+        )
+        assert effects == RollEffects(disadvantage=True)
+
+    def test_stunned_fails_strength_saves(self):
+        stunned = sources(ConditionName.STUNNED)
+        assert get_roll_effects(
+            stunned, RollType.SAVING_THROW, AbilityName.STRENGTH
+        ).auto_fail
+        assert not get_roll_effects(
+            stunned, RollType.SAVING_THROW, AbilityName.WISDOM
+        ).auto_fail
+
+    def test_exhaustion_levels(self):
+        level_2 = frozenset(condition_sources(ConditionName.EXHAUSTION, 2))
+        level_3 = frozenset(condition_sources(ConditionName.EXHAUSTION, 3))
+        assert get_roll_effects(level_2, RollType.ABILITY_CHECK).disadvantage
+        assert not get_roll_effects(level_2, RollType.ATTACK).disadvantage
+        assert get_roll_effects(level_3, RollType.ATTACK).disadvantage
+
+
+class TestGetSpeed:
+    def test_unaffected(self):
+        assert get_speed(sources(ConditionName.POISONED), 30) == 30
+
+    def test_speed_zero(self):
+        assert get_speed(sources(ConditionName.GRAPPLED), 30) == 0
+
+    def test_speed_halved(self):
+        exhausted = frozenset(condition_sources(ConditionName.EXHAUSTION, 2))
+        assert get_speed(exhausted, 30) == 15
+
+    def test_speed_zero_wins(self):
+        exhausted = frozenset(condition_sources(ConditionName.EXHAUSTION, 5))
+        assert get_speed(exhausted, 30) == 0
+
+
+@pytest.mark.django_db
+class TestCharacterEffects:
+    @pytest.fixture
+    def character(self):
+        return CharacterFactory(species=None, speed=30)
+
+    def test_no_conditions(self, character):
+        assert character.roll_effects(RollType.ATTACK) == RollEffects()
+        assert character.effective_speed == 30
+
+    def test_condition(self, character):
+        CharacterConditionFactory(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.RESTRAINED),
+        )
+        assert character.has_disadvantage(RollType.ATTACK, None)
+        assert character.has_disadvantage(
+            RollType.SAVING_THROW, None, ability_name=AbilityName.DEXTERITY
+        )
+        assert character.effective_speed == 0
+
+    def test_condition_removed(self, character):
+        condition = CharacterConditionFactory(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.POISONED),
+        )
+        assert character.has_disadvantage(RollType.ABILITY_CHECK, None)
+        condition.delete()
+        assert not character.has_disadvantage(RollType.ABILITY_CHECK, None)
+
+    def test_exhaustion_level(self, character):
+        CharacterConditionFactory(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.EXHAUSTION),
+            exhaustion_level=2,
+        )
+        assert character.effective_speed == 15
+
+    def test_memoized(self, character, django_assert_num_queries):
+        character.roll_effects(RollType.ATTACK)
+        with django_assert_num_queries(0):
+            character.roll_effects(RollType.SAVING_THROW, AbilityName.DEXTERITY)
+            character.effective_speed
@@ -1,21 +1,32 @@
+from unittest.mock import patch
+
 import pytest
+from django.core.cache import cache
 
 from magic.constants.spells import SpellLevel, SpellSchool
 from magic.models.spells import Concentration
 
+from ..constants.abilities import AbilityName
 from ..constants.classes import ClassName
+from ..constants.feats import FeatName
+from ..constants.skills import SkillName
+from ..models.character import Character
 from ..models.classes import Class
+from ..models.feats import CharacterFeat
 from ..services import (
     CharacterCreationService,
     CharacterSheetService,
     SpellsPanelService,
 )
 from equipment.constants.equipment import ArmorName, GearName, ToolName, WeaponName
+from equipment.models.equipment import Weapon, WeaponSettings
 from user.tests.factories import UserFactory
+from utils.registry import get_registry
 
 from .factories import (
     CharacterFactory,
     CharacterSpellSlotFactory,
+    FeatFactory,
     SpeciesFactory,
     SpellFactory,
     SpellPreparationFactory,
@@ -522,6 +533,36 @@ class TestCharacterSheetServiceGetData:
         assert "bonus" in attack
         assert "damage" in attack
 
+    def test_returns_one_attack_per_weapon(self, character):
+        """Two daggers and a pack give two dagger attacks."""
+        from equipment.constants.equipment import PackName, WeaponName
+
+        character.inventory.add_all(
+            [WeaponName.DAGGER, WeaponName.DAGGER, PackName.EXPLORERS_PACK]
+        )
+
+        data = CharacterSheetService.get_character_sheet_data(character)
+
+        assert [attack["name"] for attack in data["attacks"]] == [
+            WeaponName.DAGGER,
+            WeaponName.DAGGER,
+        ]
+
+    def test_consuming_a_weapon_refreshes_attacks(self, character):
+        """Stack updates bypass the Weapon signals but still refresh the sheet."""
+        from equipment.constants.equipment import WeaponName
+
+        character.inventory.add(WeaponName.DAGGER, 2)
+        assert (
+            len(CharacterSheetService.get_character_sheet_data(character)["attacks"])
+            == 2
+        )
+
+        character.inventory.consume(WeaponName.DAGGER)
+
+        data = CharacterSheetService.get_character_sheet_data(character)
+        assert len(data["attacks"]) == 1
+
     def test_returns_empty_attacks_without_weapons(self, character):
         """Empty attacks list when character has no weapons."""
         data = CharacterSheetService.get_character_sheet_data(character)
@@ -553,6 +594,84 @@ class TestCharacterSheetServiceGetData:
         assert data["inventory"] is character.inventory
 
 
+@pytest.mark.django_db
+class TestCharacterSheetServiceCache:
+    """Tests for the versioned cache of the character sheet."""
+
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_repeat_read_hits_cache(self, character, django_assert_num_queries):
+        data = CharacterSheetService.get_character_sheet_data(character)
+        with django_assert_num_queries(0):
+            assert CharacterSheetService.get_character_sheet_data(character) == data
+
+    def test_feat_invalidates(self, character):
+        CharacterSheetService.get_character_sheet_data(character)
+        CharacterFeat.objects.create(
+            character=character, feat=FeatFactory(name=FeatName.ALERT)
+        )
+        data = CharacterSheetService.get_character_sheet_data(character)
+        assert [feat["name"] for feat in data["feats"]] == ["Alert"]
+
+    def test_character_save_invalidates(self, character):
+        CharacterSheetService.get_character_sheet_data(character)
+        character.level = 17
+        character.save()
+        data = CharacterSheetService.get_character_sheet_data(character)
+        strength = next(st for st in data["saving_throws"] if st["name"] == "STR")
+        assert strength["modifier"] == character.strength.modifier + (
+            6 if strength["proficient"] else 0
+        )
+
+    def test_weapon_invalidates(self, character):
+        CharacterSheetService.get_character_sheet_data(character)
+        settings = WeaponSettings.objects.get(name=WeaponName.LONGSWORD)
+        Weapon.objects.create(settings=settings, inventory=character.inventory)
+        data = CharacterSheetService.get_character_sheet_data(character)
+        assert len(data["attacks"]) == 1
+
+    def test_species_trait_invalidates_every_sheet(self, character):
+        other = CharacterFactory(species=character.species)
+        CharacterSheetService.get_character_sheet_data(character)
+        CharacterSheetService.get_character_sheet_data(other)
+        trait = character.species.traits.first()
+        trait.description = "Rewritten"
+        trait.save()
+        for sheet_owner in (character, other):
+            data = CharacterSheetService.get_character_sheet_data(sheet_owner)
+            assert "Rewritten" in [t["description"] for t in data["racial_traits"]]
+
+    def test_invalidate_all_is_one_request(self, character):
+        CharacterSheetService.get_character_sheet_data(character)
+        CharacterFactory.create_batch(3)
+        with patch.object(cache, "incr", wraps=cache.incr) as incr:
+            CharacterSheetService.invalidate_all()
+        incr.assert_called_once_with(CharacterSheetService.REFERENCE_VERSION_KEY)
+
+    def test_lost_version_rebuilds(self, character):
+        CharacterSheetService.get_character_sheet_data(character)
+        cache.delete(f"character-sheet-version:{character.pk}")
+        CharacterFeat.objects.create(
+            character=character, feat=FeatFactory(name=FeatName.ALERT)
+        )
+        data = CharacterSheetService.get_character_sheet_data(character)
+        assert len(data["feats"]) == 1
+
+    def test_build_query_count(self, character, django_assert_num_queries):
+        character = Character.objects.get(pk=character.pk)
+        get_registry()
+        # Abilities, skills, weapons, class features, feats
+        with django_assert_num_queries(5):
+            CharacterSheetService.build_character_sheet_data(character)
+
+
 @pytest.mark.django_db
 class TestCharacterCreationService:
     """Tests for CharacterCreationService.create_character."""
@@ -671,3 +790,66 @@ class TestCharacterCreationService:
         )
 
         assert character.inventory.contains(WeaponName.HANDAXE, 2)
+
+    @pytest.mark.parametrize("class_name", ClassName.values)
+    def test_query_count(self, class_name, django_assert_max_num_queries):
+        """Every class is created with a bounded number of queries."""
+        user = UserFactory()
+        species = SpeciesFactory()
+        klass = Class.objects.get(name=class_name)
+        # Reference data comes from the registry, and the derived stats are
+        # computed once, after the equipment. A character spans about 20
+        # tables, each written with its own INSERT (inventory, abilities and
+        # their links, languages, class, proficiencies, features, feat, one
+        # per kind of equipment, disadvantages of armor worn without
+        # proficiency), plus the lookup of existing weapon and gear stacks
+        # and the inputs of the derived stats: a rogue in chain mail, the
+        # worst case, takes 36 statements.
+        get_registry()
+        with django_assert_max_num_queries(36):
+            CharacterCreationService.create_character(
+                user=user,
+                name="Counted Hero",
+                species=species,
+                klass=klass,
+                abilities=self.STANDARD_ABILITIES,
+                background="acolyte",
+                skills=[],
+                equipment=[ArmorName.CHAIN_MAIL],
+            )
+
+    def test_persists_proficiency_masks(self):
+        """Masks of bulk-created proficiencies are saved with the character."""
+        character = CharacterCreationService.create_character(
+            user=UserFactory(),
+            name="Masked Hero",
+            species=SpeciesFactory(),
+            klass=Class.objects.get(name=ClassName.FIGHTER),
+            abilities=self.STANDARD_ABILITIES,
+            background="acolyte",
+            skills=[],
+            equipment=[],
+        )
+
+        character = Character.objects.get(pk=character.pk)
+        assert character.is_proficient_in_saving_throw(AbilityName.STRENGTH)
+        assert not character.is_proficient_in_saving_throw(AbilityName.WISDOM)
+        assert character.is_proficient_with_armor(ArmorName.PLATE)
+        assert character.is_proficient_with_weapon(WeaponName.LONGSWORD)
+        assert character.is_proficient_in_skill(SkillName.INSIGHT)
+
+    def test_persists_armor_class(self):
+        """AC computed from the class equipment is saved with the character."""
+        character = CharacterCreationService.create_character(
+            user=UserFactory(),
+            name="Armored Hero",
+            species=SpeciesFactory(),
+            klass=Class.objects.get(name=ClassName.ROGUE),
+            abilities=self.STANDARD_ABILITIES,
+            background="criminal",
+            skills=[],
+            equipment=[],
+        )
+
+        # Leather armor: 11 + DEX modifier
+        assert Character.objects.get(pk=character.pk).ac == 13
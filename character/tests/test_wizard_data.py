@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from character.constants.backgrounds import Background
+from character.constants.classes import ClassName
+from character.constants.feats import FeatName
+from character.forms.equipment_choices_providers import CLASS_EQUIPMENT_CHOICES
+from character.models.feats import Feat
+from character.models.species import Species
+from character.wizard_data import BLOB_NAMES, get_wizard_data
+from utils.registry import get_registry, invalidate_registry
+
+from .factories import ClassFactory, SpeciesFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestWizardData:
+    def test_built_once_per_registry(self, django_assert_num_queries):
+        wizard_data = get_wizard_data()
+        with django_assert_num_queries(0):
+            assert get_wizard_data() is wizard_data
+
+    def test_rebuilt_when_registry_changes(self):
+        wizard_data = get_wizard_data()
+        invalidate_registry()
+        assert get_wizard_data() is not wizard_data
+
+    def test_built_without_queries_from_a_loaded_registry(
+        self, django_assert_num_queries
+    ):
+        get_registry()
+        with django_assert_num_queries(0):
+            get_wizard_data()
+
+    def test_species_preview(self):
+        species = SpeciesFactory()
+        preview = get_wizard_data().species[species.name]
+        assert preview["speed"] == species.speed
+        assert preview["size"] == species.get_size_display()
+        assert Species.objects.count() == len(get_wizard_data().species)
+
+    def test_class_preview(self):
+        klass = ClassFactory()
+        preview = get_wizard_data().classes[klass.name]
+        assert preview["hit_die"] == f"d{klass.hit_die}"
+        assert preview["primary_ability"] == klass.primary_ability.get_name_display()
+
+    def test_class_preview_level_1_features(self):
+        fighter = get_registry().classes.get(ClassName.FIGHTER)
+        features = get_wizard_data().classes[ClassName.FIGHTER]["level_1_features"]
+        assert [feature["name"] for feature in features] == [
+            feature.name for feature in fighter.features.filter(level=1)
+        ]
+
+    def test_background_preview(self):
+        backgrounds = get_wizard_data().backgrounds
+        assert set(backgrounds) == set(Background.values)
+        feat = Feat.objects.get(name=FeatName.MAGIC_INITIATE_CLERIC)
+        assert backgrounds[Background.ACOLYTE]["origin_feat"] == {
+            "name": feat.get_name_display(),
+            "description": feat.description,
+        }
+
+    @pytest.mark.parametrize("class_name", CLASS_EQUIPMENT_CHOICES)
+    def test_equipment_choices(self, class_name):
+        provider_class, fields = CLASS_EQUIPMENT_CHOICES[class_name]
+        provider = provider_class()
+        choices = get_wizard_data().equipment_choices[class_name]
+        assert {
+            field: set(field_choices) for field, field_choices in choices.items()
+        } == {
+            field: provider.get_choices(field)
+            for field in fields
+            if provider.get_choices(field)
+        }
+
+    @pytest.mark.parametrize("name", BLOB_NAMES)
+    def test_blob_holds_payload(self, name):
+        wizard_data = get_wizard_data()
+        blob = wizard_data.blobs[name]
+        assert json.loads(blob.content) == getattr(wizard_data, name)
+
+    def test_blob_version_follows_content(self):
+        version = get_wizard_data().blobs["species"].version
+        assert get_wizard_data().blobs["classes"].version != version
+        species = Species.objects.first()
+        species.speed += 5
+        species.save()
+        assert get_wizard_data().blobs["species"].version != version
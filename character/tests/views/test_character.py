@@ -23,7 +23,10 @@ from character.models.skills import Skill
 from character.views.character import (
     CharacterCreateView,
     CharacterDetailView,
+    WizardDataView,
+    wizard_data_url,
 )
+from character.wizard_data import get_wizard_data
 from game.tests.factories import GameFactory, PlayerFactory
 from user.tests.factories import UserFactory
 
@@ -243,6 +246,11 @@ class TestCharacterCreateView:
         assert response.status_code == 200
         assertTemplateUsed(response, "character/wizard/step_species.html")
 
+    def test_species_step_links_preview(self, client):
+        response = client.get(reverse(self.path_name))
+        assert response.context["species_preview_url"] == wizard_data_url("species")
+        assertContains(response, wizard_data_url("species"))
+
     @pytest.fixture
     def species_form(self):
         """Step 0: Species selection form."""
@@ -562,17 +570,18 @@ class TestCharacterCreateView:
         self,
         client,
         dwarf_species_form,
-        class_form,
+        wizard_class_form,
         abilities_form,
         background_form,
-        skills_form,
-        equipment_form,
         review_form,
     ):
         """Test dwarf character creation with D&D 2024 rules."""
+        # Wizards wear no armor: the speed is the species' own.
+        skills_form = self._make_skills_form(ClassName.WIZARD)
+        equipment_form = self._make_equipment_form(ClassName.WIZARD)
         form_list = [
             dwarf_species_form,
-            class_form,
+            wizard_class_form,
             abilities_form,
             background_form,
             skills_form,
@@ -591,17 +600,17 @@ class TestCharacterCreateView:
         self,
         client,
         elf_species_form,
-        class_form,
+        wizard_class_form,
         abilities_form,
         background_form,
-        skills_form,
-        equipment_form,
         review_form,
     ):
         """Test elf character creation with D&D 2024 rules."""
+        skills_form = self._make_skills_form(ClassName.WIZARD)
+        equipment_form = self._make_equipment_form(ClassName.WIZARD)
         form_list = [
             elf_species_form,
-            class_form,
+            wizard_class_form,
             abilities_form,
             background_form,
             skills_form,
@@ -620,17 +629,17 @@ class TestCharacterCreateView:
         self,
         client,
         halfling_species_form,
-        class_form,
+        wizard_class_form,
         abilities_form,
         background_form,
-        skills_form,
-        equipment_form,
         review_form,
     ):
         """Test halfling character creation with D&D 2024 rules."""
+        skills_form = self._make_skills_form(ClassName.WIZARD)
+        equipment_form = self._make_equipment_form(ClassName.WIZARD)
         form_list = [
             halfling_species_form,
-            class_form,
+            wizard_class_form,
             abilities_form,
             background_form,
             skills_form,
@@ -651,17 +660,17 @@ class TestCharacterCreateView:
         self,
         client,
         human_species_form,
-        class_form,
+        wizard_class_form,
         abilities_form,
         background_form,
-        skills_form,
-        equipment_form,
         review_form,
     ):
         """Test human character creation with D&D 2024 rules."""
+        skills_form = self._make_skills_form(ClassName.WIZARD)
+        equipment_form = self._make_equipment_form(ClassName.WIZARD)
         form_list = [
             human_species_form,
-            class_form,
+            wizard_class_form,
             abilities_form,
             background_form,
             skills_form,
@@ -763,6 +772,34 @@ class TestCharacterCreateView:
         assert inventory.contains(equipment_form[f"{step}-third_weapon"])
         assert inventory.contains(equipment_form[f"{step}-pack"])
 
+    def test_fighter_in_chain_mail(
+        self,
+        client,
+        human_species_form,
+        fighter_class_form,
+        abilities_form,
+        background_form,
+        review_form,
+    ):
+        skills_form = self._make_skills_form(ClassName.FIGHTER)
+        equipment_form = self._make_equipment_form(ClassName.FIGHTER)
+        step = CharacterCreateView.Step.EQUIPMENT_SELECTION
+        equipment_form[f"{step}-first_weapon"] = ArmorName.CHAIN_MAIL
+        form_list = [
+            human_species_form,
+            fighter_class_form,
+            abilities_form,
+            background_form,
+            skills_form,
+            equipment_form,
+            review_form,
+        ]
+        character = self._create_character(client, form_list)
+        # Chain mail sets the AC to 16 and needs Strength 13: with 10, the
+        # speed drops by 10 feet.
+        assert character.ac == 16
+        assert character.speed == 20
+
     def test_rogue_creation(
         self,
         client,
@@ -984,3 +1021,35 @@ class TestCharacterCreateView:
         assert character.ideal in BACKGROUNDS[Background.SOLDIER]["ideals"].values()
         assert character.bond in BACKGROUNDS[Background.SOLDIER]["bonds"].values()
         assert character.flaw in BACKGROUNDS[Background.SOLDIER]["flaws"].values()
+
+
+@pytest.mark.django_db
+class TestWizardDataView:
+    path_name = "character-wizard-data"
+
+    def test_view_mapping(self, client):
+        response = client.get(wizard_data_url("species"))
+        assert response.resolver_match.func.view_class == WizardDataView
+
+    @pytest.mark.parametrize("name", ["species", "classes", "backgrounds", "skills"])
+    def test_serves_payload(self, client, name):
+        response = client.get(wizard_data_url(name))
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == getattr(get_wizard_data(), name)
+
+    def test_cached_for_a_year(self, client):
+        response = client.get(wizard_data_url("species"))
+        assert "max-age=31536000" in response["Cache-Control"]
+        assert "public" in response["Cache-Control"]
+        assert "immutable" in response["Cache-Control"]
+
+    def test_stale_version_redirects(self, client):
+        response = client.get(reverse(self.path_name, args=("species", "stale")))
+        assertRedirects(
+            response, wizard_data_url("species"), fetch_redirect_response=False
+        )
+
+    def test_unknown_payload(self, client):
+        response = client.get(reverse(self.path_name, args=("monsters", "stale")))
+        assert response.status_code == 404
@@ -0,0 +1,346 @@
+"""Stream characters to and from JSON Lines.
+
+Each line holds a whole character graph: its fields, abilities, classes,
+features, feats, proficiencies, disadvantages, conditions, inventory and
+spells. Reference data (species, skills, settings, class features...) is
+referenced by primary key, so a dump can be loaded in any environment where
+the same fixtures are installed. The owner is referenced by username.
+
+Export iterates over characters in chunks, prefetching the related rows of
+each chunk. Import reads the same number of lines at a time and writes each
+table with one bulk_create, so memory stays constant whatever the number of
+characters.
+
+Combat state (events, active spell effects, summons, concentration) and
+attunements are not part of the graph.
+"""
+
+import json
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, TextIO
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+
+from equipment.models.equipment import Armor, Gear, Inventory, Pack, Tool, Weapon
+from equipment.models.magic_items import MagicItem
+from magic.models.spells import (
+    CharacterSpellSlot,
+    Spell,
+    SpellPreparation,
+    WarlockSpellSlot,
+)
+from user.models import User
+
+from .exceptions import CharacterImportError
+from .models.abilities import Ability
+from .models.character import Character
+from .models.classes import CharacterClass, CharacterFeature
+from .models.conditions import CharacterCondition
+from .models.disadvantages import (
+    AbilityCheckDisadvantage,
+    AttackRollDisadvantage,
+    SavingThrowDisadvantage,
+    SpellCastDisadvantage,
+)
+from .models.feats import CharacterFeat
+from .models.proficiencies import (
+    ArmorProficiency,
+    SavingThrowProficiency,
+    SkillProficiency,
+    ToolProficiency,
+    WeaponProficiency,
+)
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Rows with a foreign key to the character: (key, model, reverse accessor)
+CHARACTER_ROWS: tuple[tuple[str, type[models.Model], str], ...] = (
+    ("classes", CharacterClass, "character_classes"),
+    ("class_features", CharacterFeature, "class_features"),
+    ("feats", CharacterFeat, "character_feats"),
+    (
+        "saving_throw_proficiencies",
+        SavingThrowProficiency,
+        "savingthrowproficiency_set",
+    ),
+    ("skill_proficiencies", SkillProficiency, "skillproficiency_set"),
+    ("armor_proficiencies", ArmorProficiency, "armorproficiency_set"),
+    ("weapon_proficiencies", WeaponProficiency, "weaponproficiency_set"),
+    ("tool_proficiencies", ToolProficiency, "toolproficiency_set"),
+    (
+        "ability_check_disadvantages",
+        AbilityCheckDisadvantage,
+        "abilitycheckdisadvantage_set",
+    ),
+    ("attack_roll_disadvantages", AttackRollDisadvantage, "attackrolldisadvantage_set"),
+    (
+        "saving_throw_disadvantages",
+        SavingThrowDisadvantage,
+        "savingthrowdisadvantage_set",
+    ),
+    ("spell_cast_disadvantages", SpellCastDisadvantage, "spellcastdisadvantage_set"),
+    ("conditions", CharacterCondition, "active_conditions"),
+    ("spells", Spell, "spells_known"),
+    ("prepared_spells", SpellPreparation, "prepared_spells"),
+    ("spell_slots", CharacterSpellSlot, "spell_slots"),
+)
+
+# Rows with a foreign key to the inventory: (key, model, reverse accessor)
+INVENTORY_ROWS: tuple[tuple[str, type[models.Model], str], ...] = (
+    ("armor", Armor, "armor_set"),
+    ("weapons", Weapon, "weapon_set"),
+    ("packs", Pack, "pack_set"),
+    ("gear", Gear, "gear_set"),
+    ("tools", Tool, "tool_set"),
+    ("magic_items", MagicItem, "magicitem_set"),
+)
+
+# Many-to-many relations without a through model of their own.
+CHARACTER_M2M = ("skills", "languages")
+
+# Keys every graph holds, with the types of their values.
+REQUIRED_KEYS: dict[str, tuple[type, ...]] = {
+    "user": (str,),
+    "abilities": (list,),
+    "inventory": (dict, type(None)),
+    "pact_magic": (dict, type(None)),
+    **{name: (list,) for name in CHARACTER_M2M},
+}
+
+# Fields that identify a row rather than describe it.
+_EXCLUDED_FIELDS = {"id", "character_id", "inventory_id", "user_id"}
+
+
+def _field_names(model: type[models.Model]) -> list[str]:
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.attname not in _EXCLUDED_FIELDS
+    ]
+
+
+def _to_dict(instance: models.Model, field_names: list[str]) -> dict[str, Any]:
+    return {name: getattr(instance, name) for name in field_names}
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def serialize_character(character: Character) -> dict[str, Any]:
+    """Return the graph of a character, as written on one JSONL line.
+
+    The character is expected to come from ``export_queryset()``; other
+    instances work too, at the cost of one query per relation.
+    """
+    data = _to_dict(character, _field_names(Character))
+    data["user"] = character.user.username
+    data["abilities"] = [
+        _to_dict(ability, _field_names(Ability))
+        for ability in character.abilities.all()
+    ]
+    for name in CHARACTER_M2M:
+        data[name] = [related.pk for related in getattr(character, name).all()]
+    for key, model, accessor in CHARACTER_ROWS:
+        field_names = _field_names(model)
+        data[key] = [
+            _to_dict(row, field_names) for row in getattr(character, accessor).all()
+        ]
+    try:
+        pact_magic = character.pact_magic
+    except WarlockSpellSlot.DoesNotExist:
+        pact_magic = None
+    data["pact_magic"] = (
+        _to_dict(pact_magic, _field_names(WarlockSpellSlot)) if pact_magic else None
+    )
+
+    inventory = character.inventory
+    if inventory is None:
+        data["inventory"] = None
+    else:
+        data["inventory"] = _to_dict(inventory, _field_names(Inventory))
+        for key, model, accessor in INVENTORY_ROWS:
+            field_names = _field_names(model)
+            data["inventory"][key] = [
+                _to_dict(row, field_names) for row in getattr(inventory, accessor).all()
+            ]
+    return data
+
+
+def export_queryset() -> models.QuerySet[Character]:
+    """Characters with every relation exported by ``serialize_character()``."""
+    return (
+        Character.objects.select_related("user", "inventory", "pact_magic")
+        .prefetch_related(
+            "abilities",
+            *CHARACTER_M2M,
+            *(accessor for _, _, accessor in CHARACTER_ROWS),
+            *(f"inventory__{accessor}" for _, _, accessor in INVENTORY_ROWS),
+        )
+        .order_by("pk")
+    )
+
+
+def export_characters(
+    stream: TextIO,
+    queryset: models.QuerySet[Character] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Write one JSON line per character. Returns the number of characters.
+
+    Related rows are prefetched once per chunk of ``chunk_size`` characters.
+    """
+    if queryset is None:
+        queryset = export_queryset()
+    count = 0
+    for character in queryset.iterator(chunk_size=chunk_size):
+        line = json.dumps(serialize_character(character), cls=DjangoJSONEncoder)
+        stream.write(f"{line}\n")
+        count += 1
+    return count
+
+
+def _build_rows(
+    model: type[models.Model], rows: list[dict[str, Any]], **owner: Any
+) -> list[models.Model]:
+    field_names = set(_field_names(model))
+    return [
+        model(
+            **owner,
+            **{name: value for name, value in row.items() if name in field_names},
+        )
+        for row in rows
+    ]
+
+
+def _resolve_users(graphs: list[dict[str, Any]]) -> dict[str, User]:
+    usernames = [graph["user"] for graph in graphs]
+    users = User.objects.in_bulk(usernames, field_name="username")
+    if duplicates := sorted(
+        username for username, count in Counter(usernames).items() if count > 1
+    ):
+        raise CharacterImportError(
+            f"Users with several characters: {', '.join(duplicates)}"
+        )
+    if missing := sorted(set(usernames) - set(users)):
+        raise CharacterImportError(f"Unknown users: {', '.join(missing)}")
+    if taken := sorted(
+        Character.objects.filter(user__in=users.values()).values_list(
+            "user__username", flat=True
+        )
+    ):
+        raise CharacterImportError(
+            f"Users already have a character: {', '.join(taken)}"
+        )
+    return users
+
+
+def _parse_graph(line: str, number: int) -> dict[str, Any]:
+    """Decode the graph of a line, checking its keys before anything is written."""
+    try:
+        graph = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise CharacterImportError(f"Invalid JSON on line {number}: {exc}") from exc
+    if not isinstance(graph, dict):
+        raise CharacterImportError(f"Line {number} is not a JSON object")
+    if missing := [key for key in REQUIRED_KEYS if key not in graph]:
+        raise CharacterImportError(f"Line {number} misses keys: {', '.join(missing)}")
+    if invalid := [
+        key for key, types in REQUIRED_KEYS.items() if not isinstance(graph[key], types)
+    ]:
+        raise CharacterImportError(
+            f"Line {number} has invalid values for: {', '.join(invalid)}"
+        )
+    return graph
+
+
+def _import_batch(graphs: list[dict[str, Any]]) -> None:
+    users = _resolve_users(graphs)
+
+    # Characters without an inventory get None, to keep the lists aligned.
+    inventories = iter(
+        Inventory.objects.bulk_create(
+            _build_rows(
+                Inventory,
+                [graph["inventory"] for graph in graphs if graph["inventory"]],
+            )
+        )
+    )
+    inventories = [
+        next(inventories) if graph["inventory"] else None for graph in graphs
+    ]
+    characters = Character.objects.bulk_create(
+        Character(
+            user=users[graph["user"]],
+            inventory=inventory,
+            **{name: graph[name] for name in _field_names(Character) if name in graph},
+        )
+        for graph, inventory in zip(graphs, inventories)
+    )
+
+    abilities = []
+    ability_links = []
+    for graph, character in zip(graphs, characters):
+        for ability in _build_rows(Ability, graph["abilities"]):
+            abilities.append(ability)
+            ability_links.append((character, ability))
+    Ability.objects.bulk_create(abilities)
+    Character.abilities.through.objects.bulk_create(
+        Character.abilities.through(character=character, ability=ability)
+        for character, ability in ability_links
+    )
+    for name in CHARACTER_M2M:
+        through = getattr(Character, name).through
+        target = getattr(Character, name).field.m2m_reverse_field_name()
+        through.objects.bulk_create(
+            through(character=character, **{f"{target}_id": pk})
+            for graph, character in zip(graphs, characters)
+            for pk in graph[name]
+        )
+
+    for key, model, _ in CHARACTER_ROWS:
+        model.objects.bulk_create(
+            row
+            for graph, character in zip(graphs, characters)
+            for row in _build_rows(model, graph.get(key, []), character=character)
+        )
+    WarlockSpellSlot.objects.bulk_create(
+        WarlockSpellSlot(character=character, **graph["pact_magic"])
+        for graph, character in zip(graphs, characters)
+        if graph.get("pact_magic")
+    )
+    for key, model, _ in INVENTORY_ROWS:
+        model.objects.bulk_create(
+            row
+            for graph, inventory in zip(graphs, inventories)
+            if inventory is not None
+            for row in _build_rows(
+                model, graph["inventory"].get(key, []), inventory=inventory
+            )
+        )
+
+
+def import_characters(stream: TextIO, batch_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Create the characters of a JSONL stream. Returns the number of characters.
+
+    Lines are read ``batch_size`` at a time and every table is written with one
+    bulk_create per batch. The whole import runs in a single transaction, so
+    an invalid line leaves the database unchanged.
+
+    Raises:
+        CharacterImportError: If a line is not a character graph (naming the
+            line), or its user is unknown or already has a character.
+    """
+    lines = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+    count = 0
+    with transaction.atomic():
+        for batch in _batched(lines, batch_size):
+            graphs = [_parse_graph(line, number) for number, line in batch]
+            _import_batch(graphs)
+            count += len(graphs)
+    return count
@@ -7,7 +7,11 @@ from .views.abilities import (
     AbilitySaveView,
     AbilityStandardArrayView,
 )
-from .views.character import CharacterCreateView, CharacterDetailView
+from .views.character import (
+    CharacterCreateView,
+    CharacterDetailView,
+    WizardDataView,
+)
 from .views.hp import (
     AddTempHPView,
     DeathSaveView,
@@ -39,6 +43,11 @@ urlpatterns = [
         CharacterCreateView.as_view(),
         name="character-create",
     ),
+    path(
+        "create_character/data/<str:name>/<str:version>.json",
+        WizardDataView.as_view(),
+        name="character-wizard-data",
+    ),
     # HTMX HP Bar endpoints
     path(
         "<int:pk>/hp/",
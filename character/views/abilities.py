@@ -319,7 +319,7 @@ class AbilitySaveView(LoginRequiredMixin, View):
     """Save the assigned ability scores to the character."""
 
     def post(self, request, pk: int) -> HttpResponse:
-        from ..models.abilities import Ability, AbilityType
+        from ..models.abilities import Ability
 
         character = get_object_or_404(Character, pk=pk)
 
@@ -348,9 +348,8 @@ class AbilitySaveView(LoginRequiredMixin, View):
             # Ensure score is within valid range
             final_score = max(1, min(30, final_score))
 
-            ability_type = AbilityType.objects.get(name=name)
             ability = Ability.objects.create(
-                ability_type=ability_type,
+                ability_type_id=name,
                 score=final_score,
             )
             character.abilities.add(ability)
@@ -358,7 +357,7 @@ class AbilitySaveView(LoginRequiredMixin, View):
         # Return success state
         abilities = []
         for name, label in AbilityName.choices:
-            ability = character.abilities.get(ability_type__name=name)
+            ability = character.stats[name]
             abilities.append(
                 {
                     "name": name,
@@ -1,11 +1,15 @@
-import json
 from enum import StrEnum
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.views import View
 from django.views.generic import DetailView
 from formtools.wizard.views import SessionWizardView
 
+from utils.registry import get_registry
+
 from ..forms.wizard_forms import (
     AbilityScoreForm,
     BackgroundSelectForm,
@@ -16,7 +20,15 @@ from ..forms.wizard_forms import (
     SpeciesSelectForm,
 )
 from ..models.character import Character
+from ..models.classes import Class
 from ..services import CharacterCreationService, CharacterSheetService
+from ..wizard_data import get_wizard_data
+
+
+def wizard_data_url(name: str) -> str:
+    """Return the URL of a wizard payload, versioned by its content."""
+    blob = get_wizard_data().blobs[name]
+    return reverse("character-wizard-data", args=(name, blob.version))
 
 
 class CharacterDetailView(LoginRequiredMixin, DetailView):
@@ -128,26 +140,22 @@ class CharacterCreateView(LoginRequiredMixin, SessionWizardView):
         current_step = self.steps.current
 
         if current_step == self.Step.SPECIES_SELECTION:
-            context["species_preview"] = json.dumps(form.get_species_preview_data())
+            context["species_preview_url"] = wizard_data_url("species")
 
         elif current_step == self.Step.CLASS_SELECTION:
-            context["class_preview"] = json.dumps(form.get_class_preview_data())
+            context["class_preview_url"] = wizard_data_url("classes")
 
         elif current_step == self.Step.BACKGROUND_SELECTION:
-            context["background_preview"] = json.dumps(
-                form.get_background_preview_data()
-            )
+            context["background_preview_url"] = wizard_data_url("backgrounds")
 
         elif current_step == self.Step.SKILLS_SELECTION:
-            context["skill_descriptions"] = json.dumps(form.get_skill_descriptions())
+            context["skill_descriptions_url"] = wizard_data_url("skills")
             # Pass class info for display
             class_data = self.storage.get_step_data(self.Step.CLASS_SELECTION)
             if class_data:
-                from ..models.classes import Class
-
                 klass_pk = class_data.get("1-klass")
                 try:
-                    klass = Class.objects.get(pk=klass_pk)
+                    klass = get_registry().classes.get(klass_pk)
                     context["selected_class"] = klass.get_name_display()
                 except Class.DoesNotExist:
                     pass
@@ -156,11 +164,9 @@ class CharacterCreateView(LoginRequiredMixin, SessionWizardView):
             # Pass class info for display
             class_data = self.storage.get_step_data(self.Step.CLASS_SELECTION)
             if class_data:
-                from ..models.classes import Class
-
                 klass_pk = class_data.get("1-klass")
                 try:
-                    klass = Class.objects.get(pk=klass_pk)
+                    klass = get_registry().classes.get(klass_pk)
                     context["selected_class"] = klass.get_name_display()
                 except Class.DoesNotExist:
                     pass
@@ -219,3 +225,25 @@ class CharacterCreateView(LoginRequiredMixin, SessionWizardView):
         )
 
         return HttpResponseRedirect(character.get_absolute_url())
+
+
+class WizardDataView(View):
+    """
+    Serve a precomputed wizard payload as JSON.
+
+    The URL holds a digest of the payload, so responses never change and are
+    cached for a year. A stale digest (e.g. after a deploy) redirects to the
+    current one.
+    """
+
+    max_age = 365 * 24 * 60 * 60
+
+    def get(self, request, name, version):
+        blob = get_wizard_data().blobs.get(name)
+        if blob is None:
+            raise Http404(f"Unknown wizard data: {name}")
+        if version != blob.version:
+            return HttpResponseRedirect(wizard_data_url(name))
+        response = HttpResponse(blob.content, content_type="application/json")
+        patch_cache_control(response, public=True, max_age=self.max_age, immutable=True)
+        return response
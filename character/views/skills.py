@@ -6,9 +6,10 @@ from django.shortcuts import get_object_or_404
 from django.template.loader import render_to_string
 from django.views import View
 
+from utils.registry import get_registry
+
 from ..constants.abilities import AbilityName
 from ..models.character import Character
-from ..models.skills import Skill
 
 
 class SkillsPanelMixin:
@@ -22,13 +23,13 @@ class SkillsPanelMixin:
     ):
         """Build skills context data with optional ability filter."""
         # Get all skills
-        all_skills = Skill.objects.all().select_related("ability_type")
+        all_skills = get_registry().skills
         character_skill_names = set(character.skills.values_list("name", flat=True))
 
         # Build ability modifier lookup
-        ability_modifiers = {}
-        for ability in character.abilities.all().select_related("ability_type"):
-            ability_modifiers[ability.ability_type.name] = ability.modifier
+        ability_modifiers = {
+            name: ability.modifier for name, ability in character.stats.items()
+        }
 
         # Build skills list
         skills = []
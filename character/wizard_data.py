@@ -0,0 +1,211 @@
+"""Precomputed payloads of the character creation wizard.
+
+The species, class, background and skill previews, and the equipment choices
+of each class, only depend on reference data. They are built once per
+registry (so once per process, until fixtures are reloaded) and each preview
+is also serialized to a JSON blob, named after a digest of its content.
+
+The wizard templates fetch the blobs from ``WizardDataView``, which serves
+them with long-lived cache headers: a browser downloads each preview once per
+deploy, and rendering a wizard step only costs the session I/O.
+
+Payloads are shared by every request: they must not be modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from utils.registry import Registry, get_registry
+
+from .constants.backgrounds import BACKGROUNDS, Background
+from .constants.skills import SkillName
+from .forms.equipment_choices_providers import CLASS_EQUIPMENT_CHOICES
+
+ARMOR_PROFICIENCY_DISPLAY = {
+    "LA": "Light Armor",
+    "MA": "Medium Armor",
+    "HA": "Heavy Armor",
+    "SH": "Shields",
+}
+
+WEAPON_PROFICIENCY_DISPLAY = {
+    "simple": "Simple Weapons",
+    "martial": "Martial Weapons",
+}
+
+# Payloads served as JSON blobs, by name.
+BLOB_NAMES = ("species", "classes", "backgrounds", "skills")
+
+
+def _species_preview(registry: Registry) -> dict[str, Any]:
+    return {
+        species.name: {
+            "display_name": species.get_name_display(),
+            "size": species.get_size_display(),
+            "speed": species.speed,
+            "darkvision": species.darkvision,
+            "description": species.description,
+            "traits": [
+                {"name": trait.get_name_display(), "description": trait.description}
+                for trait in species.traits.all()
+            ],
+            "languages": [lang.get_name_display() for lang in species.languages.all()],
+        }
+        for species in registry.species
+    }
+
+
+def _class_preview(registry: Registry) -> dict[str, Any]:
+    return {
+        klass.name: {
+            "display_name": klass.get_name_display(),
+            "description": klass.description,
+            "hit_die": f"d{klass.hit_die}",
+            "hp_first_level": klass.hp_first_level,
+            "primary_ability": registry.ability_types.get(
+                klass.primary_ability_id
+            ).get_name_display(),
+            "saving_throws": [
+                ability_type.get_name_display()
+                for ability_type in klass.saving_throws.all()
+            ],
+            "armor_proficiencies": [
+                ARMOR_PROFICIENCY_DISPLAY.get(p, p) for p in klass.armor_proficiencies
+            ],
+            "weapon_proficiencies": [
+                WEAPON_PROFICIENCY_DISPLAY.get(p, p) for p in klass.weapon_proficiencies
+            ],
+            "level_1_features": [
+                {"name": feature.name, "description": feature.description}
+                for feature in klass.features.all()
+                if feature.level == 1
+            ],
+        }
+        for klass in registry.classes
+    }
+
+
+def _background_preview(registry: Registry) -> dict[str, Any]:
+    preview_data = {}
+    for bg_value, bg_display in Background.choices:
+        bg_data = BACKGROUNDS.get(bg_value, {})
+        tool_prof = bg_data.get("tool_proficiency")
+        origin_feat_name = bg_data.get("origin_feat")
+
+        feat_info = None
+        if origin_feat_name:
+            if origin_feat_name in registry.feats:
+                feat = registry.feats.get(origin_feat_name)
+                feat_info = {
+                    "name": feat.get_name_display(),
+                    "description": feat.description,
+                }
+            else:
+                feat_info = {"name": origin_feat_name, "description": ""}
+
+        preview_data[bg_value] = {
+            "display_name": bg_display,
+            "skill_proficiencies": [
+                SkillName(s).label for s in bg_data.get("skill_proficiencies", set())
+            ],
+            "tool_proficiency": tool_prof.label if tool_prof else None,
+            "origin_feat": feat_info,
+            "personality_traits": list(bg_data.get("personality_traits", {}).values()),
+            "ideals": list(bg_data.get("ideals", {}).values()),
+            "bonds": list(bg_data.get("bonds", {}).values()),
+            "flaws": list(bg_data.get("flaws", {}).values()),
+        }
+    return preview_data
+
+
+def _skill_descriptions(registry: Registry) -> dict[str, Any]:
+    return {
+        skill.name: {
+            "display_name": skill.get_name_display(),
+            "ability": skill.ability_type.get_name_display(),
+            "description": skill.description,
+        }
+        for skill in registry.skills
+    }
+
+
+def _equipment_choices(
+    registry: Registry,
+) -> dict[str, dict[str, list[tuple[str, str]]]]:
+    """Return the non-empty equipment choices of each class, by form field."""
+    equipment_choices = {}
+    for class_name, (provider_class, fields) in CLASS_EQUIPMENT_CHOICES.items():
+        provider = provider_class()
+        equipment_choices[class_name] = {
+            field: sorted(choices)
+            for field in fields
+            if (choices := provider.get_choices(field))
+        }
+    return equipment_choices
+
+
+@dataclass(frozen=True)
+class Blob:
+    """A payload serialized to JSON, with a digest of its content."""
+
+    content: bytes
+    version: str
+
+    @classmethod
+    def dump(cls, payload: Any) -> Blob:
+        content = json.dumps(payload, separators=(",", ":")).encode()
+        return cls(content=content, version=hashlib.sha256(content).hexdigest()[:16])
+
+
+@dataclass(frozen=True)
+class WizardData:
+    """Every payload of the wizard, built from one registry."""
+
+    registry: Registry
+    species: dict[str, Any]
+    classes: dict[str, Any]
+    backgrounds: dict[str, Any]
+    skills: dict[str, Any]
+    equipment_choices: Mapping[str, Mapping[str, list[tuple[str, str]]]]
+    blobs: Mapping[str, Blob]
+
+    @classmethod
+    def build(cls, registry: Registry) -> WizardData:
+        payloads = {
+            "species": _species_preview(registry),
+            "classes": _class_preview(registry),
+            "backgrounds": _background_preview(registry),
+            "skills": _skill_descriptions(registry),
+        }
+        return cls(
+            registry=registry,
+            equipment_choices=MappingProxyType(_equipment_choices(registry)),
+            blobs=MappingProxyType(
+                {name: Blob.dump(payloads[name]) for name in BLOB_NAMES}
+            ),
+            **payloads,
+        )
+
+
+_wizard_data: WizardData | None = None
+
+
+def get_wizard_data() -> WizardData:
+    """Return the wizard payloads, building them when the registry changed."""
+    global _wizard_data
+    registry = get_registry()
+    if _wizard_data is None or _wizard_data.registry is not registry:
+        _wizard_data = WizardData.build(registry)
+    return _wizard_data
+
+
+def invalidate_wizard_data() -> None:
+    """Drop the wizard payloads; they are built again on next use."""
+    global _wizard_data
+    _wizard_data = None
@@ -12,6 +12,12 @@ import pytest
 from django.core.management import call_command
 from django.core.management.commands import loaddata
 
+from bestiary.index import invalidate_bestiary_index
+from character.models.advancement import invalidate_advancement
+from character.wizard_data import invalidate_wizard_data
+from magic.spell_slots import get_spell_slot_matrix
+from utils.registry import invalidate_registry
+
 
 # List of fixtures to load in order (dependencies first)
 FIXTURES = [
@@ -45,3 +51,19 @@ def django_db_setup(django_db_setup, django_db_blocker):
     with django_db_blocker.unblock():
         for fixture in FIXTURES:
             call_command(loaddata.Command(), fixture, verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def clear_reference_data_caches():
+    """Reference data is cached per process; tests roll back their changes."""
+    invalidate_advancement()
+    invalidate_registry()
+    invalidate_wizard_data()
+    invalidate_bestiary_index()
+    get_spell_slot_matrix.cache_clear()
+    yield
+    invalidate_advancement()
+    invalidate_registry()
+    invalidate_wizard_data()
+    invalidate_bestiary_index()
+    get_spell_slot_matrix.cache_clear()
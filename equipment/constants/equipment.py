@@ -289,3 +289,33 @@ class ToolType(TextChoices):
     GAMING_SET = "GS", "Gaming set"
     MUSICAL_INSTRUMENT = "MU", "Musical instrument"
     MISC = "MI", "Misc"
+
+
+class EquipmentKind(TextChoices):
+    ARMOR = "armor", "Armor"
+    WEAPON = "weapon", "Weapon"
+    PACK = "pack", "Pack"
+    GEAR = "gear", "Gear"
+    TOOL = "tool", "Tool"
+
+
+# Equipment name -> kind, so dispatching on a name is a dict lookup.
+# Names are unique across the catalogs.
+EQUIPMENT_KINDS: dict[str, EquipmentKind] = {
+    name: kind
+    for kind, names in (
+        (EquipmentKind.ARMOR, ArmorName),
+        (EquipmentKind.WEAPON, WeaponName),
+        (EquipmentKind.PACK, PackName),
+        (EquipmentKind.GEAR, GearName),
+        (EquipmentKind.TOOL, ToolName),
+    )
+    for name in names.values
+}
+
+# Kinds whose items stack into one row with a quantity.
+STACKABLE_KINDS = frozenset({EquipmentKind.WEAPON, EquipmentKind.GEAR})
+
+# Kinds whose settings carry a weight. Packs, gear and tools are weightless
+# until their catalogs record one.
+WEIGHED_KINDS = frozenset({EquipmentKind.ARMOR, EquipmentKind.WEAPON})
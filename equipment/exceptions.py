@@ -1,2 +1,6 @@
 class EquipmentDoesNotExist(Exception):
     pass
+
+
+class EquipmentNotStackable(Exception):
+    pass
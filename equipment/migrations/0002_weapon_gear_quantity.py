@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gear",
+            name="quantity",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="weapon",
+            name="quantity",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+    ]
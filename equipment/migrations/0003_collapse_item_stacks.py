@@ -0,0 +1,51 @@
+"""
+Collapse duplicate weapon and gear rows of an inventory into one stack.
+
+The first row of each (inventory, settings) pair keeps the summed quantity;
+the other rows are deleted.
+"""
+
+from django.db import migrations
+from django.db.models import Count, Min, Sum
+
+STACKABLE_MODELS = ("Weapon", "Gear")
+
+
+def forwards(apps, schema_editor):
+    for model_name in STACKABLE_MODELS:
+        model = apps.get_model("equipment", model_name)
+        duplicates = (
+            model.objects.filter(inventory__isnull=False)
+            .values("inventory_id", "settings_id")
+            .annotate(rows=Count("pk"), first=Min("pk"), total=Sum("quantity"))
+            .filter(rows__gt=1)
+            .order_by()
+        )
+        for stack in duplicates:
+            rows = model.objects.filter(
+                inventory_id=stack["inventory_id"], settings_id=stack["settings_id"]
+            )
+            rows.filter(pk=stack["first"]).update(quantity=stack["total"])
+            rows.exclude(pk=stack["first"]).delete()
+
+
+def backwards(apps, schema_editor):
+    for model_name in STACKABLE_MODELS:
+        model = apps.get_model("equipment", model_name)
+        for stack in model.objects.filter(quantity__gt=1):
+            model.objects.bulk_create(
+                model(settings_id=stack.settings_id, inventory_id=stack.inventory_id)
+                for _ in range(stack.quantity - 1)
+            )
+            stack.quantity = 1
+            stack.save(update_fields=["quantity"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0002_weapon_gear_quantity"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
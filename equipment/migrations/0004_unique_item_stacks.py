@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0003_collapse_item_stacks"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="gear",
+            constraint=models.UniqueConstraint(
+                fields=("inventory", "settings"), name="unique_gear_stack"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="weapon",
+            constraint=models.UniqueConstraint(
+                fields=("inventory", "settings"), name="unique_weapon_stack"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0004_unique_item_stacks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="armorsettings",
+            name="ac_bonus",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="armorsettings",
+            name="adds_dex_modifier",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="armorsettings",
+            name="base_ac",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="armorsettings",
+            name="dex_modifier_max",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="armorsettings",
+            name="strength_requirement",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
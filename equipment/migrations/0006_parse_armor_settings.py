@@ -0,0 +1,41 @@
+"""
+Parse the AC and strength strings of existing armor into structured fields.
+
+New rows are parsed when saved, by equipment.signals.
+"""
+
+from django.db import migrations
+
+from equipment.utils.equipment_parsers import parse_ac_settings, parse_strength
+
+
+def forwards(apps, schema_editor):
+    ArmorSettings = apps.get_model("equipment", "ArmorSettings")
+    armor = list(ArmorSettings.objects.all())
+    for settings in armor:
+        base_ac, is_dex_modifier, modifier_max, bonus = parse_ac_settings(settings.ac)
+        settings.base_ac = base_ac
+        settings.ac_bonus = bonus
+        settings.adds_dex_modifier = is_dex_modifier
+        settings.dex_modifier_max = modifier_max or None
+        settings.strength_requirement = parse_strength(settings.strength)
+    ArmorSettings.objects.bulk_update(
+        armor,
+        [
+            "base_ac",
+            "ac_bonus",
+            "adds_dex_modifier",
+            "dex_modifier_max",
+            "strength_requirement",
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0005_armorsettings_structured_ac"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
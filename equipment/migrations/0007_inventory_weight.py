@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0006_parse_armor_settings"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="inventory",
+            name="capacity",
+        ),
+        migrations.AddField(
+            model_name="inventory",
+            name="weight",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
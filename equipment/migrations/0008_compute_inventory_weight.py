@@ -0,0 +1,41 @@
+"""
+Compute the carried weight of existing inventories.
+
+It is then maintained by Inventory and equipment.signals as items are added
+and removed.
+"""
+
+from django.db import migrations
+from django.db.models import F, Sum
+
+
+def forwards(apps, schema_editor):
+    Inventory = apps.get_model("equipment", "Inventory")
+    weights = {}
+    for model_name, weight in (
+        ("Armor", F("settings__weight")),
+        ("Weapon", F("settings__weight") * F("quantity")),
+        ("MagicItem", F("settings__weight")),
+    ):
+        model = apps.get_model("equipment", model_name)
+        for inventory_id, total in (
+            model.objects.filter(inventory__isnull=False)
+            .values_list("inventory_id")
+            .annotate(total=Sum(weight))
+            .order_by()
+        ):
+            weights[inventory_id] = weights.get(inventory_id, 0) + total
+    inventories = list(Inventory.objects.filter(pk__in=weights))
+    for inventory in inventories:
+        inventory.weight = weights[inventory.pk]
+    Inventory.objects.bulk_update(inventories, ["weight"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("equipment", "0007_inventory_weight"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
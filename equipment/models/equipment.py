@@ -1,11 +1,21 @@
-from django.db import models
-from django.db.models import TextChoices
+from collections import Counter
+from collections.abc import Iterable
+from functools import cached_property
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
+from django.db.models import Count, F, Sum, TextChoices
 
 from character.constants.abilities import AbilityName
+from character.constants.proficiencies import ABILITY_BITS, to_mask
 from equipment.constants.equipment import (
+    EQUIPMENT_KINDS,
+    STACKABLE_KINDS,
+    WEIGHED_KINDS,
     ArmorName,
     ArmorType,
     Disadvantage,
+    EquipmentKind,
     GearName,
     GearType,
     PackName,
@@ -15,50 +25,32 @@ from equipment.constants.equipment import (
     WeaponName,
     WeaponType,
 )
-from equipment.exceptions import EquipmentDoesNotExist
+from equipment.exceptions import EquipmentDoesNotExist, EquipmentNotStackable
 from character.models.disadvantages import (
     AbilityCheckDisadvantage,
     AttackRollDisadvantage,
     SavingThrowDisadvantage,
     SpellCastDisadvantage,
 )
-from character.models.proficiencies import ArmorProficiency
 from equipment.utils.equipment_parsers import parse_ac_settings, parse_strength
+from utils.registry import Table, get_registry
 
 
 class Inventory(models.Model):
-    capacity = models.SmallIntegerField(default=0)
+    """
+    Items held by a character.
+
+    The carried weight, in pounds, is maintained as items are added and
+    removed, so reading it never sums the item tables. Quantity changes go
+    through add() and consume().
+    """
+
+    weight = models.PositiveIntegerField(default=0)
     gp = models.SmallIntegerField(default=0)
 
     class Meta:
         db_table = "character_inventory"
 
-    def _compute_ac(self, armor) -> None:
-        """
-        Compute character's Armor Class (AC) depending on the selected armor.
-        """
-        base_ac, is_dex_modifier, modifier_max, bonus = parse_ac_settings(
-            armor.settings.ac
-        )
-        self.character.ac = base_ac + bonus
-        if is_dex_modifier:
-            dex_modifier = self.character.abilities.get(
-                ability_type=AbilityName.DEXTERITY
-            ).modifier
-            if modifier_max > 0 and dex_modifier > modifier_max:
-                self.character.ac += modifier_max
-            else:
-                self.character.ac += dex_modifier
-
-    def _reduce_speed(self, armor) -> None:
-        """
-        Reduce character's speed depending on the selected armor.
-        """
-        max_strength = parse_strength(armor.settings.strength)
-        strength = self.character.abilities.get(ability_type=AbilityName.STRENGTH).score
-        if strength < max_strength:
-            self.character.speed -= 10
-
     def _set_disadvantage(self, armor) -> None:
         """
         Set disadvantage on rolls depending on the selected armor.
@@ -68,104 +60,270 @@ class Inventory(models.Model):
           saving throws, attack rolls, and spell casting.
         - If armor has stealth disadvantage: disadvantage on Dexterity (Stealth) checks.
         """
-        if not ArmorProficiency.objects.filter(
-            character=self.character, armor=armor.settings
-        ).exists():
-            for ability_name, _ in AbilityName.choices:
-                AbilityCheckDisadvantage.objects.create(
-                    character=self.character, ability_type_id=ability_name
-                )
-            SavingThrowDisadvantage.objects.create(character=self.character)
-            AttackRollDisadvantage.objects.create(
-                character=self.character, ability_type_id=AbilityName.STRENGTH
+        character = self.character
+        ability_checks = []
+        attack_rolls = []
+        flags = {}
+        if not character.is_proficient_with_armor(armor.settings_id):
+            ability_checks += AbilityName.values
+            attack_rolls += [AbilityName.STRENGTH, AbilityName.DEXTERITY]
+            SavingThrowDisadvantage.objects.bulk_create(
+                [SavingThrowDisadvantage(character=character)]
             )
-            AttackRollDisadvantage.objects.create(
-                character=self.character, ability_type_id=AbilityName.DEXTERITY
+            SpellCastDisadvantage.objects.bulk_create(
+                [SpellCastDisadvantage(character=character)]
             )
-            SpellCastDisadvantage.objects.create(character=self.character)
+            flags = {"saving_throw_disadvantage": True, "spell_cast_disadvantage": True}
         if armor.settings.stealth == Disadvantage.DISADVANTAGE:
-            AbilityCheckDisadvantage.objects.create(
-                character=self.character, ability_type_id=AbilityName.DEXTERITY
-            )
+            ability_checks.append(AbilityName.DEXTERITY)
+        if not ability_checks:
+            return
 
-    def _add_armor(self, equipment_name: TextChoices) -> None:
-        armor = Armor.objects.create(
-            settings=ArmorSettings.objects.get(name=equipment_name), inventory=self
+        AbilityCheckDisadvantage.objects.bulk_create(
+            AbilityCheckDisadvantage(character=character, ability_type_id=name)
+            for name in ability_checks
         )
-        self._compute_ac(armor)
-        self._reduce_speed(armor)
-        self._set_disadvantage(armor)
-
-    def _add_weapon(self, equipment_name: TextChoices) -> None:
-        Weapon.objects.create(
-            settings=WeaponSettings.objects.get(name=equipment_name), inventory=self
+        AttackRollDisadvantage.objects.bulk_create(
+            AttackRollDisadvantage(character=character, ability_type_id=name)
+            for name in attack_rolls
         )
-
-    def _add_pack(self, equipment_name: TextChoices) -> None:
-        Pack.objects.create(
-            settings=PackSettings.objects.get(name=equipment_name), inventory=self
+        # bulk_create bypasses the signals keeping the masks and flags in sync.
+        check_mask = to_mask(ABILITY_BITS, ability_checks)
+        attack_mask = to_mask(ABILITY_BITS, attack_rolls)
+        character.ability_check_disadvantage_mask |= check_mask
+        character.attack_roll_disadvantage_mask |= attack_mask
+        for field, value in flags.items():
+            setattr(character, field, value)
+        type(character).objects.filter(pk=character.pk).update(
+            **flags,
+            ability_check_disadvantage_mask=F("ability_check_disadvantage_mask").bitor(
+                check_mask
+            ),
+            attack_roll_disadvantage_mask=F("attack_roll_disadvantage_mask").bitor(
+                attack_mask
+            ),
         )
 
-    def _add_gear(self, equipment_name: TextChoices) -> None:
-        Gear.objects.create(
-            settings=GearSettings.objects.get(name=equipment_name), inventory=self
-        )
+    @staticmethod
+    def _catalogs() -> dict[EquipmentKind, tuple[type[models.Model], Table]]:
+        """Return the item model and settings table of each equipment kind."""
+        registry = get_registry()
+        return {
+            EquipmentKind.ARMOR: (Armor, registry.armor),
+            EquipmentKind.WEAPON: (Weapon, registry.weapons),
+            EquipmentKind.PACK: (Pack, registry.packs),
+            EquipmentKind.GEAR: (Gear, registry.gear),
+            EquipmentKind.TOOL: (Tool, registry.tools),
+        }
+
+    def _refresh_derived_stats(self, armor: bool = False, load: bool = False) -> None:
+        # Bulk inserts and stack updates bypass the item signals refreshing
+        # the derived stats.
+        from character.derived_stats import Input, refresh_derived_stats
+
+        inputs = [
+            input_
+            for input_, changed in ((Input.ARMOR, armor), (Input.LOAD, load))
+            if changed
+        ]
+        if not inputs:
+            return
+        try:
+            character = self.character
+        except ObjectDoesNotExist:
+            return
+        refresh_derived_stats(character, inputs)
+
+    def _add_weight(self, weight: int) -> None:
+        """Add to the carried weight, in the database and on this instance."""
+        type(self).objects.filter(pk=self.pk).update(weight=F("weight") + weight)
+        self.weight += weight
+
+    @staticmethod
+    def add_weight(inventory_id: int, weight: int) -> None:
+        """
+        Add to the carried weight of an inventory, and refresh the encumbrance
+        of its character. Used by the item signals; a negative weight removes.
+        """
+        # character.derived_stats depends on the equipment models.
+        from character.derived_stats import Input, refresh_derived_stats
+        from character.models.character import Character
+
+        Inventory.objects.filter(pk=inventory_id).update(weight=F("weight") + weight)
+        for character in Character.objects.select_related("inventory").filter(
+            inventory_id=inventory_id
+        ):
+            refresh_derived_stats(character, [Input.LOAD])
+
+    def _invalidate_sheet(self) -> None:
+        # Stack updates and bulk inserts bypass the Weapon signals.
+        from character.services import CharacterSheetService
+
+        try:
+            character = self.character
+        except ObjectDoesNotExist:
+            return
+        CharacterSheetService.invalidate([character.pk])
+
+    def add(self, equipment_name: TextChoices, quantity: int = 1) -> None:
+        """
+        Add an equipment to the inventory.
 
-    def _add_tool(self, equipment_name: TextChoices) -> None:
-        Tool.objects.create(
-            settings=ToolSettings.objects.get(name=equipment_name), inventory=self
+        Weapons and gear stack: adding one the inventory already holds
+        increments the quantity of its stack. Raises ValueError if
+        ``quantity`` is less than 1.
+        """
+        if quantity < 1:
+            raise ValueError(f"Cannot add a quantity of {quantity}")
+        self.add_all([equipment_name] * quantity)
+
+    def add_all(
+        self,
+        equipment_names: Iterable[TextChoices],
+        refresh_derived_stats: bool = True,
+    ) -> None:
+        """
+        Add several equipment to the inventory, with one insert per equipment kind.
+
+        Stackable equipment is counted by name: existing stacks are incremented
+        atomically and new ones are created with their quantity. The character
+        creation pipeline passes ``refresh_derived_stats=False``: it computes
+        every derived stat once, after adding the equipment.
+        """
+        names_by_kind: dict[EquipmentKind, list[TextChoices]] = {}
+        for equipment_name in equipment_names:
+            kind = EQUIPMENT_KINDS.get(equipment_name)
+            if kind is None:
+                raise EquipmentDoesNotExist
+            names_by_kind.setdefault(kind, []).append(equipment_name)
+
+        catalogs = self._catalogs()
+        weight = 0
+        for kind, names in names_by_kind.items():
+            _, settings = catalogs[kind]
+            if any(name not in settings.by_pk for name in names):
+                raise EquipmentDoesNotExist
+            if kind in WEIGHED_KINDS:
+                weight += sum(settings.by_pk[name].weight for name in names)
+
+        armors = []
+        with transaction.atomic(savepoint=False):
+            if weight or not STACKABLE_KINDS.isdisjoint(names_by_kind):
+                # Updating the inventory row first locks it until commit:
+                # concurrent adds to the same inventory run one after the
+                # other, the second seeing the stacks the first created.
+                self._add_weight(weight)
+            for kind, names in names_by_kind.items():
+                model, settings = catalogs[kind]
+                if kind in STACKABLE_KINDS:
+                    self._add_stacks(model, Counter(names))
+                    continue
+                items = model.objects.bulk_create(
+                    model(settings=settings.by_pk[name], inventory=self)
+                    for name in names
+                )
+                if kind == EquipmentKind.ARMOR:
+                    armors = items
+            for armor in armors:
+                self._set_disadvantage(armor)
+            if refresh_derived_stats:
+                self._refresh_derived_stats(armor=bool(armors), load=bool(weight))
+        if EquipmentKind.WEAPON in names_by_kind:
+            self._invalidate_sheet()
+        self.__dict__.pop("item_counts", None)
+
+    def _add_stacks(self, model: type[models.Model], quantities: Counter) -> None:
+        stacks = model.objects.filter(inventory=self)
+        existing = set(
+            stacks.filter(settings_id__in=quantities).values_list(
+                "settings_id", flat=True
+            )
+        )
+        for name in existing:
+            stacks.filter(settings_id=name).update(
+                quantity=F("quantity") + quantities[name]
+            )
+        model.objects.bulk_create(
+            model(settings_id=name, inventory=self, quantity=quantity)
+            for name, quantity in quantities.items()
+            if name not in existing
         )
 
-    def add(self, equipment_name: TextChoices) -> None:
+    def consume(self, equipment_name: TextChoices, quantity: int = 1) -> bool:
         """
-        Add an equipment to the inventory.
+        Use up some of a stackable equipment, e.g. ammunition or potions.
+
+        The stack is decremented with one conditional update (or deleted when
+        used up), so concurrent consumers never take more than it holds.
+        Returns False, leaving the stack unchanged, if it holds less than
+        ``quantity``. Raises ValueError if ``quantity`` is less than 1.
         """
-        if equipment_name in ArmorName.values:
-            self._add_armor(equipment_name)
-        elif equipment_name in WeaponName.values:
-            self._add_weapon(equipment_name)
-        elif equipment_name in PackName.values:
-            self._add_pack(equipment_name)
-        elif equipment_name in GearName.values:
-            self._add_gear(equipment_name)
-        elif equipment_name in ToolName.values:
-            self._add_tool(equipment_name)
-        else:
+        if quantity < 1:
+            raise ValueError(f"Cannot consume a quantity of {quantity}")
+        kind = EQUIPMENT_KINDS.get(equipment_name)
+        if kind is None:
             raise EquipmentDoesNotExist
+        if kind not in STACKABLE_KINDS:
+            raise EquipmentNotStackable
+        model, settings = self._catalogs()[kind]
+        stack = model.objects.filter(inventory=self, settings_id=equipment_name)
+        consumed = stack.filter(quantity__gt=quantity).update(
+            quantity=F("quantity") - quantity
+        )
+        if consumed and kind in WEIGHED_KINDS:
+            self._add_weight(-settings.by_pk[equipment_name].weight * quantity)
+            self._refresh_derived_stats(load=True)
+        if not consumed:
+            # The item signals remove the weight of deleted stacks.
+            consumed, _ = stack.filter(quantity=quantity).delete()
+        if consumed and kind == EquipmentKind.WEAPON:
+            self._invalidate_sheet()
+        self.__dict__.pop("item_counts", None)
+        return bool(consumed)
+
+    @staticmethod
+    def count_items(inventory_id: int) -> Counter[str]:
+        """
+        Return the number of items of each equipment name held by an inventory,
+        counted with one query over every kind of item. Stacks count for
+        their quantity.
+        """
+        first, *others = (
+            model.objects.filter(inventory_id=inventory_id)
+            .values_list("settings_id")
+            .annotate(count=Sum("quantity") if stackable else Count("pk"))
+            .order_by()
+            for model, stackable in (
+                (Armor, False),
+                (Weapon, True),
+                (Pack, False),
+                (Gear, True),
+                (Tool, False),
+            )
+        )
+        return Counter(dict(first.union(*others, all=True)))
+
+    @cached_property
+    def item_counts(self) -> Counter[str]:
+        """
+        Number of items of each equipment name.
+
+        Loaded once per instance; add(), add_all() and refresh_from_db()
+        reload it.
+        """
+        return self.count_items(self.pk)
+
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        self.__dict__.pop("item_counts", None)
+        super().refresh_from_db(*args, **kwargs)
 
     def contains(self, equipment_name: TextChoices, quantity: int = 1) -> bool:
         """
         Check if the inventory contains an equipment, with at least
         the specified quantity.
         """
-        # The number of equipment must be superior to 0, before checking the quantity.
-        # It avoids to loop through all equipment types.
-        nb_equipment = self.armor_set.filter(settings__name=equipment_name).count()
-        if nb_equipment:
-            if nb_equipment >= quantity:
-                return True
-            return False
-        nb_equipment = self.weapon_set.filter(settings__name=equipment_name).count()
-        if nb_equipment:
-            if nb_equipment >= quantity:
-                return True
-            return False
-        nb_equipment = self.pack_set.filter(settings__name=equipment_name).count()
-        if nb_equipment:
-            if nb_equipment >= quantity:
-                return True
-            return False
-        nb_equipment = self.gear_set.filter(settings__name=equipment_name).count()
-        if nb_equipment:
-            if nb_equipment >= quantity:
-                return True
-            return False
-        nb_equipment = self.tool_set.filter(settings__name=equipment_name).count()
-        if nb_equipment:
-            if nb_equipment >= quantity:
-                return True
-            return False
-        return False
+        count = self.item_counts[equipment_name]
+        return count > 0 and count >= quantity
 
 
 class ArmorSettings(models.Model):
@@ -177,6 +335,14 @@ class ArmorSettings(models.Model):
     stealth = models.CharField(max_length=1, null=True, blank=True)
     weight = models.SmallIntegerField()
 
+    # Structured form of ``ac`` and ``strength``, parsed when the row is saved
+    # (fixtures included) by equipment.signals.
+    base_ac = models.PositiveSmallIntegerField(default=0)
+    ac_bonus = models.PositiveSmallIntegerField(default=0)
+    adds_dex_modifier = models.BooleanField(default=False)
+    dex_modifier_max = models.PositiveSmallIntegerField(null=True, blank=True)
+    strength_requirement = models.PositiveSmallIntegerField(default=0)
+
     class Meta:
         db_table = "character_armorsettings"
         verbose_name_plural = "armor settings"
@@ -184,6 +350,23 @@ class ArmorSettings(models.Model):
     def __str__(self):
         return str(self.name)
 
+    def parse_settings(self) -> None:
+        """Fill the structured AC and strength fields from their strings."""
+        base_ac, is_dex_modifier, modifier_max, bonus = parse_ac_settings(self.ac)
+        self.base_ac = base_ac
+        self.ac_bonus = bonus
+        self.adds_dex_modifier = is_dex_modifier
+        self.dex_modifier_max = modifier_max or None
+        self.strength_requirement = parse_strength(self.strength)
+
+    def armor_class(self, dex_modifier: int) -> int:
+        """Return the AC of a character wearing this armor (not a shield)."""
+        if not self.adds_dex_modifier:
+            return self.base_ac
+        if self.dex_modifier_max is not None:
+            dex_modifier = min(dex_modifier, self.dex_modifier_max)
+        return self.base_ac + dex_modifier
+
 
 class Armor(models.Model):
     """Concrete armor"""
@@ -218,13 +401,19 @@ class WeaponSettings(models.Model):
 
 
 class Weapon(models.Model):
-    """Concrete weapon"""
+    """Concrete weapon, stacked by settings within an inventory"""
 
     settings = models.ForeignKey(WeaponSettings, on_delete=models.CASCADE)
     inventory = models.ForeignKey(Inventory, on_delete=models.SET_NULL, null=True)
+    quantity = models.PositiveSmallIntegerField(default=1)
 
     class Meta:
         db_table = "character_weapon"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["inventory", "settings"], name="unique_weapon_stack"
+            )
+        ]
 
     def __str__(self):
         return str(self.settings.name)
@@ -269,13 +458,19 @@ class GearSettings(models.Model):
 
 
 class Gear(models.Model):
-    """Concrete gear"""
+    """Concrete gear, stacked by settings within an inventory"""
 
     settings = models.ForeignKey(GearSettings, on_delete=models.CASCADE)
     inventory = models.ForeignKey(Inventory, on_delete=models.SET_NULL, null=True)
+    quantity = models.PositiveSmallIntegerField(default=1)
 
     class Meta:
         db_table = "character_gear"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["inventory", "settings"], name="unique_gear_stack"
+            )
+        ]
 
     def __str__(self):
         return str(self.settings.name)
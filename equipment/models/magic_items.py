@@ -17,6 +17,7 @@ from equipment.constants.magic_items import (
     MagicWeaponBonus,
     Rarity,
 )
+from utils.dice import roll_batch
 
 
 class MagicItemSettings(models.Model):
@@ -134,22 +135,30 @@ class MagicItem(models.Model):
         self.save()
         return True
 
+    @property
+    def recharge_formula(self) -> str | None:
+        """Dice formula of the charges regained at dawn, e.g. '1d6+1'."""
+        return self.settings.effects.get("recharge")
+
+    def recharged_charges(self, roll: int) -> int:
+        """Charges held after regaining ``roll`` charges, capped at the maximum."""
+        return min(self.current_charges + roll, self.max_charges)
+
     def recharge(self) -> int:
         """
-        Recharge the item (typically at dawn).
+        Recharge the item (typically at dawn) by rolling its recharge formula.
 
-        Returns the number of charges restored.
+        Items without a formula do not regain charges. Returns the number of
+        charges restored.
         """
         if self.current_charges is None or self.max_charges is None:
             return 0
-
-        # Note: recharge_formula from settings.effects["recharge"] (e.g., "1d6+1")
-        # would be used here with the dice rolling system in a full implementation
-        restored = min(
-            self.max_charges - self.current_charges,
-            self.max_charges,  # Don't exceed max
-        )
-        self.current_charges = min(self.current_charges + restored, self.max_charges)
+        if self.recharge_formula is None:
+            return 0
+        (roll,) = roll_batch(self.recharge_formula, 1)
+        charges = self.recharged_charges(roll)
+        restored = charges - self.current_charges
+        self.current_charges = charges
         self.save()
         return restored
 
@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from utils.registry import get_registry
+
+from .models.equipment import Armor, ArmorSettings, Inventory, Weapon
+from .models.magic_items import MagicItem
+
+# Item model -> registry table holding its weight
+WEIGHED_ITEMS = {Armor: "armor", Weapon: "weapons", MagicItem: "magic_items"}
+
+
+@receiver(pre_save, sender=ArmorSettings)
+def parse_armor_settings(sender, instance: ArmorSettings, **kwargs) -> None:
+    """Parse the AC and strength strings of armor once, when it is saved.
+
+    Also covers ``loaddata``, which sends pre_save for every fixture row.
+    """
+    instance.parse_settings()
+
+
+def track_carried_weight(
+    sender, instance, created: bool = True, raw: bool = False, **kwargs
+) -> None:
+    """Add the weight of a created item to its inventory, remove a deleted one's.
+
+    Bulk inserts and stack updates bypass this; Inventory.add_all() and
+    consume() account for them.
+    """
+    if raw or not created or instance.inventory_id is None:
+        return
+    settings = getattr(get_registry(), WEIGHED_ITEMS[sender]).get(instance.settings_id)
+    weight = settings.weight * getattr(instance, "quantity", 1)
+    if not weight:
+        return
+    if kwargs["signal"] is post_delete:
+        weight = -weight
+    Inventory.add_weight(instance.inventory_id, weight)
+
+
+for model in WEIGHED_ITEMS:
+    post_save.connect(track_carried_weight, sender=model)
+    post_delete.connect(track_carried_weight, sender=model)
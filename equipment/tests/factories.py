@@ -47,7 +47,7 @@ class ArmorSettingsFactory(factory.django.DjangoModelFactory):
     name = factory.Faker("random_element", elements=ArmorName)
     armor_type = ArmorType.LIGHT_ARMOR
     cost = factory.Faker("random_int")
-    ac = factory.Faker("pystr", max_chars=5)
+    ac = factory.Faker("random_element", elements=["11 + Dex modifier", "14", "+2"])
     weight = factory.Faker("random_int")
 
 
@@ -4,23 +4,32 @@ from faker import Faker
 
 from character.constants.abilities import AbilityName
 from equipment.constants.equipment import (
+    EQUIPMENT_KINDS,
     ArmorName,
     ArmorType,
     Disadvantage,
+    EquipmentKind,
+    GearName,
+    PackName,
     ToolName,
     WeaponMastery,
     WeaponName,
     WeaponType,
 )
+from equipment.exceptions import EquipmentDoesNotExist, EquipmentNotStackable
 from equipment.models.equipment import (
     ArmorSettings,
+    Gear,
     GearSettings,
     Inventory,
+    Pack,
     PackSettings,
     ToolSettings,
+    Weapon,
     WeaponSettings,
 )
 
+from character.models.proficiencies import ArmorProficiency
 from character.tests.factories import CharacterFactory
 from equipment.tests.factories import (
     ArmorFactory,
@@ -224,6 +233,25 @@ class TestArmorSettingsFixture:
         count = ArmorSettings.objects.filter(armor_type=ArmorType.SHIELD).count()
         assert count == 1
 
+    @pytest.mark.parametrize(
+        "armor_name,base_ac,ac_bonus,dex_modifier_max,strength_requirement",
+        [
+            (ArmorName.LEATHER, 11, 0, None, 0),
+            (ArmorName.HIDE, 12, 0, 2, 0),
+            (ArmorName.PLATE, 18, 0, None, 15),
+            (ArmorName.SHIELD, 0, 2, None, 0),
+        ],
+    )
+    def test_parsed_settings(
+        self, armor_name, base_ac, ac_bonus, dex_modifier_max, strength_requirement
+    ):
+        """AC and strength strings are parsed into fields when loaded."""
+        armor = ArmorSettings.objects.get(name=armor_name)
+        assert armor.base_ac == base_ac
+        assert armor.ac_bonus == ac_bonus
+        assert armor.dex_modifier_max == dex_modifier_max
+        assert armor.strength_requirement == strength_requirement
+
     # Light Armor Tests - AC = base + full DEX modifier
     @pytest.mark.parametrize(
         "armor_name,expected_ac,expected_cost,expected_weight",
@@ -443,6 +471,31 @@ class TestInventoryModel:
         else:
             assert self.inventory.character.ac == 12 + dex_modifier
 
+    def test_add_armor_without_proficiency_sets_disadvantages(self):
+        ArmorSettingsFactory(name=ArmorName.PLATE, ac="18")
+        self.inventory.add(ArmorName.PLATE)
+        character = self.inventory.character
+        assert character.has_ability_check_disadvantage(AbilityName.WISDOM)
+        assert character.has_attack_roll_disadvantage(AbilityName.STRENGTH)
+        assert not character.has_attack_roll_disadvantage(AbilityName.WISDOM)
+        assert character.saving_throw_disadvantage
+        assert character.spell_cast_disadvantage
+        character.refresh_from_db()
+        assert character.ability_check_disadvantage_mask == 0b111111
+        assert character.attack_roll_disadvantage_mask == 0b11
+        assert character.saving_throw_disadvantage
+        assert character.spell_cast_disadvantage
+
+    def test_add_armor_with_proficiency(self):
+        settings = ArmorSettingsFactory(name=ArmorName.PLATE, ac="18")
+        ArmorProficiency.objects.create(
+            character=self.inventory.character, armor=settings
+        )
+        self.inventory.add(ArmorName.PLATE)
+        character = self.inventory.character
+        assert not character.saving_throw_disadvantage
+        assert not character.has_attack_roll_disadvantage(AbilityName.STRENGTH)
+
     def test_contains_armor(self):
         armor = ArmorFactory()
         self.inventory.armor_set.add(armor)
@@ -486,3 +539,177 @@ class TestInventoryModel:
         self.inventory.weapon_set.add(weapon)
         self.inventory.weapon_set.add(weapon)
         assert self.inventory.contains(weapon.settings.name)
+
+    def test_add_unknown_equipment(self):
+        with pytest.raises(EquipmentDoesNotExist):
+            self.inventory.add("unknown_equipment")
+
+    def test_add_all_unknown_equipment(self):
+        with pytest.raises(EquipmentDoesNotExist):
+            self.inventory.add_all([WeaponName.DAGGER, "unknown_equipment"])
+
+    def test_item_counts(self):
+        self.inventory.add_all(
+            [WeaponName.DAGGER, WeaponName.DAGGER, PackName.EXPLORERS_PACK]
+        )
+        self.inventory.add(ToolName.THIEVES_TOOLS)
+        assert self.inventory.item_counts == {
+            WeaponName.DAGGER: 2,
+            PackName.EXPLORERS_PACK: 1,
+            ToolName.THIEVES_TOOLS: 1,
+        }
+
+    def test_contains_counts_items_once(self, django_assert_num_queries):
+        self.inventory.add_all([WeaponName.DAGGER, GearName.SPELLBOOK])
+        with django_assert_num_queries(1):
+            assert self.inventory.contains(WeaponName.DAGGER)
+            assert self.inventory.contains(GearName.SPELLBOOK)
+            assert not self.inventory.contains(WeaponName.DAGGER, 2)
+            assert not self.inventory.contains(PackName.EXPLORERS_PACK)
+
+    def test_add_reloads_item_counts(self):
+        assert not self.inventory.contains(WeaponName.DAGGER)
+        self.inventory.add(WeaponName.DAGGER)
+        assert self.inventory.contains(WeaponName.DAGGER)
+
+    def test_refresh_from_db_reloads_item_counts(self):
+        assert not self.inventory.contains(WeaponName.DAGGER)
+        WeaponFactory(
+            settings=WeaponSettings.objects.get(name=WeaponName.DAGGER),
+            inventory=self.inventory,
+        )
+        self.inventory.refresh_from_db()
+        assert self.inventory.contains(WeaponName.DAGGER)
+
+    def test_add_stacks_weapons(self):
+        self.inventory.add(WeaponName.DAGGER)
+        self.inventory.add(WeaponName.DAGGER, 2)
+        stack = Weapon.objects.get(inventory=self.inventory)
+        assert stack.settings_id == WeaponName.DAGGER
+        assert stack.quantity == 3
+
+    def test_add_all_stacks_gear(self):
+        self.inventory.add_all([GearName.ARROWS, GearName.ARROWS])
+        self.inventory.add_all([GearName.ARROWS, GearName.SPELLBOOK])
+        assert dict(
+            Gear.objects.filter(inventory=self.inventory).values_list(
+                "settings_id", "quantity"
+            )
+        ) == {GearName.ARROWS: 3, GearName.SPELLBOOK: 1}
+        assert self.inventory.item_counts[GearName.ARROWS] == 3
+
+    def test_add_locks_inventory_before_stacks(self, django_assert_num_queries):
+        # Concurrent adds wait on the inventory row instead of both
+        # creating the same stack.
+        with django_assert_num_queries(3) as context:
+            self.inventory.add(GearName.ARROWS)
+        lock, lookup, insert = (query["sql"] for query in context.captured_queries)
+        assert lock.startswith('UPDATE "character_inventory"')
+        assert insert.startswith('INSERT INTO "character_gear"')
+
+    @pytest.mark.parametrize("quantity", [0, -5])
+    def test_add_invalid_quantity(self, quantity):
+        with pytest.raises(ValueError):
+            self.inventory.add(GearName.ARROWS, quantity)
+        assert not self.inventory.contains(GearName.ARROWS)
+
+    def test_add_does_not_stack_packs(self):
+        self.inventory.add(PackName.EXPLORERS_PACK, 2)
+        assert Pack.objects.filter(inventory=self.inventory).count() == 2
+        assert self.inventory.contains(PackName.EXPLORERS_PACK, 2)
+
+    def test_consume(self):
+        self.inventory.add(GearName.ARROWS, 20)
+        assert self.inventory.contains(GearName.ARROWS, 20)
+        assert self.inventory.consume(GearName.ARROWS)
+        assert self.inventory.consume(GearName.ARROWS, 4)
+        assert self.inventory.item_counts[GearName.ARROWS] == 15
+
+    def test_consume_whole_stack_removes_it(self):
+        self.inventory.add(GearName.POTION_OF_HEALING, 2)
+        assert self.inventory.consume(GearName.POTION_OF_HEALING, 2)
+        assert not Gear.objects.filter(inventory=self.inventory).exists()
+        assert not self.inventory.contains(GearName.POTION_OF_HEALING)
+
+    def test_consume_more_than_held(self):
+        self.inventory.add(WeaponName.DAGGER, 2)
+        assert not self.inventory.consume(WeaponName.DAGGER, 3)
+        assert self.inventory.item_counts[WeaponName.DAGGER] == 2
+
+    @pytest.mark.parametrize("quantity", [0, -5])
+    def test_consume_invalid_quantity(self, quantity):
+        self.inventory.add(GearName.ARROWS, 5)
+        with pytest.raises(ValueError):
+            self.inventory.consume(GearName.ARROWS, quantity)
+        assert self.inventory.item_counts[GearName.ARROWS] == 5
+
+    def test_consume_missing_equipment(self):
+        assert not self.inventory.consume(GearName.ARROWS)
+
+    def test_consume_is_one_update(self, django_assert_num_queries):
+        self.inventory.add(GearName.ARROWS, 20)
+        with django_assert_num_queries(1):
+            self.inventory.consume(GearName.ARROWS)
+
+    def test_consume_not_stackable(self):
+        self.inventory.add(PackName.EXPLORERS_PACK)
+        with pytest.raises(EquipmentNotStackable):
+            self.inventory.consume(PackName.EXPLORERS_PACK)
+
+    def test_consume_unknown_equipment(self):
+        with pytest.raises(EquipmentDoesNotExist):
+            self.inventory.consume("unknown_equipment")
+
+    def weight_of(self, name):
+        model = ArmorSettings if name in ArmorName.values else WeaponSettings
+        return model.objects.get(name=name).weight
+
+    def test_add_all_tracks_weight(self):
+        self.inventory.add_all(
+            [
+                ArmorName.CHAIN_MAIL,
+                WeaponName.DAGGER,
+                WeaponName.DAGGER,
+                PackName.EXPLORERS_PACK,
+            ]
+        )
+        weight = self.weight_of(ArmorName.CHAIN_MAIL) + 2 * self.weight_of(
+            WeaponName.DAGGER
+        )
+        assert self.inventory.weight == weight
+        self.inventory.refresh_from_db()
+        assert self.inventory.weight == weight
+
+    def test_consume_removes_weight(self):
+        self.inventory.add(WeaponName.JAVELIN, 3)
+        self.inventory.consume(WeaponName.JAVELIN)
+        assert self.inventory.weight == 2 * self.weight_of(WeaponName.JAVELIN)
+        self.inventory.consume(WeaponName.JAVELIN, 2)
+        self.inventory.refresh_from_db()
+        assert self.inventory.weight == 0
+
+    def test_created_and_deleted_items_track_weight(self):
+        armor = ArmorFactory(
+            settings=ArmorSettings.objects.get(name=ArmorName.PLATE),
+            inventory=self.inventory,
+        )
+        self.inventory.refresh_from_db()
+        assert self.inventory.weight == self.weight_of(ArmorName.PLATE)
+        armor.delete()
+        self.inventory.refresh_from_db()
+        assert self.inventory.weight == 0
+
+
+class TestEquipmentKinds:
+    @pytest.mark.parametrize(
+        "names, kind",
+        [
+            (ArmorName, EquipmentKind.ARMOR),
+            (WeaponName, EquipmentKind.WEAPON),
+            (PackName, EquipmentKind.PACK),
+            (GearName, EquipmentKind.GEAR),
+            (ToolName, EquipmentKind.TOOL),
+        ],
+    )
+    def test_every_name_has_its_kind(self, names, kind):
+        assert all(EQUIPMENT_KINDS[name] == kind for name in names.values)
@@ -297,6 +297,32 @@ class TestMagicItemModel:
         assert item.max_charges is None
         assert item.current_charges is None
 
+    def test_recharge_rolls_formula(self):
+        """Recharging regains the charges rolled with the recharge formula."""
+        settings = MagicItemSettings.objects.get(
+            name=MagicItemName.WAND_OF_MAGIC_MISSILES
+        )
+        item = MagicItem.objects.create(settings=settings, current_charges=0)
+        restored = item.recharge()
+        assert 2 <= restored <= 7
+        item.refresh_from_db()
+        assert item.current_charges == restored
+
+    def test_recharge_is_capped(self):
+        """Recharging never exceeds the maximum charges."""
+        settings = MagicItemSettings.objects.get(
+            name=MagicItemName.WAND_OF_MAGIC_MISSILES
+        )
+        item = MagicItem.objects.create(settings=settings, current_charges=6)
+        assert item.recharge() == 1
+        assert item.current_charges == 7
+
+    def test_recharge_without_formula(self):
+        """Items without a recharge formula do not regain charges."""
+        settings = MagicItemSettings.objects.get(name=MagicItemName.WEAPON_PLUS_1)
+        item = MagicItem.objects.create(settings=settings)
+        assert item.recharge() == 0
+
     def test_item_identification(self):
         """Items can be identified or unidentified."""
         settings = MagicItemSettings.objects.get(name=MagicItemName.WEAPON_PLUS_1)
@@ -15,9 +15,9 @@ from character.constants.abilities import AbilityName
 from character.models.character import Character
 from equipment.constants.equipment import WeaponProperty, WeaponType
 from equipment.models.equipment import Weapon
-from character.models.proficiencies import WeaponProficiency
 from utils.dice import DiceString
 
+from .constants.events import RollType
 from .mastery import MasteryEffect, resolve_mastery
 
 
@@ -104,9 +104,7 @@ def is_proficient_with_weapon(character: Character, weapon: Weapon) -> bool:
     Returns:
         True if the character is proficient with the weapon.
     """
-    return WeaponProficiency.objects.filter(
-        character=character, weapon=weapon.settings
-    ).exists()
+    return character.is_proficient_with_weapon(weapon.settings_id)
 
 
 def resolve_attack(
@@ -140,9 +138,14 @@ def resolve_attack(
     """
     # Determine which ability to use
     ability_name = get_attack_ability(weapon, attacker)
-    ability = attacker.abilities.get(ability_type__name=ability_name)
+    ability = attacker.stats[ability_name]
     ability_modifier = ability.modifier
 
+    # Conditions, species traits and feats of the attacker
+    effects = attacker.roll_effects(RollType.ATTACK, ability_name)
+    advantage = advantage or effects.advantage
+    disadvantage = disadvantage or effects.disadvantage
+
     # Calculate attack modifier
     proficiency_bonus = 0
     if is_proficient_with_weapon(attacker, weapon):
@@ -0,0 +1,359 @@
+"""Lightweight combatants for the non-player creatures of a combat.
+
+While a combat is active, the HP of its monsters and summoned creatures is
+kept in a roster of compact combatants, stored in the shared cache and keyed
+by combat, so every worker sees the same state. Monster and SummonedCreature
+route their damage and healing through the roster (see combatant_of()): a
+hit costs a few cache requests instead of an UPDATE. HP is written back with
+one bulk UPDATE per model when a round ends or the combat ends.
+
+The roster is opened when the combat starts and released when it ends.
+Without a roster (outside a combat, or with a cache that keeps nothing, as
+in tests), creatures save their HP directly. Anything that reads HP from the
+database during a round must flush the roster first. Combatants are marked
+clean once the transaction writing them commits, so a rolled back flush is
+written again by the next one.
+"""
+
+import logging
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.db import transaction
+from redis.exceptions import LockNotOwnedError
+
+from bestiary.index import DamageRelations, get_damage_relations
+from bestiary.models.monsters import Monster
+from magic.models.spell_effects import SummonedCreature
+
+from .constants.combat import CombatantKind
+from .exceptions import RosterLocked
+
+logger = logging.getLogger(__name__)
+
+# Rosters of combats that are never ended expire after a day.
+ROSTER_TIMEOUT = 60 * 60 * 24
+# A worker that dies holding the lock of a roster blocks it this long, in seconds.
+ROSTER_LOCK_TIMEOUT = 5
+# A worker gives up waiting for the lock of a roster after this long, in seconds.
+ROSTER_LOCK_WAIT = 2
+
+# HP and temporary HP written for each combatant, keyed by (kind, pk)
+WrittenHP = dict[tuple[CombatantKind, int], tuple[int, int]]
+
+
+@dataclass(slots=True)
+class Combatant:
+    """HP state of a monster or summoned creature during a combat."""
+
+    kind: CombatantKind
+    pk: int
+    hp: int
+    hp_max: int
+    hp_temp: int = 0
+    relations: DamageRelations = DamageRelations()
+    dirty: bool = False
+
+    @classmethod
+    def of_monster(cls, monster: Monster, relations: DamageRelations) -> "Combatant":
+        return cls(
+            kind=CombatantKind.MONSTER,
+            pk=monster.pk,
+            hp=monster.hp_current,
+            hp_max=monster.hp_max,
+            hp_temp=monster.hp_temp,
+            relations=relations,
+        )
+
+    @classmethod
+    def of_summon(cls, summon: SummonedCreature) -> "Combatant":
+        return cls(
+            kind=CombatantKind.SUMMON,
+            pk=summon.pk,
+            hp=summon.hp_current,
+            hp_max=summon.hp_max,
+        )
+
+    @property
+    def key(self) -> tuple[CombatantKind, int]:
+        return self.kind, self.pk
+
+    @property
+    def is_alive(self) -> bool:
+        return self.hp > 0
+
+    def take_damage(self, damage: int, damage_type: str = "") -> int:
+        """Apply damage, considering damage relations and temporary HP.
+
+        Returns the damage taken by HP, as Monster.take_damage does.
+        """
+        return self.absorb_damage(self.relations.adjust_damage(damage, damage_type))
+
+    def absorb_damage(self, damage: int) -> int:
+        """Apply damage already adjusted for the damage type (see Monster.absorb_damage)."""
+        if self.hp_temp > 0:
+            absorbed = min(self.hp_temp, damage)
+            self.hp_temp -= absorbed
+            damage -= absorbed
+        self.hp = max(0, self.hp - damage)
+        self.dirty = True
+        return damage
+
+    def heal(self, amount: int) -> int:
+        """Heal the combatant. Returns the amount actually healed."""
+        old_hp = self.hp
+        self.hp = min(self.hp_max, self.hp + amount)
+        self.dirty = True
+        return self.hp - old_hp
+
+    def add_temp_hp(self, amount: int) -> None:
+        """Add temporary hit points (doesn't stack, takes higher)."""
+        self.hp_temp = max(self.hp_temp, amount)
+        self.dirty = True
+
+
+@dataclass
+class CombatantRoster:
+    """The non-player combatants of a combat, indexed by (kind, pk)."""
+
+    combat_id: int
+    combatants: dict[tuple[CombatantKind, int], Combatant] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, combat_id: int) -> "CombatantRoster":
+        """Load monsters, their damage relations and summons in three queries."""
+        monsters = list(Monster.objects.filter(combat_id=combat_id))
+        relations = get_damage_relations({monster.settings_id for monster in monsters})
+        roster = cls(combat_id=combat_id)
+        for monster in monsters:
+            roster.add(Combatant.of_monster(monster, relations[monster.settings_id]))
+        for summon in SummonedCreature.objects.filter(combat_id=combat_id):
+            roster.add(Combatant.of_summon(summon))
+        return roster
+
+    def add(self, combatant: Combatant) -> None:
+        self.combatants[combatant.key] = combatant
+
+    def get(self, kind: CombatantKind, pk: int) -> Combatant:
+        return self.combatants[(kind, pk)]
+
+    def monster(self, pk: int) -> Combatant:
+        return self.get(CombatantKind.MONSTER, pk)
+
+    def summon(self, pk: int) -> Combatant:
+        return self.get(CombatantKind.SUMMON, pk)
+
+    def track(
+        self,
+        creature: Monster | SummonedCreature,
+        relations: DamageRelations | None = None,
+    ) -> Combatant:
+        """Return the combatant of a creature, adding it if it joined the
+        combat after the roster was loaded.
+
+        Args:
+            creature: The monster or summoned creature.
+            relations: The damage relations of a monster, read if not given.
+        """
+        if isinstance(creature, SummonedCreature):
+            key = (CombatantKind.SUMMON, creature.pk)
+        else:
+            key = (CombatantKind.MONSTER, creature.pk)
+        combatant = self.combatants.get(key)
+        if combatant is None:
+            if isinstance(creature, SummonedCreature):
+                combatant = Combatant.of_summon(creature)
+            else:
+                if relations is None:
+                    settings_id = creature.settings_id
+                    relations = get_damage_relations([settings_id])[settings_id]
+                combatant = Combatant.of_monster(creature, relations)
+            self.add(combatant)
+        return combatant
+
+    def alive(self) -> list[Combatant]:
+        return [
+            combatant for combatant in self.combatants.values() if combatant.is_alive
+        ]
+
+    def write(self) -> WrittenHP:
+        """Write the HP of changed combatants with one bulk UPDATE per model.
+
+        The combatants stay dirty until the transaction commits, see
+        mark_written() and flush_roster().
+
+        Returns:
+            The HP written for each combatant.
+        """
+        dirty = [combatant for combatant in self.combatants.values() if combatant.dirty]
+        if not dirty:
+            return {}
+        monsters = [
+            Monster(pk=combatant.pk, hp_current=combatant.hp, hp_temp=combatant.hp_temp)
+            for combatant in dirty
+            if combatant.kind == CombatantKind.MONSTER
+        ]
+        summons = [
+            SummonedCreature(pk=combatant.pk, hp_current=combatant.hp)
+            for combatant in dirty
+            if combatant.kind == CombatantKind.SUMMON
+        ]
+        with transaction.atomic():
+            if monsters:
+                Monster.objects.bulk_update(monsters, ["hp_current", "hp_temp"])
+            if summons:
+                SummonedCreature.objects.bulk_update(summons, ["hp_current"])
+        return {combatant.key: (combatant.hp, combatant.hp_temp) for combatant in dirty}
+
+    def mark_written(self, written: WrittenHP) -> None:
+        """Mark clean the combatants whose HP has not changed since written."""
+        for key, hp in written.items():
+            combatant = self.combatants.get(key)
+            if combatant is not None and (combatant.hp, combatant.hp_temp) == hp:
+                combatant.dirty = False
+
+
+def _roster_key(combat_id: int) -> str:
+    return f"combat-roster:{combat_id}"
+
+
+@contextmanager
+def _locked(combat_id: int) -> Iterator[None]:
+    """Hold the lock of a roster, shared by every worker through the cache.
+
+    The lock holds a token of its owner and is only released by it, even
+    after it expired and another worker took it.
+
+    Raises:
+        RosterLocked: If the lock is not free within ROSTER_LOCK_WAIT seconds.
+    """
+    key = f"combat-roster-lock:{combat_id}"
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, RedisCache):
+        # Redis locks compare and delete their token atomically.
+        lock = backend._cache.get_client(write=True).lock(
+            backend.make_and_validate_key(key),
+            timeout=ROSTER_LOCK_TIMEOUT,
+            sleep=0.01,
+            blocking_timeout=ROSTER_LOCK_WAIT,
+        )
+        if not lock.acquire():
+            raise RosterLocked(f"The roster of combat {combat_id} is locked")
+        try:
+            yield
+        finally:
+            try:
+                lock.release()
+            except LockNotOwnedError:
+                logger.warning("The lock of the roster of combat %s expired", combat_id)
+        return
+
+    # cache.add() is atomic and the timeout frees the lock of a dead worker.
+    # Other backends have no atomic compare-and-delete: the token is checked
+    # right before the lock is deleted.
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + ROSTER_LOCK_WAIT
+    while not cache.add(key, token, timeout=ROSTER_LOCK_TIMEOUT):
+        if time.monotonic() > deadline:
+            raise RosterLocked(f"The roster of combat {combat_id} is locked")
+        time.sleep(0.01)
+    try:
+        yield
+    finally:
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+def open_roster(combat_id: int) -> CombatantRoster:
+    """Load the roster of a combat into the cache (e.g. when the combat starts).
+
+    A roster that is already open is kept, with its pending changes.
+    """
+    with _locked(combat_id):
+        roster = get_roster(combat_id)
+        if roster is None:
+            roster = CombatantRoster.load(combat_id)
+            cache.set(_roster_key(combat_id), roster, timeout=ROSTER_TIMEOUT)
+    return roster
+
+
+def get_roster(combat_id: int) -> CombatantRoster | None:
+    """Return a snapshot of the roster of a combat, or None if it is not open."""
+    return cache.get(_roster_key(combat_id))
+
+
+@contextmanager
+def update_roster(combat_id: int | None) -> Iterator[CombatantRoster | None]:
+    """Lock the roster of a combat and store it back once changed.
+
+    Yields None, without locking, if the combat has no open roster.
+    """
+    if combat_id is None:
+        yield None
+        return
+    with _locked(combat_id):
+        roster = get_roster(combat_id)
+        yield roster
+        if roster is not None:
+            cache.set(_roster_key(combat_id), roster, timeout=ROSTER_TIMEOUT)
+
+
+@contextmanager
+def combatant_of(
+    creature: Monster | SummonedCreature,
+) -> Iterator[Combatant | None]:
+    """Yield the combatant of a creature in a combat with an open roster.
+
+    The HP of the combatant is copied to the creature once changed. Yields
+    None if the creature is not in such a combat: it then saves its own HP.
+    """
+    with update_roster(creature.combat_id) as roster:
+        if roster is None:
+            yield None
+            return
+        combatant = roster.track(creature)
+        yield combatant
+        creature.hp_current = combatant.hp
+        if isinstance(creature, Monster):
+            creature.hp_temp = combatant.hp_temp
+
+
+def _mark_written(combat_id: int, written: WrittenHP) -> None:
+    with update_roster(combat_id) as roster:
+        if roster is not None:
+            roster.mark_written(written)
+
+
+def flush_roster(combat_id: int) -> int:
+    """Persist the pending HP changes of a combat, if its roster is open.
+
+    The roster is marked clean once the transaction commits.
+    """
+    with update_roster(combat_id) as roster:
+        written = roster.write() if roster is not None else {}
+    if written:
+        transaction.on_commit(partial(_mark_written, combat_id, written))
+    return len(written)
+
+
+def _drop_roster(combat_id: int) -> None:
+    with _locked(combat_id):
+        roster = get_roster(combat_id)
+        if roster is not None:
+            # Changes made since the roster was released
+            roster.write()
+            cache.delete(_roster_key(combat_id))
+
+
+def release_roster(combat_id: int) -> int:
+    """Flush the roster of a combat and drop it once the transaction commits
+    (e.g. when the combat ends), so a rolled back release keeps it open."""
+    written = flush_roster(combat_id)
+    transaction.on_commit(partial(_drop_roster, combat_id))
+    return written
@@ -0,0 +1,187 @@
+"""Concentration checks for D&D 5e combat.
+
+When a concentrating creature takes damage it must succeed on a Constitution
+saving throw or lose concentration:
+- DC = max(10, damage // 2)
+- Natural 20 always succeeds, natural 1 always fails
+- Each source of damage triggers a separate save
+
+Damage resolved in one step (an area spell, a multiattack, a round of attacks)
+is checked in a single pass: concentrating targets and their Constitution
+modifiers are fetched with one query, and every resulting event is broadcast
+once the transaction writing the batch commits.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from character.constants.abilities import AbilityName
+from character.models.abilities import Ability
+from character.models.character import Character
+from magic.models.spells import Concentration, SpellSettings
+from utils.dice import roll_d20_batch
+
+from .models.events import (
+    ConcentrationBroken,
+    ConcentrationSaveRequired,
+    ConcentrationSaveResult,
+)
+from .models.game import Actor, Game
+from .utils.channels import send_to_channel
+
+
+@dataclass
+class ConcentrationCheck:
+    """A concentration save triggered by one source of damage."""
+
+    character: Character
+    spell: SpellSettings
+    damage: int
+    dc: int
+    modifier: int
+
+    # Only populated when the save is rolled
+    roll: int | None = None
+    total: int | None = None
+    success: bool | None = None
+
+    @property
+    def is_rolled(self) -> bool:
+        return self.roll is not None
+
+
+def concentration_save_dc(damage: int) -> int:
+    """Return the DC of the Constitution save caused by an amount of damage."""
+    return max(10, damage // 2)
+
+
+def _get_concentrations(character_ids: Iterable[int]) -> dict[int, Concentration]:
+    """Fetch active concentrations with their caster's CON modifier in one query."""
+    con_modifier = Ability.objects.filter(
+        character=OuterRef("character_id"),
+        ability_type__name=AbilityName.CONSTITUTION,
+    ).values("modifier")[:1]
+    concentrations = (
+        Concentration.objects.filter(character_id__in=character_ids)
+        .select_related("spell")
+        .annotate(con_modifier=Subquery(con_modifier))
+    )
+    return {
+        concentration.character_id: concentration for concentration in concentrations
+    }
+
+
+def resolve_concentration_checks(
+    damage_ledger: Iterable[tuple[Character, int]],
+    auto_roll: bool = False,
+) -> list[ConcentrationCheck]:
+    """Determine the concentration saves required by a batch of damage.
+
+    Args:
+        damage_ledger: (character, damage) pairs, one per source of damage.
+        auto_roll: If True, roll the Constitution saves. Once a character fails
+            a save, its remaining checks of the batch are dropped.
+
+    Returns:
+        The concentration checks, in ledger order.
+    """
+    ledger = [(character, damage) for character, damage in damage_ledger if damage > 0]
+    concentrations = _get_concentrations({character.pk for character, _ in ledger})
+    checks = [
+        ConcentrationCheck(
+            character=character,
+            spell=concentrations[character.pk].spell,
+            damage=damage,
+            dc=concentration_save_dc(damage),
+            modifier=concentrations[character.pk].con_modifier or 0,
+        )
+        for character, damage in ledger
+        if character.pk in concentrations
+    ]
+    if not auto_roll:
+        return checks
+
+    rolled_checks = []
+    broken = set()
+    for check, roll in zip(checks, roll_d20_batch(len(checks))):
+        if check.character.pk in broken:
+            continue
+        check.roll = roll
+        check.total = roll + check.modifier
+        check.success = roll == 20 or (roll != 1 and check.total >= check.dc)
+        if not check.success:
+            broken.add(check.character.pk)
+        rolled_checks.append(check)
+    return rolled_checks
+
+
+def apply_concentration_checks(
+    game: Game,
+    author: Actor,
+    checks: list[ConcentrationCheck],
+) -> None:
+    """Record the concentration checks as events and break failed concentrations.
+
+    Events are written in one transaction and broadcast once it commits,
+    including the transaction of the caller, if any.
+    """
+    events = []
+    broken_character_ids = []
+    with transaction.atomic():
+        for check in checks:
+            events.append(
+                ConcentrationSaveRequired.objects.create(
+                    game=game,
+                    author=author,
+                    character=check.character,
+                    spell=check.spell,
+                    damage_taken=check.damage,
+                    dc=check.dc,
+                )
+            )
+            if not check.is_rolled:
+                continue
+            events.append(
+                ConcentrationSaveResult.objects.create(
+                    game=game,
+                    author=author,
+                    character=check.character,
+                    spell=check.spell,
+                    dc=check.dc,
+                    roll=check.roll,
+                    modifier=check.modifier,
+                    total=check.total,
+                    success=check.success,
+                )
+            )
+            if not check.success:
+                events.append(
+                    ConcentrationBroken.objects.create(
+                        game=game,
+                        author=author,
+                        character=check.character,
+                        spell=check.spell,
+                        reason="Failed concentration save",
+                    )
+                )
+                broken_character_ids.append(check.character.pk)
+        if broken_character_ids:
+            Concentration.objects.filter(character_id__in=broken_character_ids).delete()
+        for event in events:
+            transaction.on_commit(partial(send_to_channel, event))
+
+
+def check_concentration(
+    game: Game,
+    author: Actor,
+    damage_ledger: Iterable[tuple[Character, int]],
+    auto_roll: bool = False,
+) -> list[ConcentrationCheck]:
+    """Resolve and apply the concentration checks caused by a batch of damage."""
+    checks = resolve_concentration_checks(damage_ledger, auto_roll=auto_roll)
+    apply_concentration_checks(game, author, checks)
+    return checks
@@ -33,3 +33,10 @@ class ActionType(TextChoices):
     ACTION = "A", "Action"
     BONUS_ACTION = "B", "Bonus Action"
     REACTION = "R", "Reaction"
+
+
+class CombatantKind(TextChoices):
+    """Kind of non-player creature tracked in a combat roster."""
+
+    MONSTER = "monster", "Monster"
+    SUMMON = "summon", "Summoned creature"
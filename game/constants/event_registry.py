@@ -27,9 +27,13 @@ def _build_registry() -> dict[type[Event], EventType]:
         ConcentrationSaveResult,
         ConcentrationStarted,
         DiceRoll,
+        EncumbranceChanged,
         GameStart,
+        MagicItemsRecharged,
         Message,
+        MonsterActionsResolved,
         QuestUpdate,
+        RestCompleted,
         RoundEnded,
         SpellCast,
         SpellConditionApplied,
@@ -67,6 +71,10 @@ def _build_registry() -> dict[type[Event], EventType]:
         ConcentrationSaveResult: EventType.CONCENTRATION_SAVE_RESULT,
         ConcentrationBroken: EventType.CONCENTRATION_BROKEN,
         ConcentrationStarted: EventType.CONCENTRATION_STARTED,
+        RestCompleted: EventType.REST_COMPLETED,
+        MagicItemsRecharged: EventType.MAGIC_ITEMS_RECHARGED,
+        EncumbranceChanged: EventType.ENCUMBRANCE_CHANGED,
+        MonsterActionsResolved: EventType.MONSTER_ACTIONS_RESOLVED,
     }
 
 
@@ -30,3 +30,8 @@ class Against(TextChoices):
 class RollResultType(TextChoices):
     SUCCESS = "S", "Success"
     FAILURE = "F", "Failure"
+
+
+class RestType(TextChoices):
+    SHORT = "S", "Short rest"
+    LONG = "L", "Long rest"
@@ -33,6 +33,7 @@ EVENT_TYPE_TO_CATEGORY: dict[EventType, LogCategory] = {
     EventType.HP_HEAL: LogCategory.COMBAT,
     EventType.HP_TEMP: LogCategory.COMBAT,
     EventType.HP_DEATH_SAVE: LogCategory.COMBAT,
+    EventType.MONSTER_ACTIONS_RESOLVED: LogCategory.COMBAT,
     # Spells
     EventType.SPELL_CAST: LogCategory.SPELLS,
     EventType.SPELL_DAMAGE_DEALT: LogCategory.SPELLS,
@@ -47,6 +48,9 @@ EVENT_TYPE_TO_CATEGORY: dict[EventType, LogCategory] = {
     EventType.MESSAGE: LogCategory.CHAT,
     EventType.QUEST_UPDATE: LogCategory.DM,
     EventType.GAME_START: LogCategory.DM,
+    EventType.REST_COMPLETED: LogCategory.DM,
+    EventType.MAGIC_ITEMS_RECHARGED: LogCategory.DM,
+    EventType.ENCUMBRANCE_CHANGED: LogCategory.DM,
 }
 
 
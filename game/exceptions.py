@@ -28,3 +28,9 @@ class NotYourTurn(Exception):
     """Raised when a player tries to act outside their turn."""
 
     pass
+
+
+class RosterLocked(Exception):
+    """Raised when another worker holds the roster of a combat for too long."""
+
+    pass
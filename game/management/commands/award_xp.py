@@ -0,0 +1,66 @@
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+
+from bestiary.models.monsters import MonsterSettings
+from game.models.game import Game
+from game.services import ExperienceService
+
+
+class Command(BaseCommand):
+    help = "award XP to every character of a game"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("game_id", type=int, help="game ID")
+        parser.add_argument(
+            "amount", type=int, nargs="?", default=0, help="XP amount to award"
+        )
+        parser.add_argument(
+            "--monster",
+            action="append",
+            dest="monsters",
+            default=[],
+            help="defeated monster whose XP is added to the amount (repeatable)",
+        )
+        parser.add_argument(
+            "--each",
+            action="store_true",
+            help="give the amount to each character instead of splitting it",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        game_id = options["game_id"]
+        assert isinstance(game_id, int)
+        amount = options["amount"]
+        assert isinstance(amount, int)
+        monster_names = options["monsters"]
+        assert isinstance(monster_names, list)
+
+        try:
+            game = Game.objects.get(id=game_id)
+        except Game.DoesNotExist as exc:
+            raise CommandError(f"game id={game_id} doesn't exist") from exc
+
+        if monster_names:
+            settings = MonsterSettings.objects.in_bulk(set(monster_names))
+            if missing := sorted(set(monster_names) - set(settings)):
+                raise CommandError(f"unknown monsters: {', '.join(missing)}")
+            amount += ExperienceService.encounter_xp(
+                settings[name] for name in monster_names
+            )
+
+        if amount <= 0:
+            raise CommandError("amount must be greater than 0")
+
+        characters = ExperienceService.award_xp(game, amount, split=not options["each"])
+        if not characters:
+            raise CommandError(f"game id={game.id} has no characters")
+        for character in characters:
+            self.stdout.write(
+                f"{character.name}: {character.xp} XP (level {character.level})"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully awarded {amount} XP to {len(characters)} characters"
+            )
+        )
@@ -0,0 +1,35 @@
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.models.game import Game
+from game.services import RechargeService
+
+
+class Command(BaseCommand):
+    help = "recharge the magic items of the characters of a game, or of every game, at dawn"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--game", type=int, dest="game_id", help="game ID")
+        target.add_argument("--all", action="store_true", help="every game")
+
+    def handle(self, *args: object, **options: object) -> None:
+        games = Game.objects.all()
+        game_id = options["game_id"]
+        if game_id is not None:
+            games = games.filter(id=game_id)
+            if not games.exists():
+                raise CommandError(f"game id={game_id} doesn't exist")
+
+        events = RechargeService.recharge_magic_items(games)
+        for event in events:
+            self.stdout.write(
+                f"Game {event.game_id}: {event.items_count} items regained "
+                f"{event.charges_restored} charges"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully recharged magic items in {len(events)} game(s)"
+            )
+        )
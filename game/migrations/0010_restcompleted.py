@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0009_update_spell_fks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RestCompleted",
+            fields=[
+                (
+                    "event_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="game.event",
+                    ),
+                ),
+                (
+                    "rest_type",
+                    models.CharField(
+                        choices=[("S", "Short rest"), ("L", "Long rest")], max_length=1
+                    ),
+                ),
+                ("characters_count", models.PositiveSmallIntegerField()),
+            ],
+            bases=("game.event",),
+        ),
+    ]
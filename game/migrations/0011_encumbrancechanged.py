@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("character", "0031_character_encumbered"),
+        ("game", "0010_restcompleted"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EncumbranceChanged",
+            fields=[
+                (
+                    "event_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="game.event",
+                    ),
+                ),
+                ("encumbered", models.BooleanField()),
+                (
+                    "character",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="encumbrance_changed_events",
+                        to="character.character",
+                    ),
+                ),
+            ],
+            bases=("game.event",),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0011_encumbrancechanged"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MagicItemsRecharged",
+            fields=[
+                (
+                    "event_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="game.event",
+                    ),
+                ),
+                ("items_count", models.PositiveSmallIntegerField()),
+                ("charges_restored", models.PositiveIntegerField()),
+            ],
+            bases=("game.event",),
+        ),
+    ]
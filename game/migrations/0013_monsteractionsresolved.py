@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bestiary", "0010_monster_spent_actions"),
+        ("game", "0012_magicitemsrecharged"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonsterActionsResolved",
+            fields=[
+                (
+                    "event_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="game.event",
+                    ),
+                ),
+                ("attacks_count", models.PositiveSmallIntegerField()),
+                ("hits_count", models.PositiveSmallIntegerField()),
+                ("damage_dealt", models.PositiveIntegerField()),
+                ("outcomes", models.JSONField(default=list)),
+                (
+                    "monster",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="actions_resolved_events",
+                        to="bestiary.monster",
+                    ),
+                ),
+            ],
+            bases=("game.event",),
+        ),
+    ]
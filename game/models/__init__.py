@@ -13,10 +13,14 @@ from .events import (
     ConcentrationSaveResult,
     ConcentrationStarted,
     DiceRoll,
+    EncumbranceChanged,
     Event,
     GameStart,
+    MagicItemsRecharged,
     Message,
+    MonsterActionsResolved,
     QuestUpdate,
+    RestCompleted,
     RollRequest,
     RollResponse,
     RollResult,
@@ -48,15 +52,19 @@ __all__ = [
     "ConcentrationSaveResult",
     "ConcentrationStarted",
     "DiceRoll",
+    "EncumbranceChanged",
     "Event",
     "Fighter",
     "Game",
     "GameStart",
+    "MagicItemsRecharged",
     "Master",
     "Message",
+    "MonsterActionsResolved",
     "Player",
     "Quest",
     "QuestUpdate",
+    "RestCompleted",
     "RollRequest",
     "RollResponse",
     "RollResult",
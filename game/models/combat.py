@@ -1,5 +1,6 @@
 from django.db import models
 
+from ..combatants import flush_roster, open_roster, release_roster
 from ..constants.combat import ActionType, CombatAction, CombatState
 from ..exceptions import ActionNotAvailable
 from .game import Game, Player
@@ -53,13 +54,14 @@ class Combat(models.Model):
         self.current_turn_index = 0
         self.current_fighter = initiative_order[0]
         self.save()
+        open_roster(self.id)
 
         # Create first round and turn
         first_round = Round.objects.create(combat=self, number=1)
         Turn.objects.create(
             fighter=self.current_fighter,
             round=first_round,
-            movement_total=self.current_fighter.character.speed or 30,
+            movement_total=self.current_fighter.character.effective_speed,
         )
 
         return self.current_fighter
@@ -97,6 +99,7 @@ class Combat(models.Model):
             self.current_round += 1
             is_new_round = True
             Round.objects.create(combat=self, number=self.current_round)
+            flush_roster(self.id)
 
         self.current_fighter = initiative_order[self.current_turn_index]
         self.save()
@@ -106,7 +109,7 @@ class Combat(models.Model):
         Turn.objects.create(
             fighter=self.current_fighter,
             round=current_round,
-            movement_total=self.current_fighter.character.speed or 30,
+            movement_total=self.current_fighter.character.effective_speed,
         )
 
         return self.current_fighter, is_new_round
@@ -116,6 +119,7 @@ class Combat(models.Model):
         self.state = CombatState.ENDED
         self.current_fighter = None
         self.save()
+        release_roster(self.id)
 
     def get_turn_order_display(self) -> list[dict]:
         """Get a list of fighters with their initiative scores for display."""
@@ -8,6 +8,7 @@ from ..constants.events import (
     Against,
     DifficultyClass,
     RollResultType,
+    RestType,
     RollStatus,
     RollType,
 )
@@ -342,3 +343,43 @@ class ConcentrationStarted(Event):
         on_delete=models.CASCADE,
         related_name="started_concentration_events",
     )
+
+
+class RestCompleted(Event):
+    """Event summarizing a short or long rest taken by the whole party."""
+
+    rest_type = models.CharField(max_length=1, choices=RestType)
+    characters_count = models.PositiveSmallIntegerField()
+
+
+class MagicItemsRecharged(Event):
+    """Event summarizing the charges the party's magic items regained at dawn."""
+
+    items_count = models.PositiveSmallIntegerField()
+    charges_restored = models.PositiveIntegerField()
+
+
+class EncumbranceChanged(Event):
+    """Event when a character's load crosses its carrying capacity."""
+
+    character = models.ForeignKey(
+        "character.Character",
+        on_delete=models.CASCADE,
+        related_name="encumbrance_changed_events",
+    )
+    encumbered = models.BooleanField()
+
+
+class MonsterActionsResolved(Event):
+    """Event summarizing a sequence of monster actions (e.g. a multiattack)."""
+
+    monster = models.ForeignKey(
+        "bestiary.Monster",
+        on_delete=models.CASCADE,
+        related_name="actions_resolved_events",
+    )
+    attacks_count = models.PositiveSmallIntegerField()
+    hits_count = models.PositiveSmallIntegerField()
+    damage_dealt = models.PositiveIntegerField()
+    # One entry per action and target, see game.monster_actions.ActionOutcome
+    outcomes = models.JSONField(default=list)
@@ -0,0 +1,243 @@
+"""Monster action resolution for D&D 5e combat.
+
+This module resolves a sequence of monster actions, usually a multiattack,
+against the chosen targets in one pass:
+- Attack roll = d20 + attack bonus of the action, compared to the target's AC
+- Critical hits on natural 20 (double damage dice), natural 1 always misses
+- On a hit, damage dice of the action plus its extra damage
+- Saving throws against the DC of the action: the save of an attack governs
+  its extra damage (e.g. a poisonous bite), the save of any other action all
+  its damage, halved or negated on a success
+- Limited actions (recharge, per rest, per day) spend a use
+
+Every d20 of the sequence is drawn in one batch, the damage dice in another,
+and each dice formula is parsed once per process.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from bestiary.constants.monsters import SaveEffect
+from bestiary.models.monsters import Monster, MonsterActionTemplate, MultiattackAction
+from character.models.character import Character
+from utils.dice import roll_d20_batch, roll_damage_batch
+
+from .constants.events import RollType
+from .exceptions import ActionNotAvailable
+from .spell import SAVE_TYPE_TO_ABILITY_MAP, get_saving_throw_modifier
+
+
+@dataclass
+class ActionOutcome:
+    """Result of a monster action against one target."""
+
+    action: MonsterActionTemplate
+    target: Character | None
+
+    # Attack roll details (attacks only)
+    natural_roll: int | None = None
+    attack_roll: int | None = None
+    is_hit: bool = False
+    is_critical_hit: bool = False
+
+    # Saving throw of the target (actions with a save DC only)
+    save_roll: int | None = None
+    save_success: bool | None = None
+
+    damage: int = 0
+
+    # False for actions without structured attack or save data, left to the
+    # master (most SRD actions only hold their description)
+    resolved: bool = True
+
+    @property
+    def is_attack(self) -> bool:
+        return self.resolved and self.action.is_attack
+
+    def summary(self) -> dict[str, Any]:
+        """Return the outcome as JSON-serializable data, for the event log."""
+        return {
+            "action": self.action.name,
+            "target": self.target.name if self.target else None,
+            "attack_roll": self.attack_roll,
+            "hit": self.is_hit,
+            "critical": self.is_critical_hit,
+            "save_roll": self.save_roll,
+            "saved": self.save_success,
+            "damage": self.damage,
+            "damage_type": self.action.damage_type,
+            "resolved": self.resolved,
+        }
+
+
+def multiattack_sequence(
+    multiattack_actions: Iterable[MultiattackAction],
+) -> list[MonsterActionTemplate]:
+    """Expand the actions of a multiattack into the actions it makes, in order.
+
+    Optional actions are left out. Actions of a same group (other than 0) are
+    alternatives: the first one, making the most attacks, is chosen.
+    """
+    sequence = []
+    chosen_groups = set()
+    for multiattack_action in multiattack_actions:
+        if multiattack_action.is_optional:
+            continue
+        if multiattack_action.group:
+            if multiattack_action.group in chosen_groups:
+                continue
+            chosen_groups.add(multiattack_action.group)
+        sequence += [multiattack_action.action] * multiattack_action.count
+    return sequence
+
+
+def _pick_d20(first: int, second: int, advantage: bool, disadvantage: bool) -> int:
+    """Keep one of two d20s; advantage and disadvantage cancel out."""
+    if advantage and not disadvantage:
+        return max(first, second)
+    if disadvantage and not advantage:
+        return min(first, second)
+    return first
+
+
+def _spend_actions(monster: Monster, actions: Sequence[MonsterActionTemplate]) -> None:
+    """Spend a use of every limited action, or none if one is not available."""
+    spent_actions = dict(monster.spent_actions)
+    for action in actions:
+        if not monster.can_use_action(action):
+            monster.spent_actions = spent_actions
+            raise ActionNotAvailable(f"{action.name} is not available")
+        monster.spend_action(action)
+
+
+def _roll_attacks(
+    outcomes: list[ActionOutcome], advantage: bool, disadvantage: bool
+) -> None:
+    rolls = roll_d20_batch(2 * len(outcomes))
+    for outcome, first, second in zip(outcomes, rolls[::2], rolls[1::2]):
+        natural = _pick_d20(first, second, advantage, disadvantage)
+        outcome.natural_roll = natural
+        outcome.attack_roll = natural + outcome.action.attack_bonus
+        outcome.is_critical_hit = natural == 20
+        outcome.is_hit = natural == 20 or (
+            natural != 1 and outcome.attack_roll >= outcome.target.ac
+        )
+
+
+def _roll_saves(outcomes: list[ActionOutcome]) -> None:
+    rolls = roll_d20_batch(2 * len(outcomes))
+    for outcome, first, second in zip(outcomes, rolls[::2], rolls[1::2]):
+        save_type = outcome.action.save_type
+        effects = outcome.target.roll_effects(
+            RollType.SAVING_THROW, SAVE_TYPE_TO_ABILITY_MAP.get(save_type)
+        )
+        natural = _pick_d20(first, second, effects.advantage, effects.disadvantage)
+        outcome.save_roll = natural + get_saving_throw_modifier(
+            outcome.target, save_type
+        )
+        outcome.save_success = (
+            outcome.save_roll >= outcome.action.save_dc and not effects.auto_fail
+        )
+
+
+def _roll_damage(
+    actions: list[tuple[MonsterActionTemplate, list[ActionOutcome]]],
+) -> None:
+    # Damage rolls, and the (outcome, roll position, halved by a save) portions
+    # of damage they deal: an area action rolls once for all its targets.
+    rolls = []
+    portions = []
+    for action, outcomes in actions:
+        formulas = [
+            (action.damage_dice, not action.is_attack),
+            (action.extra_damage_dice, action.requires_save),
+        ]
+        for formula, saved_against in formulas:
+            if not formula:
+                continue
+            if action.is_attack:
+                for outcome in outcomes:
+                    portions.append((outcome, len(rolls), saved_against))
+                    rolls.append((formula, outcome.is_critical_hit))
+            else:
+                portions += [
+                    (outcome, len(rolls), saved_against) for outcome in outcomes
+                ]
+                rolls.append((formula, False))
+    damages = roll_damage_batch(rolls)
+    for outcome, position, saved_against in portions:
+        damage = damages[position]
+        if saved_against and outcome.save_success:
+            if outcome.action.save_effect == SaveEffect.HALF_DAMAGE:
+                damage //= 2
+            else:
+                damage = 0
+        outcome.damage += damage
+
+
+def resolve_monster_actions(
+    monster: Monster,
+    actions: Sequence[MonsterActionTemplate],
+    targets: Sequence[Character],
+    advantage: bool = False,
+    disadvantage: bool = False,
+) -> list[ActionOutcome]:
+    """Resolve a sequence of monster actions against targets, in memory.
+
+    Attacks are dealt to the targets in turn (the first attack to the first
+    target, and so on, starting over when every target was attacked); other
+    actions with a save DC affect every target. Damage is not applied.
+
+    Args:
+        monster: The monster taking the actions.
+        actions: The actions, in order (see multiattack_sequence()).
+        targets: The characters targeted by the actions.
+        advantage: Whether the monster has advantage on its attack rolls.
+        disadvantage: Whether the monster has disadvantage on its attack rolls.
+
+    Returns:
+        The outcome of each action against each of its targets, in order.
+
+    Raises:
+        ActionNotAvailable: If a limited action has no use left.
+    """
+    if not targets:
+        raise ValueError("Monster actions need at least one target")
+    _spend_actions(monster, actions)
+    resolved_actions = []
+    outcomes = []
+    attacks_count = 0
+    for action in actions:
+        if action.is_attack and action.attack_bonus is not None:
+            target = targets[attacks_count % len(targets)]
+            attacks_count += 1
+            action_outcomes = [ActionOutcome(action, target)]
+        elif not action.is_attack and action.requires_save:
+            action_outcomes = [ActionOutcome(action, target) for target in targets]
+        else:
+            outcomes.append(ActionOutcome(action, None, resolved=False))
+            continue
+        resolved_actions.append((action, action_outcomes))
+        outcomes += action_outcomes
+
+    attacks = [outcome for outcome in outcomes if outcome.is_attack]
+    _roll_attacks(attacks, advantage, disadvantage)
+    _roll_saves(
+        [
+            outcome
+            for outcome in outcomes
+            if outcome.resolved
+            and outcome.action.requires_save
+            and (outcome.is_hit or not outcome.is_attack)
+        ]
+    )
+    _roll_damage(
+        [
+            (action, [outcome for outcome in action_outcomes if outcome.is_hit])
+            if action.is_attack
+            else (action, action_outcomes)
+            for action, action_outcomes in resolved_actions
+        ]
+    )
+    return outcomes
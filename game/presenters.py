@@ -187,6 +187,33 @@ def _format_concentration_started(event: Event) -> str:
     return f"{event.character.name} is now concentrating on {event.spell.name}."
 
 
+def _format_rest_completed(event: Event) -> str:
+    return (
+        f"The party finished a {event.get_rest_type_display().lower()} "
+        f"({event.characters_count} characters)."
+    )
+
+
+def _format_magic_items_recharged(event: Event) -> str:
+    return (
+        f"At dawn, {event.items_count} magic items regained "
+        f"{event.charges_restored} charges."
+    )
+
+
+def _format_encumbrance_changed(event: Event) -> str:
+    if event.encumbered:
+        return f"{event.character.name} is now encumbered."
+    return f"{event.character.name} is no longer encumbered."
+
+
+def _format_monster_actions_resolved(event: Event) -> str:
+    hits = ""
+    if event.attacks_count:
+        hits = f"{event.hits_count} of {event.attacks_count} attacks hit, "
+    return f"{event.monster} acts: {hits}{event.damage_dealt} damage dealt."
+
+
 # Lazy-built registry mapping Event subclass -> formatter function
 _MESSAGE_FORMATTERS: dict[type[Event], Callable[[Event], str]] | None = None
 
@@ -206,9 +233,13 @@ def _build_formatters() -> dict[type[Event], Callable[[Event], str]]:
         ConcentrationSaveResult,
         ConcentrationStarted,
         DiceRoll,
+        EncumbranceChanged,
         GameStart,
+        MagicItemsRecharged,
         Message,
+        MonsterActionsResolved,
         QuestUpdate,
+        RestCompleted,
         RollRequest,
         RollResponse,
         RollResult,
@@ -252,6 +283,10 @@ def _build_formatters() -> dict[type[Event], Callable[[Event], str]]:
         ConcentrationSaveResult: _format_concentration_save_result,
         ConcentrationBroken: _format_concentration_broken,
         ConcentrationStarted: _format_concentration_started,
+        RestCompleted: _format_rest_completed,
+        MagicItemsRecharged: _format_magic_items_recharged,
+        EncumbranceChanged: _format_encumbrance_changed,
+        MonsterActionsResolved: _format_monster_actions_resolved,
     }
 
 
@@ -1,5 +1,4 @@
-from character.constants.abilities import AbilityName
-from character.models.abilities import Ability, AbilityType
+from character.models.abilities import Ability
 from utils.dice import DiceString
 
 from .constants.events import RollResultType
@@ -9,16 +8,16 @@ from .models.events import RollRequest
 from .models.game import Player
 
 
-def _roll(player: Player, ability_type: AbilityType) -> int:
+def _roll(player: Player, ability_name: str) -> int:
     """
     Perform a roll and add proficiency bonus to the score, if the player's character
     is proficient in the ability passed as argument.
     """
     character = player.character
     try:
-        ability = character.abilities.get(ability_type=ability_type)
+        ability = character.stats[ability_name]
     except Ability.DoesNotExist:
-        raise InvalidRoll(f"{character=} does not have the ability: {ability_type=}")
+        raise InvalidRoll(f"{character=} does not have the ability: {ability_name=}")
     score = DiceString("d20").roll(ability.modifier)
     if character.is_proficient(ability):
         score += character.proficiency_bonus
@@ -41,8 +40,12 @@ def perform_roll(player: Player, request: RollRequest) -> tuple[int, tuple[str,
 
     character = player.character
     score = _roll(player, request.ability_type)
-    has_advantage = character.has_advantage(request.roll_type, request.against)
-    has_disadvantage = character.has_disadvantage(request.roll_type, request.against)
+    has_advantage = character.has_advantage(
+        request.roll_type, request.against, ability_name=request.ability_type
+    )
+    has_disadvantage = character.has_disadvantage(
+        request.roll_type, request.against, ability_name=request.ability_type
+    )
     if has_advantage and has_disadvantage:
         # If the character has both advantage and disadantage, there is no more roll.
         pass
@@ -52,14 +55,21 @@ def perform_roll(player: Player, request: RollRequest) -> tuple[int, tuple[str,
             score = max(score, new_score)
         if has_disadvantage:
             score = min(score, new_score)
+    if character.roll_effects(
+        request.roll_type, request.ability_type, request.against
+    ).auto_fail:
+        return score, RollResultType.FAILURE
     if score >= request.difficulty_class:
         return score, RollResultType.SUCCESS
     return score, RollResultType.FAILURE
 
 
 def perform_combat_initiative_roll(fighter: Fighter) -> int:
-    dexterity = AbilityType.objects.get(name=AbilityName.DEXTERITY)
-    score = _roll(fighter.player, dexterity)
+    """
+    Roll the initiative of a fighter: d20 plus the initiative stored on the
+    character (Dexterity modifier, and proficiency bonus with the Alert feat).
+    """
+    score = DiceString("d20").roll(fighter.player.character.initiative)
     fighter.dexterity_check = score
     fighter.save()
     return score
@@ -48,6 +48,13 @@ class EventType(StrEnum):
     CONCENTRATION_SAVE_RESULT = "concentration.save.result"
     CONCENTRATION_BROKEN = "concentration.broken"
     CONCENTRATION_STARTED = "concentration.started"
+    # Rest events
+    REST_COMPLETED = "rest.completed"
+    MAGIC_ITEMS_RECHARGED = "magic.items.recharged"
+    # Character events
+    ENCUMBRANCE_CHANGED = "encumbrance.changed"
+    # Monster events
+    MONSTER_ACTIONS_RESOLVED = "monster.actions.resolved"
 
 
 class EventOrigin(IntFlag):
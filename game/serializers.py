@@ -4,7 +4,13 @@ from typing import Any
 
 from .constants.event_registry import get_event_type
 from .constants.log_categories import LogCategory, get_category_for_event
-from .models.events import DiceRoll, Event, RollResult, SpellCast
+from .models.events import (
+    DiceRoll,
+    Event,
+    MonsterActionsResolved,
+    RollResult,
+    SpellCast,
+)
 from .presenters import format_event_message
 
 
@@ -61,4 +67,9 @@ def _get_event_details(event: Event) -> dict[str, Any] | None:
             "slot_level": event.slot_level,
             "targets": [t.name for t in event.targets.all()],
         }
+    if isinstance(event, MonsterActionsResolved):
+        return {
+            "monster": str(event.monster),
+            "outcomes": event.outcomes,
+        }
     return None
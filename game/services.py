@@ -1,9 +1,29 @@
 import logging
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-
+from functools import partial
+
+from django.db import models, transaction
+from django.db.models import F
+
+from bestiary.encounters import DEFAULT_MAX_MONSTERS, plan_encounter
+from bestiary.groups import MonsterGroup
+from bestiary.models.monsters import (
+    Monster,
+    MonsterActionTemplate,
+    MonsterSettings,
+    MultiattackAction,
+)
+from character.derived_stats import Input, derived_fields
 from character.models.character import Character
+from character.services import CharacterSheetService
+from equipment.models.magic_items import MagicItem
+from magic.models.spells import CharacterSpellSlot, WarlockSpellSlot
 
-from .constants.events import RollStatus, RollType
+from .concentration import check_concentration
+from .constants.events import RestType, RollStatus, RollType
+from .exceptions import ActionNotAvailable
 from .models.combat import Combat
 from .models.events import (
     CombatInitativeOrderSet,
@@ -13,16 +33,22 @@ from .models.events import (
     CombatInitiativeResult,
     CombatStarted,
     DiceRoll,
+    MagicItemsRecharged,
     Message,
+    MonsterActionsResolved,
+    RestCompleted,
     RollRequest,
     RollResponse,
     RollResult,
     TurnStarted,
 )
 from .models.game import Actor, Game, Master, Player
+from .monster_actions import multiattack_sequence, resolve_monster_actions
 from .rolls import perform_combat_initiative_roll, perform_roll
 from .utils.channels import send_to_channel
 from user.models import User
+from utils.dice import roll_batch
+from utils.registry import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -339,3 +365,324 @@ class DiceRollService:
         )
         send_to_channel(dice_roll)
         return dice_roll
+
+
+class RestService:
+    """Applies short and long rests to every character of a game at once."""
+
+    @classmethod
+    def take_rest(cls, game: Game, author: Actor, rest_type: RestType) -> RestCompleted:
+        """
+        Apply a rest to the whole party in one transaction, and broadcast it
+        once the transaction commits.
+
+        Each table is updated with a single set-based UPDATE, so the number of
+        statements does not depend on the party size:
+        - Short rest: Pact Magic slots are restored.
+        - Long rest: HP is restored, temporary HP and death saves are reset,
+          and all spell slots and Pact Magic slots are restored.
+        Magic items regain their charges at dawn, not on a rest (see
+        RechargeService).
+
+        Args:
+            game: The game whose characters rest
+            author: The actor (usually the Master) calling the rest
+            rest_type: Short or long rest
+
+        Returns:
+            The RestCompleted summary event
+        """
+        characters = Character.objects.filter(player__game=game)
+        with transaction.atomic():
+            if rest_type == RestType.LONG:
+                characters_count = characters.update(
+                    hp=F("max_hp"),
+                    temp_hp=0,
+                    death_save_successes=0,
+                    death_save_failures=0,
+                )
+                CharacterSpellSlot.objects.filter(character__in=characters).update(
+                    used=0
+                )
+            else:
+                characters_count = characters.count()
+            WarlockSpellSlot.objects.filter(character__in=characters).update(used=0)
+            rest_completed = RestCompleted.objects.create(
+                game=game,
+                author=author,
+                rest_type=rest_type,
+                characters_count=characters_count,
+            )
+            transaction.on_commit(partial(send_to_channel, rest_completed))
+        return rest_completed
+
+
+class RechargeService:
+    """Recharges the magic items of whole games at dawn."""
+
+    @staticmethod
+    def _charged_items(games: models.QuerySet[Game]) -> dict[str, list[MagicItem]]:
+        """
+        Return the magic items of the games' characters that can regain
+        charges, grouped by recharge formula. Each item is annotated with the
+        ID of its game.
+
+        The item rows are locked until the end of the enclosing transaction,
+        so that no charge spent meanwhile is overwritten by the recharge.
+        """
+        table = get_registry().magic_items
+        groups: dict[str, list[MagicItem]] = {}
+        for pk, settings_id, charges, game_id in (
+            MagicItem.objects.filter(
+                inventory__character__player__game__in=games,
+                current_charges__isnull=False,
+            )
+            .select_for_update(of=("self",))
+            .values_list(
+                "pk",
+                "settings_id",
+                "current_charges",
+                "inventory__character__player__game_id",
+            )
+        ):
+            item = MagicItem(
+                pk=pk, settings=table.get(settings_id), current_charges=charges
+            )
+            if item.recharge_formula is None or item.max_charges is None:
+                continue
+            if charges >= item.max_charges:
+                continue
+            item.game_id = game_id
+            groups.setdefault(item.recharge_formula, []).append(item)
+        return groups
+
+    @classmethod
+    def recharge_magic_items(
+        cls, games: models.QuerySet[Game]
+    ) -> list[MagicItemsRecharged]:
+        """
+        Recharge the magic items of every character of the games, as at dawn,
+        then record and broadcast one summary event per game.
+
+        Items are grouped by recharge formula: the formula is rolled once per
+        item in a single pass, and the group is written with one bulk UPDATE.
+        The number of statements depends on the formulas in use, not on the
+        number of items; each game whose items regained charges adds its event.
+
+        Args:
+            games: The games whose magic items recharge
+
+        Returns:
+            The MagicItemsRecharged events, one per game with recharged items
+        """
+        items_count: Counter[int] = Counter()
+        charges_restored: Counter[int] = Counter()
+        with transaction.atomic():
+            groups = cls._charged_items(games)
+            for formula, items in groups.items():
+                for item, roll in zip(items, roll_batch(formula, len(items))):
+                    charges = item.recharged_charges(roll)
+                    items_count[item.game_id] += 1
+                    charges_restored[item.game_id] += charges - item.current_charges
+                    item.current_charges = charges
+                MagicItem.objects.bulk_update(items, ["current_charges"])
+            events = [
+                MagicItemsRecharged.objects.create(
+                    game_id=master.game_id,
+                    author=master,
+                    items_count=items_count[master.game_id],
+                    charges_restored=charges_restored[master.game_id],
+                )
+                for master in Master.objects.filter(game_id__in=items_count)
+            ]
+            for event in events:
+                transaction.on_commit(partial(send_to_channel, event))
+        return events
+
+
+class ExperienceService:
+    """Awards experience points to every character of a game at once."""
+
+    @staticmethod
+    def encounter_xp(monsters: Iterable[MonsterSettings]) -> int:
+        """Return the XP of an encounter, the sum of its monsters' XP."""
+        return sum(monster.xp for monster in monsters)
+
+    @staticmethod
+    def award_xp(game: Game, xp: int, split: bool = True) -> list[Character]:
+        """
+        Award XP to the party, leveling up characters in memory and writing
+        them back with a single bulk UPDATE.
+
+        Args:
+            game: The game whose characters gain XP
+            xp: The XP awarded
+            split: If True (encounter XP), XP is divided evenly among the
+                characters, rounded down; otherwise each character gains xp.
+
+        Returns:
+            The updated characters
+        """
+        with transaction.atomic():
+            characters = list(
+                Character.objects.filter(player__game=game)
+                .select_for_update()
+                .order_by("pk")
+                # What the derived stats of a leveled up character depend on
+                .prefetch_related(
+                    "abilities",
+                    "active_conditions",
+                    "feats",
+                    "character_classes",
+                )
+            )
+            if not characters:
+                return []
+            share = xp // len(characters) if split else xp
+            for character in characters:
+                character.increase_xp(share)
+            Character.objects.bulk_update(
+                characters,
+                ["xp", "level", "hit_dice", "max_hp", *derived_fields([Input.LEVEL])],
+            )
+        # bulk_update does not send the signals invalidating the sheets.
+        CharacterSheetService.invalidate(character.pk for character in characters)
+        return characters
+
+
+class EncounterService:
+    """Generates encounters fitting the XP budget of a game's party."""
+
+    @staticmethod
+    def generate_encounter(
+        combat: Combat,
+        difficulty: str,
+        max_monsters: int = DEFAULT_MAX_MONSTERS,
+        **facets,
+    ) -> list[Monster]:
+        """
+        Pick monsters making an encounter of a difficulty for the party of a
+        combat's game and create them in the combat with a single bulk INSERT.
+
+        Args:
+            combat: The combat the monsters join
+            difficulty: An EncounterDifficulty
+            max_monsters: The largest number of monsters of the encounter
+            facets: Constraints on the monsters, see BestiaryIndex.search()
+
+        Returns:
+            The created monsters, numbered when several share a stat block
+
+        Raises:
+            EncounterGenerationError: If no group of monsters fits
+        """
+        levels = Character.objects.filter(player__game_id=combat.game_id).values_list(
+            "level", flat=True
+        )
+        entries = plan_encounter(
+            levels, difficulty, max_monsters=max_monsters, **facets
+        )
+        settings = MonsterSettings.objects.in_bulk({entry.name for entry in entries})
+        monsters = []
+        for name, count in Counter(entry.name for entry in entries).items():
+            monsters += MonsterGroup.build(settings[name], count, combat=combat)
+        return Monster.objects.bulk_create(monsters)
+
+
+class MonsterActionService:
+    """Resolves the actions of monsters against the characters of a game."""
+
+    @staticmethod
+    def execute(
+        game: Game,
+        author: Actor,
+        monster: Monster,
+        targets: Sequence[Character],
+        actions: Sequence[MonsterActionTemplate] | None = None,
+        advantage: bool = False,
+        disadvantage: bool = False,
+    ) -> MonsterActionsResolved:
+        """
+        Resolve a sequence of monster actions against targets, apply their
+        damage and record one summary event, then broadcast it.
+
+        Rolls are drawn in batches and the targets are written with a single
+        bulk UPDATE, so the number of statements does not depend on the
+        number of attacks or targets.
+
+        Args:
+            game: The game of the targets
+            author: The actor (usually the Master) running the monster
+            monster: The monster taking the actions
+            targets: The characters targeted, see resolve_monster_actions()
+            actions: The actions taken, in order; the monster's multiattack
+                if not given
+            advantage: Whether the monster has advantage on its attack rolls
+            disadvantage: Whether the monster has disadvantage on its attack rolls
+
+        Returns:
+            The MonsterActionsResolved summary event
+
+        Raises:
+            ActionNotAvailable: If the monster has no multiattack, or a limited
+                action has no use left
+            ValueError: If a target is not a character of the game
+        """
+        if actions is None:
+            actions = multiattack_sequence(
+                MultiattackAction.objects.filter(
+                    multiattack__monster_id=monster.settings_id
+                ).select_related("action")
+            )
+            if not actions:
+                raise ActionNotAvailable(f"{monster} has no multiattack")
+        spent_actions = dict(monster.spent_actions)
+        with transaction.atomic():
+            characters = (
+                Character.objects.filter(player__game=game)
+                .select_for_update()
+                # What the saving throws of the targets depend on
+                .prefetch_related("abilities", "active_conditions", "feats")
+                .in_bulk({target.pk for target in targets})
+            )
+            if any(target.pk not in characters for target in targets):
+                raise ValueError(
+                    "Monster actions can only target characters of the game"
+                )
+            targets = [characters[target.pk] for target in targets]
+            outcomes = resolve_monster_actions(
+                monster,
+                actions,
+                targets,
+                advantage=advantage,
+                disadvantage=disadvantage,
+            )
+            # One entry per source of damage, for concentration saves
+            damage_ledger = [
+                (outcome.target, outcome.damage)
+                for outcome in outcomes
+                if outcome.damage
+            ]
+            for character, damage in damage_ledger:
+                character.absorb_damage(damage)
+            Character.objects.bulk_update(
+                characters.values(),
+                ["hp", "temp_hp", "death_save_successes", "death_save_failures"],
+            )
+            if monster.spent_actions != spent_actions:
+                monster.save(update_fields=["spent_actions"])
+            attacks = [outcome for outcome in outcomes if outcome.is_attack]
+            event = MonsterActionsResolved.objects.create(
+                game=game,
+                author=author,
+                monster=monster,
+                attacks_count=len(attacks),
+                hits_count=sum(outcome.is_hit for outcome in attacks),
+                damage_dealt=sum(damage for _, damage in damage_ledger),
+                outcomes=[outcome.summary() for outcome in outcomes],
+            )
+        # bulk_update does not send the signals invalidating the sheets.
+        CharacterSheetService.invalidate(characters.keys())
+        send_to_channel(event)
+        check_concentration(game, author, damage_ledger)
+        return event
@@ -0,0 +1,36 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from character.models.character import Character
+
+from .models.events import EncumbranceChanged
+from .models.game import Player
+from .utils.channels import send_to_channel
+
+
+@receiver(post_save, sender=Character)
+def broadcast_encumbrance_change(
+    sender, instance: Character, update_fields=None, raw: bool = False, **kwargs
+) -> None:
+    """Tell the game when a player's character becomes, or stops being, encumbered.
+
+    Derived stats are saved with the fields whose value changed only, so
+    nothing is sent while the load stays on the same side of the capacity.
+    """
+    if raw or not update_fields or "encumbered" not in update_fields:
+        return
+    player = (
+        Player.objects.select_related("game", "user").filter(character=instance).first()
+    )
+    if player is None:
+        return
+    event = EncumbranceChanged.objects.create(
+        game=player.game,
+        author=player,
+        character=instance,
+        encumbered=instance.encumbered,
+    )
+    transaction.on_commit(partial(send_to_channel, event))
@@ -21,7 +21,11 @@ from magic.constants.spells import (
     SpellSaveType,
 )
 from magic.models import ActiveSpellEffect, SpellEffectTemplate, SpellSettings
-from utils.dice import DiceString, roll_d20_test
+from utils.dice import roll_d20_test
+
+from .concentration import ConcentrationCheck, check_concentration
+from .constants.events import RollType
+from .models.game import Actor, Game
 
 
 @dataclass
@@ -97,6 +101,19 @@ class SpellCastResult:
     save_results: list[tuple[Character, SpellSaveResult]] = field(default_factory=list)
     concentration_started: bool = False
 
+    @property
+    def damage_ledger(self) -> list[tuple[Character, int]]:
+        """Damage dealt to each target, one entry per damaging effect.
+
+        apply_spell_result() checks the concentration of every damaged target
+        from it in one pass.
+        """
+        return [
+            (target, damage_result.total)
+            for target, damage_result in self.damage_results
+            if damage_result.total > 0
+        ]
+
 
 # Mapping from SpellcastingAbility to AbilityName
 SPELLCASTING_ABILITY_MAP: dict[str, str] = {
@@ -141,14 +158,17 @@ def get_spellcasting_ability_modifier(caster: Character) -> int:
         if not ability_name:
             return 0
 
-        ability = caster.abilities.get(ability_type__name=ability_name)
+        ability = caster.stats[ability_name]
         return ability.modifier
     except Exception:
         return 0
 
 
 def get_spell_save_dc(caster: Character) -> int:
-    """Calculate spell save DC: 8 + proficiency + spellcasting ability modifier.
+    """Return the spell save DC: 8 + proficiency + spellcasting ability modifier.
+
+    The DC is a derived stat of the caster, recomputed when its level, class or
+    abilities change.
 
     Args:
         caster: The character casting the spell.
@@ -156,7 +176,7 @@ def get_spell_save_dc(caster: Character) -> int:
     Returns:
         The spell save DC for this caster.
     """
-    return 8 + caster.proficiency_bonus + get_spellcasting_ability_modifier(caster)
+    return caster.spell_save_dc
 
 
 def get_saving_throw_modifier(target: Character, save_type: str) -> int:
@@ -173,7 +193,7 @@ def get_saving_throw_modifier(target: Character, save_type: str) -> int:
     if not ability_name:
         return 0
 
-    ability = target.abilities.get(ability_type__name=ability_name)
+    ability = target.stats[ability_name]
     modifier = ability.modifier
 
     # Add proficiency bonus if proficient in this save
@@ -203,10 +223,13 @@ def resolve_saving_throw(
         SpellSaveResult with the roll details and success status.
     """
     modifier = get_saving_throw_modifier(target, save_type)
+    effects = target.roll_effects(
+        RollType.SAVING_THROW, SAVE_TYPE_TO_ABILITY_MAP.get(save_type)
+    )
     roll, _, _ = roll_d20_test(
         modifier=modifier,
-        advantage=advantage,
-        disadvantage=disadvantage,
+        advantage=advantage or effects.advantage,
+        disadvantage=disadvantage or effects.disadvantage,
     )
 
     return SpellSaveResult(
@@ -214,7 +237,7 @@ def resolve_saving_throw(
         dc=dc,
         roll=roll,
         modifier=modifier,
-        success=roll >= dc,
+        success=roll >= dc and not effects.auto_fail,
     )
 
 
@@ -231,20 +254,8 @@ def calculate_spell_dice(
     Returns:
         A dice string like "8d6" for the total damage/healing dice.
     """
-    if not template.base_dice:
-        return ""
-
-    base_dice = DiceString(template.base_dice)
-
-    # Add extra dice for upcasting
-    if template.dice_per_level and slot_level > template.spell.level:
-        extra_levels = slot_level - template.spell.level
-        per_level = DiceString(template.dice_per_level)
-        extra_dice_count = per_level.nb_throws * extra_levels
-        if extra_dice_count > 0:
-            base_dice.add_throws(extra_dice_count)
-
-    return str(base_dice)
+    dice = template.dice_for_slot_level(slot_level)
+    return str(dice) if dice is not None else ""
 
 
 def resolve_spell_damage(
@@ -262,15 +273,14 @@ def resolve_spell_damage(
     Returns:
         SpellDamageResult with damage total and breakdown.
     """
-    dice_str = calculate_spell_dice(template, slot_level)
-    if not dice_str:
+    dice = template.dice_for_slot_level(slot_level)
+    if dice is None:
         return SpellDamageResult(
             total=0,
             dice_rolled=[],
             damage_type=template.damage_type or "",
         )
 
-    dice = DiceString(dice_str)
     total, dice_rolled = dice.roll_keeping_individual()
 
     # Apply save-for-half if applicable
@@ -306,11 +316,10 @@ def resolve_spell_healing(
     Returns:
         SpellHealingResult with healing total and breakdown.
     """
-    dice_str = calculate_spell_dice(template, slot_level)
-    if not dice_str:
+    dice = template.dice_for_slot_level(slot_level)
+    if dice is None:
         return SpellHealingResult(total=0, dice_rolled=[])
 
-    dice = DiceString(dice_str)
     modifier = get_spellcasting_ability_modifier(caster)
     total, dice_rolled = dice.roll_keeping_individual()
     total += modifier
@@ -561,18 +570,29 @@ def apply_spell_buff(
     )
 
 
-def apply_spell_result(result: SpellCastResult) -> None:
+def apply_spell_result(
+    result: SpellCastResult, game: Game, author: Actor
+) -> list[ConcentrationCheck]:
     """Apply all effects from a spell cast result.
 
     This applies damage, healing, conditions, and buffs to all targets.
     Call this after resolve_spell() to actually modify game state.
 
+    The concentration saves caused by the damage are checked in one pass over
+    the damage ledger of the cast, however many targets it hits.
+
     Args:
         result: The complete spell cast result to apply.
+        game: The game the spell is cast in.
+        author: The actor casting the spell.
+
+    Returns:
+        The concentration checks caused by the damage of the spell.
     """
     # Apply damage
     for target, damage_result in result.damage_results:
         apply_spell_damage(target, damage_result)
+    checks = check_concentration(game, author, result.damage_ledger)
 
     # Apply healing
     for target, healing_result in result.healing_results:
@@ -598,3 +618,5 @@ def apply_spell_result(result: SpellCastResult) -> None:
             character=result.caster,
             spell=result.spell,
         )
+
+    return checks
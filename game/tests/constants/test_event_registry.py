@@ -28,11 +28,15 @@ from ..factories import (
     CombatInitiativeResultFactory,
     CombatStartedFactory,
     DiceRollFactory,
+    EncumbranceChangedFactory,
     EventFactory,
     GameFactory,
     GameStartFactory,
+    MagicItemsRechargedFactory,
     MessageFactory,
+    MonsterActionsResolvedFactory,
     QuestUpdateFactory,
+    RestCompletedFactory,
     RollRequestFactory,
     RollResponseFactory,
     RollResultFactory,
@@ -140,6 +144,21 @@ class TestGetEventType:
     def test_action_taken(self):
         assert get_event_type(ActionTakenFactory()) == EventType.ACTION_TAKEN
 
+    def test_rest_completed(self):
+        assert get_event_type(RestCompletedFactory()) == EventType.REST_COMPLETED
+
+    def test_magic_items_recharged(self):
+        event = MagicItemsRechargedFactory()
+        assert get_event_type(event) == EventType.MAGIC_ITEMS_RECHARGED
+
+    def test_encumbrance_changed(self):
+        event = EncumbranceChangedFactory()
+        assert get_event_type(event) == EventType.ENCUMBRANCE_CHANGED
+
+    def test_monster_actions_resolved(self):
+        event = MonsterActionsResolvedFactory()
+        assert get_event_type(event) == EventType.MONSTER_ACTIONS_RESOLVED
+
     def test_spell_cast(self):
         game = GameFactory()
         author = ActorFactory()
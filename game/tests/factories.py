@@ -3,7 +3,12 @@ import random
 import factory
 
 from character.constants.abilities import AbilityName
-from game.constants.events import DifficultyClass, RollResultType, RollType
+from game.constants.events import (
+    DifficultyClass,
+    RestType,
+    RollResultType,
+    RollType,
+)
 from game.constants.combat import ActionType, CombatAction
 from game.models.combat import Combat, Fighter, Round, Turn, TurnAction
 from game.models.events import (
@@ -16,10 +21,14 @@ from game.models.events import (
     CombatInitiativeResult,
     CombatStarted,
     DiceRoll,
+    EncumbranceChanged,
     Event,
     GameStart,
+    MagicItemsRecharged,
     Message,
+    MonsterActionsResolved,
     QuestUpdate,
+    RestCompleted,
     RollRequest,
     RollResponse,
     RollResult,
@@ -331,3 +340,46 @@ class DiceRollFactory(factory.django.DjangoModelFactory):
     individual_rolls = [3, 4]
     total = 7
     roll_purpose = ""
+
+
+class RestCompletedFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = RestCompleted
+
+    game = factory.SubFactory(GameFactory)
+    author = factory.SubFactory(ActorFactory)
+    rest_type = RestType.LONG
+    characters_count = 4
+
+
+class MagicItemsRechargedFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = MagicItemsRecharged
+
+    game = factory.SubFactory(GameFactory)
+    author = factory.SubFactory(ActorFactory)
+    items_count = 3
+    charges_restored = 12
+
+
+class EncumbranceChangedFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = EncumbranceChanged
+
+    game = factory.SubFactory(GameFactory)
+    author = factory.SubFactory(ActorFactory)
+    character = factory.SubFactory("character.tests.factories.CharacterFactory")
+    encumbered = True
+
+
+class MonsterActionsResolvedFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = MonsterActionsResolved
+
+    game = factory.SubFactory(GameFactory)
+    author = factory.SubFactory(ActorFactory)
+    monster = factory.SubFactory("bestiary.tests.factories.MonsterFactory")
+    attacks_count = 3
+    hits_count = 2
+    damage_dealt = 14
+    outcomes = factory.LazyFunction(list)
@@ -0,0 +1,78 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from bestiary.constants.monsters import MonsterName
+from bestiary.models.monsters import MonsterSettings
+from game.tests.factories import GameFactory, PlayerFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def party():
+    game = GameFactory()
+    characters = [PlayerFactory(game=game).character for _ in range(2)]
+    for character in characters:
+        character.xp = 0
+        character.level = 1
+        character.save()
+    return game, characters
+
+
+def test_award_xp_splits_amount(party):
+    out = StringIO()
+    game, characters = party
+    call_command("award_xp", game.id, "600", stdout=out)
+    for character in characters:
+        character.refresh_from_db()
+        assert character.xp == 300
+        assert character.level == 2
+    assert "Successfully awarded 600 XP to 2 characters" in out.getvalue()
+
+
+def test_award_xp_each(party):
+    game, characters = party
+    call_command("award_xp", game.id, "600", "--each", stdout=StringIO())
+    characters[0].refresh_from_db()
+    assert characters[0].xp == 600
+
+
+def test_award_xp_from_monsters(party):
+    game, characters = party
+    monster = MonsterSettings.objects.get(name=MonsterName.BROWN_BEAR)
+    call_command(
+        "award_xp",
+        game.id,
+        "--monster",
+        monster.name,
+        "--monster",
+        monster.name,
+        stdout=StringIO(),
+    )
+    characters[0].refresh_from_db()
+    assert characters[0].xp == monster.xp
+
+
+def test_award_xp_unknown_monster(party):
+    game, _ = party
+    with pytest.raises(CommandError):
+        call_command("award_xp", game.id, "--monster", "Tarrasque", stdout=StringIO())
+
+
+def test_award_xp_game_does_not_exist():
+    with pytest.raises(CommandError):
+        call_command("award_xp", 99999, "100", stdout=StringIO())
+
+
+def test_award_xp_invalid_amount(party):
+    game, _ = party
+    with pytest.raises(CommandError):
+        call_command("award_xp", game.id, "0", stdout=StringIO())
+
+
+def test_award_xp_game_without_characters():
+    with pytest.raises(CommandError):
+        call_command("award_xp", GameFactory().id, "100", stdout=StringIO())
@@ -0,0 +1,57 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from equipment.constants.magic_items import MagicItemName
+from equipment.models.magic_items import MagicItem
+from game.models.events import MagicItemsRecharged
+from game.tests.factories import PlayerFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def wands():
+    characters = [PlayerFactory().character for _ in range(2)]
+    return [
+        MagicItem.objects.create(
+            settings_id=MagicItemName.WAND_OF_MAGIC_MISSILES,
+            inventory=character.inventory,
+            current_charges=0,
+        )
+        for character in characters
+    ]
+
+
+def test_recharge_game(wands):
+    out = StringIO()
+    game_id = wands[0].inventory.character.player.game_id
+    call_command("recharge_magic_items", "--game", game_id, stdout=out)
+    for wand in wands:
+        wand.refresh_from_db()
+    assert wands[0].current_charges > 0
+    assert wands[1].current_charges == 0
+    assert MagicItemsRecharged.objects.get().game_id == game_id
+    assert "Successfully recharged magic items in 1 game(s)" in out.getvalue()
+
+
+def test_recharge_all(wands):
+    out = StringIO()
+    call_command("recharge_magic_items", "--all", stdout=out)
+    for wand in wands:
+        wand.refresh_from_db()
+        assert wand.current_charges > 0
+    assert MagicItemsRecharged.objects.count() == 2
+    assert "Successfully recharged magic items in 2 game(s)" in out.getvalue()
+
+
+def test_unknown_game():
+    with pytest.raises(CommandError, match="doesn't exist"):
+        call_command("recharge_magic_items", "--game", 0)
+
+
+def test_game_or_all_is_required():
+    with pytest.raises(CommandError):
+        call_command("recharge_magic_items")
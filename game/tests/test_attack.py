@@ -8,7 +8,12 @@ from character.constants.abilities import AbilityName
 from equipment.constants.equipment import WeaponName, WeaponType
 from equipment.models.equipment import Weapon, WeaponSettings
 from character.models.proficiencies import WeaponProficiency
-from character.tests.factories import CharacterFactory
+from character.constants.conditions import ConditionName
+from character.tests.factories import (
+    CharacterConditionFactory,
+    CharacterFactory,
+    ConditionFactory,
+)
 
 from game.attack import (
     apply_damage,
@@ -418,6 +423,19 @@ class TestResolveAttack:
 
             mock_dis.assert_called_once()
 
+    def test_attacker_condition_imposes_disadvantage(self, attacker, target, weapon):
+        """Test that a Poisoned attacker rolls with disadvantage."""
+        CharacterConditionFactory(
+            character=attacker,
+            condition=ConditionFactory(name=ConditionName.POISONED),
+        )
+        with patch("game.attack.DiceString.roll_with_disadvantage") as mock_dis:
+            mock_dis.return_value = (5, 5, 18)
+
+            resolve_attack(attacker, target, weapon)
+
+            mock_dis.assert_called_once()
+
     def test_attack_result_metadata(self, attacker, target, weapon):
         """Test that attack result contains correct metadata."""
         # Natural 15 + modifier 3 = 18, hits AC 15
@@ -0,0 +1,295 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache, RedisCacheClient
+
+from bestiary.constants.monsters import DAMAGE_TYPE_BITS, DamageRelationType
+from bestiary.groups import MonsterGroup
+from bestiary.models.monsters import Monster
+from bestiary.tests.factories import MonsterDamageRelationFactory, MonsterFactory
+from game.combatants import (
+    CombatantRoster,
+    _locked,
+    flush_roster,
+    get_roster,
+    open_roster,
+    release_roster,
+    update_roster,
+)
+from game.constants.combat import CombatantKind
+from game.exceptions import RosterLocked
+from magic.models.spell_effects import SummonedCreature
+from magic.tests.factories import SummonedCreatureFactory
+
+from .factories import CombatFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def combat():
+    return CombatFactory()
+
+
+@pytest.fixture
+def committed(django_capture_on_commit_callbacks):
+    """Run the on_commit callbacks of the block, as if its transaction committed."""
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+@pytest.fixture
+def monster(combat):
+    monster = MonsterFactory(combat=combat, hp_current=30, hp_max=30)
+    monster.settings.damage_relations.all().delete()
+    MonsterDamageRelationFactory(
+        monster=monster.settings,
+        damage_type="fire",
+        relation_type=DamageRelationType.RESISTANCE,
+    )
+    return monster
+
+
+@pytest.fixture
+def summon(combat):
+    return SummonedCreatureFactory(combat=combat, hp_current=20, hp_max=20)
+
+
+class TestCombatant:
+    def test_take_damage(self, combat, monster):
+        combatant = CombatantRoster.load(combat.id).monster(monster.pk)
+        assert combatant.take_damage(10) == 10
+        assert combatant.hp == 20
+        assert combatant.dirty
+
+    def test_resistance(self, combat, monster):
+        combatant = CombatantRoster.load(combat.id).monster(monster.pk)
+        assert combatant.take_damage(10, "Fire") == 5
+        assert combatant.hp == 25
+
+    def test_temp_hp_absorbs_damage(self, combat, monster):
+        combatant = CombatantRoster.load(combat.id).monster(monster.pk)
+        combatant.add_temp_hp(4)
+        assert combatant.take_damage(10) == 6
+        assert combatant.hp_temp == 0
+        assert combatant.hp == 24
+
+    def test_hp_floor(self, combat, summon):
+        combatant = CombatantRoster.load(combat.id).summon(summon.pk)
+        combatant.take_damage(50)
+        assert combatant.hp == 0
+        assert not combatant.is_alive
+
+    def test_heal_capped(self, combat, summon):
+        combatant = CombatantRoster.load(combat.id).summon(summon.pk)
+        combatant.take_damage(5)
+        assert combatant.heal(10) == 5
+        assert combatant.hp == 20
+
+
+class TestCombatantRoster:
+    def test_load(self, combat, monster, summon):
+        roster = CombatantRoster.load(combat.id)
+        assert set(roster.combatants) == {
+            (CombatantKind.MONSTER, monster.pk),
+            (CombatantKind.SUMMON, summon.pk),
+        }
+        relations = roster.monster(monster.pk).relations
+        assert relations.resistances == DAMAGE_TYPE_BITS["fire"]
+
+    def test_load_query_count(self, combat, monster, summon, django_assert_num_queries):
+        MonsterFactory(combat=combat)
+        with django_assert_num_queries(3):
+            CombatantRoster.load(combat.id)
+
+    def test_open_keeps_pending_changes(self, combat, monster):
+        open_roster(combat.id)
+        monster.take_damage(10)
+        assert open_roster(combat.id).monster(monster.pk).hp == 20
+
+    def test_not_open(self, combat, monster):
+        assert get_roster(combat.id) is None
+        with update_roster(combat.id) as roster:
+            assert roster is None
+        assert flush_roster(combat.id) == 0
+        assert release_roster(combat.id) == 0
+
+    def test_flush(self, combat, monster, summon, committed):
+        open_roster(combat.id)
+        with update_roster(combat.id) as roster:
+            roster.monster(monster.pk).take_damage(10)
+            roster.summon(summon.pk).take_damage(5)
+        assert Monster.objects.get(pk=monster.pk).hp_current == 30
+
+        with committed():
+            assert flush_roster(combat.id) == 2
+        assert Monster.objects.get(pk=monster.pk).hp_current == 20
+        assert SummonedCreature.objects.get(pk=summon.pk).hp_current == 15
+        assert flush_roster(combat.id) == 0
+
+    def test_rolled_back_flush_is_written_again(self, combat, monster):
+        open_roster(combat.id)
+        monster.take_damage(10)
+        # The transaction of the flush never commits
+        assert flush_roster(combat.id) == 1
+        assert flush_roster(combat.id) == 1
+
+    def test_changes_during_flush_stay_dirty(self, combat, monster):
+        roster = CombatantRoster.load(combat.id)
+        combatant = roster.monster(monster.pk)
+        combatant.take_damage(10)
+        written = roster.write()
+        combatant.take_damage(5)
+        roster.mark_written(written)
+        assert combatant.dirty
+
+    def test_flush_query_count(self, combat, django_assert_num_queries):
+        monsters = [MonsterFactory(combat=combat) for _ in range(10)]
+        roster = CombatantRoster.load(combat.id)
+        for monster in monsters:
+            roster.monster(monster.pk).take_damage(1)
+        # Savepoint, one bulk update, savepoint release
+        with django_assert_num_queries(3):
+            roster.write()
+
+    def test_flush_without_changes(self, combat, monster, django_assert_num_queries):
+        roster = CombatantRoster.load(combat.id)
+        with django_assert_num_queries(0):
+            assert roster.write() == {}
+
+    def test_alive(self, combat, monster, summon):
+        roster = CombatantRoster.load(combat.id)
+        roster.summon(summon.pk).take_damage(100)
+        assert [combatant.pk for combatant in roster.alive()] == [monster.pk]
+
+
+class TestCreaturesUseRoster:
+    def test_monster_damage_is_not_written_until_flush(
+        self, combat, monster, django_assert_num_queries
+    ):
+        open_roster(combat.id)
+        with django_assert_num_queries(0):
+            assert monster.take_damage(10, "fire") == 5
+            assert monster.heal(2) == 2
+            monster.add_temp_hp(3)
+        assert (monster.hp_current, monster.hp_temp) == (27, 3)
+        assert Monster.objects.get(pk=monster.pk).hp_current == 30
+        flush_roster(combat.id)
+        monster.refresh_from_db()
+        assert (monster.hp_current, monster.hp_temp) == (27, 3)
+
+    def test_summon_damage_is_not_written_until_flush(self, combat, summon):
+        open_roster(combat.id)
+        assert summon.take_damage(8) == 12
+        assert summon.heal(3) == 15
+        assert SummonedCreature.objects.get(pk=summon.pk).hp_current == 20
+        flush_roster(combat.id)
+        assert SummonedCreature.objects.get(pk=summon.pk).hp_current == 15
+
+    def test_state_is_shared(self, combat, monster):
+        # Another instance of the monster, e.g. loaded by another worker
+        open_roster(combat.id)
+        monster.take_damage(10)
+        other = Monster.objects.get(pk=monster.pk)
+        assert other.hp_current == 30
+        assert other.take_damage(5) == 5
+        assert other.hp_current == 15
+
+    def test_monster_joining_after_open(self, combat, monster):
+        open_roster(combat.id)
+        late = MonsterFactory(combat=combat, hp_current=12, hp_max=12)
+        late.take_damage(4)
+        assert get_roster(combat.id).monster(late.pk).hp == 8
+        assert Monster.objects.get(pk=late.pk).hp_current == 12
+
+    def test_group_damage(self, combat, monster, django_assert_num_queries):
+        open_roster(combat.id)
+        outsider = MonsterFactory(
+            settings=monster.settings, hp_current=30, hp_max=30, combat=None
+        )
+        group = MonsterGroup([monster, outsider])
+        # Damage relations, the bulk update of the monster outside the combat
+        with django_assert_num_queries(2):
+            assert group.take_damage(10, "fire") == [5, 5]
+        assert Monster.objects.get(pk=monster.pk).hp_current == 30
+        assert Monster.objects.get(pk=outsider.pk).hp_current == 25
+        monster.take_damage(1)
+        assert monster.hp_current == 24
+
+    def test_without_roster(self, combat, monster):
+        monster.take_damage(10)
+        assert Monster.objects.get(pk=monster.pk).hp_current == 20
+
+
+class TestCombatRoster:
+    def test_start_combat_opens_roster(self, combat, monster):
+        combat.start_combat()
+        assert get_roster(combat.id).monster(monster.pk).hp == 30
+
+    def test_end_combat_flushes_and_releases(self, combat, monster, committed):
+        open_roster(combat.id)
+        monster.take_damage(7)
+        with committed():
+            combat.end_combat()
+        assert Monster.objects.get(pk=monster.pk).hp_current == 23
+        assert get_roster(combat.id) is None
+
+    def test_rolled_back_release_keeps_roster(self, combat, monster):
+        open_roster(combat.id)
+        monster.take_damage(7)
+        release_roster(combat.id)
+        assert get_roster(combat.id).monster(monster.pk).dirty
+
+    def test_new_round_flushes(self, combat, monster):
+        combat.start_combat()
+        monster.take_damage(4)
+        for _ in combat.get_initiative_order():
+            combat.advance_turn()
+        assert combat.current_round == 2
+        assert Monster.objects.get(pk=monster.pk).hp_current == 26
+
+
+class TestRosterLock:
+    def test_wait_is_capped(self, combat, monkeypatch):
+        monkeypatch.setattr("game.combatants.ROSTER_LOCK_WAIT", 0)
+        cache.add(f"combat-roster-lock:{combat.id}", "other worker")
+        with pytest.raises(RosterLocked):
+            with _locked(combat.id):
+                pass
+
+    def test_only_the_owner_releases(self, combat):
+        key = f"combat-roster-lock:{combat.id}"
+        with _locked(combat.id):
+            # The lock expired and another worker took it
+            cache.set(key, "other worker")
+        assert cache.get(key) == "other worker"
+
+    def test_release(self, combat):
+        with _locked(combat.id):
+            pass
+        assert cache.get(f"combat-roster-lock:{combat.id}") is None
+
+    def test_redis_lock(self, combat):
+        backend = RedisCache("redis://localhost:6379", {})
+        with (
+            patch("game.combatants.caches", {"default": backend}),
+            patch.object(RedisCacheClient, "get_client") as get_client,
+        ):
+            lock = get_client.return_value.lock.return_value
+            with _locked(combat.id):
+                lock.release.assert_not_called()
+            lock.release.assert_called_once_with()
+            lock.acquire.return_value = False
+            with pytest.raises(RosterLocked):
+                with _locked(combat.id):
+                    pass
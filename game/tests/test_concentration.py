@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+import pytest
+
+from character.tests.factories import CharacterFactory, SpellSettingsFactory
+from game.concentration import (
+    check_concentration,
+    concentration_save_dc,
+    resolve_concentration_checks,
+)
+from game.models.events import (
+    ConcentrationBroken,
+    ConcentrationSaveRequired,
+    ConcentrationSaveResult,
+)
+from magic.models.spells import Concentration
+
+from .factories import GameFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def concentrating_characters():
+    spell = SpellSettingsFactory(name="Bless", concentration=True)
+    characters = [CharacterFactory() for _ in range(3)]
+    for character in characters:
+        Concentration.start_concentration(character, spell)
+    return characters
+
+
+class TestConcentrationSaveDC:
+    def test_minimum_dc(self):
+        assert concentration_save_dc(7) == 10
+
+    def test_half_damage(self):
+        assert concentration_save_dc(31) == 15
+
+
+class TestResolveConcentrationChecks:
+    def test_only_concentrating_characters(self, concentrating_characters):
+        bystander = CharacterFactory()
+        ledger = [(concentrating_characters[0], 12), (bystander, 12)]
+        checks = resolve_concentration_checks(ledger)
+        assert [check.character for check in checks] == [concentrating_characters[0]]
+        assert checks[0].dc == 10
+        assert checks[0].spell.name == "Bless"
+        assert checks[0].is_rolled is False
+
+    def test_one_check_per_damage_source(self, concentrating_characters):
+        character = concentrating_characters[0]
+        checks = resolve_concentration_checks([(character, 8), (character, 24)])
+        assert [check.dc for check in checks] == [10, 12]
+
+    def test_ignores_zero_damage(self, concentrating_characters):
+        assert resolve_concentration_checks([(concentrating_characters[0], 0)]) == []
+
+    def test_uses_constitution_modifier(self, concentrating_characters):
+        character = concentrating_characters[0]
+        checks = resolve_concentration_checks([(character, 10)])
+        assert checks[0].modifier == character.constitution.modifier
+
+    def test_single_query(self, concentrating_characters, django_assert_num_queries):
+        ledger = [(character, 20) for character in concentrating_characters]
+        with django_assert_num_queries(1):
+            resolve_concentration_checks(ledger)
+
+    def test_auto_roll(self, concentrating_characters):
+        ledger = [(character, 10) for character in concentrating_characters]
+        with patch("game.concentration.roll_d20_batch", return_value=[20, 1, 20]):
+            checks = resolve_concentration_checks(ledger, auto_roll=True)
+        assert [check.success for check in checks] == [True, False, True]
+
+    def test_auto_roll_stops_after_failure(self, concentrating_characters):
+        character = concentrating_characters[0]
+        with patch("game.concentration.roll_d20_batch", return_value=[1, 20]):
+            checks = resolve_concentration_checks(
+                [(character, 10), (character, 10)], auto_roll=True
+            )
+        assert len(checks) == 1
+        assert checks[0].success is False
+
+
+class TestCheckConcentration:
+    @pytest.fixture(autouse=True)
+    def setup(self, django_capture_on_commit_callbacks):
+        self.capture_on_commit_callbacks = django_capture_on_commit_callbacks
+
+    def test_creates_save_required_events(self, concentrating_characters):
+        game = GameFactory()
+        ledger = [(character, 10) for character in concentrating_characters]
+        with patch("game.concentration.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks(execute=True):
+                check_concentration(game, game.master, ledger)
+        assert ConcentrationSaveRequired.objects.filter(game=game).count() == 3
+        assert not ConcentrationSaveResult.objects.filter(game=game).exists()
+        assert mock_send.call_count == 3
+
+    def test_auto_roll_breaks_failed_concentrations(self, concentrating_characters):
+        game = GameFactory()
+        ledger = [(character, 10) for character in concentrating_characters]
+        with (
+            patch("game.concentration.send_to_channel") as mock_send,
+            patch("game.concentration.roll_d20_batch", return_value=[20, 1, 1]),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            check_concentration(game, game.master, ledger, auto_roll=True)
+        assert ConcentrationSaveResult.objects.filter(game=game).count() == 3
+        assert ConcentrationBroken.objects.filter(game=game).count() == 2
+        assert list(Concentration.objects.values_list("character", flat=True)) == [
+            concentrating_characters[0].pk
+        ]
+        # 3 required + 3 results + 2 broken
+        assert mock_send.call_count == 8
+
+    def test_broadcasts_after_commit(self, concentrating_characters):
+        game = GameFactory()
+        ledger = [(concentrating_characters[0], 10)]
+        with patch("game.concentration.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks() as callbacks:
+                check_concentration(game, game.master, ledger)
+            mock_send.assert_not_called()
+        assert len(callbacks) == 1
@@ -0,0 +1,227 @@
+"""Tests for the monster action resolution system."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bestiary.constants.monsters import (
+    ActionType,
+    DamageType,
+    MonsterName,
+    RechargeType,
+    SaveEffect,
+    SaveType,
+)
+from bestiary.tests.factories import (
+    MonsterActionTemplateFactory,
+    MonsterFactory,
+    MonsterMultiattackFactory,
+    MonsterSettingsFactory,
+    MultiattackActionFactory,
+)
+from character.tests.factories import CharacterFactory
+
+from game.exceptions import ActionNotAvailable
+from game.monster_actions import multiattack_sequence, resolve_monster_actions
+
+pytestmark = pytest.mark.django_db
+
+
+def d20s(attack_rolls, save_rolls=()):
+    """Patch the d20 batches of the sequence: each roll is drawn twice."""
+    return patch(
+        "game.monster_actions.roll_d20_batch",
+        side_effect=[
+            [roll for roll in batch for _ in range(2)]
+            for batch in (attack_rolls, save_rolls)
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def roll_ones(monkeypatch):
+    """Make every damage die roll 1."""
+    monkeypatch.setattr("random.choices", lambda population, k: [population[0]] * k)
+
+
+@pytest.fixture
+def settings():
+    return MonsterSettingsFactory(name=MonsterName.BANDIT)
+
+
+@pytest.fixture
+def monster(settings):
+    return MonsterFactory(settings=settings)
+
+
+@pytest.fixture
+def targets():
+    characters = [CharacterFactory(), CharacterFactory()]
+    for character in characters:
+        character.ac = 15
+        for ability in character.abilities.all():
+            ability.score = 10
+            ability.save()
+    return characters
+
+
+@pytest.fixture
+def scimitar(settings):
+    # Damage dice roll 1: 4, or 5 on a critical hit.
+    return MonsterActionTemplateFactory(
+        monster=settings, attack_bonus=5, damage_dice="1d6+3"
+    )
+
+
+@pytest.fixture
+def breath(settings):
+    return MonsterActionTemplateFactory(
+        monster=settings,
+        action_type=ActionType.SPECIAL,
+        attack_bonus=None,
+        damage_dice="2d6+8",
+        damage_type=DamageType.FIRE,
+        save_dc=13,
+        save_type=SaveType.DEXTERITY,
+        save_effect=SaveEffect.HALF_DAMAGE,
+        recharge=RechargeType.RECHARGE_5_6,
+    )
+
+
+class TestMultiattackSequence:
+    def test_counts(self, settings, scimitar):
+        multiattack = MonsterMultiattackFactory(monster=settings)
+        bite = MonsterActionTemplateFactory(monster=settings)
+        MultiattackActionFactory(multiattack=multiattack, action=scimitar, count=2)
+        MultiattackActionFactory(multiattack=multiattack, action=bite, count=1)
+        sequence = multiattack_sequence(multiattack.actions.all())
+        assert sequence == [scimitar, scimitar, bite]
+
+    def test_optional_actions_are_left_out(self, settings, scimitar):
+        multiattack = MonsterMultiattackFactory(monster=settings)
+        MultiattackActionFactory(multiattack=multiattack, action=scimitar, count=2)
+        MultiattackActionFactory(multiattack=multiattack, is_optional=True)
+        assert multiattack_sequence(multiattack.actions.all()) == [scimitar] * 2
+
+    def test_first_alternative_is_chosen(self, settings, scimitar):
+        multiattack = MonsterMultiattackFactory(monster=settings)
+        MultiattackActionFactory(
+            multiattack=multiattack, action=scimitar, count=3, group=1
+        )
+        MultiattackActionFactory(multiattack=multiattack, count=2, group=1)
+        assert multiattack_sequence(multiattack.actions.all()) == [scimitar] * 3
+
+
+class TestAttacks:
+    def test_hit_and_miss(self, monster, targets, scimitar):
+        with d20s([10, 9]):
+            hit, miss = resolve_monster_actions(monster, [scimitar] * 2, targets[:1])
+        assert hit.attack_roll == 15
+        assert hit.is_hit
+        assert hit.damage == 4
+        assert miss.attack_roll == 14
+        assert not miss.is_hit
+        assert miss.damage == 0
+
+    def test_critical_hit_doubles_dice(self, monster, targets, scimitar):
+        targets[0].ac = 30
+        with d20s([20]):
+            (outcome,) = resolve_monster_actions(monster, [scimitar], targets[:1])
+        assert outcome.is_hit
+        assert outcome.is_critical_hit
+        assert outcome.damage == 5
+
+    def test_natural_one_misses(self, monster, targets, scimitar):
+        scimitar.attack_bonus = 30
+        with d20s([1]):
+            (outcome,) = resolve_monster_actions(monster, [scimitar], targets[:1])
+        assert not outcome.is_hit
+
+    def test_advantage(self, monster, targets, scimitar):
+        with patch("game.monster_actions.roll_d20_batch", side_effect=[[2, 18], []]):
+            (outcome,) = resolve_monster_actions(
+                monster, [scimitar], targets[:1], advantage=True
+            )
+        assert outcome.natural_roll == 18
+
+    def test_targets_are_attacked_in_turn(self, monster, targets, scimitar):
+        with d20s([10] * 3):
+            outcomes = resolve_monster_actions(monster, [scimitar] * 3, targets)
+        assert [outcome.target for outcome in outcomes] == [
+            targets[0],
+            targets[1],
+            targets[0],
+        ]
+
+    def test_extra_damage_save(self, monster, targets, scimitar):
+        scimitar.extra_damage_dice = "1d4+1"
+        scimitar.extra_damage_type = DamageType.POISON
+        scimitar.save_dc = 13
+        scimitar.save_type = SaveType.CONSTITUTION
+        scimitar.save_effect = SaveEffect.NEGATES
+        with d20s([10, 10], [20, 1]):
+            saved, failed = resolve_monster_actions(monster, [scimitar] * 2, targets)
+        assert saved.save_success
+        assert saved.damage == 4
+        assert not failed.save_success
+        assert failed.damage == 4 + 2
+
+    def test_unstructured_action(self, monster, targets):
+        action = MonsterActionTemplateFactory(
+            monster=monster.settings, attack_bonus=None, damage_dice=""
+        )
+        with d20s([]):
+            (outcome,) = resolve_monster_actions(monster, [action], targets)
+        assert not outcome.resolved
+        assert outcome.target is None
+        assert outcome.summary()["resolved"] is False
+
+
+class TestSaves:
+    def test_every_target_saves(self, monster, targets, breath):
+        with d20s([], [20, 1]):
+            saved, failed = resolve_monster_actions(monster, [breath], targets)
+        assert saved.save_success
+        assert saved.damage == 10 // 2
+        assert not failed.save_success
+        assert failed.damage == 10
+
+    def test_save_negates(self, monster, targets, breath):
+        breath.save_effect = SaveEffect.NEGATES
+        with d20s([], [20, 1]):
+            saved, failed = resolve_monster_actions(monster, [breath], targets)
+        assert saved.damage == 0
+        assert failed.damage == 10
+
+
+class TestRecharge:
+    def test_recharge_action_is_spent(self, monster, targets, breath):
+        with d20s([], [1, 1]):
+            resolve_monster_actions(monster, [breath], targets)
+        assert not monster.can_use_action(breath)
+        with pytest.raises(ActionNotAvailable):
+            resolve_monster_actions(monster, [breath], targets)
+
+    def test_nothing_is_spent_when_an_action_is_not_available(
+        self, monster, targets, breath
+    ):
+        daily = MonsterActionTemplateFactory(
+            monster=monster.settings, recharge=RechargeType.DAILY_2
+        )
+        with pytest.raises(ActionNotAvailable):
+            resolve_monster_actions(monster, [daily, breath, breath], targets)
+        assert monster.spent_actions == {}
+
+    def test_daily_uses(self, monster, targets):
+        daily = MonsterActionTemplateFactory(
+            monster=monster.settings, recharge=RechargeType.DAILY_2
+        )
+        with d20s([10, 10], []):
+            resolve_monster_actions(monster, [daily, daily], targets)
+        assert monster.spent_actions == {str(daily.pk): 2}
+        assert not monster.can_use_action(daily)
+
+
+def test_targets_are_required(monster, scimitar):
+    with pytest.raises(ValueError):
+        resolve_monster_actions(monster, [scimitar], [])
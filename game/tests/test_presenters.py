@@ -161,6 +161,55 @@ class TestFormatCombatEnded:
         assert format_event_message(event) == "Combat has ended."
 
 
+class TestFormatRestCompleted:
+    def test_message(self):
+        from .factories import RestCompletedFactory
+
+        event = RestCompletedFactory()
+        expected = "The party finished a long rest (4 characters)."
+        assert format_event_message(event) == expected
+
+
+class TestFormatMagicItemsRecharged:
+    def test_message(self):
+        from .factories import MagicItemsRechargedFactory
+
+        event = MagicItemsRechargedFactory()
+        expected = "At dawn, 3 magic items regained 12 charges."
+        assert format_event_message(event) == expected
+
+
+class TestFormatEncumbranceChanged:
+    def test_encumbered(self):
+        from .factories import EncumbranceChangedFactory
+
+        event = EncumbranceChangedFactory()
+        expected = f"{event.character.name} is now encumbered."
+        assert format_event_message(event) == expected
+
+    def test_no_longer_encumbered(self):
+        from .factories import EncumbranceChangedFactory
+
+        event = EncumbranceChangedFactory(encumbered=False)
+        expected = f"{event.character.name} is no longer encumbered."
+        assert format_event_message(event) == expected
+
+
+class TestFormatMonsterActionsResolved:
+    def test_attacks(self):
+        from .factories import MonsterActionsResolvedFactory
+
+        event = MonsterActionsResolvedFactory()
+        expected = f"{event.monster} acts: 2 of 3 attacks hit, 14 damage dealt."
+        assert format_event_message(event) == expected
+
+    def test_without_attacks(self):
+        from .factories import MonsterActionsResolvedFactory
+
+        event = MonsterActionsResolvedFactory(attacks_count=0, hits_count=0)
+        assert format_event_message(event) == f"{event.monster} acts: 14 damage dealt."
+
+
 class TestFormatSpellCast:
     def test_no_targets(self):
         game = GameFactory()
@@ -1,10 +1,12 @@
 import pytest
 
 from character.constants.abilities import AbilityName
+from character.constants.conditions import ConditionName
+from character.tests.factories import CharacterConditionFactory, ConditionFactory
 from game.constants.events import Against, DifficultyClass, RollResultType, RollType
 from game.exceptions import InvalidRoll
-from game.tests.factories import RollRequestFactory, PlayerFactory
-from game.rolls import _roll, perform_roll
+from game.tests.factories import FighterFactory, RollRequestFactory, PlayerFactory
+from game.rolls import _roll, perform_combat_initiative_roll, perform_roll
 
 pytestmark = pytest.mark.django_db
 
@@ -67,10 +69,10 @@ def test_perform_roll_with_advantage(monkeypatch):
     def patched_roll(self, modifier=0):
         return next(score_generator)
 
-    def patched_advantage(self, roll_type, against):
+    def patched_advantage(self, roll_type, against, ability_name=None):
         return True
 
-    def patched_disadvantage(self, roll_type, against):
+    def patched_disadvantage(self, roll_type, against, ability_name=None):
         return False
 
     monkeypatch.setattr("utils.dice.DiceString.roll", patched_roll)
@@ -98,10 +100,10 @@ def test_perform_roll_with_disadvantage(monkeypatch):
     def patched_roll(self, modifier=0):
         return next(score_generator)
 
-    def patched_advantage(self, roll_type, against):
+    def patched_advantage(self, roll_type, against, ability_name=None):
         return False
 
-    def patched_disadvantage(self, roll_type, against):
+    def patched_disadvantage(self, roll_type, against, ability_name=None):
         return True
 
     monkeypatch.setattr("utils.dice.DiceString.roll", patched_roll)
@@ -131,10 +133,10 @@ def test_perform_roll_with_both_advantage_and_disadvantage(monkeypatch):
         roll_count += 1
         return 10
 
-    def patched_advantage(self, roll_type, against):
+    def patched_advantage(self, roll_type, against, ability_name=None):
         return True
 
-    def patched_disadvantage(self, roll_type, against):
+    def patched_disadvantage(self, roll_type, against, ability_name=None):
         return True
 
     monkeypatch.setattr("utils.dice.DiceString.roll", patched_roll)
@@ -165,5 +167,38 @@ def test_roll_invalid_ability(monkeypatch):
 
     ability_type = AbilityType.objects.first()
     with pytest.raises(InvalidRoll) as exc_info:
-        _roll(player, ability_type)
+        _roll(player, ability_type.name)
     assert "does not have the ability" in str(exc_info.value)
+
+
+def test_perform_roll_auto_fail(monkeypatch):
+    def patched_roll(self, modifier=0):
+        return 20
+
+    monkeypatch.setattr("utils.dice.DiceString.roll", patched_roll)
+    player = PlayerFactory()
+    CharacterConditionFactory(
+        character=player.character,
+        condition=ConditionFactory(name=ConditionName.STUNNED),
+    )
+    request = RollRequestFactory(
+        player=player,
+        roll_type=RollType.SAVING_THROW,
+        ability_type=AbilityName.STRENGTH,
+        difficulty_class=DifficultyClass.EASY,
+    )
+    _, result = perform_roll(player, request)
+    assert result == RollResultType.FAILURE
+
+
+def test_combat_initiative_roll_uses_stored_initiative(monkeypatch):
+    def patched_roll(self, modifier=0):
+        return 10 + modifier
+
+    monkeypatch.setattr("utils.dice.DiceString.roll", patched_roll)
+    fighter = FighterFactory()
+    # The stored initiative includes the bonus of the Alert feat.
+    fighter.player.character.initiative = 5
+    assert perform_combat_initiative_roll(fighter) == 15
+    fighter.refresh_from_db()
+    assert fighter.dexterity_check == 15
@@ -7,6 +7,7 @@ from game.tests.factories import (
     DiceRollFactory,
     GameFactory,
     MessageFactory,
+    MonsterActionsResolvedFactory,
     PlayerFactory,
 )
 
@@ -70,3 +71,13 @@ class TestSerializeGameLogEvent:
         data = serialize_game_log_event(message)
 
         assert data["details"] is None
+
+    def test_serialize_monster_actions_include_outcomes(self):
+        outcomes = [{"action": "Scimitar", "hit": True, "damage": 5}]
+        event = MonsterActionsResolvedFactory(outcomes=outcomes)
+
+        data = serialize_game_log_event(event)
+
+        assert data["category"] == LogCategory.COMBAT
+        assert data["details"]["monster"] == str(event.monster)
+        assert data["details"]["outcomes"] == outcomes
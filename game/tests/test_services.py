@@ -1,14 +1,58 @@
 import pytest
 from django.utils import timezone
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from character.models.character import Character
-
-from game.models.game import Actor
-from game.models.events import DiceRoll
-from game.services import DiceRollService, GameEventService
-
-from .factories import GameFactory, PlayerFactory
+from equipment.constants.magic_items import MagicItemName
+from equipment.models.magic_items import MagicItem
+from character.tests.factories import (
+    CharacterSpellSlotFactory,
+    MagicItemFactory,
+    MagicItemSettingsFactory,
+    WarlockSpellSlotFactory,
+)
+
+from game.constants.events import RestType
+from game.models.game import Actor, Game
+from game.exceptions import ActionNotAvailable
+from game.models.events import (
+    ConcentrationSaveRequired,
+    DiceRoll,
+    MagicItemsRecharged,
+    MonsterActionsResolved,
+    RestCompleted,
+)
+from bestiary.constants.encounters import EncounterDifficulty
+from bestiary.constants.monsters import (
+    ActionType,
+    CreatureType,
+    MonsterName,
+    RechargeType,
+    SaveType,
+)
+from bestiary.encounters import encounter_multiplier, party_threshold
+from bestiary.exceptions import EncounterGenerationError
+from bestiary.index import get_bestiary_index
+from bestiary.models.monsters import Monster, MonsterSettings
+from bestiary.tests.factories import (
+    MonsterActionTemplateFactory,
+    MonsterFactory,
+    MonsterMultiattackFactory,
+    MonsterSettingsFactory,
+    MultiattackActionFactory,
+)
+from magic.tests.factories import ConcentrationFactory
+from game.services import (
+    DiceRollService,
+    EncounterService,
+    ExperienceService,
+    GameEventService,
+    MonsterActionService,
+    RechargeService,
+    RestService,
+)
+
+from .factories import CombatFactory, GameFactory, PlayerFactory
 
 
 pytestmark = pytest.mark.django_db
@@ -239,3 +283,429 @@ class TestDiceRollService:
             )
 
         assert isinstance(dice_roll, DiceRoll)
+
+
+class TestRestService:
+    @pytest.fixture
+    def party(self):
+        game = GameFactory()
+        players = [PlayerFactory(game=game) for _ in range(3)]
+        for player in players:
+            character = player.character
+            character.max_hp = 20
+            character.hp = 5
+            character.temp_hp = 3
+            character.death_save_failures = 2
+            character.save()
+            CharacterSpellSlotFactory(character=character, total=4, used=3)
+        return game, [player.character for player in players]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, django_capture_on_commit_callbacks):
+        self.capture_on_commit_callbacks = django_capture_on_commit_callbacks
+
+    def take_rest(self, game, rest_type):
+        with patch("game.services.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks(execute=True):
+                rest_completed = RestService.take_rest(game, game.master, rest_type)
+        mock_send.assert_called_once_with(rest_completed)
+        return rest_completed
+
+    def test_broadcasts_after_commit(self, party):
+        game, _ = party
+        with patch("game.services.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks() as callbacks:
+                RestService.take_rest(game, game.master, RestType.SHORT)
+            mock_send.assert_not_called()
+        assert len(callbacks) == 1
+
+    def test_long_rest_restores_hit_points(self, party):
+        game, characters = party
+        self.take_rest(game, RestType.LONG)
+        for character in characters:
+            character.refresh_from_db()
+            assert character.hp == character.max_hp
+            assert character.temp_hp == 0
+            assert character.death_save_failures == 0
+
+    def test_long_rest_restores_spell_slots(self, party):
+        game, characters = party
+        pact_magic = WarlockSpellSlotFactory(character=characters[0], used=1)
+        self.take_rest(game, RestType.LONG)
+        for character in characters:
+            assert all(slot.used == 0 for slot in character.spell_slots.all())
+        pact_magic.refresh_from_db()
+        assert pact_magic.used == 0
+
+    def test_long_rest_leaves_magic_item_charges_to_dawn(self, party):
+        game, characters = party
+        settings = MagicItemSettingsFactory()
+        settings.effects = {"charges": 7, "recharge": "1d6+1"}
+        settings.save()
+        magic_item = MagicItemFactory(
+            settings=settings, inventory=characters[0].inventory
+        )
+        magic_item.current_charges = 2
+        magic_item.save()
+        self.take_rest(game, RestType.LONG)
+        magic_item.refresh_from_db()
+        assert magic_item.current_charges == 2
+
+    def test_short_rest_only_restores_pact_magic(self, party):
+        game, characters = party
+        pact_magic = WarlockSpellSlotFactory(character=characters[0], used=1)
+        self.take_rest(game, RestType.SHORT)
+        pact_magic.refresh_from_db()
+        assert pact_magic.used == 0
+        characters[0].refresh_from_db()
+        assert characters[0].hp == 5
+        assert characters[0].spell_slots.get().used == 3
+
+    def test_does_not_affect_other_games(self, party):
+        game, _ = party
+        other = PlayerFactory().character
+        other.hp = 1
+        other.save()
+        self.take_rest(game, RestType.LONG)
+        other.refresh_from_db()
+        assert other.hp == 1
+
+    def test_creates_event(self, party):
+        game, characters = party
+        rest_completed = self.take_rest(game, RestType.LONG)
+        assert RestCompleted.objects.get() == rest_completed
+        assert rest_completed.rest_type == RestType.LONG
+        assert rest_completed.characters_count == len(characters)
+
+    def test_long_rest_query_count_is_constant(self, party, django_assert_num_queries):
+        game, _ = party
+        # Savepoint, three set-based updates, event creation (two inserts),
+        # savepoint release
+        with django_assert_num_queries(7):
+            self.take_rest(game, RestType.LONG)
+
+
+class TestRechargeService:
+    @pytest.fixture
+    def party(self):
+        game = GameFactory()
+        characters = [PlayerFactory(game=game).character for _ in range(2)]
+        return game, characters
+
+    def add_item(self, character, name, current_charges):
+        return MagicItem.objects.create(
+            settings_id=name,
+            inventory=character.inventory,
+            current_charges=current_charges,
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup(self, django_capture_on_commit_callbacks):
+        self.capture_on_commit_callbacks = django_capture_on_commit_callbacks
+
+    def recharge(self, games):
+        with patch("game.services.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks(execute=True):
+                events = RechargeService.recharge_magic_items(games)
+        assert mock_send.call_args_list == [call(event) for event in events]
+        return events
+
+    def test_broadcasts_after_commit(self, party):
+        game, characters = party
+        self.add_item(characters[0], MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+        with patch("game.services.send_to_channel") as mock_send:
+            with self.capture_on_commit_callbacks() as callbacks:
+                RechargeService.recharge_magic_items(Game.objects.filter(pk=game.pk))
+            mock_send.assert_not_called()
+        assert len(callbacks) == 1
+
+    def test_rolls_recharge_formula(self, party):
+        game, characters = party
+        wand = self.add_item(characters[0], MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+        staff = self.add_item(characters[1], MagicItemName.STAFF_OF_HEALING, 0)
+        self.recharge(Game.objects.filter(pk=game.pk))
+        wand.refresh_from_db()
+        staff.refresh_from_db()
+        assert 2 <= wand.current_charges <= 7
+        assert 5 <= staff.current_charges <= 10
+
+    def test_charges_are_capped(self, party):
+        game, characters = party
+        wand = self.add_item(characters[0], MagicItemName.WAND_OF_MAGIC_MISSILES, 6)
+        self.recharge(Game.objects.filter(pk=game.pk))
+        wand.refresh_from_db()
+        assert wand.current_charges == 7
+
+    def test_creates_event(self, party):
+        game, characters = party
+        wand = self.add_item(characters[0], MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+        self.add_item(characters[1], MagicItemName.WAND_OF_MAGIC_MISSILES, 7)
+        (event,) = self.recharge(Game.objects.filter(pk=game.pk))
+        wand.refresh_from_db()
+        assert MagicItemsRecharged.objects.get() == event
+        assert event.game == game
+        assert event.author_id == game.master.pk
+        assert event.items_count == 1
+        assert event.charges_restored == wand.current_charges
+
+    def test_does_not_affect_other_games(self, party):
+        game, _ = party
+        other = PlayerFactory().character
+        wand = self.add_item(other, MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+        assert self.recharge(Game.objects.filter(pk=game.pk)) == []
+        wand.refresh_from_db()
+        assert wand.current_charges == 0
+
+    def test_every_game(self, party):
+        game, characters = party
+        self.add_item(characters[0], MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+        other = PlayerFactory().character
+        self.add_item(other, MagicItemName.STAFF_OF_HEALING, 0)
+        events = self.recharge(Game.objects.all())
+        assert {event.game_id for event in events} == {game.pk, other.player.game_id}
+
+    def test_query_count_does_not_depend_on_items(
+        self, party, django_assert_num_queries
+    ):
+        game, characters = party
+        for character in characters:
+            for _ in range(3):
+                self.add_item(character, MagicItemName.WAND_OF_MAGIC_MISSILES, 0)
+                self.add_item(character, MagicItemName.STAFF_OF_HEALING, 0)
+        # Savepoint, items select, one update per formula, master select,
+        # event creation (two inserts), savepoint release
+        with django_assert_num_queries(8):
+            self.recharge(Game.objects.filter(pk=game.pk))
+
+
+class TestExperienceService:
+    @pytest.fixture
+    def party(self):
+        game = GameFactory()
+        players = [PlayerFactory(game=game) for _ in range(3)]
+        for player in players:
+            player.character.xp = 0
+            player.character.level = 1
+            player.character.save()
+        return game, [player.character for player in players]
+
+    def test_encounter_xp(self):
+        monsters = MonsterSettings.objects.all()[:3]
+        assert ExperienceService.encounter_xp(monsters) == sum(
+            monster.xp for monster in monsters
+        )
+
+    def test_award_xp_splits_evenly(self, party):
+        game, characters = party
+        ExperienceService.award_xp(game, 1000)
+        for character in characters:
+            character.refresh_from_db()
+            assert character.xp == 333
+            assert character.level == 2
+
+    def test_award_xp_to_each(self, party):
+        game, characters = party
+        ExperienceService.award_xp(game, 6500, split=False)
+        for character in characters:
+            character.refresh_from_db()
+            assert character.xp == 6500
+            assert character.level == 5
+
+    def test_award_xp_levels_up(self, party):
+        game, characters = party
+        old_max_hp = characters[0].max_hp
+        (character, *_) = ExperienceService.award_xp(game, 2700)
+        assert character.level == 3
+        character.refresh_from_db()
+        assert character.max_hp == old_max_hp + character.hp_increase * 2
+
+    def test_award_xp_does_not_affect_other_games(self, party):
+        game, _ = party
+        other = PlayerFactory().character
+        old_xp = other.xp
+        ExperienceService.award_xp(game, 300)
+        other.refresh_from_db()
+        assert other.xp == old_xp
+
+    def test_award_xp_without_characters(self):
+        assert ExperienceService.award_xp(GameFactory(), 300) == []
+
+    def test_award_xp_query_count_is_constant(self, party, django_assert_num_queries):
+        game, _ = party
+        # Savepoint, select for update, the prefetches of what the derived
+        # stats depend on (abilities, conditions, feats, classes), advancement
+        # table (loaded once per process), bulk update, savepoint release
+        with django_assert_num_queries(9):
+            ExperienceService.award_xp(game, 100_000)
+
+
+class TestEncounterService:
+    @pytest.fixture
+    def party(self):
+        game = GameFactory()
+        for level in (3, 4, 5):
+            character = PlayerFactory(game=game).character
+            character.level = level
+            character.save()
+        return game
+
+    def test_generate_encounter(self, party):
+        combat = CombatFactory(game=party)
+        monsters = EncounterService.generate_encounter(combat, EncounterDifficulty.HARD)
+        assert monsters
+        assert Monster.objects.filter(combat=combat).count() == len(monsters)
+        xp = sum(monster.settings.xp for monster in monsters)
+        adjusted = xp * encounter_multiplier(len(monsters), 3)
+        assert adjusted >= party_threshold([3, 4, 5], EncounterDifficulty.HARD)
+        assert adjusted < party_threshold([3, 4, 5], EncounterDifficulty.DEADLY)
+        for monster in monsters:
+            assert monster.pk is not None
+            assert monster.hp_current == monster.hp_max == monster.settings.hp_average
+
+    def test_copies_are_numbered(self, party):
+        # Only Dretches: several copies of the same stat block.
+        with patch("bestiary.encounters.random.choice", side_effect=lambda s: s[-1]):
+            monsters = EncounterService.generate_encounter(
+                CombatFactory(game=party),
+                EncounterDifficulty.MEDIUM,
+                creature_type=CreatureType.FIEND,
+                cr_max=0.25,
+            )
+        assert len(monsters) > 1
+        assert [monster.instance_name for monster in monsters] == [
+            f"Dretch {number}" for number in range(1, len(monsters) + 1)
+        ]
+
+    def test_query_count(self, party, django_assert_num_queries):
+        combat = CombatFactory(game=party)
+        get_bestiary_index()
+        # Party levels, monster settings, bulk insert
+        with django_assert_num_queries(3):
+            EncounterService.generate_encounter(combat, EncounterDifficulty.EASY)
+
+    def test_without_characters(self):
+        with pytest.raises(EncounterGenerationError):
+            EncounterService.generate_encounter(
+                CombatFactory(), EncounterDifficulty.EASY
+            )
+
+
+class TestMonsterActionService:
+    @pytest.fixture
+    def party(self):
+        game = GameFactory()
+        characters = [PlayerFactory(game=game).character for _ in range(2)]
+        for character in characters:
+            for ability in character.abilities.all():
+                ability.score = 10
+                ability.save()
+        Character.objects.filter(pk__in=[c.pk for c in characters]).update(
+            ac=15, hp=30, max_hp=30, temp_hp=0
+        )
+        return game, characters
+
+    @pytest.fixture
+    def monster(self):
+        return MonsterFactory(settings=MonsterSettingsFactory(name=MonsterName.BANDIT))
+
+    def multiattack(self, monster, count):
+        # Damage dice roll 1 (see execute()): 4 per hit.
+        scimitar = MonsterActionTemplateFactory(
+            monster=monster.settings, attack_bonus=5, damage_dice="1d6+3"
+        )
+        MultiattackActionFactory(
+            multiattack=MonsterMultiattackFactory(monster=monster.settings),
+            action=scimitar,
+            count=count,
+        )
+
+    def execute(self, game, monster, targets, **kwargs):
+        with (
+            patch(
+                "game.monster_actions.roll_d20_batch",
+                side_effect=lambda count: [10] * count,
+            ),
+            # Every damage die rolls 1
+            patch(
+                "random.choices",
+                side_effect=lambda population, k: [population[0]] * k,
+            ),
+            patch("game.services.send_to_channel") as mock_send,
+        ):
+            event = MonsterActionService.execute(
+                game, game.master, monster, targets, **kwargs
+            )
+        mock_send.assert_called_once_with(event)
+        return event
+
+    def test_multiattack(self, party, monster):
+        game, characters = party
+        self.multiattack(monster, 3)
+        event = self.execute(game, monster, characters)
+        assert event.attacks_count == event.hits_count == 3
+        assert event.damage_dealt == 3 * 4
+        assert [outcome["target"] for outcome in event.outcomes] == [
+            characters[0].name,
+            characters[1].name,
+            characters[0].name,
+        ]
+        assert MonsterActionsResolved.objects.get() == event
+        for character, hits in zip(characters, (2, 1)):
+            character.refresh_from_db()
+            assert character.hp == 30 - 4 * hits
+
+    def test_actions(self, party, monster):
+        game, characters = party
+        breath = MonsterActionTemplateFactory(
+            monster=monster.settings,
+            action_type=ActionType.SPECIAL,
+            attack_bonus=None,
+            damage_dice="2d6+8",
+            save_dc=30,
+            save_type=SaveType.DEXTERITY,
+            recharge=RechargeType.RECHARGE_6,
+        )
+        event = self.execute(game, monster, characters, actions=[breath])
+        assert event.attacks_count == 0
+        assert event.damage_dealt == 2 * 10
+        monster.refresh_from_db()
+        assert monster.spent_actions == {str(breath.pk): 1}
+        with pytest.raises(ActionNotAvailable):
+            self.execute(game, monster, characters, actions=[breath])
+
+    def test_targets_outside_the_game(self, party, monster):
+        game, characters = party
+        self.multiattack(monster, 2)
+        outsider = PlayerFactory().character
+        with pytest.raises(ValueError):
+            MonsterActionService.execute(
+                game, game.master, monster, [characters[0], outsider]
+            )
+        assert not MonsterActionsResolved.objects.exists()
+
+    def test_without_multiattack(self, party, monster):
+        game, characters = party
+        with pytest.raises(ActionNotAvailable):
+            MonsterActionService.execute(game, game.master, monster, characters)
+
+    def test_concentration_saves(self, party, monster):
+        game, characters = party
+        self.multiattack(monster, 2)
+        ConcentrationFactory(character=characters[0])
+        self.execute(game, monster, characters[:1])
+        assert (
+            ConcentrationSaveRequired.objects.filter(
+                character=characters[0], damage_taken=4
+            ).count()
+            == 2
+        )
+
+    @pytest.mark.parametrize("count", [2, 8])
+    def test_query_count(self, party, monster, count, django_assert_num_queries):
+        game, characters = party
+        self.multiattack(monster, count)
+        # Multiattack; in a savepoint: characters and their abilities,
+        # conditions and feats, bulk update, event and its parent row;
+        # concentrations, then their (empty) savepoint
+        with django_assert_num_queries(13):
+            self.execute(game, monster, characters)
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from equipment.constants.equipment import WeaponName
+from game.models.events import EncumbranceChanged
+
+from .factories import PlayerFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBroadcastEncumbranceChange:
+    @pytest.fixture
+    def character(self):
+        character = PlayerFactory().character
+        character.strength.score = 10
+        character.strength.save()
+        character.refresh_from_db()
+        return character
+
+    @staticmethod
+    def over_capacity(character) -> int:
+        """Number of mauls (10 lb each) exceeding the character's capacity."""
+        return character.carrying_capacity // 10 + 1
+
+    def add_mauls(self, character, quantity, django_capture_on_commit_callbacks):
+        with (
+            patch("game.signals.send_to_channel") as mock_send,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            character.inventory.add(WeaponName.MAUL, quantity)
+        return mock_send
+
+    def test_crossing_the_capacity(self, character, django_capture_on_commit_callbacks):
+        mock_send = self.add_mauls(
+            character, self.over_capacity(character), django_capture_on_commit_callbacks
+        )
+        event = EncumbranceChanged.objects.get()
+        assert event.character == character
+        assert event.encumbered
+        assert event.author.player == character.player
+        mock_send.assert_called_once_with(event)
+
+    def test_load_change_below_the_capacity(
+        self, character, django_capture_on_commit_callbacks
+    ):
+        mock_send = self.add_mauls(character, 1, django_capture_on_commit_callbacks)
+        assert not EncumbranceChanged.objects.exists()
+        mock_send.assert_not_called()
+
+    def test_load_change_above_the_capacity(
+        self, character, django_capture_on_commit_callbacks
+    ):
+        self.add_mauls(
+            character, self.over_capacity(character), django_capture_on_commit_callbacks
+        )
+        mock_send = self.add_mauls(character, 1, django_capture_on_commit_callbacks)
+        assert EncumbranceChanged.objects.count() == 1
+        mock_send.assert_not_called()
+
+    def test_character_without_game(
+        self, character, django_capture_on_commit_callbacks
+    ):
+        character.player.delete()
+        self.add_mauls(
+            character, self.over_capacity(character), django_capture_on_commit_callbacks
+        )
+        character.refresh_from_db()
+        assert character.encumbered
+        assert not EncumbranceChanged.objects.exists()
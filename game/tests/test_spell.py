@@ -29,6 +29,8 @@ from character.tests.factories import (
     SpellSettingsFactory,
 )
 
+from game.concentration import check_concentration
+from game.models.events import ConcentrationSaveRequired
 from game.spell import (
     SpellBuffResult,
     SpellCastResult,
@@ -53,6 +55,8 @@ from game.spell import (
     resolve_spell_healing,
 )
 
+from .factories import GameFactory
+
 pytestmark = pytest.mark.django_db
 
 
@@ -162,6 +166,8 @@ class TestGetSpellSaveDC:
         int_ability.score = 18
         int_ability.modifier = 4
         int_ability.save()
+        # Reload the spell save DC, refreshed by the ability change.
+        character.refresh_from_db()
 
         return character
 
@@ -274,6 +280,34 @@ class TestResolveSavingThrow:
                 modifier=2, advantage=False, disadvantage=True
             )
 
+    def test_condition_imposes_disadvantage(self, character):
+        """Test that a Restrained target has disadvantage on Dexterity saves."""
+        CharacterCondition.objects.create(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.RESTRAINED),
+        )
+        with patch("game.spell.roll_d20_test") as mock_roll:
+            mock_roll.return_value = (8, False, True)
+
+            resolve_saving_throw(character, SpellSaveType.DEXTERITY, dc=15)
+
+            mock_roll.assert_called_once_with(
+                modifier=2, advantage=False, disadvantage=True
+            )
+
+    def test_condition_auto_fails(self, character):
+        """Test that a Paralyzed target automatically fails Dexterity saves."""
+        CharacterCondition.objects.create(
+            character=character,
+            condition=ConditionFactory(name=ConditionName.PARALYZED),
+        )
+        with patch("game.spell.roll_d20_test") as mock_roll:
+            mock_roll.return_value = (20, False, False)
+
+            result = resolve_saving_throw(character, SpellSaveType.DEXTERITY, dc=15)
+
+            assert result.success is False
+
 
 class TestCalculateSpellDice:
     """Tests for spell dice calculation with upcasting."""
@@ -329,7 +363,7 @@ class TestResolveSpellDamage:
             base_dice="8d6",
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_roll:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_roll:
             mock_roll.return_value = (28, [4, 3, 5, 2, 6, 3, 4, 1])
 
             result = resolve_spell_damage(template, slot_level=3)
@@ -357,7 +391,7 @@ class TestResolveSpellDamage:
             success=True,
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_roll:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_roll:
             mock_roll.return_value = (28, [4, 3, 5, 2, 6, 3, 4, 1])
 
             result = resolve_spell_damage(
@@ -384,7 +418,7 @@ class TestResolveSpellDamage:
             success=False,
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_roll:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_roll:
             mock_roll.return_value = (28, [4, 3, 5, 2, 6, 3, 4, 1])
 
             result = resolve_spell_damage(
@@ -427,7 +461,7 @@ class TestResolveSpellHealing:
             base_dice="1d8",
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_roll:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_roll:
             mock_roll.return_value = (5, [5])
 
             result = resolve_spell_healing(template, slot_level=1, caster=cleric)
@@ -548,6 +582,8 @@ class TestResolveSpell:
         int_ability.score = 16
         int_ability.modifier = 3
         int_ability.save()
+        # Reload the spell save DC, refreshed by the ability change.
+        character.refresh_from_db()
 
         return character
 
@@ -575,7 +611,7 @@ class TestResolveSpell:
         with patch("game.spell.roll_d20_test") as mock_save:
             mock_save.return_value = (12, False, False)  # Failed save
 
-            with patch("game.spell.DiceString.roll_keeping_individual") as mock_damage:
+            with patch("utils.dice.DiceString.roll_keeping_individual") as mock_damage:
                 mock_damage.return_value = (28, [4, 3, 5, 2, 6, 3, 4, 1])
 
                 result = resolve_spell(caster, spell, [target], slot_level=3)
@@ -594,7 +630,7 @@ class TestResolveSpell:
             base_dice="1d8",
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_heal:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_heal:
             mock_heal.return_value = (5, [5])
 
             result = resolve_spell(caster, spell, [target], slot_level=1)
@@ -634,7 +670,7 @@ class TestResolveSpell:
         with patch("game.spell.roll_d20_test") as mock_save:
             mock_save.return_value = (10, False, False)
 
-            with patch("game.spell.DiceString.roll_keeping_individual") as mock_damage:
+            with patch("utils.dice.DiceString.roll_keeping_individual") as mock_damage:
                 mock_damage.return_value = (24, [4, 4, 4, 4, 4, 4])
 
                 result = resolve_spell(
@@ -672,7 +708,7 @@ class TestResolveSpell:
         with patch("game.spell.roll_d20_test") as mock_save:
             mock_save.return_value = (8, False, False)  # Failed save
 
-            with patch("game.spell.DiceString.roll_keeping_individual") as mock_damage:
+            with patch("utils.dice.DiceString.roll_keeping_individual") as mock_damage:
                 mock_damage.return_value = (7, [3, 4])
 
                 result = resolve_spell(caster, spell, [target], slot_level=2)
@@ -715,7 +751,7 @@ class TestResolveSpell:
             save_type=SpellSaveType.NONE,
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_heal:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_heal:
             mock_heal.return_value = (6, [6])
 
             result = resolve_spell(caster, spell, [target], slot_level=1)
@@ -778,7 +814,7 @@ class TestResolveSpell:
             base_dice="1d10",
         )
 
-        with patch("game.spell.DiceString.roll_keeping_individual") as mock_damage:
+        with patch("utils.dice.DiceString.roll_keeping_individual") as mock_damage:
             mock_damage.return_value = (7, [7])
 
             result = resolve_spell(caster, spell, [target], slot_level=1)
@@ -957,6 +993,10 @@ class TestApplySpellResult:
 
         return character
 
+    @pytest.fixture
+    def game(self):
+        return GameFactory()
+
     @pytest.fixture
     def target(self):
         """Create a target character."""
@@ -966,7 +1006,7 @@ class TestApplySpellResult:
         character.save()
         return character
 
-    def test_apply_spell_result_applies_damage(self, caster, target):
+    def test_apply_spell_result_applies_damage(self, game, caster, target):
         """Test that apply_spell_result applies damage effects."""
         spell = SpellSettingsFactory(concentration=True)
         damage_result = SpellDamageResult(
@@ -985,7 +1025,7 @@ class TestApplySpellResult:
             concentration_started=True,
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         target.refresh_from_db()
         assert target.hp == 15  # 30 - 15
@@ -993,7 +1033,24 @@ class TestApplySpellResult:
         # Check concentration started
         assert Concentration.objects.filter(character=caster, spell=spell).exists()
 
-    def test_apply_spell_result_applies_healing(self, caster):
+    def test_damage_ledger(self, caster, target):
+        """Test the damage ledger lists non-zero damage per target."""
+        other = CharacterFactory()
+        result = SpellCastResult(
+            spell=SpellSettingsFactory(),
+            caster=caster,
+            targets=[target, other],
+            slot_level=3,
+            success=True,
+            damage_results=[
+                (target, SpellDamageResult(12, [6, 6], SpellDamageType.FIRE)),
+                (other, SpellDamageResult(0, [], SpellDamageType.FIRE)),
+            ],
+        )
+
+        assert result.damage_ledger == [(target, 12)]
+
+    def test_apply_spell_result_applies_healing(self, game, caster):
         """Test that apply_spell_result applies healing effects."""
         target = CharacterFactory()
         target.hp = 10
@@ -1015,12 +1072,12 @@ class TestApplySpellResult:
             healing_results=[(target, healing_result)],
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         target.refresh_from_db()
         assert target.hp == 22  # 10 + 12
 
-    def test_apply_spell_result_applies_condition(self, caster, target):
+    def test_apply_spell_result_applies_condition(self, game, caster, target):
         """Test that apply_spell_result applies condition effects."""
         spell = SpellSettingsFactory()
         condition = ConditionFactory(name=ConditionName.STUNNED)
@@ -1039,13 +1096,13 @@ class TestApplySpellResult:
             condition_results=[(target, condition_result)],
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         assert CharacterCondition.objects.filter(
             character=target, condition=condition
         ).exists()
 
-    def test_apply_spell_result_applies_buff(self, caster, target):
+    def test_apply_spell_result_applies_buff(self, game, caster, target):
         """Test that apply_spell_result applies buff effects."""
         from magic.models import ActiveSpellEffect
 
@@ -1075,13 +1132,13 @@ class TestApplySpellResult:
             buff_results=[(target, buff_result)],
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         assert ActiveSpellEffect.objects.filter(
             character=target, template=template, caster=caster
         ).exists()
 
-    def test_apply_spell_result_multiple_targets(self, caster):
+    def test_apply_spell_result_multiple_targets(self, game, caster):
         """Test that apply_spell_result applies effects to multiple targets."""
         target1 = CharacterFactory()
         target1.hp = 20
@@ -1110,14 +1167,14 @@ class TestApplySpellResult:
             damage_results=[(target1, damage_result1), (target2, damage_result2)],
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         target1.refresh_from_db()
         target2.refresh_from_db()
         assert target1.hp == 10  # 20 - 10
         assert target2.hp == 15  # 25 - 10
 
-    def test_apply_spell_result_without_concentration(self, caster, target):
+    def test_apply_spell_result_without_concentration(self, game, caster, target):
         """Test that apply_spell_result doesn't start concentration when not needed."""
         spell = SpellSettingsFactory(concentration=False)
         damage_result = SpellDamageResult(
@@ -1134,6 +1191,36 @@ class TestApplySpellResult:
             concentration_started=False,
         )
 
-        apply_spell_result(result)
+        apply_spell_result(result, game, game.master)
 
         assert not Concentration.objects.filter(character=caster, spell=spell).exists()
+
+    def test_apply_spell_result_checks_concentration_once(self, game, caster):
+        """Test that the damage of every target is checked in one pass."""
+        bless = SpellSettingsFactory(name="Bless", concentration=True)
+        targets = [CharacterFactory(), CharacterFactory()]
+        for target in targets:
+            Concentration.start_concentration(target, bless)
+        result = SpellCastResult(
+            spell=SpellSettingsFactory(),
+            caster=caster,
+            targets=targets,
+            slot_level=3,
+            success=True,
+            damage_results=[
+                (target, SpellDamageResult(24, [6] * 4, SpellDamageType.FIRE))
+                for target in targets
+            ],
+        )
+
+        with patch(
+            "game.spell.check_concentration", wraps=check_concentration
+        ) as mock_check:
+            checks = apply_spell_result(result, game, game.master)
+
+        mock_check.assert_called_once_with(
+            game, game.master, [(target, 24) for target in targets]
+        )
+        assert [check.character for check in checks] == targets
+        assert [check.dc for check in checks] == [12, 12]
+        assert ConcentrationSaveRequired.objects.filter(game=game).count() == 2
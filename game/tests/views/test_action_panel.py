@@ -265,8 +265,8 @@ class TestActionPanelView:
         response = client.get(panel_url)
 
         content = response.content.decode()
-        # Should show reduced movement (30 - 15 = 15)
-        assert "15" in content
+        speed = setup["player1"].character.speed
+        assert f"{speed - 15}/{speed} ft" in content
 
 
 class TestTakeActionViewHTMX:
@@ -438,8 +438,8 @@ class TestMoveViewHTMX:
         )
 
         content = response.content.decode()
-        # Should show 15 remaining (30 - 15)
-        assert "15" in content
+        speed = setup["player"].character.speed
+        assert f"{speed - 15}/{speed} ft" in content
 
     def test_non_htmx_request_returns_json(self, client, active_combat_setup):
         """Test non-HTMX request still returns JSON."""
@@ -330,8 +330,8 @@ class TestConcentrationSaveRollView:
         assert response.status_code == 404
 
 
-class TestCheckConcentrationOnDamage:
-    """Tests for the check_concentration_on_damage utility function."""
+class TestConcentrationOnDamage:
+    """Tests for the concentration checks of the damage applied by attacks."""
 
     @pytest.fixture
     def combat_with_concentration(self):
@@ -17,7 +17,7 @@ from character.constants.abilities import AbilityName
 from character.models.character import Character
 from character.tests.factories import CharacterFactory
 from game.constants.combat import FighterAttributeChoices
-from game.constants.events import DifficultyClass, RollType
+from game.constants.events import DifficultyClass, RestType, RollType
 from game.exceptions import UserHasNoCharacter
 from game.flows import GameFlow
 from game.forms import CombatCreateForm, QuestCreateForm
@@ -28,6 +28,7 @@ from game.constants.combat import CombatState
 from game.models.events import (
     CombatEnded,
     CombatInitialization,
+    RestCompleted,
     RoundEnded,
     TurnEnded,
     TurnStarted,
@@ -39,6 +40,7 @@ from game.views.master import (
     CombatEndView,
     GameStartView,
     QuestCreateView,
+    RestView,
     UserInviteConfirmView,
     UserInviteView,
 )
@@ -665,3 +667,51 @@ class TestCombatEndView:
         assert response.status_code == 302
         # No new CombatEnded event should be created
         assert CombatEnded.objects.filter(combat=active_combat).count() == 0
+
+
+class TestRestView:
+    path_name = "game-rest"
+
+    @pytest.fixture
+    def logged_in_master(self, client, started_game):
+        client.force_login(started_game.master.user)
+        return client
+
+    def test_view_mapping(self, logged_in_master, started_game):
+        response = logged_in_master.post(
+            reverse(self.path_name, args=(started_game.id,)),
+            data={"rest_type": RestType.SHORT},
+        )
+        assert response.status_code == 302
+        assert response.resolver_match.func.view_class == RestView
+
+    def test_long_rest(self, logged_in_master, started_game):
+        character = Player.objects.filter(game=started_game).first().character
+        character.hp = 1
+        character.save()
+        response = logged_in_master.post(
+            reverse(self.path_name, args=(started_game.id,)),
+            data={"rest_type": RestType.LONG},
+        )
+        assertRedirects(response, started_game.get_absolute_url())
+        character.refresh_from_db()
+        assert character.hp == character.max_hp
+        rest_completed = RestCompleted.objects.get(game=started_game)
+        assert rest_completed.rest_type == RestType.LONG
+
+    def test_invalid_rest_type(self, logged_in_master, started_game):
+        response = logged_in_master.post(
+            reverse(self.path_name, args=(started_game.id,)),
+            data={"rest_type": "X"},
+        )
+        assert response.status_code == 400
+        assert not RestCompleted.objects.exists()
+
+    def test_player_forbidden(self, client, started_game):
+        player = Player.objects.filter(game=started_game).first()
+        client.force_login(player.user)
+        response = client.post(
+            reverse(self.path_name, args=(started_game.id,)),
+            data={"rest_type": RestType.LONG},
+        )
+        assert response.status_code == 403
@@ -497,8 +497,9 @@ class TestMoveView:
             args=(setup["game"].id, setup["combat"].id),
         )
 
-        # Use most of movement
-        client.post(url, {"feet": 25})
+        # Use most of movement (speed derives from the species)
+        speed = setup["fighter"].character.speed
+        client.post(url, {"feet": speed - 5})
 
         # Try to move more than remaining
         response = client.post(url, {"feet": 20})
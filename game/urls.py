@@ -71,6 +71,11 @@ urlpatterns = [
         master.CombatEndView.as_view(),
         name="combat-end",
     ),
+    path(
+        "<int:game_id>/rest",
+        master.RestView.as_view(),
+        name="game-rest",
+    ),
     path(
         "<int:game_id>/combat/<int:combat_id>/action",
         player.TakeActionView.as_view(),
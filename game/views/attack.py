@@ -4,7 +4,6 @@ from django.template.loader import render_to_string
 from django.views import View
 
 from equipment.models.equipment import Weapon
-from magic.models.spells import Concentration
 
 from ..attack import (
     apply_damage,
@@ -12,13 +11,14 @@ from ..attack import (
     is_proficient_with_weapon,
     resolve_attack,
 )
+from ..concentration import check_concentration
 from ..constants.combat import CombatAction, CombatState
 from ..models.combat import Combat, Fighter, Turn
 from ..models.events import ActionTaken
 from ..models.game import Actor
 from ..utils.channels import send_to_channel
 from .action_panel import ActionPanelMixin
-from .concentration import check_concentration_on_damage
+from .concentration import concentration_save_info
 from .mixins import GameContextMixin
 
 
@@ -56,9 +56,7 @@ class AttackModalMixin:
         weapon_data = []
         for weapon in weapons:
             ability_name = get_attack_ability(weapon, character)
-            ability = character.abilities.filter(
-                ability_type__name=ability_name
-            ).first()
+            ability = character.stats.get(ability_name)
             ability_modifier = ability.modifier if ability else 0
             proficiency = (
                 character.proficiency_bonus
@@ -263,9 +261,15 @@ class ApplyDamageView(
         except Fighter.DoesNotExist:
             return HttpResponse("Invalid target", status=400)
 
+        author = Actor.objects.get(
+            player__game=self.game, player__user=self.request.user
+        )
+
         # Apply damage to target character using the service module
         target_character = target.character
         apply_damage(target_character, damage)
+        # One entry per damaged character, checked for concentration in one pass
+        damage_ledger = [(target_character, damage)]
 
         # Use the action
         turn = Turn.objects.filter(
@@ -278,9 +282,6 @@ class ApplyDamageView(
             turn_action = turn.use_action(CombatAction.ATTACK, target)
 
             # Create and broadcast event
-            author = Actor.objects.get(
-                player__game=self.game, player__user=self.request.user
-            )
             action_event = ActionTaken.objects.create(
                 game=self.game,
                 author=author,
@@ -290,18 +291,9 @@ class ApplyDamageView(
             )
             send_to_channel(action_event)
 
-        # Check if target has concentration and needs to make a save
-        concentration_info = None
-        try:
-            if target_character.concentration:
-                concentration_info = check_concentration_on_damage(
-                    game=self.game,
-                    character=target_character,
-                    damage=damage,
-                    author=author,
-                )
-        except Concentration.DoesNotExist:
-            pass
+        # Concentration saves required by the damage
+        checks = check_concentration(self.game, author, damage_ledger)
+        concentration_info = concentration_save_info(checks[0]) if checks else None
 
         # Build confirmation context
         context = self.get_attack_context(combat, request.user, fighter)
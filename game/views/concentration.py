@@ -7,11 +7,8 @@ from django.views import View
 
 from magic.models.spells import Concentration
 
-from ..models.events import (
-    ConcentrationBroken,
-    ConcentrationSaveRequired,
-    ConcentrationSaveResult,
-)
+from ..concentration import ConcentrationCheck, concentration_save_dc
+from ..models.events import ConcentrationBroken, ConcentrationSaveResult
 from ..models.game import Actor
 from ..utils.channels import send_to_channel
 from .mixins import GameContextMixin
@@ -42,8 +39,7 @@ class ConcentrationSaveModalView(UserPassesTestMixin, GameContextMixin, View):
         except Concentration.DoesNotExist:
             return HttpResponse("No active concentration", status=400)
 
-        # Calculate DC: max(10, damage // 2)
-        dc = max(10, damage // 2)
+        dc = concentration_save_dc(damage)
 
         # Get Constitution modifier
         try:
@@ -158,34 +154,11 @@ class ConcentrationSaveRollView(UserPassesTestMixin, GameContextMixin, View):
         return response
 
 
-def check_concentration_on_damage(game, character, damage, author):
-    """
-    Check if a character needs to make a concentration save after taking damage.
-
-    Returns a dict with concentration info if save is required, None otherwise.
-    """
-    try:
-        concentration = character.concentration
-    except Concentration.DoesNotExist:
-        return None
-
-    # Calculate DC
-    dc = max(10, damage // 2)
-
-    # Create the event
-    event = ConcentrationSaveRequired.objects.create(
-        game=game,
-        author=author,
-        character=character,
-        spell=concentration.spell,
-        damage_taken=damage,
-        dc=dc,
-    )
-    send_to_channel(event)
-
+def concentration_save_info(check: ConcentrationCheck) -> dict:
+    """Return what the attack modal shows of a required concentration save."""
     return {
-        "character_id": character.pk,
-        "spell_name": concentration.spell.name,
-        "damage": damage,
-        "dc": dc,
+        "character_id": check.character.pk,
+        "spell_name": check.spell.name,
+        "damage": check.damage,
+        "dc": check.dc,
     }
@@ -1,6 +1,6 @@
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.core.mail import send_mail
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseBadRequest, HttpResponseRedirect
 from django.urls import reverse, reverse_lazy
 from django.views.generic import FormView, ListView, UpdateView
 from viewflow.fsm import TransitionNotAllowed
@@ -10,7 +10,7 @@ from character.models.character import Character
 from user.models import User
 
 from ..constants.combat import CombatState, FighterAttributeChoices
-from ..constants.events import RollStatus, RollType
+from ..constants.events import RestType, RollStatus, RollType
 from ..exceptions import UserHasNoCharacter
 from ..flows import GameFlow
 from ..forms import AbilityCheckRequestForm, CombatCreateForm, QuestCreateForm
@@ -27,6 +27,7 @@ from ..models.events import (
     UserInvitation,
 )
 from ..models.game import Actor, Player, Quest
+from ..services import RestService
 from ..utils.channels import send_to_channel
 from ..utils.emails import get_players_emails
 from ..views.mixins import EventContextMixin, GameContextMixin, GameStatusControlMixin
@@ -312,3 +313,23 @@ class CombatEndView(UserPassesTestMixin, GameContextMixin):
         send_to_channel(combat_ended)
 
         return HttpResponseRedirect(reverse("game", args=(self.game.id,)))
+
+
+class RestView(UserPassesTestMixin, GameContextMixin):
+    """View for the master to make the whole party take a short or long rest."""
+
+    def test_func(self):
+        return self.is_user_master()
+
+    def post(self, request, *args, **kwargs):
+        try:
+            rest_type = RestType(request.POST.get("rest_type"))
+        except ValueError:
+            return HttpResponseBadRequest("Invalid rest type")
+
+        author = Actor.objects.get(
+            master__game=self.game, master__user=self.request.user
+        )
+        RestService.take_rest(self.game, author, rest_type)
+
+        return HttpResponseRedirect(reverse("game", args=(self.game.id,)))
@@ -1,5 +1,7 @@
 from django.db.models import IntegerChoices, TextChoices
 
+from character.constants.classes import ClassName
+
 
 class SpellSchool(TextChoices):
     """D&D 5e schools of magic."""
@@ -96,6 +98,76 @@ class CasterType(TextChoices):
     PACT = "pact", "Pact"  # Warlock Pact Magic
 
 
+class CasterProgression(TextChoices):
+    """How fast a class gains spell slots (SRD Multiclassing rules)."""
+
+    FULL = "full", "Full"  # Bard, Cleric, Druid, Sorcerer, Wizard
+    HALF = "half", "Half"  # Paladin, Ranger (levels rounded up)
+    PACT = "pact", "Pact"  # Warlock Pact Magic, never combined
+
+
+# Spell slot progression per class, per D&D 2024 SRD
+CLASS_CASTER_PROGRESSION: dict[str, CasterProgression] = {
+    ClassName.BARD: CasterProgression.FULL,
+    ClassName.CLERIC: CasterProgression.FULL,
+    ClassName.DRUID: CasterProgression.FULL,
+    ClassName.SORCERER: CasterProgression.FULL,
+    ClassName.WIZARD: CasterProgression.FULL,
+    ClassName.PALADIN: CasterProgression.HALF,
+    ClassName.RANGER: CasterProgression.HALF,
+    ClassName.WARLOCK: CasterProgression.PACT,
+}
+
+# Multiclass Spellcaster table: slots per slot level (1-9), by caster level (1-20).
+# Full casters use it directly for their class level.
+MULTICLASS_SPELL_SLOTS: tuple[tuple[int, ...], ...] = (
+    (2, 0, 0, 0, 0, 0, 0, 0, 0),
+    (3, 0, 0, 0, 0, 0, 0, 0, 0),
+    (4, 2, 0, 0, 0, 0, 0, 0, 0),
+    (4, 3, 0, 0, 0, 0, 0, 0, 0),
+    (4, 3, 2, 0, 0, 0, 0, 0, 0),
+    (4, 3, 3, 0, 0, 0, 0, 0, 0),
+    (4, 3, 3, 1, 0, 0, 0, 0, 0),
+    (4, 3, 3, 2, 0, 0, 0, 0, 0),
+    (4, 3, 3, 3, 1, 0, 0, 0, 0),
+    (4, 3, 3, 3, 2, 0, 0, 0, 0),
+    (4, 3, 3, 3, 2, 1, 0, 0, 0),
+    (4, 3, 3, 3, 2, 1, 0, 0, 0),
+    (4, 3, 3, 3, 2, 1, 1, 0, 0),
+    (4, 3, 3, 3, 2, 1, 1, 0, 0),
+    (4, 3, 3, 3, 2, 1, 1, 1, 0),
+    (4, 3, 3, 3, 2, 1, 1, 1, 0),
+    (4, 3, 3, 3, 2, 1, 1, 1, 1),
+    (4, 3, 3, 3, 3, 1, 1, 1, 1),
+    (4, 3, 3, 3, 3, 2, 1, 1, 1),
+    (4, 3, 3, 3, 3, 2, 2, 1, 1),
+)
+
+# Warlock Pact Magic: (number of slots, slot level), by warlock level (1-20).
+PACT_MAGIC_SLOTS: tuple[tuple[int, int], ...] = (
+    (1, 1),
+    (2, 1),
+    (2, 2),
+    (2, 2),
+    (2, 3),
+    (2, 3),
+    (2, 4),
+    (2, 4),
+    (2, 5),
+    (2, 5),
+    (3, 5),
+    (3, 5),
+    (3, 5),
+    (3, 5),
+    (3, 5),
+    (3, 5),
+    (4, 5),
+    (4, 5),
+    (4, 5),
+    (4, 5),
+)
+
+
 class SpellcastingAbility(TextChoices):
     """Spellcasting ability by class."""
 
@@ -6,16 +6,48 @@ This module defines:
 - SummonedCreature: Tracks creatures summoned by spells
 """
 
+from functools import cache
+
 from django.db import models
 
 from magic.constants.spells import (
     EffectDurationType,
     SpellDamageType,
     SpellEffectType,
+    SpellLevel,
     SpellSaveEffect,
     SpellSaveType,
     SpellTargetType,
 )
+from utils.dice import DiceString, compile_dice
+
+
+@cache
+def compile_scaled_dice(
+    base_dice: str, dice_per_level: str, spell_level: int
+) -> tuple[DiceString | None, ...]:
+    """Compile the dice of an effect for every slot level, once per process.
+
+    The result only depends on the template's dice strings and its spell level,
+    so it is shared by every template with the same values. The returned
+    DiceString objects are shared and must not be mutated.
+
+    Returns:
+        A tuple indexed by slot level (0 to 9); entries are None when the
+        effect has no dice.
+    """
+    if not base_dice:
+        return (None,) * (SpellLevel.NINTH + 1)
+    extra_throws = compile_dice(dice_per_level).nb_throws if dice_per_level else 0
+    base = compile_dice(base_dice)
+    table = []
+    for slot_level in range(SpellLevel.NINTH + 1):
+        dice = DiceString(str(base))
+        extra_levels = slot_level - spell_level
+        if extra_throws and extra_levels > 0:
+            dice.add_throws(extra_throws * extra_levels)
+        table.append(dice)
+    return tuple(table)
 
 
 class SpellEffectTemplate(models.Model):
@@ -124,6 +156,17 @@ class SpellEffectTemplate(models.Model):
     def __str__(self) -> str:
         return f"{self.spell.name}: {self.get_effect_type_display()}"
 
+    @property
+    def scaled_dice(self) -> tuple[DiceString | None, ...]:
+        """Compiled dice of this effect indexed by slot level."""
+        return compile_scaled_dice(
+            self.base_dice, self.dice_per_level, self.spell.level
+        )
+
+    def dice_for_slot_level(self, slot_level: int) -> DiceString | None:
+        """Return the compiled dice of this effect when cast at a slot level."""
+        return self.scaled_dice[min(max(slot_level, 0), SpellLevel.NINTH)]
+
 
 class ActiveSpellEffect(models.Model):
     """Tracks ongoing spell effects on characters.
@@ -224,13 +267,30 @@ class SummonedCreature(models.Model):
         return f"{self.name} (summoned by {self.summoner.name})"
 
     def take_damage(self, damage: int) -> int:
-        """Apply damage to the summoned creature. Returns remaining HP."""
+        """Apply damage to the summoned creature. Returns remaining HP.
+
+        In a combat with an open roster, the damage goes to the creature's
+        combatant, written back when the round ends (see game.combatants).
+        """
+        # The combatants depend on the summoned creature model.
+        from game.combatants import combatant_of
+
+        with combatant_of(self) as combatant:
+            if combatant is not None:
+                combatant.take_damage(damage)
+                return combatant.hp
         self.hp_current = max(0, self.hp_current - damage)
         self.save()
         return self.hp_current
 
     def heal(self, amount: int) -> int:
         """Heal the summoned creature. Returns new HP."""
+        from game.combatants import combatant_of
+
+        with combatant_of(self) as combatant:
+            if combatant is not None:
+                combatant.heal(amount)
+                return combatant.hp
         self.hp_current = min(self.hp_max, self.hp_current + amount)
         self.save()
         return self.hp_current
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models.spells import SpellSlotTable
+from .spell_slots import reload_spell_slot_matrix
+
+
+@receiver(post_save, sender=SpellSlotTable)
+@receiver(post_delete, sender=SpellSlotTable)
+def reload_spell_slots(sender, **kwargs) -> None:
+    """Keep the in-memory spell slot matrix in sync with SpellSlotTable.
+
+    Also covers ``loaddata``, which sends post_save for every fixture row.
+    """
+    reload_spell_slot_matrix()
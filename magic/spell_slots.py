@@ -0,0 +1,166 @@
+"""In-memory spell slot progression.
+
+Spell slot progression is reference data: it only depends on a character's
+classes and class levels. Instead of querying SpellSlotTable for every
+(class, class level, slot level), the SRD progression is compiled once per
+process into an immutable matrix. Rows stored in SpellSlotTable override the
+SRD defaults, and the matrix is reloaded whenever that table changes (see
+magic.signals).
+"""
+
+from collections.abc import Mapping, Sequence
+from functools import cache
+from types import MappingProxyType
+
+from magic.constants.spells import (
+    CLASS_CASTER_PROGRESSION,
+    MULTICLASS_SPELL_SLOTS,
+    PACT_MAGIC_SLOTS,
+    CasterProgression,
+)
+from magic.models.spells import CharacterSpellSlot, SpellSlotTable
+
+MAX_CLASS_LEVEL = 20
+MAX_SLOT_LEVEL = 9
+NO_SLOTS: tuple[int, ...] = (0,) * MAX_SLOT_LEVEL
+
+
+def _half_caster_level(class_level: int) -> int:
+    """Half casters count half their levels, rounded up."""
+    return (class_level + 1) // 2
+
+
+class SpellSlotMatrix:
+    """Immutable class × class level × slot level table of spell slots.
+
+    Slot tuples are indexed by slot level minus one (index 0 is 1st level).
+    """
+
+    __slots__ = ("_class_slots",)
+
+    def __init__(self, class_slots: Mapping[tuple[str, int], tuple[int, ...]]):
+        self._class_slots = MappingProxyType(dict(class_slots))
+
+    def class_slots(self, class_name: str, class_level: int) -> tuple[int, ...]:
+        """Return the slots granted by a single class at a given level."""
+        return self._class_slots.get((class_name, class_level), NO_SLOTS)
+
+    def has_slots(self, class_name: str, class_level: int) -> bool:
+        return any(self.class_slots(class_name, class_level))
+
+    @staticmethod
+    def caster_level(class_levels: Mapping[str, int]) -> int:
+        """Combined spellcaster level used by the Multiclass Spellcaster table."""
+        level = 0
+        for class_name, class_level in class_levels.items():
+            progression = CLASS_CASTER_PROGRESSION.get(class_name)
+            if progression == CasterProgression.FULL:
+                level += class_level
+            elif progression == CasterProgression.HALF:
+                level += _half_caster_level(class_level)
+        return level
+
+    def slots(self, class_levels: Mapping[str, int]) -> tuple[int, ...]:
+        """Return the spell slots of a character given its level in each class.
+
+        A character with a single spellcasting class uses that class's table.
+        Several spellcasting classes are combined through the Multiclass
+        Spellcaster table. Pact Magic is tracked separately and never combined.
+        """
+        casting_classes = {
+            class_name: class_level
+            for class_name, class_level in class_levels.items()
+            if self.has_slots(class_name, class_level)
+        }
+        if not casting_classes:
+            return NO_SLOTS
+        if len(casting_classes) == 1:
+            ((class_name, class_level),) = casting_classes.items()
+            return self.class_slots(class_name, class_level)
+        caster_level = min(self.caster_level(casting_classes), MAX_CLASS_LEVEL)
+        if caster_level < 1:
+            return NO_SLOTS
+        return MULTICLASS_SPELL_SLOTS[caster_level - 1]
+
+    @staticmethod
+    def pact_magic(class_level: int) -> tuple[int, int]:
+        """Return (number of slots, slot level) of Pact Magic for a warlock level."""
+        if class_level < 1:
+            return 0, 0
+        return PACT_MAGIC_SLOTS[min(class_level, MAX_CLASS_LEVEL) - 1]
+
+
+def _build_srd_slots() -> dict[tuple[str, int], tuple[int, ...]]:
+    class_slots = {}
+    for class_name, progression in CLASS_CASTER_PROGRESSION.items():
+        for class_level in range(1, MAX_CLASS_LEVEL + 1):
+            if progression == CasterProgression.FULL:
+                caster_level = class_level
+            elif progression == CasterProgression.HALF:
+                caster_level = _half_caster_level(class_level)
+            else:
+                continue
+            class_slots[(class_name, class_level)] = MULTICLASS_SPELL_SLOTS[
+                caster_level - 1
+            ]
+    return class_slots
+
+
+@cache
+def get_spell_slot_matrix() -> SpellSlotMatrix:
+    """Return the process-wide spell slot matrix, building it on first use."""
+    class_slots = _build_srd_slots()
+    overrides: dict[tuple[str, int], list[int]] = {}
+    rows = SpellSlotTable.objects.values_list(
+        "class_name", "class_level", "slot_level", "slots"
+    )
+    for class_name, class_level, slot_level, slots in rows:
+        key = (class_name, class_level)
+        if key not in overrides:
+            overrides[key] = list(class_slots.get(key, NO_SLOTS))
+        overrides[key][slot_level - 1] = slots
+    class_slots.update({key: tuple(row) for key, row in overrides.items()})
+    return SpellSlotMatrix(class_slots)
+
+
+def reload_spell_slot_matrix() -> None:
+    """Drop the cached matrix so the next lookup reads SpellSlotTable again."""
+    get_spell_slot_matrix.cache_clear()
+
+
+def assign_spell_slots(character, slots: Sequence[int]) -> None:
+    """Persist slot totals on a character with one bulk create and one bulk update.
+
+    Args:
+        character: The character whose slots are assigned.
+        slots: Slot totals indexed by slot level minus one.
+    """
+    existing = {slot.slot_level: slot for slot in character.spell_slots.all()}
+    to_create = []
+    to_update = []
+    for slot_level, total in enumerate(slots, start=1):
+        slot = existing.get(slot_level)
+        if slot is None:
+            if total > 0:
+                to_create.append(
+                    CharacterSpellSlot(
+                        character=character, slot_level=slot_level, total=total
+                    )
+                )
+        elif slot.total != total:
+            slot.total = total
+            slot.used = min(slot.used, total)
+            to_update.append(slot)
+    if to_create:
+        CharacterSpellSlot.objects.bulk_create(to_create)
+    if to_update:
+        CharacterSpellSlot.objects.bulk_update(to_update, ["total", "used"])
+
+
+def sync_spell_slots(character) -> None:
+    """Set a character's spell slots from its current class levels.
+
+    Used at character creation and after a class level changes.
+    """
+    class_levels = dict(character.character_classes.values_list("klass_id", "level"))
+    assign_spell_slots(character, get_spell_slot_matrix().slots(class_levels))
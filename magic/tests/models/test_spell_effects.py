@@ -4,6 +4,7 @@ from magic.constants.spells import (
     EffectDurationType,
     SpellDamageType,
     SpellEffectType,
+    SpellLevel,
     SpellSaveEffect,
     SpellSaveType,
     SpellTargetType,
@@ -12,6 +13,7 @@ from magic.models.spell_effects import (
     ActiveSpellEffect,
     SpellEffectTemplate,
     SummonedCreature,
+    compile_scaled_dice,
 )
 
 from character.tests.factories import CharacterFactory, ConditionFactory
@@ -165,6 +167,66 @@ class TestSpellEffectTemplateModel:
         assert not SpellEffectTemplate.objects.filter(spell__name=spell_name).exists()
 
 
+class TestCompileScaledDice:
+    def test_scales_above_spell_level(self):
+        table = compile_scaled_dice("8d6", "1d6", SpellLevel.THIRD)
+        assert [str(dice) for dice in table[3:]] == [
+            "8d6",
+            "9d6",
+            "10d6",
+            "11d6",
+            "12d6",
+            "13d6",
+            "14d6",
+        ]
+
+    def test_no_scaling_below_spell_level(self):
+        table = compile_scaled_dice("8d6", "1d6", SpellLevel.THIRD)
+        assert str(table[1]) == "8d6"
+
+    def test_several_dice_per_level(self):
+        table = compile_scaled_dice("3d8", "2d8", SpellLevel.FIRST)
+        assert str(table[2]) == "5d8"
+
+    def test_no_dice_per_level(self):
+        table = compile_scaled_dice("1d10", "", SpellLevel.CANTRIP)
+        assert {str(dice) for dice in table} == {"1d10"}
+
+    def test_no_base_dice(self):
+        assert compile_scaled_dice("", "", SpellLevel.FIRST) == (None,) * 10
+
+    def test_is_cached(self):
+        assert compile_scaled_dice("8d6", "1d6", 3) is compile_scaled_dice(
+            "8d6", "1d6", 3
+        )
+
+
+@pytest.mark.django_db
+class TestSpellEffectTemplateDiceForSlotLevel:
+    def test_dice_for_slot_level(self):
+        template = SpellEffectTemplateFactory(
+            spell=SpellSettingsFactory(level=SpellLevel.THIRD),
+            base_dice="8d6",
+            dice_per_level="1d6",
+        )
+        assert str(template.dice_for_slot_level(5)) == "10d6"
+
+    def test_slot_level_is_clamped(self):
+        template = SpellEffectTemplateFactory(
+            spell=SpellSettingsFactory(level=SpellLevel.FIRST),
+            base_dice="1d4",
+            dice_per_level="1d4",
+        )
+        assert str(template.dice_for_slot_level(12)) == "9d4"
+        assert str(template.dice_for_slot_level(-1)) == "1d4"
+
+    def test_shared_between_templates(self):
+        spell = SpellSettingsFactory(level=SpellLevel.THIRD)
+        template1 = SpellEffectTemplateFactory(spell=spell)
+        template2 = SpellEffectTemplateFactory(spell=spell)
+        assert template1.scaled_dice is template2.scaled_dice
+
+
 @pytest.mark.django_db
 class TestActiveSpellEffectModel:
     def test_creation(self):
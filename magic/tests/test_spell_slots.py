@@ -0,0 +1,111 @@
+import pytest
+
+from character.constants.classes import ClassName
+from character.tests.factories import (
+    CharacterClassFactory,
+    CharacterFactory,
+    ClassFactory,
+)
+from magic.models.spells import CharacterSpellSlot
+from magic.spell_slots import (
+    NO_SLOTS,
+    SpellSlotMatrix,
+    assign_spell_slots,
+    get_spell_slot_matrix,
+    sync_spell_slots,
+)
+from magic.tests.factories import CharacterSpellSlotFactory, SpellSlotTableFactory
+
+
+@pytest.mark.django_db
+class TestSpellSlotMatrix:
+    def test_full_caster_level_1(self):
+        matrix = get_spell_slot_matrix()
+        assert matrix.class_slots(ClassName.WIZARD, 1) == (2, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    def test_full_caster_level_20(self):
+        matrix = get_spell_slot_matrix()
+        assert matrix.class_slots(ClassName.CLERIC, 20) == (4, 3, 3, 3, 3, 2, 2, 1, 1)
+
+    def test_half_caster_rounds_up(self):
+        matrix = get_spell_slot_matrix()
+        assert matrix.class_slots(ClassName.PALADIN, 1) == (2, 0, 0, 0, 0, 0, 0, 0, 0)
+        assert matrix.class_slots(ClassName.RANGER, 5) == (4, 2, 0, 0, 0, 0, 0, 0, 0)
+
+    def test_non_caster_has_no_slots(self):
+        matrix = get_spell_slot_matrix()
+        assert matrix.class_slots(ClassName.FIGHTER, 10) == NO_SLOTS
+        assert matrix.class_slots(ClassName.WARLOCK, 10) == NO_SLOTS
+
+    def test_is_cached(self):
+        assert get_spell_slot_matrix() is get_spell_slot_matrix()
+
+    def test_table_rows_override_srd(self):
+        SpellSlotTableFactory(
+            class_name=ClassName.WIZARD, class_level=97, slot_level=3, slots=5
+        )
+        matrix = get_spell_slot_matrix()
+        assert matrix.class_slots(ClassName.WIZARD, 97) == (0, 0, 5, 0, 0, 0, 0, 0, 0)
+
+    def test_multiclass_caster_level(self):
+        caster_level = SpellSlotMatrix.caster_level(
+            {ClassName.WIZARD: 3, ClassName.PALADIN: 3, ClassName.WARLOCK: 2}
+        )
+        assert caster_level == 5
+
+    def test_multiclass_slots(self):
+        matrix = get_spell_slot_matrix()
+        slots = matrix.slots({ClassName.CLERIC: 3, ClassName.RANGER: 3})
+        # Caster level 5
+        assert slots == (4, 3, 2, 0, 0, 0, 0, 0, 0)
+
+    def test_single_class_ignores_non_casters(self):
+        matrix = get_spell_slot_matrix()
+        slots = matrix.slots({ClassName.FIGHTER: 5, ClassName.PALADIN: 2})
+        assert slots == matrix.class_slots(ClassName.PALADIN, 2)
+
+    def test_pact_magic(self):
+        assert SpellSlotMatrix.pact_magic(1) == (1, 1)
+        assert SpellSlotMatrix.pact_magic(11) == (3, 5)
+        assert SpellSlotMatrix.pact_magic(20) == (4, 5)
+        assert SpellSlotMatrix.pact_magic(0) == (0, 0)
+
+
+@pytest.mark.django_db
+class TestAssignSpellSlots:
+    def test_creates_slots(self):
+        character = CharacterFactory()
+        assign_spell_slots(character, (4, 2, 0, 0, 0, 0, 0, 0, 0))
+        slots = CharacterSpellSlot.objects.filter(character=character)
+        assert [(s.slot_level, s.total) for s in slots] == [(1, 4), (2, 2)]
+
+    def test_updates_existing_slots(self):
+        character = CharacterFactory()
+        CharacterSpellSlotFactory(character=character, slot_level=1, total=2, used=1)
+        assign_spell_slots(character, (3, 0, 0, 0, 0, 0, 0, 0, 0))
+        slot = CharacterSpellSlot.objects.get(character=character, slot_level=1)
+        assert slot.total == 3
+        assert slot.used == 1
+
+    def test_query_count(self, django_assert_num_queries):
+        character = CharacterFactory()
+        CharacterSpellSlotFactory(character=character, slot_level=1, total=2)
+        # One select, one bulk insert, one bulk update
+        with django_assert_num_queries(3):
+            assign_spell_slots(character, (4, 3, 2, 0, 0, 0, 0, 0, 0))
+
+    def test_sync_multiclass(self):
+        character = CharacterFactory()
+        CharacterClassFactory(
+            character=character, klass=ClassFactory(name=ClassName.WIZARD), level=2
+        )
+        CharacterClassFactory(
+            character=character,
+            klass=ClassFactory(name=ClassName.CLERIC),
+            level=1,
+            is_primary=False,
+        )
+        sync_spell_slots(character)
+        slots = CharacterSpellSlot.objects.filter(character=character)
+        # Caster level 3
+        assert [(s.slot_level, s.total) for s in slots] == [(1, 4), (2, 2)]
@@ -1,6 +1,8 @@
 import random
 import re
 from collections import UserString
+from collections.abc import Iterable
+from functools import cache
 
 DICE_REGEX = r"(\d+)?d(\d+)([\+\-]\d+)?"
 
@@ -14,34 +16,44 @@ class DiceStringFormatError(Exception):
 
 class DiceString(UserString):
     """
-    A dice string looks like '[N]dT', where N is the number of dice throws
-    and T the type of the dice.
+    A dice string looks like '[N]dT[+M]', where N is the number of dice throws,
+    T the type of the dice and M a modifier added to each roll, e.g. '2d6+4'.
 
     Attributes:
         nb_throws (int): Number of throws.
         dice_type (int): Dice type.
+        modifier (int): Modifier of the dice string, 0 if none.
         data (str): The dice string itself, inherited from Userstring class.
     """
 
     def __init__(self, dice_str: str):
         super().__init__(dice_str)
-        if not re.match(DICE_REGEX, dice_str):
+        match = re.fullmatch(DICE_REGEX, self.data.replace(" ", ""))
+        if match is None:
             raise DiceStringFormatError(f"{dice_str=} is not a dice string")
-        dice_str_parts = self.split("d")
-        try:
-            self.nb_throws = int(dice_str_parts[0])
-        except ValueError:
-            # This is raised when no throw is specified in the dice string.
-            self.nb_throws = 1
-        dice_type = int(dice_str_parts[1])
+        nb_throws, dice_type, modifier = match.groups()
+        # A single throw when no throw is specified in the dice string.
+        self.nb_throws = int(nb_throws or 1)
+        dice_type = int(dice_type)
         if dice_type not in dice_types:
             raise DiceStringFormatError(f"{dice_type=} is not supported")
         self.dice_type = dice_type
+        self.modifier = int(modifier or 0)
 
     def _roll_dice(self) -> list[int]:
         """Roll the dice and return individual results."""
         return [random.randint(1, self.dice_type) for _ in range(self.nb_throws)]
 
+    def _roll_dice_batch(self, count: int) -> list[int]:
+        """Roll the dice several times with a single draw and return the sum
+        of each roll."""
+        nb_throws = self.nb_throws
+        dice = random.choices(range(1, self.dice_type + 1), k=count * nb_throws)
+        return [
+            sum(dice[start : start + nb_throws])
+            for start in range(0, count * nb_throws, nb_throws)
+        ]
+
     def add_throws(self, nb_throws: int) -> str:
         """
         Add throws to a dice string.
@@ -59,6 +71,8 @@ class DiceString(UserString):
             )
         self.nb_throws += nb_throws
         self.data = f"{self.nb_throws}d{self.dice_type}"
+        if self.modifier:
+            self.data += f"{self.modifier:+d}"
         return self.data
 
     def roll(self, modifier: int = 0) -> int:
@@ -66,7 +80,7 @@ class DiceString(UserString):
         Roll the dice defined in the dice string.
 
         In case of several rolls, it sums the values of each roll and adds
-        the modifier value (if any).
+        the modifier of the dice string and the modifier value (if any).
 
         Args:
             modifier (int): Positive or negative integer to add on a roll result.
@@ -74,7 +88,23 @@ class DiceString(UserString):
         Returns:
             int: Sum of dice rolls results.
         """
-        return sum(self._roll_dice()) + modifier
+        return sum(self._roll_dice()) + self.modifier + modifier
+
+    def roll_batch(self, count: int, modifier: int = 0) -> list[int]:
+        """Roll the dice string several times at once.
+
+        Every die of every roll is drawn with a single call, e.g. to recharge
+        all the magic items sharing a formula at dawn.
+
+        Args:
+            count (int): Number of rolls.
+            modifier (int): Positive or negative integer to add on each roll.
+
+        Returns:
+            list: The totals of each roll, modifiers included, in order.
+        """
+        modifier += self.modifier
+        return [total + modifier for total in self._roll_dice_batch(count)]
 
     def roll_keeping_individual(self, modifier: int = 0) -> tuple[int, list[int]]:
         """Roll and return individual die results for transparency.
@@ -86,7 +116,7 @@ class DiceString(UserString):
             tuple: (total_with_modifier, list_of_individual_rolls)
         """
         rolls = self._roll_dice()
-        return sum(rolls) + modifier, rolls
+        return sum(rolls) + self.modifier + modifier, rolls
 
     def roll_with_advantage(self, modifier: int = 0) -> tuple[int, int, int]:
         """Roll twice and take the higher result (D&D 5e advantage).
@@ -99,7 +129,7 @@ class DiceString(UserString):
         """
         roll1 = sum(self._roll_dice())
         roll2 = sum(self._roll_dice())
-        return max(roll1, roll2) + modifier, roll1, roll2
+        return max(roll1, roll2) + self.modifier + modifier, roll1, roll2
 
     def roll_with_disadvantage(self, modifier: int = 0) -> tuple[int, int, int]:
         """Roll twice and take the lower result (D&D 5e disadvantage).
@@ -112,13 +142,14 @@ class DiceString(UserString):
         """
         roll1 = sum(self._roll_dice())
         roll2 = sum(self._roll_dice())
-        return min(roll1, roll2) + modifier, roll1, roll2
+        return min(roll1, roll2) + self.modifier + modifier, roll1, roll2
 
     def roll_damage(self, critical: bool = False) -> int:
         """Roll damage dice with optional critical hit (doubles dice).
 
         Args:
-            critical: If True, roll twice as many dice (D&D 5e critical hit).
+            critical: If True, roll twice as many dice (D&D 5e critical hit),
+                the modifier of the dice string being added once.
 
         Returns:
             int: Total damage rolled.
@@ -126,7 +157,7 @@ class DiceString(UserString):
         rolls = self._roll_dice()
         if critical:
             rolls += self._roll_dice()
-        return sum(rolls)
+        return sum(rolls) + self.modifier
 
 
 def roll_d20_test(
@@ -164,3 +195,71 @@ def roll_d20_test(
         natural = rolls[0]
 
     return natural + modifier, natural == 20, natural == 1
+
+
+def roll_d20_batch(count: int) -> list[int]:
+    """Roll several independent d20s at once.
+
+    Used to resolve a batch of tests (e.g. concentration saves after an area
+    spell) without rolling them one by one.
+
+    Args:
+        count: Number of d20s to roll.
+
+    Returns:
+        list: The natural results, in order.
+    """
+    return random.choices(range(1, 21), k=count)
+
+
+@cache
+def compile_dice(formula: str) -> DiceString:
+    """Parse a dice formula once per process.
+
+    The returned DiceString is shared and must not be mutated.
+
+    Args:
+        formula: Dice formula, like '1d6+4' or 'd8-1'.
+    """
+    return DiceString(formula)
+
+
+def roll_batch(formula: str, count: int) -> list[int]:
+    """Roll a dice formula several times at once, see DiceString.roll_batch().
+
+    Args:
+        formula: Dice formula, like '1d6+4' or 'd8-1'.
+        count: Number of rolls.
+
+    Returns:
+        list: The totals of each roll, modifier included, in order.
+    """
+    return compile_dice(formula).roll_batch(count)
+
+
+def roll_damage_batch(rolls: Iterable[tuple[str, bool]]) -> list[int]:
+    """Roll several damage formulas at once, with one batch per formula.
+
+    A critical roll doubles the dice of its formula, not the modifier.
+
+    Args:
+        rolls: (formula, critical) pairs.
+
+    Returns:
+        list: The damage of each roll, never negative, in order.
+    """
+    rolls = list(rolls)
+    positions: dict[str, list[int]] = {}
+    for position, (formula, _) in enumerate(rolls):
+        positions.setdefault(formula, []).append(position)
+    totals = [0] * len(rolls)
+    for formula, formula_positions in positions.items():
+        dice = compile_dice(formula)
+        for position, total in zip(
+            formula_positions, dice.roll_batch(len(formula_positions))
+        ):
+            totals[position] = total
+        critical = [position for position in formula_positions if rolls[position][1]]
+        for position, extra in zip(critical, dice._roll_dice_batch(len(critical))):
+            totals[position] += extra
+    return [max(0, total) for total in totals]
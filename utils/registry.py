@@ -0,0 +1,192 @@
+"""Process-wide registry of the read-only SRD reference data.
+
+Ability types, skills, conditions, languages, classes, species, feats and
+equipment settings only change when fixtures are loaded. The registry reads
+them once per process, on first use, into read-only tables keyed by primary
+key and by name, so hot paths do not query them on every request.
+
+Rows are shared by every request: they must not be modified. Saving or
+deleting a row of a registered model (as ``loaddata`` does) invalidates the
+registry of the current process; ``reload_registry()`` reloads it explicitly.
+Other processes see the new data once restarted, as after a deploy.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from django.apps import apps
+from django.db import models
+
+if TYPE_CHECKING:
+    from character.models.abilities import AbilityType
+    from character.models.classes import Class
+    from character.models.conditions import Condition
+    from character.models.feats import Feat
+    from character.models.races import Language
+    from character.models.skills import Skill
+    from character.models.species import Species
+    from equipment.models.equipment import (
+        ArmorSettings,
+        GearSettings,
+        PackSettings,
+        ToolSettings,
+        WeaponSettings,
+    )
+    from equipment.models.magic_items import MagicItemSettings
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=models.Model)
+
+
+@dataclass(frozen=True)
+class Table(Generic[M]):
+    """The rows of a reference model, in the model's default ordering."""
+
+    model: type[M]
+    rows: tuple[M, ...]
+    by_pk: Mapping[Any, M]
+    by_name: Mapping[str, M]
+
+    @classmethod
+    def load(
+        cls,
+        model: type[M],
+        select_related: tuple[str, ...] = (),
+        prefetch_related: tuple[str, ...] = (),
+    ) -> Table[M]:
+        rows = tuple(
+            model.objects.select_related(*select_related).prefetch_related(
+                *prefetch_related
+            )
+        )
+        return cls(
+            model=model,
+            rows=rows,
+            by_pk=MappingProxyType({row.pk: row for row in rows}),
+            by_name=MappingProxyType({row.name: row for row in rows}),
+        )
+
+    def __iter__(self) -> Iterator[M]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.by_pk or key in self.by_name
+
+    def get(self, key: Any) -> M:
+        """Return the row with this primary key or name."""
+        row = self.by_pk.get(key)
+        if row is None:
+            row = self.by_name.get(key)
+        if row is None:
+            raise self.model.DoesNotExist(
+                f"{self.model.__name__} {key!r} does not exist"
+            )
+        return row
+
+    def filter(self, **lookups: Any) -> tuple[M, ...]:
+        """Return the rows matching every lookup.
+
+        Lookups compare an attribute for equality, or for membership with the
+        ``__in`` suffix (e.g. ``armor_type__in=["LA", "MA"]``).
+        """
+        rows = self.rows
+        for lookup, value in lookups.items():
+            if lookup.endswith("__in"):
+                attribute, values = lookup.removesuffix("__in"), set(value)
+                rows = tuple(row for row in rows if getattr(row, attribute) in values)
+            else:
+                rows = tuple(row for row in rows if getattr(row, lookup) == value)
+        return rows
+
+
+# Field name -> (model label, select_related, prefetch_related)
+TABLES: dict[str, tuple[str, tuple[str, ...], tuple[str, ...]]] = {
+    "ability_types": ("character.AbilityType", (), ()),
+    "skills": ("character.Skill", ("ability_type",), ()),
+    "conditions": ("character.Condition", (), ()),
+    "languages": ("character.Language", (), ()),
+    "classes": ("character.Class", ("spellcasting",), ("saving_throws", "features")),
+    "species": ("character.Species", (), ("traits", "languages")),
+    "feats": ("character.Feat", (), ()),
+    "armor": ("equipment.ArmorSettings", (), ()),
+    "weapons": ("equipment.WeaponSettings", (), ()),
+    "packs": ("equipment.PackSettings", (), ()),
+    "gear": ("equipment.GearSettings", (), ()),
+    "tools": ("equipment.ToolSettings", (), ()),
+    "magic_items": ("equipment.MagicItemSettings", (), ()),
+}
+
+
+@dataclass(frozen=True)
+class Registry:
+    """All reference tables, loaded together."""
+
+    ability_types: Table[AbilityType]
+    skills: Table[Skill]
+    conditions: Table[Condition]
+    languages: Table[Language]
+    classes: Table[Class]
+    species: Table[Species]
+    feats: Table[Feat]
+    armor: Table[ArmorSettings]
+    weapons: Table[WeaponSettings]
+    packs: Table[PackSettings]
+    gear: Table[GearSettings]
+    tools: Table[ToolSettings]
+    magic_items: Table[MagicItemSettings]
+
+    @classmethod
+    def load(cls) -> Registry:
+        """Load every table, with one query per table and prefetched relation."""
+        tables = {
+            name: Table.load(apps.get_model(label), select_related, prefetch_related)
+            for name, (label, select_related, prefetch_related) in TABLES.items()
+        }
+        return cls(**tables)
+
+    @staticmethod
+    def models() -> list[type[models.Model]]:
+        """Return the registered models."""
+        return [apps.get_model(label) for label, _, _ in TABLES.values()]
+
+    def __len__(self) -> int:
+        return sum(len(getattr(self, field.name)) for field in fields(self))
+
+
+_registry: Registry | None = None
+
+
+def get_registry() -> Registry:
+    """Return the reference data registry, loading it on first use."""
+    global _registry
+    if _registry is None:
+        start = time.perf_counter()
+        _registry = Registry.load()
+        logger.info(
+            "Loaded %d reference rows in %.1f ms",
+            len(_registry),
+            (time.perf_counter() - start) * 1000,
+        )
+    return _registry
+
+
+def invalidate_registry() -> None:
+    """Drop the registry; it is loaded again on next use."""
+    global _registry
+    _registry = None
+
+
+def reload_registry() -> Registry:
+    """Reload the registry now (e.g. after ``loaddata``)."""
+    invalidate_registry()
+    return get_registry()
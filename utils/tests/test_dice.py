@@ -1,7 +1,16 @@
 import pytest
 from faker import Faker
 
-from utils.dice import DiceString, DiceStringFormatError, dice_types, roll_d20_test
+from utils.dice import (
+    DiceString,
+    DiceStringFormatError,
+    compile_dice,
+    dice_types,
+    roll_batch,
+    roll_damage_batch,
+    roll_d20_batch,
+    roll_d20_test,
+)
 
 
 @pytest.fixture
@@ -38,6 +47,21 @@ def test_constructor_invalid_dice_type():
         DiceString(f"{nb_throws}d{dice_type}")
 
 
+def test_constructor_modifier():
+    dice_str = DiceString("2d6 - 1")
+    assert (dice_str.nb_throws, dice_str.dice_type, dice_str.modifier) == (2, 6, -1)
+    assert DiceString("d8").modifier == 0
+
+
+def test_constructor_trailing_text():
+    with pytest.raises(DiceStringFormatError):
+        DiceString("2d6 fire")
+
+
+def test_add_throws_keeps_modifier():
+    assert DiceString("1d6+4").add_throws(2) == "3d6+4"
+
+
 def test_add_throws_valid_nb_throws(dice_str):
     fake = Faker()
     nb_throws = fake.random_int(min=1, max=10)
@@ -88,6 +112,11 @@ def test_roll_with_modifier(dice_str):
     )
 
 
+def test_roll_adds_dice_string_modifier(monkeypatch):
+    monkeypatch.setattr("random.randint", lambda a, b: 3)
+    assert DiceString("2d6+4").roll(1) == 11
+
+
 class TestRollKeepingIndividual:
     def test_returns_total_and_individual_rolls(self):
         dice_str = DiceString("3d6")
@@ -249,3 +278,71 @@ class TestRollD20Test:
         monkeypatch.setattr("random.randint", lambda a, b: next(rolls_sequence))
         _, _, is_nat_1 = roll_d20_test(disadvantage=True)
         assert is_nat_1 is True
+
+
+class TestRollD20Batch:
+    def test_count(self):
+        assert len(roll_d20_batch(50)) == 50
+
+    def test_values_in_range(self):
+        assert all(1 <= roll <= 20 for roll in roll_d20_batch(200))
+
+    def test_empty(self):
+        assert roll_d20_batch(0) == []
+
+
+class TestRollBatch:
+    def test_count(self):
+        assert len(roll_batch("1d6+4", 50)) == 50
+
+    def test_values_in_range(self):
+        assert all(6 <= roll <= 20 for roll in roll_batch("2d8+4", 200))
+
+    def test_negative_modifier(self):
+        assert all(0 <= roll <= 3 for roll in roll_batch("d4-1", 100))
+
+    def test_spaces(self):
+        assert all(2 <= roll <= 7 for roll in roll_batch("1d6 + 1", 100))
+
+    def test_empty(self):
+        assert roll_batch("1d6", 0) == []
+
+    def test_invalid_formula(self):
+        with pytest.raises(DiceStringFormatError):
+            roll_batch("1d6 charges", 1)
+
+
+class TestCompileDice:
+    def test_formula(self):
+        dice_str = compile_dice("d8 - 1")
+        assert (dice_str.nb_throws, dice_str.dice_type, dice_str.modifier) == (1, 8, -1)
+
+    def test_compiled_once(self):
+        assert compile_dice("2d6+4") is compile_dice("2d6+4")
+
+    def test_invalid_formula(self):
+        with pytest.raises(DiceStringFormatError):
+            compile_dice("2d")
+
+
+@pytest.fixture
+def roll_ones(monkeypatch):
+    """Make every die of the batches roll 1."""
+    monkeypatch.setattr("random.choices", lambda population, k: [population[0]] * k)
+
+
+class TestRollDamageBatch:
+    def test_order(self, roll_ones):
+        rolls = roll_damage_batch([("1d6+3", False), ("2d6", False), ("1d6+3", True)])
+        assert rolls == [4, 2, 5]
+
+    def test_critical_doubles_dice_only(self):
+        assert all(
+            8 <= roll <= 28 for roll in roll_damage_batch([("2d6+4", True)] * 100)
+        )
+
+    def test_never_negative(self, roll_ones):
+        assert roll_damage_batch([("1d4-3", False)]) == [0]
+
+    def test_empty(self):
+        assert roll_damage_batch([]) == []
@@ -0,0 +1,105 @@
+import pytest
+from django.core.management import call_command
+
+from character.constants.abilities import AbilityName
+from character.constants.skills import SkillName
+from character.models.skills import Skill
+from character.tests.factories import SpeciesTraitFactory
+from equipment.constants.equipment import ArmorName, ArmorType
+from equipment.models.equipment import ArmorSettings
+from utils.registry import (
+    TABLES,
+    get_registry,
+    invalidate_registry,
+    reload_registry,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestTable:
+    def test_get_by_pk(self):
+        skill = get_registry().skills.get(SkillName.ARCANA)
+        assert skill.name == SkillName.ARCANA
+        assert skill.ability_type_id == AbilityName.INTELLIGENCE
+
+    def test_get_by_name(self):
+        languages = get_registry().languages
+        language = next(iter(languages))
+        assert languages.get(language.name) is languages.get(language.pk)
+
+    def test_get_missing(self):
+        with pytest.raises(Skill.DoesNotExist):
+            get_registry().skills.get("Juggling")
+
+    def test_contains(self):
+        assert SkillName.STEALTH in get_registry().skills
+        assert "Juggling" not in get_registry().skills
+
+    def test_filter(self):
+        shields = get_registry().armor.filter(armor_type=ArmorType.SHIELD)
+        assert [armor.name for armor in shields] == [ArmorName.SHIELD]
+
+    def test_filter_in(self):
+        armor_types = [ArmorType.LIGHT_ARMOR, ArmorType.SHIELD]
+        armor = get_registry().armor.filter(armor_type__in=armor_types)
+        assert {settings.pk for settings in armor} == set(
+            ArmorSettings.objects.filter(armor_type__in=armor_types).values_list(
+                "pk", flat=True
+            )
+        )
+
+    def test_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            get_registry().skills.by_pk["Juggling"] = None
+
+
+class TestRegistry:
+    def test_loads_every_row(self):
+        registry = get_registry()
+        assert len(registry.skills) == Skill.objects.count()
+        assert len(registry.armor) == ArmorSettings.objects.count()
+
+    def test_is_cached(self, django_assert_num_queries):
+        get_registry()
+        with django_assert_num_queries(0):
+            assert get_registry().skills.get(SkillName.ARCANA)
+
+    def test_cold_start_query_count(self, django_assert_num_queries):
+        invalidate_registry()
+        # One query per table, plus class saving throws and features, and
+        # species traits and languages.
+        with django_assert_num_queries(len(TABLES) + 4):
+            get_registry()
+
+    def test_prefetches_relations(self, django_assert_num_queries):
+        registry = get_registry()
+        with django_assert_num_queries(0):
+            for species in registry.species:
+                list(species.traits.all())
+            for klass in registry.classes:
+                list(klass.saving_throws.all())
+
+    def test_save_invalidates(self):
+        registry = get_registry()
+        settings = ArmorSettings.objects.get(name=ArmorName.PLATE)
+        settings.ac = "19"
+        settings.save()
+        assert get_registry() is not registry
+        assert get_registry().armor.get(ArmorName.PLATE).ac == "19"
+
+    def test_m2m_change_invalidates(self):
+        registry = get_registry()
+        species = registry.species.rows[0]
+        trait = SpeciesTraitFactory()
+        species.traits.add(trait)
+        assert trait in get_registry().species.get(species.pk).traits.all()
+
+    def test_loaddata_invalidates(self):
+        registry = get_registry()
+        call_command("loaddata", "character/fixtures/skills.yaml", verbosity=0)
+        assert get_registry() is not registry
+
+    def test_reload(self):
+        registry = get_registry()
+        assert reload_registry() is not registry